@@ -8,7 +8,6 @@ from airflow import DAG
 from airflow.operators.python import PythonOperator
 from airflow.utils.dates import days_ago
 
-from src.pipeline import PipelineRunner, PipelineCompiler, UnifiedRegistry
 from src.integrations.jira_airflow_integration import get_integration_service
 from pathlib import Path
 
@@ -38,22 +37,18 @@ def _build_task_callable(source: str):
         params["jira_issue_key"] = jira_issue_key
         params["airflow_dag_run_id"] = dag_run_id
 
-        # Load and compile pipeline
-        components_yaml = DSL_ROOT / "components.yaml"
-        pipeline_yaml = DSL_ROOT / "pipelines" / f"{source}.yaml"
-        
-        registry = UnifiedRegistry.from_yaml(components_yaml)
-        compiler = PipelineCompiler(registry)
-        compiled = compiler.compile_from_file(pipeline_yaml)
-        
-        # Execute with unified runner
-        runner = PipelineRunner()
-        result = runner.run(
-            pipeline=compiled,
+        # Runs on the warm pipeline worker when PIPELINE_WORKER_SOCKET/URL is
+        # set (waiting while its queue is full); otherwise compiles and runs in
+        # this process.
+        from src.entrypoints.pipeline_worker import run_pipeline_via_worker
+
+        result = run_pipeline_via_worker(
             source=conf.get("source", source),
-            environment=environment,
             run_type=run_type,
             params=params,
+            environment=environment,
+            jira_issue_key=jira_issue_key,
+            airflow_dag_run_id=dag_run_id,
         )
 
         # Update Jira if issue key provided
@@ -62,21 +57,21 @@ def _build_task_callable(source: str):
             if integration_service:
                 integration_service.update_jira_on_completion(
                     issue_key=jira_issue_key,
-                    status=result.status,
-                    run_id=result.run_id,
+                    status=result["status"],
+                    run_id=result["run_id"],
                     dag_run_id=dag_run_id,
-                    item_count=result.item_count,
-                    error=result.error,
+                    item_count=result["item_count"],
+                    error=result["error"],
                 )
 
-        if result.status == "failed":
-            raise RuntimeError(result.error or "Pipeline run failed")
+        if result["status"] == "failed":
+            raise RuntimeError(result["error"] or "Pipeline run failed")
 
         return {
-            "status": result.status,
-            "run_id": result.run_id,
-            "item_count": result.item_count,
-            "duration": result.duration_seconds,
+            "status": result["status"],
+            "run_id": result["run_id"],
+            "item_count": result["item_count"],
+            "duration": result["duration"],
         }
 
     return _task_callable
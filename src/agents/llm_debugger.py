@@ -9,15 +9,54 @@ Provides diagnostic capabilities:
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from src.common.logging_utils import get_logger
 from src.processors.llm.llm_client import LLMClient, get_llm_client_from_config
 
+if TYPE_CHECKING:  # pragma: no cover
+    from src.processors.llm.async_llm_client import AsyncLLMClient
+
 log = get_logger("llm-debugger")
 
 
+def _failure_prompt(error_message: str, context: Optional[Dict[str, Any]]) -> str:
+    context_str = ""
+    if context:
+        context_str = "\n".join(f"{k}: {v}" for k, v in context.items())
+
+    return f"""Analyze this scraper failure and provide diagnostics:
+
+Error: {error_message}
+
+Context:
+{context_str if context_str else "No additional context"}
+
+Return JSON with:
+- root_cause: Brief description of the root cause
+- severity: One of: low, medium, high, critical
+- suggested_fixes: List of suggested fixes
+- related_issues: List of related known issues or patterns"""
+
+
+def _failure_analysis(result: Any) -> Dict[str, Any]:
+    if not isinstance(result, dict):
+        return {
+            "root_cause": "Analysis failed",
+            "severity": "medium",
+            "suggested_fixes": [],
+            "related_issues": [],
+        }
+    return {
+        "root_cause": result.get("root_cause", "Unknown"),
+        "severity": result.get("severity", "medium"),
+        "suggested_fixes": result.get("suggested_fixes", []),
+        "related_issues": result.get("related_issues", []),
+    }
+
+
 def analyze_failure(
     error_message: str,
     context: Optional[Dict[str, Any]] = None,
@@ -60,42 +99,35 @@ def analyze_failure(
         }
     
     try:
-        context_str = ""
-        if context:
-            context_str = "\n".join(f"{k}: {v}" for k, v in context.items())
-        
-        prompt = f"""Analyze this scraper failure and provide diagnostics:
-
-Error: {error_message}
-
-Context:
-{context_str if context_str else "No additional context"}
-
-Return JSON with:
-- root_cause: Brief description of the root cause
-- severity: One of: low, medium, high, critical
-- suggested_fixes: List of suggested fixes
-- related_issues: List of related known issues or patterns"""
-        
-        result = llm_client.extract_json(prompt)
-        
-        if isinstance(result, dict):
-            return {
-                "root_cause": result.get("root_cause", "Unknown"),
-                "severity": result.get("severity", "medium"),
-                "suggested_fixes": result.get("suggested_fixes", []),
-                "related_issues": result.get("related_issues", []),
-            }
-    
+        return _failure_analysis(llm_client.extract_json(_failure_prompt(error_message, context)))
     except Exception as exc:
         log.error("Failure analysis failed", extra={"error": str(exc)})
     
-    return {
-        "root_cause": "Analysis failed",
-        "severity": "medium",
-        "suggested_fixes": [],
-        "related_issues": [],
-    }
+    return _failure_analysis(None)
+
+
+async def analyze_failures_async(
+    failures: List[Tuple[str, Optional[Dict[str, Any]]]],
+    llm_client: "AsyncLLMClient",
+) -> List[Dict[str, Any]]:
+    """
+    Analyze many ``(error_message, context)`` failures concurrently
+    (async batch variant of ``analyze_failure``).
+
+    Returns:
+        One diagnostics dict per failure, in input order
+    """
+    results = await asyncio.gather(
+        *(llm_client.aextract_json(_failure_prompt(error, context)) for error, context in failures),
+        return_exceptions=True,
+    )
+    analyses = []
+    for result in results:
+        if isinstance(result, BaseException):
+            log.error("Failure analysis failed", extra={"error": str(result)})
+            result = None
+        analyses.append(_failure_analysis(result))
+    return analyses
 
 
 def suggest_fixes(
@@ -7,14 +7,30 @@ and extract structured fields. This is the "Auto-Selector Engine" feature.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from src.common.config_loader import load_source_config as _load_source_config
 from src.common.logging_utils import get_logger
 from src.processors.llm.llm_client import LLMClient, get_llm_client_from_config
 
+if TYPE_CHECKING:  # pragma: no cover
+    from src.processors.llm.async_llm_client import AsyncLLMClient
+
 log = get_logger("llm-selector-engine")
 
+_FIELDS_SYSTEM_PROMPT = """You are a data extraction specialist. Extract structured data from HTML.
+Return only the extracted values as JSON, no explanation."""
+
+
+def _fields_prompt(html: str, fields: List[str]) -> str:
+    return f"""Extract these fields from the HTML: {", ".join(fields)}
+
+HTML:
+{html[:8000]}
+
+Return JSON with field names as keys and extracted values as values."""
+
 
 def load_source_config(source: str) -> dict:
     """Thin wrapper so tests can patch source config loading."""
@@ -94,31 +110,12 @@ def extract_fields_with_llm(
     Returns:
         Dict with extracted field values
     """
-    system_prompt = """You are a data extraction specialist. Extract structured data from HTML.
-Return only the extracted values as JSON, no explanation."""
-
-    fields_str = ", ".join(fields)
-    
-    # If selectors provided, extract those sections first
-    if selectors:
-        # This is a simplified version - in production you'd extract HTML sections
-        # using the selectors first, then pass to LLM
-        prompt = f"""Extract these fields from the HTML: {fields_str}
-
-HTML:
-{html[:8000]}
-
-Return JSON with field names as keys and extracted values as values."""
-    else:
-        prompt = f"""Extract these fields from the HTML: {fields_str}
-
-HTML:
-{html[:8000]}
-
-Return JSON with field names as keys and extracted values as values."""
-
+    # Selectors are accepted for API compatibility; the prompt does not narrow
+    # the HTML to their sections yet
     try:
-        result = llm_client.extract_json(prompt, system_prompt=system_prompt)
+        result = llm_client.extract_json(
+            _fields_prompt(html, fields), system_prompt=_FIELDS_SYSTEM_PROMPT
+        )
         if isinstance(result, dict):
             return result
         else:
@@ -129,6 +126,40 @@ Return JSON with field names as keys and extracted values as values."""
         return {}
 
 
+async def extract_fields_with_llm_async(
+    pages: List[str],
+    fields: List[str],
+    llm_client: "AsyncLLMClient",
+) -> List[Dict[str, Any]]:
+    """
+    Extract ``fields`` from many HTML pages concurrently (async batch variant of
+    ``extract_fields_with_llm``).
+
+    Returns:
+        One field dict per page, in input order; failed pages yield ``{}``
+    """
+    results = await asyncio.gather(
+        *(
+            llm_client.aextract_json(
+                _fields_prompt(html, fields), system_prompt=_FIELDS_SYSTEM_PROMPT
+            )
+            for html in pages
+        ),
+        return_exceptions=True,
+    )
+    extracted = []
+    for result in results:
+        if isinstance(result, BaseException):
+            log.error("Failed to extract fields with LLM", extra={"error": str(result)})
+            extracted.append({})
+        elif isinstance(result, dict):
+            extracted.append(result)
+        else:
+            log.warning("LLM returned non-dict for fields", extra={"result_type": type(result)})
+            extracted.append({})
+    return extracted
+
+
 def repair_selectors_with_llm(
     html_old: str,
     html_new: str,
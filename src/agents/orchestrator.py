@@ -6,9 +6,7 @@ import time
 from pathlib import Path
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional
 
-import yaml
-
-from src.common.config_loader import load_config, load_source_config
+from src.common.config_loader import get_config_cache, load_config, load_source_config
 from src.common.logging_utils import get_logger
 from src.common.paths import CONFIG_DIR
 
@@ -110,7 +108,7 @@ class AgentOrchestrator:
 def _read_yaml(path: Path) -> Mapping[str, Any]:
     if not path.exists():
         return {}
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return get_config_cache().read(path)[1]
 
 
 def load_agent_configs(
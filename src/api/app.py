@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.constants import EXPECTED_SCHEMA_VERSION
 from src.api import startup_checks
+from src.common import config_loader
 from src.api.middleware.tenant_middleware import TenantMiddleware
 from src.api.routes import airflow_control, airflow_proxy, audit, costs, deploy, health, integration, logs, runs, sessions, source_health, steps, variants
 
@@ -27,6 +28,8 @@ async def verify_startup():
 
     startup_checks.validate_required_env_vars()
     startup_checks.validate_schema_version(EXPECTED_SCHEMA_VERSION)
+    # Parse every config once so request handlers only hit the cache
+    config_loader.prewarm()
 
 app.include_router(health.router)
 app.include_router(sessions.router)
@@ -288,14 +288,17 @@ def _read_file_stream_chunk(
 
 
 @router.get("")
-def get_logs(
+async def get_logs(
     source: Optional[str] = Query(None),
     run_id: Optional[str] = Query(None),
     level: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
 ) -> Dict[str, Any]:
-    return _read_logs(source=source, run_id=run_id, level=level, limit=limit, offset=offset)
+    # DB work runs on the pool's executor so requests don't queue behind each other
+    return await db.run_async(
+        _read_logs, source=source, run_id=run_id, level=level, limit=limit, offset=offset
+    )
 
 
 def _format_sse(payload: Dict[str, Any]) -> str:
@@ -311,15 +314,17 @@ async def _log_stream(
     poll_interval: float = 1.0,
 ) -> Any:
     position = 0
-    use_db_stream = _ensure_log_table()
-    last_id = _latest_log_id(source, run_id, level) if use_db_stream else 0
+    use_db_stream = await db.run_async(_ensure_log_table)
+    last_id = await db.run_async(_latest_log_id, source, run_id, level) if use_db_stream else 0
 
     while True:
         if await request.is_disconnected():
             break
 
         if use_db_stream:
-            rows = _poll_db_logs_since(last_id, source=source, run_id=run_id, level=level)
+            rows = await db.run_async(
+                _poll_db_logs_since, last_id, source=source, run_id=run_id, level=level
+            )
             if rows is None:
                 use_db_stream = False
             else:
@@ -1,7 +1,24 @@
+"""
+Platform and per-source YAML config loading.
+
+Parsed files and merged results are memoized in a process-wide
+:class:`ConfigCache` keyed by path and ``(mtime_ns, size)``, so repeated
+``load_config`` / ``load_source_config`` calls cost a couple of ``stat``
+calls; an edited file is re-read on the next call. Parsing uses libyaml's
+``CSafeLoader`` when PyYAML was built with it.
+
+Loaded configs are frozen (:class:`FrozenDict` / :class:`FrozenList`, which
+still pass ``isinstance(..., dict/list)`` checks) because every caller shares
+the cached object; use :func:`thaw` for a mutable copy. :func:`prewarm` loads
+everything under ``config/`` once, e.g. at worker startup.
+"""
+
 from __future__ import annotations
 
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import yaml
 
@@ -24,13 +41,94 @@ REQUIRED_SECTION_FIELDS = {
 REQUIRED_SOURCE_FIELDS = ("source", "engine")
 
 
-def _read_yaml(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        raise FileNotFoundError(f"Missing config file: {path}")
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_READ_ONLY = "config is shared and read-only; use config_loader.thaw() for a mutable copy"
+
+
+def _read_only(self: Any, *args: Any, **kwargs: Any) -> Any:
+    raise TypeError(_READ_ONLY)
+
+
+class FrozenDict(dict):
+    """Read-only dict handed out by the config cache."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> Any:
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+        return self
+
+
+class FrozenList(list):
+    """Read-only list handed out by the config cache."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+    def __reduce__(self) -> Any:
+        return (FrozenList, (list(self),))
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenList":
+        return self
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists into FrozenDict/FrozenList."""
+
+    if isinstance(value, FrozenDict) or isinstance(value, FrozenList):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively copy a (frozen) config into plain, mutable dicts and lists."""
+
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+for _dumper in filter(None, (yaml.SafeDumper, getattr(yaml, "CSafeDumper", None))):
+    _dumper.add_representer(FrozenDict, yaml.representer.SafeRepresenter.represent_dict)
+    _dumper.add_representer(FrozenList, yaml.representer.SafeRepresenter.represent_list)
+
+
+Stamp = Tuple[int, int]
+
+
+def _stamp(path: str) -> Stamp:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing config file: {path}") from None
+    return st.st_mtime_ns, st.st_size
+
+
+def _parse_yaml(path: Path) -> Dict[str, Any]:
     text = path.read_text(encoding="utf-8")
 
     try:
-        data = yaml.safe_load(text)
+        data = yaml.load(text, Loader=_YAML_LOADER)  # noqa: S506 - safe loader
     except Exception as exc:
         raise ValueError(f"Failed to parse YAML at {path}: {exc}") from exc
 
@@ -43,6 +141,61 @@ def _read_yaml(path: Path) -> Dict[str, Any]:
     return data
 
 
+class ConfigCache:
+    """Parsed and merged configs keyed by file path and ``(mtime_ns, size)``."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Keyed by path string: pathlib construction and hashing would cost more than the stat
+        self._files: Dict[str, Tuple[Stamp, FrozenDict]] = {}
+        self._merged: Dict[Tuple[Any, ...], Tuple[Tuple[Stamp, ...], FrozenDict]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def read(self, path: Path | str) -> Tuple[Stamp, FrozenDict]:
+        """Frozen contents of ``path``, re-parsed only if the file changed."""
+
+        key = os.fspath(path)
+        stamp = _stamp(key)
+        entry = self._files.get(key)
+        if entry is not None and entry[0] == stamp:
+            self.hits += 1
+            return entry
+        data = freeze(_parse_yaml(Path(key)))
+        entry = (stamp, data)
+        with self._lock:
+            self._files[key] = entry
+            self.misses += 1
+        return entry
+
+    def merged(self, key: Tuple[Any, ...], stamps: Tuple[Stamp, ...]) -> Optional[FrozenDict]:
+        entry = self._merged.get(key)
+        if entry is not None and entry[0] == stamps:
+            return entry[1]
+        return None
+
+    def store_merged(
+        self, key: Tuple[Any, ...], stamps: Tuple[Stamp, ...], value: Dict[str, Any]
+    ) -> FrozenDict:
+        frozen = freeze(value)
+        with self._lock:
+            self._merged[key] = (stamps, frozen)
+        return frozen
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+            self._merged.clear()
+            self.hits = self.misses = 0
+
+
+_cache = ConfigCache()
+
+
+def get_config_cache() -> ConfigCache:
+    return _cache
+
+
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     merged: Dict[str, Any] = dict(base)
     for key, value in override.items():
@@ -85,31 +238,37 @@ def load_config(env: str | None = None, *, config_dir: Path = CONFIG_DIR) -> Dic
         config_dir: Base directory containing ``settings.yaml`` and ``env/``.
 
     Returns:
-        A dictionary combining base settings with environment overrides.
+        A read-only dictionary combining base settings with environment
+        overrides; shared with other callers, see :func:`thaw`.
 
     Raises:
         FileNotFoundError: When a referenced config file cannot be located.
         ValueError: When the loaded config is missing required sections.
     """
 
-    base_path = config_dir / "settings.yaml"
-    config = _read_yaml(base_path)
+    base_path = os.path.join(config_dir, "settings.yaml")
+    base_stamp, config = _cache.read(base_path)
 
-    env_name = env if env is not None else get_runtime_env(default=None)
+    runtime_env = env if env is not None else get_runtime_env(default=None)
+    env_name = runtime_env or config.get("app", {}).get("environment")
+    if not env_name:
+        _validate(config)
+        return config
 
-    if env_name:
-        log.info("Using environment '%s' from runtime settings", env_name)
-    else:
-        env_name = config.get("app", {}).get("environment")
+    env_path = os.path.join(config_dir, "env", f"{env_name}.yaml")
+    env_stamp, env_config = _cache.read(env_path)
+    key = ("settings", base_path, env_path)
+    stamps = (base_stamp, env_stamp)
+    merged = _cache.merged(key, stamps)
+    if merged is not None:
+        return merged
 
-    if env_name:
-        env_path = config_dir / "env" / f"{env_name}.yaml"
-        log.info("Loading environment overrides from %s", env_path)
-        env_config = _read_yaml(env_path)
-        config = _deep_merge(config, env_config)
-
-    _validate(config)
-    return config
+    if runtime_env:
+        log.info("Using environment '%s' from runtime settings", runtime_env)
+    log.info("Loading environment overrides from %s", env_path)
+    merged_config = _deep_merge(config, env_config)
+    _validate(merged_config)
+    return _cache.store_merged(key, stamps, merged_config)
 
 
 def load_source_config(source: str, *, config_dir: Path = CONFIG_DIR) -> Dict[str, Any]:
@@ -120,16 +279,19 @@ def load_source_config(source: str, *, config_dir: Path = CONFIG_DIR) -> Dict[st
         config_dir: Base config directory containing ``sources/<source>.yaml``.
 
     Returns:
-        Parsed YAML content for the source.
+        Parsed YAML content for the source (read-only and shared, see
+        :func:`thaw`).
 
     Raises:
         FileNotFoundError: If the source file is missing.
         ValueError: If required fields are missing or the ``source`` field mismatches.
     """
 
-    path = config_dir / "sources" / f"{source}.yaml"
-    log.info("Loading source config for %s from %s", source, path)
-    source_cfg = _read_yaml(path)
+    path = os.path.join(config_dir, "sources", f"{source}.yaml")
+    misses = _cache.misses
+    source_cfg = _cache.read(path)[1]
+    if _cache.misses != misses:
+        log.info("Loaded source config for %s from %s", source, path)
 
     missing = [field for field in REQUIRED_SOURCE_FIELDS if field not in source_cfg]
     if missing:
@@ -145,4 +307,42 @@ def load_source_config(source: str, *, config_dir: Path = CONFIG_DIR) -> Dict[st
     return source_cfg
 
 
-__all__ = ["load_config", "load_source_config"]
+def prewarm(env: str | None = None, *, config_dir: Path = CONFIG_DIR) -> List[str]:
+    """Load the platform config and every ``sources/*.yaml`` into the cache.
+
+    Meant for worker / API startup so the first request does not pay for YAML
+    parsing. Invalid source files are logged and skipped. Returns the names of
+    the sources that loaded.
+    """
+
+    loaded: List[str] = []
+    try:
+        load_config(env, config_dir=config_dir)
+    except (FileNotFoundError, ValueError) as exc:
+        log.warning("Config prewarm: platform settings failed to load: %s", exc)
+    for source in _source_names(config_dir):
+        try:
+            load_source_config(source, config_dir=config_dir)
+        except (FileNotFoundError, ValueError) as exc:
+            log.warning("Config prewarm: skipping source %s: %s", source, exc)
+            continue
+        loaded.append(source)
+    log.info("Prewarmed config cache", extra={"sources": len(loaded)})
+    return loaded
+
+
+def _source_names(config_dir: Path) -> Iterable[str]:
+    return sorted(path.stem for path in (config_dir / "sources").glob("*.yaml"))
+
+
+__all__ = [
+    "ConfigCache",
+    "FrozenDict",
+    "FrozenList",
+    "freeze",
+    "get_config_cache",
+    "load_config",
+    "load_source_config",
+    "prewarm",
+    "thaw",
+]
@@ -1,44 +1,386 @@
 # file: src/common/db.py
 """
 Shared DB helpers (connections, engines, etc.).
+
+Database work goes through a process-wide, thread-safe connection pool.
+``transaction()`` checks a connection out for the duration of one
+transaction, so concurrent API requests and pipeline steps run in parallel
+and a failure only discards the connection it happened on. Async callers
+(the FastAPI routes) use ``run_async`` / ``transaction_async``, which run
+the blocking work on an executor sized to the pool.
+
+Pool sizing comes from the environment:
+
+- ``DB_POOL_MIN`` / ``DB_POOL_MAX``: connections kept open when idle / hard
+  cap (defaults 1 / 10)
+- ``DB_POOL_MAX_IDLE_SECONDS``: idle time after which connections above the
+  minimum are closed (default 300)
+- ``DB_POOL_TIMEOUT``: seconds to wait for a free connection (default 30)
+- ``DB_POOL_HEALTHCHECK_SECONDS``: connections idle longer than this are
+  pinged with ``SELECT 1`` before reuse (default 30)
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar
 
 import psycopg2
-from psycopg2.extensions import connection
+from psycopg2 import extensions
+from psycopg2.extensions import connection as PgConnection
+
+from src.common.logging_utils import get_logger
+from src.observability import metrics
 
-_CONN: connection | None = None
+log = get_logger("db")
+
+T = TypeVar("T")
+
+_CONN: PgConnection | None = None
 _LOCK = threading.Lock()
 
 
-def get_conn() -> connection:
-    """Return a process-wide psycopg2 connection using ``DB_URL``."""
+class PoolTimeout(RuntimeError):
+    """Raised when no pooled connection frees up within the checkout timeout."""
+
+
+class ConnectionPool:
+    """Thread-safe pool of psycopg2 connections with health checks.
+
+    Connections are created lazily up to ``max_size`` and returned connections
+    stay open; those above ``min_size`` are closed once idle for ``max_idle``
+    seconds. A connection is discarded instead of reused when it is closed,
+    left in an unknown transaction state, or fails its health check.
+    """
+
+    def __init__(
+        self,
+        dsn: Optional[str],
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+        max_idle: float = 300.0,
+        connect: Callable[[Optional[str]], PgConnection] = psycopg2.connect,
+        name: str = "default",
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self.dsn = dsn
+        self.min_size = max(0, min(min_size, max_size))
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.max_idle = max_idle
+        self.name = name
+        self._connect = connect
+        self._idle: List[Tuple[PgConnection, float]] = []
+        self._in_use = 0
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    # ------------------------------------------------------------------ #
+    # Checkout / return
+    # ------------------------------------------------------------------ #
+    def getconn(self, timeout: Optional[float] = None) -> PgConnection:
+        """Check out a healthy connection, waiting up to ``timeout`` seconds."""
+
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        while True:
+            conn, idle_since, create = self._reserve(deadline)
+            if create:
+                try:
+                    conn = self._connect(self.dsn)
+                except Exception:
+                    self._release_slot()
+                    raise
+            elif not self._healthy(conn, idle_since):
+                self._discard(conn)
+                continue
+            break
+
+        waited = time.monotonic() - started
+        metrics.incr("db.pool.checkouts", pool=self.name)
+        metrics.incr("db.pool.wait_seconds", amount=waited, pool=self.name)
+        self._publish()
+        return conn
+
+    def putconn(self, conn: PgConnection, *, discard: bool = False) -> None:
+        """Return ``conn`` to the pool; broken ones (or any after ``close()``) are closed."""
+
+        if not discard:
+            discard = not self._reset(conn)
+        with self._cond:
+            self._in_use -= 1
+            keep = not discard and not self._closed
+            if keep:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                self._size -= 1
+            self._cond.notify()
+        if not keep:
+            _close_quietly(conn)
+            if discard:
+                metrics.incr("db.pool.discarded", pool=self.name)
+        self._publish()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[PgConnection]:
+        conn = self.getconn(timeout)
+        try:
+            yield conn
+        except BaseException:
+            self.putconn(conn, discard=conn.closed != 0)
+            raise
+        self.putconn(conn)
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones are closed when returned."""
+
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            _close_quietly(conn)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "size": self._size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "max_size": self.max_size,
+                "utilization": self._in_use / self.max_size,
+            }
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    def _reserve(self, deadline: float) -> Tuple[Optional[PgConnection], float, bool]:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError(f"Connection pool '{self.name}' is closed")
+                self._trim_idle()
+                if self._idle:
+                    conn, idle_since = self._idle.pop()
+                    self._in_use += 1
+                    return conn, idle_since, False
+                if self._size < self.max_size:
+                    self._size += 1
+                    self._in_use += 1
+                    return None, 0.0, True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    metrics.incr("db.pool.timeouts", pool=self.name)
+                    raise PoolTimeout(
+                        f"No connection available in pool '{self.name}' "
+                        f"(max_size={self.max_size}) within {self.timeout:.1f}s"
+                    )
+                self._cond.wait(remaining)
+
+    def _trim_idle(self) -> None:
+        # Idle list is LIFO, so the stalest connections sit at the front
+        cutoff = time.monotonic() - self.max_idle
+        while len(self._idle) > self.min_size and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.pop(0)
+            self._size -= 1
+            _close_quietly(conn)
+
+    def _release_slot(self) -> None:
+        with self._cond:
+            self._in_use -= 1
+            self._size -= 1
+            self._cond.notify()
+
+    def _discard(self, conn: PgConnection) -> None:
+        self._release_slot()
+        _close_quietly(conn)
+        metrics.incr("db.pool.discarded", pool=self.name)
+
+    def _healthy(self, conn: PgConnection, idle_since: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception as exc:
+            log.warning(
+                "Discarding unhealthy pooled connection",
+                extra={"pool": self.name, "error": str(exc)},
+            )
+            return False
+
+    @staticmethod
+    def _reset(conn: PgConnection) -> bool:
+        """Leave ``conn`` idle and outside a transaction; ``False`` if it is unusable."""
+
+        if conn.closed:
+            return False
+        try:
+            status = conn.info.transaction_status
+            if status == extensions.TRANSACTION_STATUS_IDLE:
+                return True
+            if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                return False
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _publish(self) -> None:
+        stats = self.stats()
+        metrics.set_gauge("db.pool.size", stats["size"], pool=self.name)
+        metrics.set_gauge("db.pool.in_use", stats["in_use"], pool=self.name)
+        metrics.set_gauge("db.pool.utilization", stats["utilization"], pool=self.name)
+
+
+def _close_quietly(conn: PgConnection) -> None:
+    try:
+        conn.close()
+    except Exception:  # pragma: no cover - defensive cleanup
+        pass
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+_POOL: Optional[ConnectionPool] = None
+_POOL_PID: Optional[int] = None
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide pool for ``DB_URL`` (re-created after a fork)."""
+
+    global _POOL, _POOL_PID, _EXECUTOR
+    pid = os.getpid()
+    if _POOL is not None and _POOL_PID == pid:
+        return _POOL
+    with _LOCK:
+        if _POOL is None or _POOL_PID != pid:
+            _POOL = ConnectionPool(
+                os.getenv("DB_URL"),
+                min_size=int(_env_number("DB_POOL_MIN", 1)),
+                max_size=int(_env_number("DB_POOL_MAX", 10)),
+                timeout=_env_number("DB_POOL_TIMEOUT", 30.0),
+                health_check_interval=_env_number("DB_POOL_HEALTHCHECK_SECONDS", 30.0),
+                max_idle=_env_number("DB_POOL_MAX_IDLE_SECONDS", 300.0),
+            )
+            _POOL_PID = pid
+            _EXECUTOR = None
+        return _POOL
+
+
+def close_pool() -> None:
+    """Close the process-wide pool and its async executor (tests, shutdown)."""
+
+    global _POOL, _EXECUTOR
+    with _LOCK:
+        pool, executor = _POOL, _EXECUTOR
+        _POOL, _EXECUTOR = None, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+    if pool is not None:
+        pool.close()
+
+
+def get_conn() -> PgConnection:
+    """Return a process-wide psycopg2 connection using ``DB_URL``.
+
+    Legacy helper for callers that keep a connection open across calls.
+    Prefer ``transaction()`` / ``connection()``, which use the pool.
+    """
 
     global _CONN
-    if _CONN is not None:
+    if _CONN is not None and not _CONN.closed:
         return _CONN
     with _LOCK:
-        if _CONN is None:
+        if _CONN is None or _CONN.closed:
             _CONN = psycopg2.connect(os.getenv("DB_URL"))
         return _CONN
 
 
 @contextmanager
-def transaction():
-    """Context manager that wraps a database transaction."""
+def connection() -> Iterator[PgConnection]:
+    """Check out a pooled connection for the duration of the block."""
 
-    conn = get_conn()
-    try:
+    with get_pool().connection() as conn:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
 
 
-__all__ = ["get_conn", "transaction"]
+@contextmanager
+def transaction():
+    """Context manager that wraps a database transaction on a pooled connection."""
+
+    with get_pool().connection() as conn:
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    pool = get_pool()
+    if _EXECUTOR is not None:
+        return _EXECUTOR
+    with _LOCK:
+        if _EXECUTOR is None:
+            # One thread per pooled connection: async callers queue here
+            # instead of tying up event-loop threads waiting on the pool.
+            _EXECUTOR = ThreadPoolExecutor(max_workers=pool.max_size, thread_name_prefix="db-pool")
+        return _EXECUTOR
+
+
+async def run_async(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run blocking DB code ``fn`` off the event loop on the pool's executor."""
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor(), functools.partial(fn, *args, **kwargs))
+
+
+async def transaction_async(fn: Callable[[PgConnection], T]) -> T:
+    """Async variant of ``transaction()``: run ``fn(conn)`` in one pooled transaction."""
+
+    def _run() -> T:
+        with transaction() as conn:
+            return fn(conn)
+
+    return await run_async(_run)
+
+
+__all__ = [
+    "ConnectionPool",
+    "PoolTimeout",
+    "close_pool",
+    "connection",
+    "get_conn",
+    "get_pool",
+    "run_async",
+    "transaction",
+    "transaction_async",
+]
@@ -1,8 +1,34 @@
 """Lightweight DSL compiler and execution engine bindings."""
 
-from src.core_kernel.execution_engine import ExecutionEngine
-from src.core_kernel.pipeline_compiler import CompiledPipeline, CompiledStep, PipelineCompiler
-from src.core_kernel.registry import ComponentRegistry
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.core_kernel.execution_engine import ExecutionEngine
+    from src.core_kernel.pipeline_compiler import CompiledPipeline, CompiledStep, PipelineCompiler
+    from src.core_kernel.registry import ComponentRegistry
+
+# Exports are resolved on first access so importing a leaf module such as
+# ``src.core_kernel.utils`` does not load the compiler and its schema deps.
+_EXPORTS = {
+    "CompiledPipeline": "src.core_kernel.pipeline_compiler",
+    "CompiledStep": "src.core_kernel.pipeline_compiler",
+    "ComponentRegistry": "src.core_kernel.registry",
+    "ExecutionEngine": "src.core_kernel.execution_engine",
+    "PipelineCompiler": "src.core_kernel.pipeline_compiler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "CompiledPipeline",
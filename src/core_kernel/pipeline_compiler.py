@@ -2,15 +2,15 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
-import jsonschema
 import yaml
-from jsonschema import ValidationError
 
 from src.common.logging_utils import get_logger
 from src.core_kernel.registry import Component, ComponentRegistry
+from src.pipeline.compile_cache import CompileCache
 
 log = get_logger(__name__)
 
@@ -67,6 +67,7 @@ def _load_pipeline_yaml(path: Path) -> Dict[str, Any]:
     return raw
 
 
+@lru_cache(maxsize=1)
 def _load_pipeline_schema() -> Dict[str, Any]:
     """Load the JSON schema used to validate pipeline DSL definitions."""
 
@@ -77,6 +78,9 @@ def _load_pipeline_schema() -> Dict[str, Any]:
 def _validate_pipeline(raw: Dict[str, Any], path: Path) -> None:
     """Validate parsed pipeline YAML against the DSL schema."""
 
+    import jsonschema
+    from jsonschema import ValidationError
+
     schema = _load_pipeline_schema()
     try:
         jsonschema.validate(instance=raw, schema=schema)
@@ -86,6 +90,14 @@ def _validate_pipeline(raw: Dict[str, Any], path: Path) -> None:
         raise ValueError(msg) from exc
 
 
+def load_pipeline_definition(path: Path) -> Dict[str, Any]:
+    """Parse a pipeline YAML file and validate it against the DSL schema."""
+
+    raw = _load_pipeline_yaml(path)
+    _validate_pipeline(raw, path)
+    return raw
+
+
 class PipelineCompiler:
     """Compile pipeline DSL files into executable structures."""
 
@@ -105,8 +117,7 @@ class PipelineCompiler:
             ValueError: If validation fails or the pipeline is missing steps.
         """
 
-        raw = _load_pipeline_yaml(pipeline_path)
-        _validate_pipeline(raw, pipeline_path)
+        raw = load_pipeline_definition(pipeline_path)
 
         pipeline_block = raw.get("pipeline") or {}
         name = pipeline_block.get("name") or pipeline_path.stem
@@ -152,3 +163,26 @@ class PipelineCompiler:
             raise ValueError(f"Pipeline {name} has no steps defined")
 
         return CompiledPipeline(name=name, description=description, steps=steps, variants=variants)
+
+
+def _build_from_files(
+    pipeline_path: Path, registry_path: Path
+) -> Tuple[ComponentRegistry, CompiledPipeline]:
+    registry = ComponentRegistry.from_yaml(Path(registry_path))
+    return registry, PipelineCompiler(registry).compile_from_file(Path(pipeline_path))
+
+
+_COMPILED: CompileCache[Tuple[ComponentRegistry, CompiledPipeline]] = CompileCache(
+    _build_from_files, name="core_kernel"
+)
+
+
+def compile_pipeline_file(
+    pipeline_path: Path, registry_path: Path
+) -> Tuple[ComponentRegistry, CompiledPipeline]:
+    """Registry and compiled pipeline for the two files, reused until either file's content changes.
+
+    Both are shared between callers and must not be mutated.
+    """
+
+    return _COMPILED.get(pipeline_path, registry_path)
@@ -6,7 +6,7 @@ Kept tiny on purpose, to avoid circular imports.
 
 from __future__ import annotations
 
-from typing import Iterable, List, TypeVar
+from typing import Iterable, Iterator, List, TypeVar
 
 T = TypeVar("T")
 
@@ -26,3 +26,18 @@ def chunked(iterable: Iterable[T], size: int) -> List[List[T]]:
     if buf:
         out.append(buf)
     return out
+
+
+def iter_chunks(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Lazy counterpart of `chunked`: yields each chunk as soon as it is full,
+    so streaming producers are never materialized as a whole.
+    """
+    buf: List[T] = []
+    for item in iterable:
+        buf.append(item)
+        if len(buf) >= size:
+            yield buf
+            buf = []
+    if buf:
+        yield buf
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from src.common.db import get_conn, transaction
+from src.common.db import transaction
 from src.common.settings import get_runtime_env
 
 log = logging.getLogger(__name__)
@@ -36,8 +36,7 @@ def _ensure_table(cur) -> None:
 def schema_version_table_exists() -> bool:
     """Return ``True`` if the ``scraper.schema_version`` table exists."""
 
-    conn = get_conn()
-    with conn, conn.cursor() as cur:
+    with transaction() as conn, conn.cursor() as cur:
         cur.execute("SELECT to_regclass('scraper.schema_version');")
         return cur.fetchone()[0] is not None
 
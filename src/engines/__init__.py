@@ -2,7 +2,7 @@
 Engine selection helpers and unified engine interface.
 
 This module provides a thin abstraction so scrapers can choose
-which engine to use (selenium / http / playwright / groq_browser) based on the
+which engine to use (selenium / http / async_http / playwright / groq_browser) based on the
 per-source config, instead of hardcoding selenium everywhere.
 """
 
@@ -12,14 +12,14 @@ import importlib
 from typing import Any, Mapping, Literal, TYPE_CHECKING, Callable
 
 from .base_engine import BaseEngine, EngineConfig, EngineError, EngineResult, RateLimitError
-from .engine_factory import create_engine
 from .rate_limiter import SimpleRateLimiter
 
 if TYPE_CHECKING:
+    from .engine_factory import create_engine
     from .http_client import HttpRequestConfig
 
 
-EngineType = Literal["selenium", "http", "playwright", "groq_browser"]
+EngineType = Literal["selenium", "http", "async_http", "playwright", "groq_browser"]
 
 
 def _normalize_engine_type(raw: str | None) -> EngineType:
@@ -28,6 +28,8 @@ def _normalize_engine_type(raw: str | None) -> EngineType:
     raw = raw.strip().lower()
     if raw in ("http", "requests", "rest"):
         return "http"
+    if raw in ("async_http", "http_async", "httpx"):
+        return "async_http"
     if raw in ("playwright", "pw"):
         return "playwright"
     if raw in ("groq", "groq_browser", "groq-browser", "browserbase"):
@@ -43,7 +45,7 @@ def get_engine_type_for_source(source_config: Mapping[str, Any]) -> EngineType:
     Expects config structure like:
 
         engine:
-          type: selenium | http | playwright
+          type: selenium | http | async_http | playwright
     """
     engine_cfg = source_config.get("engine") or {}
     return _normalize_engine_type(engine_cfg.get("type"))
@@ -71,6 +73,16 @@ def build_rate_limiter_from_config(global_config: Mapping[str, Any]) -> SimpleRa
     return SimpleRateLimiter(min_delay=float(min_delay), max_delay=float(max_delay))
 
 
+def __getattr__(name: str) -> Any:
+    # The factory is resolved on first use so importing any engine submodule
+    # does not drag in every engine's dependencies (selenium, httpx, groq).
+    if name == "create_engine":
+        from .engine_factory import create_engine
+
+        return create_engine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _import_engine_module(module: str, dependency_hint: str | None = None):
     """
     Import an engine submodule lazily so optional deps don't break imports.
@@ -97,6 +109,13 @@ def get_http_engine() -> tuple[Callable[..., Any], "HttpRequestConfig"]:
     return http_client.send_request, http_client.HttpRequestConfig
 
 
+def get_async_http_engine():
+    """
+    Convenience wrapper returning the pooled asyncio HTTP engine class.
+    """
+    return _import_engine_module("async_http_engine", dependency_hint="httpx").AsyncHttpEngine
+
+
 def get_selenium_engine():
     """
     Convenience wrapper to access selenium helpers in a single place.
@@ -128,6 +147,7 @@ __all__ = [
     "get_engine_type_for_source",
     "build_rate_limiter_from_config",
     "get_http_engine",
+    "get_async_http_engine",
     "get_selenium_engine",
     "get_playwright_engine",
     "get_groq_browser_engine",
@@ -0,0 +1,298 @@
+"""
+Asyncio HTTP engine with pooled keep-alive connections.
+
+``AsyncHttpEngine`` implements the ``BaseEngine`` contract on top of
+``httpx.AsyncClient`` and adds a ``fetch_many`` batch API:
+
+- one keep-alive connection pool per proxy (clients are reused across calls)
+- bounded concurrency overall and per host
+- the same retry/backoff semantics as ``BaseEngine.fetch_with_retry``
+
+The synchronous entry points (``fetch``, ``fetch_with_retry``, ``fetch_many``)
+drive an engine-owned event loop so connection pools stay warm between calls.
+Async callers use ``afetch``/``afetch_with_retry``/``afetch_many`` on their own
+loop; pools are tracked per loop because httpx clients are loop-bound.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Union
+from urllib.parse import urlsplit
+
+from src.common.logging_utils import get_logger, safe_log
+from src.engines.base_engine import (
+    BaseEngine,
+    EngineConfig,
+    EngineError,
+    EngineResult,
+    RateLimitError,
+)
+
+try:  # pragma: no cover - import guard
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without httpx
+    httpx = None  # type: ignore[assignment]
+
+log = get_logger("async-http-engine")
+
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_MAX_PER_HOST = 8
+
+
+@dataclass
+class _LoopState:
+    """Connection pools and semaphores bound to a single event loop."""
+
+    global_slots: asyncio.Semaphore
+    clients: Dict[Optional[str], "httpx.AsyncClient"] = field(default_factory=dict)
+    host_slots: Dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+
+class AsyncHttpEngine(BaseEngine):
+    """Concurrent HTTP engine using httpx with per-proxy keep-alive pools."""
+
+    def __init__(
+        self,
+        config: EngineConfig,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+    ):
+        if httpx is None:
+            raise RuntimeError(
+                "The async_http_engine requires the 'httpx' package. "
+                "Install it or disable that engine."
+            )
+        super().__init__(config)
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_per_host = max(1, min(int(max_per_host), self.max_concurrency))
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sync_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ------------------------------------------------------------------ #
+    # Pools
+    # ------------------------------------------------------------------ #
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = _LoopState(global_slots=asyncio.Semaphore(self.max_concurrency))
+            self._states[loop] = state
+        return state
+
+    def _client(self, state: _LoopState, proxy: Optional[str]) -> "httpx.AsyncClient":
+        client = state.clients.get(proxy)
+        if client is None:
+            client = httpx.AsyncClient(
+                proxy=proxy,
+                headers=self.config.headers,
+                timeout=self.config.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+            state.clients[proxy] = client
+        return client
+
+    def _host_slot(self, state: _LoopState, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        slot = state.host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_per_host)
+            state.host_slots[host] = slot
+        return slot
+
+    # ------------------------------------------------------------------ #
+    # Async API
+    # ------------------------------------------------------------------ #
+
+    async def afetch(
+        self, url: str, method: str = "GET", *, proxy: Optional[str] = None, **kwargs: Any
+    ) -> EngineResult:
+        """Single request (no retries), bounded by the global and per-host limits."""
+        if self._closed:
+            raise EngineError("Engine has been closed")
+
+        state = self._state()
+        proxy = proxy if proxy is not None else self.config.proxy
+        client = self._client(state, proxy)
+
+        # Host slot first: waiting on a busy host must not park a global slot
+        async with self._host_slot(state, url), state.global_slots:
+            try:
+                start = time.time()
+                response = await client.request(method, url, **kwargs)
+                elapsed = time.time() - start
+            except httpx.TimeoutException as exc:
+                raise EngineError(f"Request timeout: {exc}", url=url) from exc
+            except httpx.TransportError as exc:
+                raise EngineError(f"Connection error: {exc}", url=url) from exc
+            except httpx.HTTPError as exc:
+                raise EngineError(f"Request failed: {exc}", url=url) from exc
+
+        if response.status_code == 429:
+            raise RateLimitError(
+                f"Rate limited: {response.status_code}",
+                url=url,
+                status_code=response.status_code,
+            )
+        if response.status_code >= 500:
+            raise EngineError(
+                f"Server error: {response.status_code}",
+                url=url,
+                status_code=response.status_code,
+            )
+
+        return EngineResult(
+            url=str(response.url),
+            status_code=response.status_code,
+            content=response.text,
+            headers=dict(response.headers),
+            elapsed_seconds=elapsed,
+            metadata={
+                "method": method,
+                "final_url": str(response.url),
+                "http_version": response.http_version,
+                "proxy": proxy,
+            },
+        )
+
+    async def afetch_with_retry(self, url: str, **kwargs: Any) -> EngineResult:
+        """Async counterpart of ``BaseEngine.fetch_with_retry``."""
+        attempt = 0
+        last_error: Optional[Exception] = None
+
+        while attempt <= self.config.max_retries:
+            await self._await_rate_limiter()
+
+            try:
+                return await self.afetch(url, **kwargs)
+            except RateLimitError as exc:
+                last_error = exc
+                safe_log(
+                    log,
+                    "warning",
+                    "Rate limit detected",
+                    extra={"url": url, "attempt": attempt},
+                )
+                if attempt < self.config.max_retries:
+                    await asyncio.sleep(self._calculate_backoff(attempt) * 2)
+            except Exception as exc:
+                last_error = exc
+                if not self._is_transient(attempt, exc):
+                    break
+
+                safe_log(
+                    log,
+                    "warning",
+                    "Fetch failed, retrying",
+                    extra={
+                        "url": url,
+                        "attempt": attempt,
+                        "error": type(exc.__cause__ or exc).__name__,
+                    },
+                )
+
+            attempt += 1
+            if attempt <= self.config.max_retries:
+                await asyncio.sleep(self._calculate_backoff(attempt))
+
+        raise EngineError(
+            f"Failed to fetch {url} after {self.config.max_retries} retries",
+            url=url,
+            retries_exhausted=True,
+        ) from last_error
+
+    async def afetch_many(
+        self, urls: Iterable[str], **kwargs: Any
+    ) -> List[Union[EngineResult, EngineError]]:
+        """Fetch URLs concurrently; results are returned in input order.
+
+        Failed URLs yield their ``EngineError`` instead of raising, so one bad
+        page does not abort the batch.
+        """
+
+        async def _one(url: str) -> Union[EngineResult, EngineError]:
+            try:
+                return await self.afetch_with_retry(url, **kwargs)
+            except EngineError as exc:
+                return exc
+
+        return list(await asyncio.gather(*(_one(url) for url in urls)))
+
+    async def aclose(self) -> None:
+        """Close the pools owned by the running loop."""
+        state = self._states.pop(asyncio.get_running_loop(), None)
+        if state:
+            await asyncio.gather(*(client.aclose() for client in state.clients.values()))
+
+    # ------------------------------------------------------------------ #
+    # BaseEngine contract (sync)
+    # ------------------------------------------------------------------ #
+
+    def fetch(self, url: str, method: str = "GET", **kwargs: Any) -> EngineResult:
+        return self._run(self.afetch(url, method=method, **kwargs))
+
+    def fetch_with_retry(self, url: str, **kwargs: Any) -> EngineResult:
+        return self._run(self.afetch_with_retry(url, **kwargs))
+
+    def fetch_many(
+        self, urls: Iterable[str], **kwargs: Any
+    ) -> List[Union[EngineResult, EngineError]]:
+        """Synchronous wrapper around :meth:`afetch_many`."""
+        return self._run(self.afetch_many(list(urls), **kwargs))
+
+    def cleanup(self) -> None:
+        """Close pooled connections and the engine-owned loop."""
+        if self._sync_loop is not None and not self._sync_loop.is_closed():
+            self._sync_loop.run_until_complete(self.aclose())
+            self._sync_loop.close()
+        self._sync_loop = None
+        self._mark_closed()
+
+    # ------------------------------------------------------------------ #
+    # Helpers
+    # ------------------------------------------------------------------ #
+
+    def _run(self, coro: Any) -> Any:
+        if self._sync_loop is None or self._sync_loop.is_closed():
+            self._sync_loop = asyncio.new_event_loop()
+        return self._sync_loop.run_until_complete(coro)
+
+    def _is_transient(self, attempt: int, error: Exception) -> bool:
+        """Apply ``BaseEngine._should_retry`` to the underlying transport error.
+
+        Transport failures are wrapped in ``EngineError``; the base heuristic
+        keys on the exception name, so it is applied to the cause. 5xx
+        responses are treated as transient as well.
+        """
+        if attempt >= self.config.max_retries:
+            return False
+        if isinstance(error, EngineError) and (error.status_code or 0) >= 500:
+            return True
+        return self._should_retry(attempt, error.__cause__ or error)
+
+    async def _await_rate_limiter(self) -> None:
+        limiter = self.config.rate_limiter
+        if limiter is None:
+            return
+        async_wait = getattr(limiter, "async_wait", None)
+        if async_wait is not None:
+            result = async_wait()
+            if inspect.isawaitable(result):
+                await result
+            return
+        await asyncio.to_thread(limiter.wait)
+
+
+__all__ = ["AsyncHttpEngine", "DEFAULT_MAX_CONCURRENCY", "DEFAULT_MAX_PER_HOST"]
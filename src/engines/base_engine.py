@@ -27,7 +27,7 @@ class EngineConfig:
     retry_backoff: float = 1.0
     retry_jitter: float = 0.5
     headers: Optional[Dict[str, str]] = None
-    rate_limiter: Optional[Any] = None  # SimpleRateLimiter
+    rate_limiter: Optional[Any] = None  # anything with wait() (and optionally async_wait())
 
 
 @dataclass
@@ -6,15 +6,17 @@ This provides dependency injection and unified engine creation.
 
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 from src.common.logging_utils import get_logger
 from src.engines.base_engine import BaseEngine, EngineConfig
-from src.engines.groq_browser import GroqBrowserAutomationClient
-from src.engines.http_engine import HttpEngine
-from src.engines.rate_limiter import SimpleRateLimiter
-from src.engines.selenium_engine import BrowserSession, create_driver, open_with_session
-from src.sessions.session_manager import SessionRecord
+
+if TYPE_CHECKING:
+    from src.engines.selenium_engine import BrowserSession
+    from src.sessions.session_manager import SessionRecord
+
+# Engine implementations are imported inside create_engine / the wrappers, so
+# that asking for an HTTP engine never imports selenium, httpx or groq.
 
 log = get_logger("engine-factory")
 
@@ -30,7 +32,7 @@ def create_engine(
     Create an engine instance based on type and configuration.
 
     Args:
-        engine_type: Engine type ('http', 'selenium', 'playwright', 'groq_browser')
+        engine_type: Engine type ('http', 'async_http', 'selenium', 'playwright', 'groq_browser')
         source_config: Source configuration dict
         proxy: Optional proxy string
         session_record: Optional session record for browser engines
@@ -44,11 +46,15 @@ def create_engine(
     engine_cfg = source_config.get("engine", {})
     rate_limit_cfg = source_config.get("rate_limits", {})
 
-    # Build rate limiter if configured
-    rate_limiter: Optional[SimpleRateLimiter] = None
-    if rate_limit_cfg.get("max_qps"):
-        min_delay = 1.0 / rate_limit_cfg["max_qps"]
-        rate_limiter = SimpleRateLimiter(min_delay=min_delay, max_delay=min_delay * 2)
+    # Shared per-source token bucket so every engine for a source draws
+    # from the same QPS/concurrency budget
+    rate_limiter: Optional[Any] = None
+    if rate_limit_cfg.get("max_qps") or rate_limit_cfg.get("max_concurrent"):
+        from src.resource_manager.rate_limiter import get_rate_limiter
+
+        rate_limiter = get_rate_limiter(
+            source_config.get("source") or "default", settings=rate_limit_cfg
+        )
 
     # Build engine config
     config = EngineConfig(
@@ -63,8 +69,23 @@ def create_engine(
     engine_type = engine_type.lower().strip()
 
     if engine_type in ("http", "requests", "rest"):
+        from src.engines.http_engine import HttpEngine
+
         return HttpEngine(config)
 
+    elif engine_type in ("async_http", "http_async", "httpx"):
+        from src.engines.async_http_engine import (
+            DEFAULT_MAX_CONCURRENCY,
+            DEFAULT_MAX_PER_HOST,
+            AsyncHttpEngine,
+        )
+
+        return AsyncHttpEngine(
+            config,
+            max_concurrency=int(engine_cfg.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)),
+            max_per_host=int(engine_cfg.get("max_per_host", DEFAULT_MAX_PER_HOST)),
+        )
+
     elif engine_type in ("selenium", "chrome", "webdriver"):
         # Selenium engine is special - it returns BrowserSession, not BaseEngine
         # We'll create a wrapper or use it directly
@@ -96,6 +117,8 @@ class SeleniumEngineWrapper(BaseEngine):
 
     def fetch(self, url: str, **kwargs: Any) -> Any:  # Returns EngineResult
         """Fetch using Selenium."""
+        from src.engines.selenium_engine import open_with_session
+
         if not self._browser_session:
             self._browser_session = open_with_session(url, self.session_record)
         else:
@@ -125,6 +148,8 @@ class GroqBrowserEngineWrapper(BaseEngine):
     """Wrapper to make Groq browser automation work as BaseEngine."""
 
     def __init__(self, config: EngineConfig, api_key: Optional[str] = None):
+        from src.engines.groq_browser import GroqBrowserAutomationClient
+
         super().__init__(config)
         self._client = GroqBrowserAutomationClient(api_key=api_key)
 
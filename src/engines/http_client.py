@@ -12,6 +12,7 @@ This is intentionally simple but robust:
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Sequence
@@ -65,6 +66,21 @@ class HttpResult:
     elapsed_seconds: float
 
 
+_thread_local = threading.local()
+
+
+def _default_session() -> requests.Session:
+    """
+    Per-thread shared session so callers that don't pass one still get
+    keep-alive connection reuse instead of a fresh pool per request.
+    """
+    sess = getattr(_thread_local, "session", None)
+    if sess is None:
+        sess = requests.Session()
+        _thread_local.session = sess
+    return sess
+
+
 def _build_proxies(proxy: Optional[str]) -> Optional[Dict[str, str]]:
     """
     Convert a single proxy string into the requests proxies dict.
@@ -93,7 +109,7 @@ def send_request(
         RuntimeError if all retries are exhausted or status is not allowed.
     """
 
-    sess = session or requests.Session()
+    sess = session or _default_session()
     proxies = _build_proxies(cfg.proxy)
 
     attempt = 0
@@ -1,9 +1,22 @@
-import random
-import time
+"""
+Per-engine request pacing.
 
-class SimpleRateLimiter:
-    def __init__(self, min_delay: float = 1.0, max_delay: float = 3.0):
+``SimpleRateLimiter`` keeps its historical ``min_delay``/``max_delay``
+interface but is now a leaky bucket: consecutive calls are spaced by
+``min_delay`` plus up to ``max_delay - min_delay`` of jitter, and a caller
+only waits for whatever remains of that spacing since the previous call.
+"""
+from __future__ import annotations
+
+from src.utils.token_bucket import LeakyBucket
+
+
+class SimpleRateLimiter(LeakyBucket):
+    def __init__(self, min_delay: float = 1.0, max_delay: float = 3.0, *, key: str = "engine"):
+        super().__init__(
+            max(0.0, min_delay),
+            jitter=max(0.0, max_delay - min_delay),
+            key=key,
+        )
         self.min_delay = min_delay
         self.max_delay = max_delay
-    def wait(self):
-        time.sleep(random.uniform(self.min_delay, self.max_delay))
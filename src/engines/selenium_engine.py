@@ -3,12 +3,6 @@ import random
 import time
 from typing import Mapping, Optional
 
-from selenium import webdriver
-from selenium.common.exceptions import WebDriverException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-
 from src.common.logging_utils import get_logger, sanitize_for_log, safe_log
 from src.sessions.session_manager import SessionRecord
 
@@ -91,6 +85,8 @@ class BrowserSession:
             try:
                 self.driver.get(url)
                 if _looks_rate_limited(self.driver):
+                    from selenium.common.exceptions import WebDriverException
+
                     raise WebDriverException("rate limited or blocked")
                 _sleep_with_jitter(wait, jitter)
                 return
@@ -122,6 +118,16 @@ class BrowserSession:
         if last_exc:
             raise last_exc
 
+
+def __getattr__(name: str):
+    # Kept importable from here for callers that catch it; resolved lazily with selenium
+    if name == "WebDriverException":
+        from selenium.common.exceptions import WebDriverException
+
+        return WebDriverException
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _use_fake_driver() -> bool:
     """Check if fake driver mode is enabled via environment variable."""
     return os.getenv(FAKE_BROWSER_ENV, "").lower() in {"1", "true", "yes", "on"}
@@ -143,6 +149,8 @@ def _get_chromedriver_path() -> str:
         return env_path
 
     if _CHROMEDRIVER_PATH is None:
+        from webdriver_manager.chrome import ChromeDriverManager
+
         _CHROMEDRIVER_PATH = ChromeDriverManager().install()
         log.info("Resolved chromedriver via ChromeDriverManager: %s", _CHROMEDRIVER_PATH)
     return _CHROMEDRIVER_PATH
@@ -205,6 +213,11 @@ def create_driver(proxy: Optional[str] = None):
         log.info("Using FakeDriver (env %s)", FAKE_BROWSER_ENV)
         return FakeDriver()
 
+    # selenium is only imported once a real browser is needed
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
     opts = Options()
     opts.add_argument("--headless=new")
     opts.add_argument("--disable-gpu")
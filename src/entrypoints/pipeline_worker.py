@@ -0,0 +1,676 @@
+"""
+Long-lived worker that runs scraper pipelines for Airflow tasks.
+
+Each ``dags/scraper_*`` task used to start a fresh interpreter, re-import the
+scraper stack, re-read ``dsl/components.yaml`` and recompile the pipeline
+before fetching anything. The worker keeps that state warm instead:
+
+* compiled pipelines, from the content-hash compile cache
+  (``src.pipeline.compile_cache``), recompiled only when ``components.yaml``
+  or the pipeline file changes;
+* the config cache and every component module, imported once at start-up;
+  component modules that define ``prewarm()`` (e.g. the AlfaBeta pipeline's
+  PCID index) are prewarmed too;
+* process-wide singletons such as the default ``ResourceManager``.
+
+Runs arrive over HTTP, either on a Unix socket or on a local TCP port, and go
+through a bounded queue served by ``max_concurrency`` threads. A full queue
+answers 429, and callers back off and resubmit. A draining worker answers
+503, and callers run in-process, as they do when no worker is reachable.
+SIGTERM/SIGINT drain the queue before exiting.
+
+Endpoints (JSON bodies):
+    POST /runs             submit ``{"source": ..., "run_type": ..., ...}`` -> 202 job
+    GET  /runs/<id>?wait=N job state, waiting up to N seconds for completion
+    GET  /health           queue depth, running jobs, warm pipelines
+    POST /drain            stop accepting runs and finish queued ones
+
+Example:
+    python -m src.entrypoints.pipeline_worker --socket /run/scraper/worker.sock --warm alfabeta
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import queue
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from src.common import config_loader
+from src.common.logging_utils import get_logger
+from src.entrypoints.run_pipeline import DSL_ROOT, run_pipeline
+from src.observability import metrics
+from src.pipeline import CompiledPipeline, PipelineRunner, compile_cached
+
+log = get_logger("pipeline-worker")
+
+SOCKET_ENV_VAR = "PIPELINE_WORKER_SOCKET"
+URL_ENV_VAR = "PIPELINE_WORKER_URL"
+
+# How long a caller keeps resubmitting to a full worker before giving up
+BUSY_TIMEOUT_SECONDS = 900.0
+
+RUN_FIELDS = ("source", "run_type", "params", "environment", "jira_issue_key", "airflow_dag_run_id")
+
+
+class WorkerBusyError(RuntimeError):
+    """The run queue is full."""
+
+
+class WorkerDrainingError(RuntimeError):
+    """The worker is draining and no longer accepts runs."""
+
+
+class WorkerUnavailableError(RuntimeError):
+    """No worker is reachable; callers should run in-process."""
+
+
+class WarmPipelineState:
+    """Compiled pipelines for the sources this worker has served or warmed."""
+
+    def __init__(self, dsl_root: Path = DSL_ROOT) -> None:
+        self.dsl_root = Path(dsl_root)
+        self._lock = threading.Lock()
+        self._warm: set = set()
+
+    @property
+    def components_path(self) -> Path:
+        return self.dsl_root / "components.yaml"
+
+    def pipeline_path(self, source: str) -> Path:
+        return self.dsl_root / "pipelines" / f"{source}.yaml"
+
+    def sources(self) -> List[str]:
+        return sorted(path.stem for path in (self.dsl_root / "pipelines").glob("*.yaml"))
+
+    def compiled(self, source: str) -> CompiledPipeline:
+        """Compiled pipeline for ``source``, recompiled only if a DSL file's content changed."""
+
+        path = self.pipeline_path(source)
+        if not path.exists():
+            raise FileNotFoundError(f"Pipeline file not found: {path}")
+        compiled = compile_cached(path, self.components_path)
+        with self._lock:
+            self._warm.add(source)
+        return compiled
+
+    def warm_sources(self) -> List[str]:
+        with self._lock:
+            return sorted(self._warm)
+
+    def warm(self, sources: Optional[Iterable[str]] = None, env: Optional[str] = None) -> List[str]:
+        """Compile ``sources`` (default: every DSL pipeline) and prewarm their modules.
+
+        Sources that fail to compile are logged and skipped. Returns the
+        sources that are warm.
+        """
+
+        config_loader.prewarm(env)
+        warmed: List[str] = []
+        prewarmed: set = set()
+        for source in sources or self.sources():
+            try:
+                compiled = self.compiled(source)
+            except (FileNotFoundError, ImportError, ValueError) as exc:
+                log.warning("Worker warm-up: skipping pipeline %s: %s", source, exc)
+                continue
+            for step in compiled.steps:
+                module = sys.modules.get(getattr(step.callable, "__module__", "") or "")
+                hook = getattr(module, "prewarm", None)
+                if module is None or not callable(hook) or module.__name__ in prewarmed:
+                    continue
+                prewarmed.add(module.__name__)
+                try:
+                    hook()
+                except Exception as exc:  # pragma: no cover - best effort
+                    log.warning("Worker warm-up: %s.prewarm failed: %s", module.__name__, exc)
+            warmed.append(source)
+        log.info(
+            "Pipeline worker warm",
+            extra={"sources": warmed, "prewarmed_modules": sorted(prewarmed)},
+        )
+        return warmed
+
+
+@dataclass
+class RunJob:
+    """A queued or finished run request."""
+
+    job_id: str
+    request: Dict[str, Any]
+    status: str = "queued"
+    result: Optional[Dict[str, Any]] = None
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "source": self.request.get("source"),
+            "result": self.result,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+_STOP = object()
+
+
+class PipelineWorker:
+    """Bounded run queue in front of a warm :class:`WarmPipelineState`.
+
+    ``submit`` never blocks: it raises :class:`WorkerBusyError` once
+    ``queue_size`` runs are waiting and :class:`WorkerDrainingError` after
+    :meth:`drain` was called. ``run`` is the function executing a request
+    (``run_pipeline`` by default; it receives ``compiled=`` and ``runner=``).
+    """
+
+    def __init__(
+        self,
+        state: Optional[WarmPipelineState] = None,
+        *,
+        max_concurrency: int = 2,
+        queue_size: int = 16,
+        max_finished: int = 1000,
+        run: Callable[..., Dict[str, Any]] = run_pipeline,
+    ) -> None:
+        if max_concurrency < 1 or queue_size < 1:
+            raise ValueError("max_concurrency and queue_size must be at least 1")
+        self.state = state or WarmPipelineState()
+        self.max_concurrency = max_concurrency
+        self.max_finished = max_finished
+        self._run = run
+        self._runner = PipelineRunner()
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._jobs: "OrderedDict[str, RunJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._running = 0
+        self._draining = False
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> "PipelineWorker":
+        if self._threads:
+            return self
+        for index in range(self.max_concurrency):
+            thread = threading.Thread(
+                target=self._serve, name=f"pipeline-worker-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    @property
+    def draining(self) -> bool:
+        return self._draining
+
+    def submit(self, request: Mapping[str, Any]) -> RunJob:
+        if not request.get("source"):
+            raise ValueError("run request needs a 'source'")
+        job = RunJob(
+            job_id=uuid.uuid4().hex, request={k: request[k] for k in RUN_FIELDS if k in request}
+        )
+        with self._lock:
+            if self._draining:
+                metrics.incr("worker.runs.rejected", reason="draining")
+                raise WorkerDrainingError("worker is draining")
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                metrics.incr("worker.runs.rejected", reason="busy")
+                raise WorkerBusyError(
+                    f"run queue is full ({self._queue.maxsize} waiting)"
+                ) from None
+            self._jobs[job.job_id] = job
+            self._trim_finished()
+        metrics.incr("worker.runs.submitted", source=job.request["source"])
+        metrics.set_gauge("worker.queue.depth", self._queue.qsize())
+        return job
+
+    def get(self, job_id: str) -> Optional[RunJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[RunJob]:
+        job = self.get(job_id)
+        if job is not None:
+            job.done.wait(timeout)
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            running = self._running
+        return {
+            "queued": self._queue.qsize(),
+            "queue_size": self._queue.maxsize,
+            "running": running,
+            "max_concurrency": self.max_concurrency,
+            "draining": self._draining,
+            "warm_pipelines": self.state.warm_sources(),
+        }
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Stop accepting runs, finish queued and running ones, then stop the threads.
+
+        Returns ``False`` if runs were still in progress after ``timeout``.
+        """
+
+        with self._lock:
+            self._draining = True
+        log.info("Pipeline worker draining", extra=self.stats())
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+        try:
+            for thread in self._threads:
+                if thread.is_alive():
+                    # Sentinels queue up behind the pending runs, so those finish first
+                    self._queue.put(_STOP, timeout=remaining())
+        except queue.Full:
+            pass
+        for thread in self._threads:
+            thread.join(remaining())
+        drained = not any(thread.is_alive() for thread in self._threads)
+        log.info(
+            "Pipeline worker drained" if drained else "Pipeline worker drain timed out",
+            extra=self.stats(),
+        )
+        return drained
+
+    def _trim_finished(self) -> None:
+        excess = len(self._jobs) - self.max_finished
+        if excess <= 0:
+            return
+        for job_id in [jid for jid, job in self._jobs.items() if job.done.is_set()][:excess]:
+            del self._jobs[job_id]
+
+    def _serve(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                return
+            with self._lock:
+                self._running += 1
+            metrics.set_gauge("worker.queue.depth", self._queue.qsize())
+            job.status = "running"
+            job.started_at = time.time()
+            try:
+                job.result = self._execute(job.request)
+            except Exception as exc:  # pragma: no cover - run_pipeline reports its own failures
+                log.error(
+                    "Pipeline worker run crashed", exc_info=True, extra={"job_id": job.job_id}
+                )
+                job.result = _failed_result(job.request, str(exc))
+            job.finished_at = time.time()
+            job.status = "done"
+            with self._lock:
+                self._running -= 1
+            metrics.incr(
+                "worker.runs.completed",
+                source=job.request["source"],
+                status=str(job.result.get("status")),
+            )
+            job.done.set()
+
+    def _execute(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            compiled = self.state.compiled(request["source"])
+        except (FileNotFoundError, ImportError, ValueError) as exc:
+            log.error("Pipeline worker could not compile %s: %s", request["source"], exc)
+            return _failed_result(request, str(exc))
+        return self._run(**request, compiled=compiled, runner=self._runner)
+
+
+def _failed_result(request: Mapping[str, Any], error: str) -> Dict[str, Any]:
+    return {
+        "status": "failed",
+        "run_id": None,
+        "source": request.get("source"),
+        "item_count": None,
+        "duration": None,
+        "error": error,
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "PipelineWorker/1.0"
+
+    @property
+    def worker(self) -> PipelineWorker:
+        return self.server.worker  # type: ignore[attr-defined]
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Unix-socket peers have no address, which the default implementation indexes
+        log.debug("worker http: " + format, *args)
+
+    def _reply(self, status: int, payload: Mapping[str, Any]) -> None:
+        body = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        data = json.loads(self.rfile.read(length) or b"{}")
+        if not isinstance(data, dict):
+            raise ValueError("request body must be a JSON object")
+        return data
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        url = urlsplit(self.path)
+        if url.path == "/health":
+            self._reply(200, self.worker.stats())
+            return
+        if url.path.startswith("/runs/"):
+            try:
+                wait = float(parse_qs(url.query).get("wait", ["0"])[0])
+            except ValueError:
+                self._reply(400, {"error": "wait must be a number of seconds"})
+                return
+            job = self.worker.wait(url.path[len("/runs/") :], timeout=max(0.0, wait))
+            if job is None:
+                self._reply(404, {"error": "unknown job"})
+            else:
+                self._reply(200, job.to_dict())
+            return
+        self._reply(404, {"error": "not found"})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        url = urlsplit(self.path)
+        if url.path == "/drain":
+            shutdown = self.server.shutdown_gracefully  # type: ignore[attr-defined]
+            threading.Thread(target=shutdown, daemon=True).start()
+            self._reply(202, {"draining": True})
+            return
+        if url.path != "/runs":
+            self._reply(404, {"error": "not found"})
+            return
+        try:
+            job = self.worker.submit(self._body())
+        except (ValueError, json.JSONDecodeError) as exc:
+            self._reply(400, {"error": str(exc)})
+        except WorkerBusyError as exc:
+            self._reply(429, {"error": str(exc)})
+        except WorkerDrainingError as exc:
+            self._reply(503, {"error": str(exc)})
+        else:
+            self._reply(202, job.to_dict())
+
+
+class _ServerMixin:
+    daemon_threads = True
+    worker: PipelineWorker
+    drain_timeout: Optional[float] = None
+
+    def shutdown_gracefully(self) -> None:
+        """Drain the worker, then stop ``serve_forever`` (must not run on the serving thread)."""
+
+        self.worker.drain(self.drain_timeout)
+        self.shutdown()  # type: ignore[attr-defined]
+
+
+class _TCPServer(_ServerMixin, ThreadingHTTPServer):
+    pass
+
+
+class _UnixServer(_ServerMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    pass
+
+
+def make_server(
+    worker: PipelineWorker,
+    *,
+    socket_path: Optional[str] = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    drain_timeout: Optional[float] = None,
+) -> socketserver.BaseServer:
+    """HTTP server for ``worker`` on ``socket_path`` if given, else on ``host:port``."""
+
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server: Any = _UnixServer(socket_path, _Handler)
+    else:
+        server = _TCPServer((host, port), _Handler)
+    server.worker = worker
+    server.drain_timeout = drain_timeout
+    return server
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: Optional[float] = None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class WorkerClient:
+    """Submit runs to a :class:`PipelineWorker` and wait for their results."""
+
+    def __init__(
+        self,
+        *,
+        socket_path: Optional[str] = None,
+        url: Optional[str] = None,
+        timeout: float = 10.0,
+    ) -> None:
+        if not socket_path and not url:
+            raise ValueError("socket_path or url is required")
+        self.socket_path = socket_path
+        self.url = urlsplit(url) if url else None
+        self.timeout = timeout
+
+    @classmethod
+    def from_env(cls) -> Optional["WorkerClient"]:
+        """Client for ``PIPELINE_WORKER_SOCKET`` / ``PIPELINE_WORKER_URL``.
+
+        Returns ``None`` if neither is set.
+        """
+
+        socket_path = os.getenv(SOCKET_ENV_VAR)
+        url = os.getenv(URL_ENV_VAR)
+        if not socket_path and not url:
+            return None
+        return cls(socket_path=socket_path or None, url=url or None)
+
+    def _request(
+        self, method: str, path: str, payload: Any = None, timeout: Optional[float] = None
+    ) -> Tuple[int, Any]:
+        timeout = self.timeout if timeout is None else timeout
+        if self.socket_path:
+            conn: http.client.HTTPConnection = _UnixHTTPConnection(
+                self.socket_path, timeout=timeout
+            )
+        else:
+            conn = http.client.HTTPConnection(
+                self.url.hostname, self.url.port, timeout=timeout  # type: ignore[union-attr]
+            )
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            return response.status, json.loads(response.read() or b"{}")
+        finally:
+            conn.close()
+
+    def health(self) -> Dict[str, Any]:
+        return self._request("GET", "/health")[1]
+
+    def submit(self, **request: Any) -> str:
+        """Queue a run and return its job id.
+
+        Raises :class:`WorkerBusyError` on 429, :class:`WorkerDrainingError` on
+        503, :class:`WorkerUnavailableError` when the worker cannot be reached
+        and ``RuntimeError`` for any other refusal.
+        """
+
+        try:
+            status, payload = self._request("POST", "/runs", request)
+        except OSError as exc:
+            raise WorkerUnavailableError(f"pipeline worker unreachable: {exc}") from exc
+        if status == 202:
+            return payload["job_id"]
+        error = payload.get("error")
+        if status == 429:
+            raise WorkerBusyError(error)
+        if status == 503:
+            raise WorkerDrainingError(error)
+        raise RuntimeError(f"pipeline worker refused run ({status}): {error}")
+
+    def wait(
+        self, job_id: str, *, poll_seconds: float = 30.0, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Long-poll ``job_id`` until it finishes and return its result dict."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = poll_seconds
+            if deadline is not None:
+                wait = max(0.0, min(poll_seconds, deadline - time.monotonic()))
+            status, payload = self._request(
+                "GET", f"/runs/{job_id}?wait={wait:g}", timeout=wait + self.timeout
+            )
+            if status != 200:
+                raise WorkerUnavailableError(f"pipeline worker lost job {job_id} ({status})")
+            if payload["status"] == "done":
+                return payload["result"]
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"pipeline run {job_id} still {payload['status']} after {timeout}s"
+                )
+
+    def run(self, **request: Any) -> Dict[str, Any]:
+        return self.wait(self.submit(**request))
+
+    def drain(self) -> None:
+        self._request("POST", "/drain")
+
+
+def run_pipeline_via_worker(
+    *,
+    busy_timeout: float = BUSY_TIMEOUT_SECONDS,
+    backoff_base: float = 1.0,
+    backoff_max: float = 60.0,
+    **request: Any,
+) -> Dict[str, Any]:
+    """Run on the warm worker when one is configured, else in-process.
+
+    Accepts the keyword arguments of :func:`run_pipeline`. A full worker
+    (429) is retried with exponential backoff for up to ``busy_timeout``
+    seconds, after which :class:`WorkerBusyError` propagates so the task
+    fails and Airflow retries it later. The run only falls back to this
+    process when no worker is reachable or it is draining (503).
+    """
+
+    client = WorkerClient.from_env()
+    if client is None:
+        return run_pipeline(**request)
+
+    deadline = time.monotonic() + busy_timeout
+    delay = backoff_base
+    while True:
+        try:
+            job_id = client.submit(**request)
+        except WorkerBusyError as exc:
+            if time.monotonic() + delay > deadline:
+                raise WorkerBusyError(
+                    f"pipeline worker still busy after {busy_timeout:g}s: {exc}"
+                ) from exc
+            log.info(
+                "Pipeline worker busy; retrying in %.1fs",
+                delay,
+                extra={"source": request.get("source")},
+            )
+            metrics.incr("worker.client.busy_retries")
+            time.sleep(delay)
+            delay = min(backoff_max, delay * 2)
+        except (WorkerUnavailableError, WorkerDrainingError) as exc:
+            log.warning("Pipeline worker unavailable; running in-process: %s", exc)
+            return run_pipeline(**request)
+        else:
+            return client.wait(job_id)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve warm pipeline runs for Airflow tasks")
+    parser.add_argument(
+        "--socket", default=os.getenv(SOCKET_ENV_VAR), help="Unix socket path to listen on"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host when no socket is given")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port when no socket is given")
+    parser.add_argument(
+        "--max-concurrency", type=int, default=2, help="Pipeline runs executed in parallel"
+    )
+    parser.add_argument(
+        "--queue-size", type=int, default=16, help="Runs allowed to wait before 429"
+    )
+    parser.add_argument(
+        "--drain-timeout", type=float, default=None, help="Seconds to wait for runs on shutdown"
+    )
+    parser.add_argument(
+        "--warm", default="", help="Comma-separated sources to precompile (default: all)"
+    )
+    parser.add_argument("--env", default=None, help="Config environment to prewarm")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    worker = PipelineWorker(max_concurrency=args.max_concurrency, queue_size=args.queue_size)
+    worker.state.warm([s for s in args.warm.split(",") if s] or None, env=args.env)
+    worker.start()
+    server = make_server(
+        worker,
+        socket_path=args.socket,
+        host=args.host,
+        port=args.port,
+        drain_timeout=args.drain_timeout,
+    )
+
+    def _on_signal(signum: int, _frame: Any) -> None:
+        log.info("Pipeline worker received signal %s", signum)
+        shutdown = server.shutdown_gracefully  # type: ignore[attr-defined]
+        threading.Thread(target=shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _on_signal)
+    signal.signal(signal.SIGINT, _on_signal)
+    address = args.socket or f"{args.host}:{args.port}"
+    log.info("Pipeline worker listening", extra={"address": address})
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
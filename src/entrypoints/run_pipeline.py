@@ -13,7 +13,14 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 
 from src.common.logging_utils import get_logger
-from src.pipeline import PipelineRunner, PipelineCompiler, UnifiedRegistry
+from src.pipeline import (
+    CompiledPipeline,
+    PipelineRunner,
+    PipelineCompiler,
+    UnifiedRegistry,
+    compile_cached,
+    precompile,
+)
 from src.run_tracking.recorder import RunRecorder
 from src.run_tracking.models import RunRecord
 from pathlib import Path
@@ -24,6 +31,32 @@ log = get_logger("run-pipeline-entrypoint")
 DSL_ROOT = Path(__file__).resolve().parents[2] / "dsl"
 
 
+def pipeline_paths(source: str, dsl_root: Path = DSL_ROOT) -> tuple[Path, Path]:
+    """Return ``(components.yaml, pipelines/<source>.yaml)``, raising if either is missing."""
+    components_yaml = dsl_root / "components.yaml"
+    pipeline_yaml = dsl_root / "pipelines" / f"{source}.yaml"
+
+    if not components_yaml.exists():
+        raise FileNotFoundError(f"DSL components file not found: {components_yaml}")
+
+    if not pipeline_yaml.exists():
+        raise FileNotFoundError(f"Pipeline file not found: {pipeline_yaml}")
+
+    return components_yaml, pipeline_yaml
+
+
+def compile_pipeline(source: str, registry: Optional[UnifiedRegistry] = None) -> CompiledPipeline:
+    """Compile the DSL pipeline for ``source``.
+
+    Without an explicit ``registry`` the result comes from the content-hash
+    compile cache, so it is only recompiled when one of the DSL files changes.
+    """
+    components_yaml, pipeline_yaml = pipeline_paths(source)
+    if registry is None:
+        return compile_cached(pipeline_yaml, components_yaml)
+    return PipelineCompiler(registry).compile_from_file(pipeline_yaml)
+
+
 def run_pipeline(
     source: str,
     run_type: str = "FULL_REFRESH",
@@ -31,11 +64,16 @@ def run_pipeline(
     environment: str = "prod",
     jira_issue_key: Optional[str] = None,
     airflow_dag_run_id: Optional[str] = None,
+    *,
+    compiled: Optional[CompiledPipeline] = None,
+    runner: Optional[PipelineRunner] = None,
 ) -> Dict[str, Any]:
     """
     Execute a scraper pipeline programmatically.
 
     This is the main entry point called by Airflow or other orchestrators.
+    Long-lived callers (see ``pipeline_worker``) pass an already compiled
+    pipeline and a shared runner; otherwise both are built for this call.
 
     Args:
         source: Scraper source name (e.g., 'alfabeta')
@@ -44,13 +82,16 @@ def run_pipeline(
         environment: Environment name ('dev', 'staging', 'prod')
         jira_issue_key: Optional Jira issue key for tracking
         airflow_dag_run_id: Optional Airflow DAG run ID for correlation
+        compiled: Pre-compiled pipeline for ``source``
+        runner: Runner to execute with
 
     Returns:
         Dict with:
-            - status: 'success' or 'failed'
+            - status: 'success', 'partial' or 'failed'
             - run_id: Platform run ID
             - source: Source name
             - item_count: Number of items processed (if available)
+            - duration: Pipeline execution time in seconds (if it ran)
             - error: Error message if failed
     """
     run_id = f"RUN-{datetime.utcnow().strftime('%Y-%m-%d')}-{uuid.uuid4().hex[:6].upper()}"
@@ -68,6 +109,7 @@ def run_pipeline(
         },
     )
 
+    started_at = datetime.utcnow()
     try:
         # Initialize run recorder
         recorder = RunRecorder()
@@ -83,23 +125,11 @@ def run_pipeline(
             },
         )
 
-        # Load DSL components and compile pipeline
-        components_yaml = DSL_ROOT / "components.yaml"
-        pipeline_yaml = DSL_ROOT / "pipelines" / f"{source}.yaml"
-
-        if not components_yaml.exists():
-            raise FileNotFoundError(f"DSL components file not found: {components_yaml}")
-
-        if not pipeline_yaml.exists():
-            raise FileNotFoundError(f"Pipeline file not found: {pipeline_yaml}")
-
-        # Use unified pipeline system
-        registry = UnifiedRegistry.from_yaml(components_yaml)
-        compiler = PipelineCompiler(registry)
-        compiled = compiler.compile_from_file(pipeline_yaml)
+        if compiled is None:
+            compiled = compile_pipeline(source)
 
         # Execute pipeline with unified runner
-        runner = PipelineRunner()
+        runner = runner or PipelineRunner()
         result = runner.run(
             pipeline=compiled,
             source=source,
@@ -115,21 +145,32 @@ def run_pipeline(
         recorder.finish_run(
             run_id=run_id,
             source=source,
-            status="success",
-            metadata={"item_count": item_count, "results": str(results)[:500]},
+            status=result.status,
+            metadata={
+                "item_count": item_count,
+                "results": str(result.step_results)[:500],
+                "error": result.error,
+            },
+            started_at=started_at,
         )
 
         log.info(
-            "Pipeline run completed successfully",
-            extra={"run_id": run_id, "source": source, "item_count": item_count},
+            "Pipeline run completed",
+            extra={
+                "run_id": run_id,
+                "source": source,
+                "status": result.status,
+                "item_count": item_count,
+            },
         )
 
         return {
-            "status": "success",
+            "status": result.status,
             "run_id": run_id,
             "source": source,
             "item_count": item_count,
-            "error": None,
+            "duration": result.duration_seconds,
+            "error": result.error,
         }
 
     except Exception as exc:
@@ -152,6 +193,7 @@ def run_pipeline(
                 source=source,
                 status="failed",
                 metadata={"error": error_msg},
+                started_at=started_at,
             )
         except Exception:
             pass  # Best effort
@@ -161,6 +203,7 @@ def run_pipeline(
             "run_id": run_id,
             "source": source,
             "item_count": None,
+            "duration": None,
             "error": error_msg,
         }
 
@@ -170,7 +213,12 @@ def run_pipeline_cli() -> None:
     import argparse
 
     parser = argparse.ArgumentParser(description="Run a scraper pipeline")
-    parser.add_argument("--source", required=True, help="Source name (e.g., alfabeta)")
+    parser.add_argument("--source", help="Source name (e.g., alfabeta)")
+    parser.add_argument(
+        "--precompile",
+        action="store_true",
+        help="Compile and validate every dsl/pipelines/*.yaml, then exit",
+    )
     parser.add_argument("--run-type", default="FULL_REFRESH", help="Run type")
     parser.add_argument("--environment", default="prod", help="Environment")
     parser.add_argument("--jira-issue-key", help="Jira issue key")
@@ -179,6 +227,18 @@ def run_pipeline_cli() -> None:
 
     args = parser.parse_args()
 
+    if args.precompile:
+        errors = {name: error for name, error in precompile(DSL_ROOT).items() if error}
+        for name, error in sorted(errors.items()):
+            print(f"{name}: {error}")
+        if errors:
+            print(f"Precompile: {len(errors)} pipeline(s) failed")
+        else:
+            print("Precompile: all pipelines valid")
+        exit(1 if errors else 0)
+    if not args.source:
+        parser.error("--source is required unless --precompile is given")
+
     params = {}
     if args.params:
         import json
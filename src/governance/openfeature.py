@@ -3,21 +3,36 @@
 This module keeps feature toggles centralized and makes it easy to stub or
 override values in tests without pulling in an external provider. Flags can be
 overridden via environment variable ``FEATURE_FLAGS`` containing a JSON
-object, or by using :func:`override_flags` within a test.
+object, via a JSON file named by ``FEATURE_FLAGS_FILE``, or by using
+:func:`override_flags` within a test.
+
+Evaluation goes through an immutable :class:`FlagSnapshot`: overrides are
+parsed once and every flag is resolved to either a constant or a precompiled
+predicate. The client rebuilds the snapshot when ``FEATURE_FLAGS`` changes
+(checked on every call, a plain string compare), when the overrides file's
+mtime changes (checked at most every ``file_check_interval`` seconds) or when
+manual overrides are set. Per-record loops can take :func:`flag_snapshot`
+once and query it directly.
 """
 
 from __future__ import annotations
 
 import json
 import os
+import threading
+import time
 from contextlib import contextmanager
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
-from src.governance.openfeature_flags import FEATURE_FLAGS, FeatureFlag
+from src.governance.openfeature_flags import FEATURE_FLAGS, FeatureFlag, FlagPredicate
 
+ENV_VAR = "FEATURE_FLAGS"
+FILE_ENV_VAR = "FEATURE_FLAGS_FILE"
 
-def _load_env_overrides() -> Dict[str, bool]:
-    raw = os.getenv("FEATURE_FLAGS")
+_UNSET = object()
+
+
+def _parse_overrides(raw: Optional[str]) -> Dict[str, bool]:
     if not raw:
         return {}
 
@@ -25,6 +40,8 @@ def _load_env_overrides() -> Dict[str, bool]:
         parsed = json.loads(raw)
     except json.JSONDecodeError:
         return {}
+    if not isinstance(parsed, dict):
+        return {}
 
     overrides: Dict[str, bool] = {}
     for key, value in parsed.items():
@@ -32,34 +49,183 @@ def _load_env_overrides() -> Dict[str, bool]:
     return overrides
 
 
+def _load_env_overrides() -> Dict[str, bool]:
+    return _parse_overrides(os.getenv(ENV_VAR))
+
+
+def _file_state(path: Optional[str]) -> Tuple[Optional[str], Optional[float]]:
+    if not path:
+        return None, None
+    try:
+        return path, os.stat(path).st_mtime
+    except OSError:
+        return path, None
+
+
+class FlagSnapshot:
+    """Immutable, precompiled view of every flag at one point in time.
+
+    Flags without rollout strategies (and all overridden flags) resolve to a
+    constant, so checking them is a single dict lookup; flags with strategies
+    hold a compiled predicate over the evaluation context.
+    """
+
+    __slots__ = ("_constants", "_predicates", "version")
+
+    def __init__(
+        self,
+        constants: Mapping[str, bool],
+        predicates: Mapping[str, FlagPredicate],
+        version: int = 0,
+    ):
+        self._constants: Dict[str, bool] = dict(constants)
+        self._predicates: Dict[str, FlagPredicate] = dict(predicates)
+        self.version = version
+
+    @classmethod
+    def build(
+        cls,
+        flags: Mapping[str, FeatureFlag],
+        overrides: Sequence[Mapping[str, bool]] = (),
+        version: int = 0,
+    ) -> "FlagSnapshot":
+        """Compile ``flags``; ``overrides`` are applied lowest precedence first."""
+
+        constants: Dict[str, bool] = {}
+        predicates: Dict[str, FlagPredicate] = {}
+        for key, flag in flags.items():
+            if flag.strategies:
+                predicates[key] = flag.compile()
+            else:
+                constants[key] = bool(flag.default)
+        for layer in overrides:
+            for key, value in layer.items():
+                constants[key] = bool(value)
+                predicates.pop(key, None)
+        return cls(constants, predicates, version)
+
+    def is_enabled(
+        self, flag_key: str, default: bool = False, *, context: Mapping[str, Any] | None = None
+    ) -> bool:
+        value = self._constants.get(flag_key)
+        if value is not None:
+            return value
+        predicate = self._predicates.get(flag_key)
+        if predicate is None:
+            return bool(default)
+        return predicate(context)
+
+    def evaluate_many(
+        self,
+        flags: Sequence[str],
+        contexts: Sequence[Mapping[str, Any] | None],
+        *,
+        default: bool = False,
+    ) -> Dict[str, List[bool]]:
+        """Evaluate every flag for every context; returns one list per flag, in context order."""
+
+        results: Dict[str, List[bool]] = {}
+        for flag_key in flags:
+            value = self._constants.get(flag_key)
+            if value is None and flag_key not in self._predicates:
+                value = bool(default)
+            if value is not None:
+                results[flag_key] = [value] * len(contexts)
+            else:
+                results[flag_key] = list(map(self._predicates[flag_key], contexts))
+        return results
+
+
 class FeatureFlagClient:
     """Simple in-process feature-flag client with rollout support."""
 
-    def __init__(self, defaults: Optional[Mapping[str, FeatureFlag]] = None):
+    def __init__(
+        self,
+        defaults: Optional[Mapping[str, FeatureFlag]] = None,
+        *,
+        overrides_file: Optional[str] = None,
+        file_check_interval: float = 1.0,
+    ):
         self._flags: Dict[str, FeatureFlag] = dict(defaults or {})
         self._manual_overrides: Dict[str, bool] = {}
+        self._overrides_file = overrides_file
+        self._file_check_interval = file_check_interval
+        self._lock = threading.Lock()
+        self._snapshot: Optional[FlagSnapshot] = None
+        self._env_raw: Any = _UNSET
+        self._file_seen: Tuple[Optional[str], Optional[float]] = (None, None)
+        self._next_file_check = 0.0
+        self._version = 0
+
+    def snapshot(self) -> FlagSnapshot:
+        """Current snapshot, rebuilt first if any override source changed."""
+
+        snapshot = self._snapshot
+        raw = os.environ.get(ENV_VAR)
+        if snapshot is None or raw != self._env_raw or self._file_changed():
+            snapshot = self._rebuild()
+        return snapshot
 
     def is_enabled(
         self, flag_key: str, default: bool = False, *, context: Mapping[str, Any] | None = None
     ) -> bool:
-        env_overrides = _load_env_overrides()
-        if flag_key in self._manual_overrides:
-            return bool(self._manual_overrides[flag_key])
-
-        if flag_key in env_overrides:
-            return bool(env_overrides[flag_key])
+        return self.snapshot().is_enabled(flag_key, default, context=context)
 
-        if flag_key in self._flags:
-            return bool(self._flags[flag_key].evaluate(context))
-
-        return bool(default)
+    def evaluate_many(
+        self,
+        flags: Sequence[str],
+        contexts: Sequence[Mapping[str, Any] | None],
+        *,
+        default: bool = False,
+    ) -> Dict[str, List[bool]]:
+        return self.snapshot().evaluate_many(flags, contexts, default=default)
 
     def set_overrides(self, overrides: Mapping[str, Any]) -> None:
-        for key, value in overrides.items():
-            self._manual_overrides[key] = bool(value)
+        with self._lock:
+            for key, value in overrides.items():
+                self._manual_overrides[key] = bool(value)
+            self._snapshot = None
 
     def clear_overrides(self) -> None:
-        self._manual_overrides.clear()
+        with self._lock:
+            self._manual_overrides.clear()
+            self._snapshot = None
+
+    def reload(self) -> FlagSnapshot:
+        """Re-read every override source now."""
+
+        return self._rebuild()
+
+    def _file_changed(self) -> bool:
+        now = time.monotonic()
+        if now < self._next_file_check:
+            return False
+        self._next_file_check = now + self._file_check_interval
+        return _file_state(self._overrides_file or os.environ.get(FILE_ENV_VAR)) != self._file_seen
+
+    def _rebuild(self) -> FlagSnapshot:
+        with self._lock:
+            raw = os.environ.get(ENV_VAR)
+            file_state = _file_state(self._overrides_file or os.environ.get(FILE_ENV_VAR))
+            file_overrides: Dict[str, bool] = {}
+            if file_state[1] is not None:
+                try:
+                    with open(file_state[0], encoding="utf-8") as fh:  # type: ignore[arg-type]
+                        file_overrides = _parse_overrides(fh.read())
+                except OSError:
+                    file_overrides = {}
+            self._version += 1
+            # Precedence, lowest first: file, environment, manual overrides
+            snapshot = FlagSnapshot.build(
+                self._flags,
+                (file_overrides, _parse_overrides(raw), dict(self._manual_overrides)),
+                version=self._version,
+            )
+            self._env_raw = raw
+            self._file_seen = file_state
+            self._next_file_check = time.monotonic() + self._file_check_interval
+            self._snapshot = snapshot
+        return snapshot
 
 
 _client = FeatureFlagClient(FEATURE_FLAGS)
@@ -77,6 +243,23 @@ def is_enabled(
     return _client.is_enabled(flag_key, default=default, context=context)
 
 
+def evaluate_many(
+    flags: Sequence[str],
+    contexts: Sequence[Mapping[str, Any] | None],
+    *,
+    default: bool = False,
+) -> Dict[str, List[bool]]:
+    """Evaluate several flags over a batch of contexts against one snapshot."""
+
+    return _client.evaluate_many(flags, contexts, default=default)
+
+
+def flag_snapshot() -> FlagSnapshot:
+    """The current flag snapshot; hold it across a per-record loop for plain dict-hit checks."""
+
+    return _client.snapshot()
+
+
 @contextmanager
 def override_flags(overrides: Mapping[str, Any]):
     """Temporarily apply flag overrides within a context."""
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Iterable, List, Mapping
+from typing import Any, Callable, Iterable, List, Mapping, Optional
 
 from src.governance.rollout_strategies import FlagStrategy, PercentageRollout
 
+FlagPredicate = Callable[[Optional[Mapping[str, Any]]], bool]
+
 
 @dataclass
 class FeatureFlag:
@@ -24,6 +26,31 @@ class FeatureFlag:
                 return bool(result)
         return bool(self.default)
 
+    def compile(self) -> FlagPredicate:
+        """Return a predicate equivalent to :meth:`evaluate` over precompiled strategies."""
+
+        default = bool(self.default)
+        predicates = tuple(strategy.compile() for strategy in self.strategies)
+        if not predicates:
+            return lambda context=None: default
+        if len(predicates) == 1:
+            (only,) = predicates
+
+            def single(context: Mapping[str, Any] | None = None) -> bool:
+                result = only(context)
+                return default if result is None else bool(result)
+
+            return single
+
+        def first_decision(context: Mapping[str, Any] | None = None) -> bool:
+            for predicate in predicates:
+                result = predicate(context)
+                if result is not None:
+                    return bool(result)
+            return default
+
+        return first_decision
+
 
 # Centralized catalog of known flags so tests and runtime can share semantics.
 _FEATURES: Iterable[FeatureFlag] = (
@@ -10,7 +10,18 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
-from typing import Any, Mapping, Optional
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Optional
+
+StrategyPredicate = Callable[[Optional[Mapping[str, Any]]], Optional[bool]]
+
+
+@lru_cache(maxsize=65536)
+def stable_bucket(actor: str) -> int:
+    """Stable 0-99 bucket for an actor identifier (cached; md5 is the slow part)."""
+
+    digest = hashlib.md5(actor.encode("utf-8"))  # noqa: S324 - non-crypto hash for bucketing
+    return int(digest.hexdigest(), 16) % 100
 
 
 class FlagStrategy:
@@ -23,6 +34,15 @@ class FlagStrategy:
     def evaluate(self, context: Mapping[str, Any] | None = None) -> Optional[bool]:
         raise NotImplementedError
 
+    def compile(self) -> StrategyPredicate:
+        """Return a predicate equivalent to :meth:`evaluate` with the parameters bound.
+
+        Subclasses override this to hoist per-call work out of the hot path;
+        the default simply defers to :meth:`evaluate`.
+        """
+
+        return self.evaluate
+
 
 @dataclass
 class PercentageRollout(FlagStrategy):
@@ -45,9 +65,21 @@ class PercentageRollout(FlagStrategy):
             return None
 
         # Compute a stable 0-99 bucket using a hash of the actor identifier.
-        digest = hashlib.md5(str(actor).encode("utf-8"))  # noqa: S324 - non-crypto hash for bucketing
-        bucket = int(digest.hexdigest(), 16) % 100
-        return bucket < self.percentage
+        return stable_bucket(str(actor)) < self.percentage
+
+    def compile(self) -> StrategyPredicate:
+        percentage = self.percentage
+        bucket_by = self.bucket_by
+
+        def predicate(context: Mapping[str, Any] | None = None) -> Optional[bool]:
+            if context is None:
+                return None
+            actor = context.get(bucket_by)
+            if actor is None:
+                return None
+            return stable_bucket(str(actor)) < percentage
+
+        return predicate
 
 
 @dataclass
@@ -67,6 +99,20 @@ class EnvironmentMatchStrategy(FlagStrategy):
 
         return str(env_value) in self.allowed
 
+    def compile(self) -> StrategyPredicate:
+        allowed = frozenset(self.allowed)
+        context_key = self.context_key
+
+        def predicate(context: Mapping[str, Any] | None = None) -> Optional[bool]:
+            if context is None:
+                return None
+            env_value = context.get(context_key)
+            if env_value is None:
+                return None
+            return str(env_value) in allowed
+
+        return predicate
+
 
 @dataclass
 class AttributeEqualsStrategy(FlagStrategy):
@@ -83,3 +129,18 @@ class AttributeEqualsStrategy(FlagStrategy):
             return None
 
         return context.get(self.key) == self.expected_value
+
+    def compile(self) -> StrategyPredicate:
+        key = self.key
+        expected = self.expected_value
+        missing = object()
+
+        def predicate(context: Mapping[str, Any] | None = None) -> Optional[bool]:
+            if context is None:
+                return None
+            value = context.get(key, missing)
+            if value is missing:
+                return None
+            return value == expected
+
+        return predicate
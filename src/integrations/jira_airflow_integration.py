@@ -13,7 +13,6 @@ from __future__ import annotations
 import os
 from typing import Any, Dict, Optional
 
-import requests
 from src.common.logging_utils import get_logger
 from src.integrations.jira_client import JiraClient, get_jira_client
 
@@ -161,6 +160,8 @@ class IntegrationService:
         }
 
         try:
+            import requests
+
             url = f"{self.airflow_base_url}/api/v1/dags/{dag_id}/dagRuns"
             resp = requests.post(
                 url,
@@ -194,6 +195,8 @@ class IntegrationService:
 
         url = f"{self.airflow_base_url}/api/v1/dags/{dag_id}/dagRuns/{dag_run_id}"
         try:
+            import requests
+
             resp = requests.get(url, timeout=10, **self.airflow_auth)
             resp.raise_for_status()
             data = resp.json()
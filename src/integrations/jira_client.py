@@ -9,7 +9,6 @@ from __future__ import annotations
 import os
 from typing import Any, Dict, Optional
 
-import requests
 from src.common.logging_utils import get_logger
 
 log = get_logger("jira-client")
@@ -53,6 +52,8 @@ class JiraClient:
         if not self.base_url:
             raise RuntimeError("Jira base URL not configured")
 
+        import requests
+
         url = f"{self.base_url}/rest/api/3/{endpoint}"
         headers = {"Accept": "application/json", "Content-Type": "application/json"}
 
@@ -129,7 +129,7 @@ def iter_cost_records() -> List[Dict[str, Any]]:
 def iter_cost_records_from_db() -> List[Dict[str, Any]]:
     """Read cost records from PostgreSQL."""
     import os
-    from src.common.db import get_conn
+    from src.common.db import transaction
 
     db_url = os.getenv("DB_URL")
     if not db_url:
@@ -137,19 +137,18 @@ def iter_cost_records_from_db() -> List[Dict[str, Any]]:
         return iter_cost_records()
 
     try:
-        conn = get_conn()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT source, run_id, proxy_cost_usd, compute_cost_usd, other_cost_usd,
-                   currency, created_at,
-                   (proxy_cost_usd + compute_cost_usd + other_cost_usd) as total_usd
-            FROM scraper.cost_tracking
-            ORDER BY created_at DESC
-            """
-        )
-        columns = [col[0] for col in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        with transaction() as conn, conn.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT source, run_id, proxy_cost_usd, compute_cost_usd, other_cost_usd,
+                       currency, created_at,
+                       (proxy_cost_usd + compute_cost_usd + other_cost_usd) as total_usd
+                FROM scraper.cost_tracking
+                ORDER BY created_at DESC
+                """
+            )
+            columns = [col[0] for col in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
     except Exception as exc:
         log.warning("Failed to read cost records from PostgreSQL: %s", exc)
         # Fallback to file log
@@ -8,6 +8,7 @@ from .runner import PipelineRunner, RunContext, RunResult
 from .registry import UnifiedRegistry
 from .step import PipelineStep, StepResult, StepType
 from .compiler import PipelineCompiler, CompiledPipeline
+from .compile_cache import compile_cached, precompile
 
 __all__ = [
     "PipelineRunner",
@@ -19,4 +20,6 @@ __all__ = [
     "StepType",
     "PipelineCompiler",
     "CompiledPipeline",
+    "compile_cached",
+    "precompile",
 ]
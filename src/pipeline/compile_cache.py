@@ -0,0 +1,177 @@
+"""Content-addressed cache of compiled pipelines.
+
+Compiling a DSL pipeline parses ``components.yaml`` and the pipeline YAML,
+imports every step's module and analyses the step graph. The result depends
+only on the content of those two files, so it is cached under the SHA-256 of
+both: a compiled pipeline is reused until either file's content changes, and
+touching a file without changing it does not recompile. File digests are
+themselves memoized per path and only recomputed when size or mtime change.
+
+:func:`precompile` compiles and validates every ``dsl/pipelines/*.yaml`` in
+one pass (``run_pipeline --precompile``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from src.common.logging_utils import get_logger
+from src.observability import metrics
+
+from .compiler import CompiledPipeline, PipelineCompiler
+from .graph import graph_problems
+from .registry import UnifiedRegistry
+
+log = get_logger("pipeline.compile-cache")
+
+T = TypeVar("T")
+
+DSL_ROOT = Path(__file__).resolve().parents[2] / "dsl"
+
+_DIGESTS: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_DIGESTS_LOCK = threading.Lock()
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of ``path``, re-read only when its size or mtime changed."""
+
+    key = os.fspath(path)
+    stat = os.stat(key)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _DIGESTS_LOCK:
+        cached = _DIGESTS.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(key, "rb") as fh:
+        digest = hashlib.sha256(fh.read()).hexdigest()
+    with _DIGESTS_LOCK:
+        _DIGESTS[key] = (stamp, digest)
+    return digest
+
+
+class CompileCache(Generic[T]):
+    """LRU of ``build(*paths)`` results keyed by the content hash of ``paths``."""
+
+    def __init__(
+        self, build: Callable[..., T], *, name: str = "pipeline", max_entries: int = 32
+    ) -> None:
+        self._build = build
+        self.name = name
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, T]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, *paths: Path) -> str:
+        combined = hashlib.sha256()
+        for path in paths:
+            if not Path(path).exists():
+                raise FileNotFoundError(f"DSL file not found: {path}")
+            combined.update(file_digest(path).encode("ascii"))
+        return combined.hexdigest()
+
+    def get(self, *paths: Path) -> T:
+        key = self.key(*paths)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                metrics.incr("pipeline.compile_cache.hits", cache=self.name)
+                return self._entries[key]
+            # Built under the lock so concurrent callers do not compile twice
+            value = self._build(*paths)
+            self.misses += 1
+            metrics.incr("pipeline.compile_cache.misses", cache=self.name)
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+def _build_registry(components_path: Path) -> UnifiedRegistry:
+    return UnifiedRegistry.from_yaml(Path(components_path))
+
+
+_REGISTRIES: CompileCache[UnifiedRegistry] = CompileCache(
+    _build_registry, name="registry", max_entries=4
+)
+
+
+def _build_pipeline(pipeline_path: Path, components_path: Path) -> CompiledPipeline:
+    registry = _REGISTRIES.get(components_path)
+    compiled = PipelineCompiler(registry).compile_from_file(Path(pipeline_path))
+    compiled.metadata["content_hash"] = _PIPELINES.key(pipeline_path, components_path)
+    return compiled
+
+
+_PIPELINES: CompileCache[CompiledPipeline] = CompileCache(_build_pipeline, name="pipeline")
+
+
+def compile_cached(pipeline_path: Path, components_path: Path) -> CompiledPipeline:
+    """Compiled pipeline for ``pipeline_path``, recompiled only when either file's content changes.
+
+    The returned pipeline is shared between callers and must not be mutated.
+    """
+
+    return _PIPELINES.get(pipeline_path, components_path)
+
+
+def clear_compile_cache() -> None:
+    _PIPELINES.clear()
+    _REGISTRIES.clear()
+
+
+def compile_cache_stats() -> Dict[str, int]:
+    return {
+        "entries": len(_PIPELINES._entries),
+        "hits": _PIPELINES.hits,
+        "misses": _PIPELINES.misses,
+    }
+
+
+def precompile(dsl_root: Path = DSL_ROOT) -> Dict[str, Optional[str]]:
+    """Compile and validate every pipeline under ``dsl_root/pipelines``.
+
+    Each pipeline is checked against the DSL JSON schema, compiled (which
+    resolves every component callable) and checked for duplicate step ids,
+    unknown dependencies and cycles. Returns ``{pipeline: error or None}``;
+    pipelines that pass are left warm in the cache.
+    """
+
+    from src.core_kernel.pipeline_compiler import load_pipeline_definition
+
+    components_path = Path(dsl_root) / "components.yaml"
+    results: Dict[str, Optional[str]] = {}
+    for path in sorted((Path(dsl_root) / "pipelines").glob("*.yaml")):
+        try:
+            load_pipeline_definition(path)
+            compiled = compile_cached(path, components_path)
+        except (FileNotFoundError, ImportError, ValueError) as exc:
+            results[path.stem] = str(exc)
+            continue
+        problems: List[str] = graph_problems(compiled.steps)
+        results[path.stem] = "; ".join(problems) if problems else None
+    failed = sorted(name for name, error in results.items() if error)
+    log.info("Precompiled DSL pipelines", extra={"pipelines": len(results), "failed": failed})
+    return results
+
+
+__all__ = [
+    "CompileCache",
+    "clear_compile_cache",
+    "compile_cache_stats",
+    "compile_cached",
+    "file_digest",
+    "precompile",
+]
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List
 
-import jsonschema
 import yaml
 
 from src.common.logging_utils import get_logger
+from .graph import critical_path_lengths, dependents_map, topological_order
 from .registry import UnifiedRegistry
 from .step import PipelineStep, StepType
 
@@ -26,6 +26,10 @@ class CompiledPipeline:
     steps: List[PipelineStep]
     variants: List[Dict[str, Any]]
     metadata: Dict[str, Any]
+    # Graph analysis done at compile time so cached pipelines skip it per run
+    order: List[str] = field(default_factory=list)
+    dependents: Dict[str, List[str]] = field(default_factory=dict)
+    critical_path: Dict[str, int] = field(default_factory=dict)
 
 
 class PipelineCompiler:
@@ -79,12 +83,16 @@ class PipelineCompiler:
             
         log.info("Compiled pipeline '%s' with %d steps", pipeline_name, len(steps))
         
+        dependents = dependents_map(steps)
         return CompiledPipeline(
             name=pipeline_name,
             description=description,
             steps=steps,
             variants=variants,
             metadata={"source_file": name},
+            order=topological_order(steps),
+            dependents=dependents,
+            critical_path=critical_path_lengths(steps, dependents),
         )
         
     def _compile_step(self, step_def: Dict[str, Any]) -> PipelineStep:
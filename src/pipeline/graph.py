@@ -0,0 +1,83 @@
+"""Dependency-graph helpers shared by the pipeline compiler and runner."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, List, Sequence, Set
+
+from .step import PipelineStep
+
+
+def dependents_map(steps: Sequence[PipelineStep]) -> Dict[str, List[str]]:
+    """Reverse dependency map: step id -> ids of the steps that depend on it."""
+    dependents: Dict[str, List[str]] = defaultdict(list)
+    for step in steps:
+        for dep in step.depends_on:
+            dependents[dep].append(step.id)
+    return dict(dependents)
+
+
+def critical_path_lengths(
+    steps: Sequence[PipelineStep], dependents: Dict[str, List[str]]
+) -> Dict[str, int]:
+    """Number of steps on the longest chain from each step to a sink."""
+    lengths: Dict[str, int] = {}
+    visiting: Set[str] = set()
+
+    def visit(step_id: str) -> int:
+        if step_id in lengths:
+            return lengths[step_id]
+        if step_id in visiting:
+            return 0  # Cycle; surfaced later as a deadlock
+        visiting.add(step_id)
+        longest = max((visit(child) for child in dependents.get(step_id, [])), default=0)
+        visiting.discard(step_id)
+        lengths[step_id] = longest + 1
+        return lengths[step_id]
+
+    for step in steps:
+        visit(step.id)
+    return lengths
+
+
+def topological_order(steps: Sequence[PipelineStep]) -> List[str]:
+    """Step ids in dependency order, ties broken by declaration order.
+
+    Steps on a cycle or behind an unknown dependency are left out; see
+    :func:`graph_problems`.
+    """
+    known = {step.id for step in steps}
+    in_degree = {step.id: sum(1 for dep in step.depends_on if dep in known) for step in steps}
+    dependents = dependents_map(steps)
+    blocked = {step.id for step in steps if any(dep not in known for dep in step.depends_on)}
+    order: List[str] = []
+    ready = [step.id for step in steps if in_degree[step.id] == 0 and step.id not in blocked]
+    position = {step.id: idx for idx, step in enumerate(steps)}
+    while ready:
+        ready.sort(key=position.__getitem__, reverse=True)
+        step_id = ready.pop()
+        order.append(step_id)
+        for child in dependents.get(step_id, []):
+            in_degree[child] -= 1
+            if in_degree[child] == 0 and child not in blocked:
+                ready.append(child)
+    return order
+
+
+def graph_problems(steps: Sequence[PipelineStep]) -> List[str]:
+    """Duplicate ids, unknown dependencies and cycles, as readable messages."""
+    problems: List[str] = []
+    seen: Set[str] = set()
+    for step in steps:
+        if step.id in seen:
+            problems.append(f"duplicate step id '{step.id}'")
+        seen.add(step.id)
+    for step in steps:
+        for dep in step.depends_on:
+            if dep not in seen:
+                problems.append(f"step '{step.id}' depends on unknown step '{dep}'")
+    ordered = set(topological_order(steps))
+    stuck = [step.id for step in steps if step.id not in ordered]
+    if stuck and not problems:
+        problems.append(f"dependency cycle among steps {stuck}")
+    return problems
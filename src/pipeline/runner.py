@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
+import heapq
+import queue
 import time
 import uuid
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from src.common.logging_utils import get_logger
+from src.observability import metrics
 from .compiler import CompiledPipeline
+from .graph import critical_path_lengths, dependents_map
 from .step import PipelineStep, StepResult, StepType
 
 log = get_logger("pipeline.runner")
 
+# How often to re-check timeouts for steps still waiting for a pool worker
+_TIMEOUT_POLL_SECONDS = 0.05
+
 
 @dataclass
 class RunContext:
@@ -169,69 +175,204 @@ class PipelineRunner:
         return result
         
     def _execute_pipeline(self, pipeline: CompiledPipeline, context: RunContext) -> None:
-        """Execute all pipeline steps with dependency resolution."""
-        # Build dependency graph
+        """Execute all pipeline steps with event-driven dependency resolution.
+
+        Worker threads push finished steps onto a completion queue; the
+        scheduler blocks on that queue (bounded by the nearest step timeout),
+        decrements the in-degree of each dependent and releases it the moment
+        its last dependency finishes. Ready steps wait in a priority heap and
+        are dispatched longest critical path first, only as worker slots free
+        up, so a step released late can still overtake earlier low-priority
+        ones. Export steps still run one at a time in declaration order.
+        """
         step_map = {step.id: step for step in pipeline.steps}
-        dependents = self._build_dependents_map(pipeline.steps)
-        
-        # Categorize steps by type (export steps must run sequentially)
+        # Compiled pipelines carry the graph analysis; hand-built ones get it here
+        dependents = pipeline.dependents or self._build_dependents_map(pipeline.steps)
+        priorities = pipeline.critical_path or self._critical_path_lengths(
+            pipeline.steps, dependents
+        )
+        order_index = {step.id: idx for idx, step in enumerate(pipeline.steps)}
+
         export_steps = [s.id for s in pipeline.steps if s.type == StepType.EXPORT]
         export_order = {step_id: idx for idx, step_id in enumerate(export_steps)}
-        
-        # Track ready and pending steps
-        ready: Set[str] = {s.id for s in pipeline.steps if not s.depends_on}
-        pending: Set[str] = {s.id for s in pipeline.steps} - ready
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {}
-            
-            while ready or futures or pending:
-                # Submit ready steps (except export steps which run serially)
-                for step_id in list(ready):
-                    step = step_map[step_id]
-                    
-                    # Export steps run sequentially
-                    if step.type == StepType.EXPORT:
-                        # Only run if it's the next export in order
-                        completed_exports = [
-                            s for s in export_steps
-                            if s in context.step_results
-                        ]
-                        if export_order[step_id] != len(completed_exports):
-                            continue  # Wait for earlier exports
-                            
-                        # Run synchronously
-                        ready.remove(step_id)
-                        result = self._execute_step(step, context)
-                        context.step_results[step_id] = result
-                        self._mark_dependents_ready(step_id, dependents, step_map, context, ready, pending)
-                    else:
-                        # Parallel execution for non-export steps
-                        ready.remove(step_id)
-                        future = executor.submit(self._execute_step, step, context)
-                        futures[future] = step_id
-                
-                # Wait for any future to complete
-                if futures:
-                    done, _ = as_completed(futures.keys(), timeout=1).__next__, None
-                    if done:
-                        for future in list(futures.keys()):
-                            if future.done():
-                                step_id = futures.pop(future)
-                                result = future.result()
-                                context.step_results[step_id] = result
-                                self._mark_dependents_ready(
-                                    step_id, dependents, step_map, context, ready, pending
-                                )
-                                
-                # Check for deadlock
-                if not ready and not futures and pending:
-                    unmet = [
-                        (sid, [d for d in step_map[sid].depends_on if d not in context.step_results])
-                        for sid in pending
-                    ]
-                    raise RuntimeError(f"Pipeline deadlock detected. Unmet dependencies: {unmet}")
-                    
+        exports_done = 0
+        export_in_flight = False
+        held_exports: Dict[str, float] = {}
+
+        in_degree: Dict[str, int] = {
+            s.id: sum(1 for dep in s.depends_on if dep in step_map) for s in pipeline.steps
+        }
+        unknown_deps = {
+            s.id: [dep for dep in s.depends_on if dep not in step_map]
+            for s in pipeline.steps
+            if any(dep not in step_map for dep in s.depends_on)
+        }
+        pending: Set[str] = {sid for sid in step_map if sid not in unknown_deps}
+
+        ready: List[Tuple[int, int, str]] = []
+        released_at: Dict[str, float] = {}
+        started_at: Dict[str, float] = {}
+        in_flight: Set[str] = set()
+        completions: "queue.Queue[Tuple[str, Optional[StepResult], Optional[BaseException]]]" = (
+            queue.Queue()
+        )
+        abandoned = False
+
+        def release(step_id: str) -> None:
+            pending.discard(step_id)
+            released_at[step_id] = time.monotonic()
+            if step_id in export_order:
+                held_exports[step_id] = released_at[step_id]
+            else:
+                heapq.heappush(ready, (-priorities[step_id], order_index[step_id], step_id))
+
+        def run(step_id: str) -> StepResult:
+            started_at[step_id] = time.monotonic()
+            return self._execute_step(step_map[step_id], context)
+
+        def on_done(step_id: str, future: Future) -> None:
+            exc = future.exception()
+            completions.put((step_id, None if exc else future.result(), exc))
+
+        for step_id in [sid for sid, deg in in_degree.items() if deg == 0 and sid in pending]:
+            release(step_id)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while ready or in_flight or held_exports:
+                # Fill free worker slots only; anything queued in the pool would be FIFO
+                while ready and len(in_flight) < self.max_workers:
+                    _prio, _idx, step_id = heapq.heappop(ready)
+                    self._submit(executor, step_id, run, on_done)
+                    in_flight.add(step_id)
+
+                if not export_in_flight and exports_done < len(export_steps):
+                    next_export = export_steps[exports_done]
+                    if next_export in held_exports:
+                        held_exports.pop(next_export)
+                        self._submit(executor, next_export, run, on_done)
+                        in_flight.add(next_export)
+                        export_in_flight = True
+
+                if not in_flight:
+                    break
+
+                try:
+                    step_id, result, exc = completions.get(
+                        timeout=self._next_deadline(step_map, started_at, in_flight)
+                    )
+                except queue.Empty:
+                    timed_out = self._collect_timeouts(step_map, started_at, in_flight)
+                    if not timed_out:
+                        continue
+                    abandoned = True
+                    finished = [(sid, self._timeout_result(step_map[sid])) for sid in timed_out]
+                else:
+                    if step_id not in in_flight:
+                        continue  # Late result from a step that already timed out
+                    if exc is not None:
+                        raise exc
+                    finished = [(step_id, result)]
+
+                for step_id, result in finished:
+                    in_flight.discard(step_id)
+                    released = released_at[step_id]
+                    queue_wait = max(0.0, started_at.get(step_id, released) - released)
+                    result.metadata.setdefault("queue_wait_seconds", queue_wait)
+                    self._record_queue_wait(pipeline, context, step_id, queue_wait)
+                    context.step_results[step_id] = result
+
+                    if step_id in export_order:
+                        exports_done += 1
+                        export_in_flight = False
+
+                    for dependent_id in dependents.get(step_id, []):
+                        in_degree[dependent_id] -= 1
+                        if in_degree[dependent_id] == 0 and dependent_id in pending:
+                            release(dependent_id)
+        finally:
+            # Never block on a thread that blew through its timeout
+            executor.shutdown(wait=not abandoned, cancel_futures=True)
+
+        stalled = pending | set(held_exports)
+        if stalled or unknown_deps:
+            unmet = [
+                (sid, [d for d in step_map[sid].depends_on if d not in context.step_results])
+                for sid in sorted(stalled | set(unknown_deps), key=order_index.__getitem__)
+            ]
+            raise RuntimeError(f"Pipeline deadlock detected. Unmet dependencies: {unmet}")
+
+    @staticmethod
+    def _submit(executor: ThreadPoolExecutor, step_id: str, run, on_done) -> None:
+        future = executor.submit(run, step_id)
+        future.add_done_callback(lambda fut: on_done(step_id, fut))
+
+    @staticmethod
+    def _next_deadline(
+        step_map: Dict[str, PipelineStep],
+        started_at: Dict[str, float],
+        in_flight: Set[str],
+    ) -> Optional[float]:
+        """Seconds until the earliest in-flight step times out (None = no limit)."""
+        now = time.monotonic()
+        waits = []
+        for step_id in in_flight:
+            timeout = step_map[step_id].timeout
+            if not timeout:
+                continue
+            if step_id not in started_at:
+                # Still queued in the pool; poll until it starts its clock
+                waits.append(_TIMEOUT_POLL_SECONDS)
+                continue
+            waits.append(max(0.0, started_at[step_id] + timeout - now))
+        return min(waits) if waits else None
+
+    @staticmethod
+    def _collect_timeouts(
+        step_map: Dict[str, PipelineStep],
+        started_at: Dict[str, float],
+        in_flight: Set[str],
+    ) -> List[str]:
+        now = time.monotonic()
+        return [
+            step_id
+            for step_id in in_flight
+            if step_map[step_id].timeout
+            and step_id in started_at
+            and now - started_at[step_id] >= step_map[step_id].timeout
+        ]
+
+    @staticmethod
+    def _timeout_result(step: PipelineStep) -> StepResult:
+        log.error("Step %s exceeded timeout of %ss", step.id, step.timeout)
+        return StepResult(
+            step_id=step.id,
+            status="failed" if step.required else "skipped",
+            duration_seconds=float(step.timeout or 0),
+            error=f"Step {step.id} timed out after {step.timeout}s",
+            metadata={"exception_type": "TimeoutError"},
+        )
+
+    @staticmethod
+    def _record_queue_wait(
+        pipeline: CompiledPipeline, context: RunContext, step_id: str, queue_wait: float
+    ) -> None:
+        context.metadata.setdefault("queue_wait_seconds", {})[step_id] = queue_wait
+        metrics.set_gauge(
+            "pipeline_step_queue_wait_seconds",
+            queue_wait,
+            pipeline=pipeline.name,
+            step=step_id,
+        )
+        metrics.incr("pipeline_step_queue_wait_seconds_total", queue_wait, pipeline=pipeline.name)
+
+    @staticmethod
+    def _critical_path_lengths(
+        steps: List[PipelineStep], dependents: Dict[str, List[str]]
+    ) -> Dict[str, int]:
+        """Number of steps on the longest chain from each step to a sink."""
+        return critical_path_lengths(steps, dependents)
+
     def _execute_step(self, step: PipelineStep, context: RunContext) -> StepResult:
         """Execute a single step with retries."""
         log.info("Executing step: %s (%s)", step.id, step.type.value)
@@ -266,29 +407,8 @@ class PipelineRunner:
         
     def _build_dependents_map(self, steps: List[PipelineStep]) -> Dict[str, List[str]]:
         """Build reverse dependency map."""
-        dependents: Dict[str, List[str]] = defaultdict(list)
-        for step in steps:
-            for dep in step.depends_on:
-                dependents[dep].append(step.id)
-        return dict(dependents)
+        return dependents_map(steps)
         
-    def _mark_dependents_ready(
-        self,
-        completed_step_id: str,
-        dependents: Dict[str, List[str]],
-        step_map: Dict[str, PipelineStep],
-        context: RunContext,
-        ready: Set[str],
-        pending: Set[str],
-    ) -> None:
-        """Mark dependent steps as ready if all dependencies are met."""
-        for dependent_id in dependents.get(completed_step_id, []):
-            if dependent_id in pending:
-                step = step_map[dependent_id]
-                if context.all_dependencies_met(step):
-                    pending.remove(dependent_id)
-                    ready.add(dependent_id)
-                    
     def _determine_status(self, pipeline: CompiledPipeline, context: RunContext) -> str:
         """Determine final pipeline status."""
         total = len(pipeline.steps)
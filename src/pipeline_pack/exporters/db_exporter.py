@@ -1,74 +1,61 @@
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Sequence
 import logging
-import psycopg2
-import psycopg2.extras
+
+from src.processors.exporters.pg_copy_loader import PostgresCopyLoader
 
 logger = logging.getLogger(__name__)
 
+COLUMNS = ["product_name", "manufacturer", "strength", "pack_size", "price", "raw"]
 
-class DBExporter:
-    """Minimal Postgres exporter for batch inserts."""
 
-    def __init__(self, dsn: str, target_table: str, batch_size: int = 500) -> None:
+class DBExporter:
+    """Minimal Postgres exporter for batch loads (COPY via PostgresCopyLoader)."""
+
+    def __init__(
+        self,
+        dsn: str,
+        target_table: str,
+        batch_size: int = 50_000,
+        conflict_key: Sequence[str] = (),
+        connection: Optional[Any] = None,
+    ) -> None:
         self.dsn = dsn
         self.target_table = target_table
-        self.batch_size = batch_size
-
-    def export(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
-        if not records:
-            logger.info("DBExporter: no records to export")
-            return {"inserted": 0}
-
-        conn = psycopg2.connect(self.dsn)
-        conn.autocommit = False
-        inserted = 0
+        self.batch_size = batch_size  # rows per COPY round
+        self.conflict_key = tuple(conflict_key)
+        self.connection = connection
+
+    def export(self, records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        loader = PostgresCopyLoader(
+            self.target_table,
+            dsn=self.dsn,
+            conflict_key=self.conflict_key,
+            columns=COLUMNS,
+            batch_rows=self.batch_size,
+            connection=self.connection,
+        )
         try:
-            with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
-                for i in range(0, len(records), self.batch_size):
-                    batch = records[i : i + self.batch_size]
-                    logger.info(
-                        "Exporting batch %s..%s of %s",
-                        i,
-                        i + len(batch),
-                        len(records),
-                    )
-                    self._insert_batch(cur, batch)
-                    inserted += len(batch)
-                conn.commit()
+            stats = loader.load(self._rows(records))
         except Exception as exc:  # pragma: no cover - runtime guard
-            conn.rollback()
             logger.exception("DB export failed: %s", exc)
             raise
-        finally:
-            conn.close()
-        return {"inserted": inserted}
-
-    def _insert_batch(self, cur, batch: List[Dict[str, Any]]) -> None:
-        sql = f"""
-        INSERT INTO {self.target_table} (
-            product_name,
-            manufacturer,
-            strength,
-            pack_size,
-            price,
-            raw
-        ) VALUES %s
-        """
-        values = []
-        for rec in batch:
-            values.append(
-                (
-                    rec.get("product_name"),
-                    rec.get("manufacturer"),
-                    rec.get("strength"),
-                    rec.get("pack_size"),
-                    rec.get("price"),
-                    rec,
-                )
-            )
-        psycopg2.extras.execute_values(cur, sql, values)
+        if not stats.rows:
+            logger.info("DBExporter: no records to export")
+        return {"inserted": stats.rows, "rows_per_second": stats.rows_per_second}
+
+    @staticmethod
+    def _rows(records: Iterable[Mapping[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for rec in records:
+            yield {
+                "product_name": rec.get("product_name"),
+                "manufacturer": rec.get("manufacturer"),
+                "strength": rec.get("strength"),
+                "pack_size": rec.get("pack_size"),
+                "price": rec.get("price"),
+                "raw": dict(rec),
+            }
 
 
 __all__ = ["DBExporter"]
@@ -45,6 +45,13 @@ BUILTIN_PLUGINS = [
         type="processor",
         description="Match unified records to PCIDs via vector store and deterministic rules.",
     ),
+    Plugin(
+        name="processor.pcid.match_records_batch",
+        module="src.plugins.processors.pcid",
+        entrypoint="match_records_batch",
+        type="processor",
+        description="Batch PCID matching returning columnar decisions for large record sets.",
+    ),
     Plugin(
         name="processor.dedupe.records",
         module="src.plugins.processors.dedupe",
@@ -1,5 +1,5 @@
 """Plugin adapter for PCID matching helpers."""
 
-from src.processors.pcid_matcher import build_pcid_index, match_records
+from src.processors.pcid_matcher import build_pcid_index, match_records, match_records_batch
 
-__all__ = ["build_pcid_index", "match_records"]
+__all__ = ["build_pcid_index", "match_records", "match_records_batch"]
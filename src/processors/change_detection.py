@@ -0,0 +1,374 @@
+"""
+Cross-run change detection against the previous snapshot of a source.
+
+A FingerprintStore (SQLite, one file per source output dir) maps every record
+key to a hash of the record's content as of the last committed run. A run
+opens a ChangeTracker, classifies its records chunk by chunk as ``new``,
+``changed`` or ``unchanged``, and at the end learns which previously known
+keys were not seen again (``removed``). Nothing in the snapshot moves until
+:meth:`ChangeTracker.commit`, so a run that fails half-way is compared
+against the same snapshot when it is retried. A run that saw no records, or
+would remove more than ``max_removed_ratio`` of the snapshot, is most likely a
+broken scrape; :meth:`ChangeTracker.removal_problem` reports it so callers can
+abort instead of wiping the snapshot.
+
+Keys and content are reduced to 64-bit hashes (see
+``src.processors.dedupe.key_hash64``). Fields starting with ``_`` and
+per-run bookkeeping such as ``run_id`` are left out of the content hash, so a
+record that only got a new run id is unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from src.common.logging_utils import get_logger
+from src.processors.dedupe import DEFAULT_KEY_FIELDS, key_hash64, record_key
+
+log = get_logger("change-detection")
+
+CHANGE_NEW = "new"
+CHANGE_CHANGED = "changed"
+CHANGE_UNCHANGED = "unchanged"
+CHANGE_REMOVED = "removed"
+
+DEFAULT_IGNORE_FIELDS: FrozenSet[str] = frozenset(
+    {"run_id", "scraped_at", "extracted_at", "fetched_at"}
+)
+DEFAULT_STORE_NAME = "fingerprints.sqlite"
+DEFAULT_MAX_REMOVED_RATIO = 0.5
+
+# Host parameters per IN (...) lookup; well under SQLite's limit
+_LOOKUP_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    source TEXT NOT NULL,
+    key_hash INTEGER NOT NULL,
+    content_hash INTEGER NOT NULL,
+    key_json TEXT NOT NULL,
+    run_id TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (source, key_hash)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS staged (
+    source TEXT NOT NULL,
+    key_hash INTEGER NOT NULL,
+    content_hash INTEGER NOT NULL,
+    key_json TEXT NOT NULL,
+    PRIMARY KEY (source, key_hash)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS snapshots (
+    source TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    committed_at TEXT NOT NULL,
+    new INTEGER NOT NULL,
+    changed INTEGER NOT NULL,
+    unchanged INTEGER NOT NULL,
+    removed INTEGER NOT NULL,
+    change_ratio REAL NOT NULL,
+    PRIMARY KEY (source, run_id)
+);
+"""
+
+
+def _signed(value: int) -> int:
+    # SQLite integers are signed 64-bit
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def content_hash64(
+    record: Mapping[str, Any], ignore_fields: FrozenSet[str] = DEFAULT_IGNORE_FIELDS
+) -> int:
+    """64-bit hash of a record's content, ignoring ``_``-prefixed and bookkeeping fields."""
+
+    content = {k: v for k, v in record.items() if k not in ignore_fields and not k.startswith("_")}
+    return key_hash64((json.dumps(content, sort_keys=True, default=str),))
+
+
+@dataclass
+class IncrementalSettings:
+    """``export.incremental`` in the platform config: a bool or a mapping of these fields."""
+
+    enabled: bool = True
+    key_fields: Tuple[str, ...] = DEFAULT_KEY_FIELDS
+    ignore_fields: FrozenSet[str] = DEFAULT_IGNORE_FIELDS
+    store_path: Optional[Path] = None
+    max_removed_ratio: float = DEFAULT_MAX_REMOVED_RATIO
+
+    @classmethod
+    def from_config(cls, export_cfg: Optional[Mapping[str, Any]] = None) -> "IncrementalSettings":
+        raw = (export_cfg or {}).get("incremental", True)
+        if not isinstance(raw, Mapping):
+            return cls(enabled=bool(raw))
+        settings = cls(enabled=bool(raw.get("enabled", True)))
+        if raw.get("key_fields"):
+            settings.key_fields = tuple(raw["key_fields"])
+        if raw.get("ignore_fields") is not None:
+            settings.ignore_fields = frozenset(raw["ignore_fields"])
+        if raw.get("store_path"):
+            settings.store_path = Path(raw["store_path"])
+        if raw.get("max_removed_ratio") is not None:
+            settings.max_removed_ratio = float(raw["max_removed_ratio"])
+        return settings
+
+
+@dataclass
+class ChangeSummary:
+    new: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    removed_keys: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def change_ratio(self) -> float:
+        """Share of the union of both snapshots that is new, changed or removed."""
+
+        total = self.new + self.changed + self.unchanged + self.removed
+        return (self.new + self.changed + self.removed) / total if total else 0.0
+
+    def as_stats(self) -> Dict[str, Any]:
+        return {
+            "new": self.new,
+            "changed": self.changed,
+            "unchanged": self.unchanged,
+            "removed": self.removed,
+            "change_ratio": round(self.change_ratio, 6),
+        }
+
+
+class FingerprintStore:
+    """Per-source snapshot of record key -> content hash."""
+
+    def __init__(self, path: Path | str, source: str):
+        self.path = Path(path)
+        self.source = source
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def begin(
+        self,
+        run_id: str,
+        *,
+        key_fields: Sequence[str] = DEFAULT_KEY_FIELDS,
+        ignore_fields: FrozenSet[str] = DEFAULT_IGNORE_FIELDS,
+        max_removed_ratio: float = DEFAULT_MAX_REMOVED_RATIO,
+    ) -> "ChangeTracker":
+        """Start classifying a run; leftovers of an aborted run are discarded."""
+
+        with self._conn:
+            self._conn.execute("DELETE FROM staged WHERE source = ?", (self.source,))
+        return ChangeTracker(self, run_id, tuple(key_fields), ignore_fields, max_removed_ratio)
+
+    def size(self) -> int:
+        row = self._conn.execute(
+            "SELECT COUNT(*) FROM fingerprints WHERE source = ?", (self.source,)
+        ).fetchone()
+        return int(row[0])
+
+    def last_change_ratio(self) -> Optional[float]:
+        row = self._conn.execute(
+            "SELECT change_ratio FROM snapshots WHERE source = ? "
+            "ORDER BY committed_at DESC LIMIT 1",
+            (self.source,),
+        ).fetchone()
+        return float(row[0]) if row else None
+
+
+class ChangeTracker:
+    """One run's classification against a FingerprintStore; see the module docstring."""
+
+    def __init__(
+        self,
+        store: FingerprintStore,
+        run_id: str,
+        key_fields: Tuple[str, ...],
+        ignore_fields: FrozenSet[str],
+        max_removed_ratio: float = DEFAULT_MAX_REMOVED_RATIO,
+    ):
+        self.store = store
+        self.run_id = run_id
+        self.key_fields = key_fields
+        self.ignore_fields = ignore_fields
+        self.max_removed_ratio = max_removed_ratio
+        self.summary = ChangeSummary()
+        self._finalized = False
+        self._conn = store._conn
+        self._source = store.source
+
+    def classify(self, records: Sequence[Mapping[str, Any]]) -> List[str]:
+        """Return the change status of each record, in order, and stage its fingerprint."""
+
+        rows = []
+        for record in records:
+            key = record_key(record, self.key_fields)
+            rows.append(
+                (
+                    _signed(key_hash64(key)),
+                    _signed(content_hash64(record, self.ignore_fields)),
+                    json.dumps(dict(zip(self.key_fields, key)), default=str),
+                )
+            )
+
+        previous = self._lookup("fingerprints", [row[0] for row in rows])
+        staged = self._lookup("staged", [row[0] for row in rows])
+
+        statuses: List[str] = []
+        pending: Dict[int, Tuple[int, int, str]] = {}
+        for key_hash, content, key_json in rows:
+            if key_hash in staged or key_hash in pending:
+                # Repeated key within the run: the first occurrence wins, like dedupe
+                statuses.append(CHANGE_UNCHANGED)
+                continue
+            pending[key_hash] = (key_hash, content, key_json)
+            if key_hash not in previous:
+                statuses.append(CHANGE_NEW)
+                self.summary.new += 1
+            elif previous[key_hash] != content:
+                statuses.append(CHANGE_CHANGED)
+                self.summary.changed += 1
+            else:
+                statuses.append(CHANGE_UNCHANGED)
+                self.summary.unchanged += 1
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO staged (source, key_hash, content_hash, key_json) VALUES (?, ?, ?, ?)",
+                [(self._source, *row) for row in pending.values()],
+            )
+        return statuses
+
+    def finalize(self) -> ChangeSummary:
+        """Fill in the removed keys (known snapshot keys not seen this run).
+
+        Nothing is committed yet.
+        """
+
+        cur = self._conn.execute(
+            """
+            SELECT f.key_json FROM fingerprints f
+            WHERE f.source = ? AND NOT EXISTS (
+                SELECT 1 FROM staged s WHERE s.source = f.source AND s.key_hash = f.key_hash
+            )
+            """,
+            (self._source,),
+        )
+        self.summary.removed_keys = [json.loads(row[0]) for row in cur]
+        self.summary.removed = len(self.summary.removed_keys)
+        self._finalized = True
+        return self.summary
+
+    def removal_problem(self) -> Optional[str]:
+        """Why committing this run would be unsafe, or ``None`` when it looks sane.
+
+        A run that saw no records, or whose removals exceed
+        ``max_removed_ratio`` of the current snapshot, would otherwise wipe
+        the snapshot and make the next run re-export everything.
+        """
+
+        if not self._finalized:
+            self.finalize()
+        summary = self.summary
+        if not summary.new + summary.changed + summary.unchanged:
+            return "run saw no records"
+        size = self.store.size()
+        ratio = summary.removed / size if size else 0.0
+        if ratio > self.max_removed_ratio:
+            return (
+                f"run would remove {summary.removed} of {size} known keys "
+                f"({ratio:.1%} > max_removed_ratio {self.max_removed_ratio:.1%})"
+            )
+        return None
+
+    def commit(self) -> ChangeSummary:
+        """Replace the source's snapshot with this run's fingerprints."""
+
+        if not self._finalized:
+            self.finalize()
+        now = datetime.utcnow().isoformat()
+        with self._conn:
+            self._conn.execute(
+                """
+                DELETE FROM fingerprints WHERE source = ? AND NOT EXISTS (
+                    SELECT 1 FROM staged s
+                    WHERE s.source = fingerprints.source AND s.key_hash = fingerprints.key_hash
+                )
+                """,
+                (self._source,),
+            )
+            self._conn.execute(
+                """
+                INSERT INTO fingerprints
+                    (source, key_hash, content_hash, key_json, run_id, updated_at)
+                SELECT source, key_hash, content_hash, key_json, ?, ? FROM staged WHERE source = ?
+                ON CONFLICT (source, key_hash) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    run_id = excluded.run_id,
+                    updated_at = excluded.updated_at
+                WHERE fingerprints.content_hash != excluded.content_hash
+                """,
+                (self.run_id, now, self._source),
+            )
+            self._conn.execute("DELETE FROM staged WHERE source = ?", (self._source,))
+            summary = self.summary
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._source,
+                    self.run_id,
+                    now,
+                    summary.new,
+                    summary.changed,
+                    summary.unchanged,
+                    summary.removed,
+                    summary.change_ratio,
+                ),
+            )
+        log.info(
+            "Committed change snapshot",
+            extra={"source": self._source, "run_id": self.run_id, **summary.as_stats()},
+        )
+        return summary
+
+    def abort(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM staged WHERE source = ?", (self._source,))
+
+    def _lookup(self, table: str, key_hashes: Iterable[int]) -> Dict[int, int]:
+        found: Dict[int, int] = {}
+        keys = list(dict.fromkeys(key_hashes))
+        for start in range(0, len(keys), _LOOKUP_BATCH):
+            batch = keys[start : start + _LOOKUP_BATCH]
+            placeholders = ", ".join("?" * len(batch))
+            cur = self._conn.execute(
+                f"SELECT key_hash, content_hash FROM {table} "
+                f"WHERE source = ? AND key_hash IN ({placeholders})",
+                (self._source, *batch),
+            )
+            found.update(cur.fetchall())
+        return found
+
+
+__all__ = [
+    "CHANGE_NEW",
+    "CHANGE_CHANGED",
+    "CHANGE_UNCHANGED",
+    "CHANGE_REMOVED",
+    "ChangeSummary",
+    "ChangeTracker",
+    "DEFAULT_MAX_REMOVED_RATIO",
+    "FingerprintStore",
+    "IncrementalSettings",
+    "content_hash64",
+]
@@ -1,14 +1,218 @@
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import Iterable, List, Sequence
+import os
+import shutil
+import tempfile
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from src.core_kernel.models import NormalizedRecord
+import numpy as np
+
+from src.observability import metrics
+
+if TYPE_CHECKING:
+    from src.core_kernel.models import NormalizedRecord
 
 log = logging.getLogger("dedupe")
 
+DEFAULT_KEY_FIELDS: Tuple[str, ...] = ("product_url", "name")
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 10_000
+
+# In-memory runs are merged once there are this many, to keep lookups cheap
+_MAX_MEMORY_RUNS = 8
+
+
+def record_key(record: Any, key_fields: Sequence[str]) -> Tuple[Any, ...]:
+    """Key tuple for a dict or attribute-style record (e.g. ``NormalizedRecord``)."""
+
+    if isinstance(record, dict):
+        return tuple(record.get(field) for field in key_fields)
+    return tuple(getattr(record, field) for field in key_fields)
+
+
+def key_hash64(key: Tuple[Any, ...]) -> int:
+    """Stable 64-bit hash of a key tuple.
+
+    Unlike ``hash()`` this is identical across processes, so hashes can be
+    spilled to disk and compared later. Distinct keys collide with
+    probability ~n^2 / 2^65 (about 3e-6 for ten million keys).
+    """
+
+    digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _contains(run: np.ndarray, hashes: np.ndarray) -> np.ndarray:
+    if not len(run):
+        return np.zeros(len(hashes), dtype=bool)
+    idx = np.searchsorted(run, hashes)
+    np.minimum(idx, len(run) - 1, out=idx)
+    return run[idx] == hashes
+
+
+@dataclass
+class DedupeStats:
+    records: int = 0
+    unique: int = 0
+    duplicates: int = 0
+    spills: int = 0
+
+
+class StreamingDeduper:
+    """First-occurrence-wins dedupe over an unbounded record stream.
+
+    Keys are reduced to 64-bit hashes (:func:`key_hash64`) and kept as sorted
+    ``uint64`` runs. While the runs fit in ``memory_budget`` bytes they stay
+    in memory; past that they are merged and spilled to a sorted file under
+    ``spill_dir`` that is memory-mapped for lookups. Records are processed in
+    chunks of ``chunk_size``, so each lookup is a vectorized binary search per
+    run rather than a Python set probe.
+
+    Duplicates are reported as aggregated ``dedupe.*`` counters and in
+    :attr:`stats`, never one log line per record. Use as a context manager
+    (or call :meth:`close`) to delete spill files.
+    """
+
+    def __init__(
+        self,
+        key_fields: Sequence[str] = DEFAULT_KEY_FIELDS,
+        *,
+        key_fn: Optional[Callable[[Any], Tuple[Any, ...]]] = None,
+        memory_budget: Optional[int] = None,
+        spill_dir: Optional[Path | str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        source: Optional[str] = None,
+    ):
+        self.key_fields = tuple(key_fields)
+        self.key_fn = key_fn or (lambda record: record_key(record, self.key_fields))
+        if memory_budget is None:
+            budget_mb = float(os.getenv("DEDUPE_MEMORY_MB", DEFAULT_MEMORY_BUDGET / 2**20))
+            memory_budget = int(budget_mb * 2**20)
+        self.memory_budget = max(8, memory_budget)
+        self.spill_root = spill_dir or os.getenv("DEDUPE_SPILL_DIR") or None
+        self.chunk_size = max(1, chunk_size)
+        self.stats = DedupeStats()
+        self._labels = {"source": source} if source else {}
+        self._memory_runs: List[np.ndarray] = []
+        self._disk_runs: List[np.ndarray] = []
+        self._spill_dir: Optional[Path] = None
+        self._finalizer: Optional[weakref.finalize] = None
+
+    def __enter__(self) -> "StreamingDeduper":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(run.nbytes for run in self._memory_runs)
+
+    def filter(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Yield the first record of every key, in input order."""
 
-def dedupe_records(records: Iterable[NormalizedRecord], key_fields: Sequence[str] = ("product_url", "name")) -> List[NormalizedRecord]:
+        chunk: List[Any] = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= self.chunk_size:
+                yield from self.filter_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield from self.filter_chunk(chunk)
+
+    def filter_chunk(self, records: Sequence[Any]) -> List[Any]:
+        """Return the records of ``records`` whose key has not been seen before."""
+
+        if not records:
+            return []
+        hashes = np.fromiter(map(self._hash, records), dtype=np.uint64, count=len(records))
+        uniq, first_idx = np.unique(hashes, return_index=True)
+        fresh = np.ones(len(uniq), dtype=bool)
+        for run in self._memory_runs + self._disk_runs:
+            fresh &= ~_contains(run, uniq)
+
+        keep_idx = np.sort(first_idx[fresh])
+        self._add(uniq[fresh])
+        kept = [records[i] for i in keep_idx.tolist()]
+
+        duplicates = len(records) - len(kept)
+        self.stats.records += len(records)
+        self.stats.unique += len(kept)
+        self.stats.duplicates += duplicates
+        metrics.incr("dedupe.records", amount=len(records), **self._labels)
+        if duplicates:
+            metrics.incr("dedupe.duplicates", amount=duplicates, **self._labels)
+        return kept
+
+    def close(self) -> None:
+        """Drop all seen keys and delete spill files."""
+
+        self._memory_runs = []
+        self._disk_runs = []
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+            self._spill_dir = None
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    def _hash(self, record: Any) -> int:
+        try:
+            return key_hash64(self.key_fn(record))
+        except Exception as exc:  # pragma: no cover - defensive guard
+            log.warning("Failed to compute dedupe key: %s", exc)
+            # A hash of the object identity keeps the record without matching others
+            return key_hash64(("__unkeyed__", id(record)))
+
+    def _add(self, new_hashes: np.ndarray) -> None:
+        if not len(new_hashes):
+            return
+        self._memory_runs.append(new_hashes)  # np.unique output is already sorted
+        if len(self._memory_runs) > _MAX_MEMORY_RUNS:
+            self._memory_runs = [np.sort(np.concatenate(self._memory_runs))]
+        if self.memory_bytes > self.memory_budget:
+            self._spill()
+
+    def _spill(self) -> None:
+        merged = np.sort(np.concatenate(self._memory_runs))
+        if self._spill_dir is None:
+            if self.spill_root:
+                Path(self.spill_root).mkdir(parents=True, exist_ok=True)
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="dedupe-", dir=self.spill_root))
+            self._finalizer = weakref.finalize(self, shutil.rmtree, str(self._spill_dir), True)
+
+        path = self._spill_dir / f"run-{len(self._disk_runs):05d}.u64"
+        merged.tofile(path)
+        self._disk_runs.append(np.memmap(path, dtype=np.uint64, mode="r"))
+        self._memory_runs = []
+        self.stats.spills += 1
+        metrics.incr("dedupe.spills", **self._labels)
+        log.info(
+            "Spilled dedupe keys to disk",
+            extra={"keys": int(len(merged)), "runs": len(self._disk_runs), "path": str(path)},
+        )
+
+
+def dedupe_stream(
+    records: Iterable[Any],
+    key_fields: Sequence[str] = DEFAULT_KEY_FIELDS,
+    **options: Any,
+) -> Iterator[Any]:
+    """Generator form of :class:`StreamingDeduper`; spill files are removed when it finishes."""
+
+    with StreamingDeduper(key_fields, **options) as deduper:
+        yield from deduper.filter(records)
+
+
+def dedupe_records(
+    records: Iterable[NormalizedRecord], key_fields: Sequence[str] = DEFAULT_KEY_FIELDS
+) -> List[NormalizedRecord]:
     """Remove duplicate records based on the provided key fields.
 
     Args:
@@ -20,25 +224,28 @@ def dedupe_records(records: Iterable[NormalizedRecord], key_fields: Sequence[str
         key tuple retained.
 
     Side effects:
-        Logs a message for each dropped duplicate for observability.
+        Increments the ``dedupe.records`` / ``dedupe.duplicates`` counters and
+        logs one summary line when duplicates were dropped. Keys are tracked
+        by a :class:`StreamingDeduper`, so very large inputs spill key hashes
+        to disk instead of growing an in-memory set.
     """
 
-    seen = set()
-    unique: List[NormalizedRecord] = []
-
-    for record in records:
-        try:
-            key = tuple(record.get(field) if isinstance(record, dict) else getattr(record, field) for field in key_fields)
-        except Exception as exc:  # pragma: no cover - defensive guard
-            log.warning("Failed to compute dedupe key: %s", exc)
-            unique.append(record)
-            continue
-
-        if key in seen:
-            log.info("Dropping duplicate record", extra={"key": key})
-            continue
+    with StreamingDeduper(key_fields) as deduper:
+        unique = list(deduper.filter(records))
+        if deduper.stats.duplicates:
+            log.info(
+                "Dropped duplicate records",
+                extra={"duplicates": deduper.stats.duplicates, "records": deduper.stats.records},
+            )
+    return unique
 
-        seen.add(key)
-        unique.append(record)
 
-    return unique
+__all__ = [
+    "DEFAULT_KEY_FIELDS",
+    "DedupeStats",
+    "StreamingDeduper",
+    "dedupe_records",
+    "dedupe_stream",
+    "key_hash64",
+    "record_key",
+]
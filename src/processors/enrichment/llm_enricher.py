@@ -10,14 +10,50 @@ Provides enrichment capabilities:
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 from src.common.logging_utils import get_logger
 from src.processors.llm.llm_client import LLMClient, get_llm_client_from_config
 
+if TYPE_CHECKING:  # pragma: no cover
+    from src.processors.llm.async_llm_client import AsyncLLMClient
+
 log = get_logger("llm-enricher")
 
+DEFAULT_TRANSLATE_FIELDS = ["name", "description", "presentation", "company"]
+
+
+def _translation_prompt(text: str, target_language: str) -> str:
+    return (
+        f"Translate the following text to {target_language}. "
+        f"Return only the translation, no explanation:\n\n{text}"
+    )
+
+
+def _metadata_prompt(record: Dict[str, Any]) -> str:
+    context = "\n".join(f"{k}: {v}" for k, v in record.items() if v)
+    return f"""Analyze this product record and extract additional metadata:
+
+{context}
+
+Return JSON with:
+- category: Product category
+- tags: List of relevant tags
+- description_summary: Brief summary
+- inferred_fields: Any other useful inferred fields"""
+
+
+def _merge_metadata(record: Dict[str, Any], result: Any) -> Dict[str, Any]:
+    if not isinstance(result, dict):
+        return record
+    expanded = record.copy()
+    for key, value in result.items():
+        if key not in expanded or not expanded[key]:
+            expanded[key] = value
+    return expanded
+
 
 def translate_record(
     record: Dict[str, Any],
@@ -51,16 +87,16 @@ def translate_record(
     
     # Default fields to translate
     if fields is None:
-        fields = ["name", "description", "presentation", "company"]
+        fields = DEFAULT_TRANSLATE_FIELDS
     
     translated = record.copy()
     
     for field in fields:
         if field in record and record[field]:
             try:
-                text = str(record[field])
-                prompt = f"Translate the following text to {target_language}. Return only the translation, no explanation:\n\n{text}"
-                result = llm_client.complete(prompt)
+                result = llm_client.complete(
+                    _translation_prompt(str(record[field]), target_language)
+                )
                 translated[field] = result.strip()
             except Exception as exc:
                 log.warning(f"Translation failed for field {field}", extra={"error": str(exc)})
@@ -100,36 +136,75 @@ def expand_metadata(
         return record
     
     try:
-        # Build context from record
-        context = "\n".join(f"{k}: {v}" for k, v in record.items() if v)
-        
-        prompt = f"""Analyze this product record and extract additional metadata:
-
-{context}
-
-Return JSON with:
-- category: Product category
-- tags: List of relevant tags
-- description_summary: Brief summary
-- inferred_fields: Any other useful inferred fields"""
-        
-        result = llm_client.extract_json(prompt)
-        
-        if isinstance(result, dict):
-            # Merge inferred fields
-            expanded = record.copy()
-            for key, value in result.items():
-                if key not in expanded or not expanded[key]:
-                    expanded[key] = value
-            
-            return expanded
-    
+        result = llm_client.extract_json(_metadata_prompt(record))
+        return _merge_metadata(record, result)
     except Exception as exc:
         log.warning("Metadata expansion failed", extra={"error": str(exc)})
     
     return record
 
 
+async def translate_records_async(
+    records: List[Dict[str, Any]],
+    target_language: str,
+    llm_client: "AsyncLLMClient",
+    fields: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Translate many records concurrently (async batch variant of ``translate_record``).
+
+    Every field of every record is submitted at once; the client's
+    concurrency limit and rate budget decide how many run in parallel.
+    Fields whose translation fails keep their original value.
+
+    Returns:
+        Translated copies of ``records``, in input order
+    """
+    fields = DEFAULT_TRANSLATE_FIELDS if fields is None else fields
+    jobs = [
+        (idx, field) for idx, record in enumerate(records) for field in fields if record.get(field)
+    ]
+    results = await asyncio.gather(
+        *(
+            llm_client.acomplete(_translation_prompt(str(records[idx][field]), target_language))
+            for idx, field in jobs
+        ),
+        return_exceptions=True,
+    )
+
+    translated = [record.copy() for record in records]
+    for (idx, field), result in zip(jobs, results):
+        if isinstance(result, BaseException):
+            log.warning(f"Translation failed for field {field}", extra={"error": str(result)})
+            continue
+        translated[idx][field] = result.strip()
+    return translated
+
+
+async def expand_metadata_async(
+    records: List[Dict[str, Any]],
+    llm_client: "AsyncLLMClient",
+) -> List[Dict[str, Any]]:
+    """
+    Expand metadata for many records concurrently (async batch variant of ``expand_metadata``).
+
+    Returns:
+        Expanded records in input order; a record whose call fails is returned unchanged
+    """
+    results = await asyncio.gather(
+        *(llm_client.aextract_json(_metadata_prompt(record)) for record in records),
+        return_exceptions=True,
+    )
+    expanded = []
+    for record, result in zip(records, results):
+        if isinstance(result, BaseException):
+            log.warning("Metadata expansion failed", extra={"error": str(result)})
+            expanded.append(record)
+        else:
+            expanded.append(_merge_metadata(record, result))
+    return expanded
+
+
 def correct_ocr_errors(
     text: str,
     llm_client: Optional[LLMClient] = None,
@@ -9,6 +9,11 @@ It expects either:
 - DB_NAME, DB_USER, DB_PASS,
   DB_HOST, DB_PORT                (to build a DSN), AND
 - DB_TABLE or SCRAPER_DB_TABLE    (target table name)
+- DB_CONFLICT_KEY                 (optional, comma-separated unique key;
+                                   turns the load into an upsert)
+
+Rows are streamed through pg_copy_loader (COPY into a staging table, then
+INSERT ... SELECT / ON CONFLICT upsert).
 
 If these are not set, it will raise RuntimeError instead of silently
 doing nothing.
@@ -18,9 +23,11 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Iterable, Mapping, Any, List
+from itertools import chain
+from typing import Any, Iterable, Mapping, Optional, Sequence, Tuple
 
 from src.common.logging_utils import get_logger
+from src.processors.exporters.pg_copy_loader import PostgresCopyLoader
 
 log = get_logger("database-loader")
 
@@ -67,26 +74,42 @@ def _get_table_name(explicit: str | None = None) -> str:
     return table
 
 
+def _conflict_key(explicit: Optional[Sequence[str]] = None) -> Tuple[str, ...]:
+    if explicit is not None:
+        return tuple(explicit)
+    raw = os.getenv("DB_CONFLICT_KEY", "")
+    return tuple(part.strip() for part in raw.split(",") if part.strip())
+
+
 def export_records(
     records: Iterable[Mapping[str, Any]],
     table: str | None = None,
+    *,
+    conflict_key: Optional[Sequence[str]] = None,
+    columns: Optional[Sequence[str]] = None,
 ) -> int:
     """
     Persist records into the warehouse / OLTP DB.
 
     Args:
-        records: iterable of dict-like rows.
+        records: iterable of dict-like rows; consumed lazily, so a generator
+                 of any length is fine.
         table: optional table name override. If not provided, will use
                DB_TABLE or SCRAPER_DB_TABLE env var.
+        conflict_key: optional unique-key columns to upsert on; defaults to
+               DB_CONFLICT_KEY (plain insert when unset).
+        columns: optional column order; defaults to the target table's
+               columns (see PostgresCopyLoader).
 
     Returns:
-        Number of rows successfully inserted.
+        Number of rows successfully loaded.
 
     Raises:
         RuntimeError if psycopg2 or DB configuration is missing.
     """
-    recs: List[Mapping[str, Any]] = list(records)
-    if not recs:
+    iterator = iter(records)
+    first = next(iterator, None)
+    if first is None:
         log.info("database_loader: no records to export")
         return 0
 
@@ -97,43 +120,18 @@ def export_records(
         )
 
     table_name = _get_table_name(table)
-    dsn = _get_dsn()
-
-    # Union of keys across all records
-    cols = sorted({k for r in recs for k in r.keys()})
-    if not cols:
-        log.warning("database_loader: records have no columns; skipping export")
-        return 0
-
-    log.info(
-        "database_loader: exporting %d records to %s",
-        len(recs),
+    loader = PostgresCopyLoader(
         table_name,
+        dsn=_get_dsn(),
+        conflict_key=_conflict_key(conflict_key),
+        columns=columns,
     )
-
-    # Bulk insert using executemany (avoids psycopg2.extras dependency)
-    # This works on Windows and is more portable
-    with psycopg2.connect(dsn) as conn:  # type: ignore[call-arg]
-        with conn.cursor() as cur:
-            # Build safe column names (already validated by _get_table_name)
-            col_list = ", ".join(f'"{c}"' for c in cols)
-            placeholders = ", ".join(["%s"] * len(cols))
-            insert_sql = f'INSERT INTO "{table_name}" ({col_list}) VALUES ({placeholders})'
-
-            # Batch insert in chunks of 1000 for efficiency
-            batch_size = 1000
-            inserted = 0
-            for i in range(0, len(recs), batch_size):
-                batch = recs[i : i + batch_size]
-                batch_rows = [tuple(r.get(c) for c in cols) for r in batch]
-                cur.executemany(insert_sql, batch_rows)
-                inserted += len(batch_rows)
-
-            conn.commit()
+    stats = loader.load(chain([first], iterator))
 
     log.info(
-        "database_loader: successfully exported %d records to %s",
-        inserted,
+        "database_loader: successfully exported %d records to %s (%.0f rows/s)",
+        stats.rows,
         table_name,
+        stats.rows_per_second,
     )
-    return inserted
+    return stats.rows
@@ -2,15 +2,34 @@
 Google Cloud Storage exporter utilities.
 
 Provides a minimal wrapper around ``google-cloud-storage`` to push processed
-records directly into a bucket.
+records directly into a bucket. Records are serialized as they are read (see
+``streaming_upload``); exports larger than one part are uploaded as parallel
+part objects and stitched together with ``compose`` (a parallel composite
+upload), then the part objects are deleted.
 """
 
 from __future__ import annotations
 
-import csv
-from io import StringIO
-from pathlib import Path
-from typing import Iterable, Mapping, Optional
+import threading
+import uuid
+from itertools import chain
+from typing import Any, Iterable, List, Mapping, Optional
+
+from src.common.logging_utils import get_logger
+from src.processors.exporters.streaming_upload import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PART_SIZE,
+    UploadStats,
+    content_headers,
+    iter_csv_parts,
+    object_key,
+    upload_parts,
+)
+
+log = get_logger("gcs-exporter")
+
+# GCS compose accepts at most 32 source objects per call
+MAX_COMPOSE_SOURCES = 32
 
 
 def export_to_gcs(
@@ -19,49 +38,109 @@ def export_to_gcs(
     bucket: str,
     prefix: str | None = None,
     object_name: Optional[str] = None,
+    compression: Optional[str] = None,
+    part_size: int = DEFAULT_PART_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    client: Any = None,
 ) -> str:
     """
     Upload records as a CSV object to Google Cloud Storage.
 
     Args:
-        records: Iterable of record mappings to serialize.
+        records: Iterable of record mappings to serialize; consumed lazily.
         bucket: Destination GCS bucket name.
         prefix: Optional key prefix (``"folder/"`` style) to prepend.
         object_name: Optional object name; defaults to ``export.csv`` when not
-            provided.
+            provided. ``.gz`` / ``.zst`` is appended when compressing.
+        compression: ``"gzip"``, ``"zstd"`` or ``None``.
+        part_size: Size in bytes of each part object.
+        max_concurrency: Parts uploaded in parallel.
+        client: Optional ``storage.Client``; one is created when omitted.
 
     Returns:
-        The full object key uploaded to GCS.
+        The full object key uploaded to GCS, or ``""`` if there were no records.
 
     Raises:
         google.cloud.exceptions.GoogleCloudError for upload failures.
         ImportError if ``google-cloud-storage`` is not installed.
     """
 
-    rows = list(records)
-    if not rows:
+    stats = UploadStats()
+    parts = iter_csv_parts(records, part_size=part_size, compression=compression, stats=stats)
+    first = next(parts, None)
+    if first is None:
         return ""
 
-    from google.cloud import storage
-
-    object_key = object_name or "export.csv"
-    normalized_prefix = prefix or ""
-    if normalized_prefix and not normalized_prefix.endswith("/"):
-        normalized_prefix = f"{normalized_prefix}/"
-    full_key = f"{normalized_prefix}{Path(object_key).name}" if normalized_prefix else Path(object_key).name
+    if client is None:
+        from google.cloud import storage
 
-    buffer = StringIO()
-    fieldnames = list(rows[0].keys())
-    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(rows)
+        client = storage.Client()
 
-    client = storage.Client()
+    full_key = object_key(object_name, prefix, compression)
+    headers = content_headers(compression)
     bucket_obj = client.bucket(bucket)
-    blob = bucket_obj.blob(full_key)
-    blob.upload_from_string(buffer.getvalue(), content_type="text/csv")
-
+    target = bucket_obj.blob(full_key)
+    target.content_encoding = headers.get("content_encoding")
+
+    second = next(parts, None)
+    if second is None:
+        target.upload_from_string(first, content_type=headers["content_type"])
+    else:
+        part_prefix = f"{full_key}.parts-{uuid.uuid4().hex}/"
+        created: List[Any] = []
+        lock = threading.Lock()
+
+        def upload(number: int, data: bytes) -> Any:
+            blob = bucket_obj.blob(f"{part_prefix}{number:06d}")
+            with lock:
+                created.append(blob)
+            blob.upload_from_string(data, content_type="application/octet-stream")
+            return blob
+
+        try:
+            sources = upload_parts(
+                chain([first, second], parts),
+                upload,
+                max_concurrency=max_concurrency,
+                backend="gcs",
+            )
+            level = 0
+            while len(sources) > MAX_COMPOSE_SOURCES:
+                # Compose in rounds of 32 until one final compose can take the rest
+                merged = []
+                for start in range(0, len(sources), MAX_COMPOSE_SOURCES):
+                    blob = bucket_obj.blob(f"{part_prefix}compose-{level}-{start:06d}")
+                    created.append(blob)
+                    blob.compose(sources[start : start + MAX_COMPOSE_SOURCES])
+                    merged.append(blob)
+                sources = merged
+                level += 1
+            target.content_type = headers["content_type"]
+            target.compose(sources)
+        finally:
+            _delete_quietly(created)
+
+    log.info(
+        "gcs_exporter: uploaded %d rows (%d bytes, %d parts) to gs://%s/%s",
+        stats.rows,
+        stats.bytes,
+        stats.parts,
+        bucket,
+        full_key,
+    )
     return full_key
 
 
+def _delete_quietly(blobs: Iterable[Any]) -> None:
+    for blob in blobs:
+        try:
+            blob.delete()
+        except Exception as exc:  # pragma: no cover - best-effort cleanup
+            log.warning(
+                "gcs_exporter: could not delete part object %s: %s",
+                getattr(blob, "name", blob),
+                exc,
+            )
+
+
 __all__ = ["export_to_gcs"]
@@ -0,0 +1,344 @@
+# file: src/processors/exporters/pg_copy_loader.py
+"""
+Streaming Postgres bulk loader built on ``COPY FROM STDIN``.
+
+Rows are pulled from any iterable (a generator is fine), encoded to COPY text
+format on the fly and streamed into a temporary staging table, one COPY per
+``batch_rows`` rows. Each batch is then moved into the target table with a
+single ``INSERT ... SELECT``; with a ``conflict_key`` this is an upsert
+(``ON CONFLICT (...) DO UPDATE``) where the last row for a key wins. The whole
+load is one transaction.
+
+The column list is fixed once, from ``columns`` or else the target table's
+columns in ``information_schema``. Identity and generated columns are left to
+the database; columns with a DEFAULT are loaded only when some row of the first
+batch carries them, so the default still applies when the records never set
+them. Row keys outside that list are dropped and counted, because COPY needs
+the same shape for every row; missing keys load as NULL.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import re
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+from src.common.logging_utils import get_logger
+from src.observability import metrics
+
+log = get_logger("pg-copy-loader")
+
+try:
+    import psycopg2
+except Exception:  # pragma: no cover - import guard
+    psycopg2 = None  # type: ignore[attr-defined]
+
+_TABLE_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_\.]*$")
+_STAGING_TABLE = "_copy_stage"
+_SEQ_COLUMN = "_copy_seq"
+
+_TABLE_COLUMNS_SQL = """
+SELECT column_name, column_default IS NOT NULL FROM information_schema.columns
+WHERE table_schema = COALESCE(%s, current_schema()) AND table_name = %s
+  AND is_identity = 'NO' AND is_generated = 'NEVER'
+ORDER BY ordinal_position
+"""
+
+DEFAULT_BATCH_ROWS = 250_000
+_READ_SIZE = 1 << 16
+
+_NEEDS_ESCAPE = re.compile(r"[\\\t\n\r]")
+_ESCAPES = {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+
+
+def quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def quote_table(table: str) -> str:
+    if not _TABLE_NAME_RE.match(table):
+        raise RuntimeError(f"Unsafe table name for export: {table!r}")
+    return ".".join(quote_ident(part) for part in table.split("."))
+
+
+def _escape_text(text: str) -> str:
+    # Most values need no escaping; the regex scan is much cheaper than str.translate
+    if _NEEDS_ESCAPE.search(text) is None:
+        return text
+    return _NEEDS_ESCAPE.sub(lambda m: _ESCAPES[m.group()], text)
+
+
+# One shared encoder; json.dumps with non-default options builds a new one per call
+_json_encode = json.JSONEncoder(default=str, ensure_ascii=False).encode
+
+
+def _encode_json(value: Any) -> str:
+    return _escape_text(_json_encode(value))
+
+
+# Exact-type dispatch for the common cases; subclasses fall through to copy_value's checks
+_ENCODERS: Dict[type, Callable[[Any], str]] = {
+    str: _escape_text,
+    int: str,
+    float: str,
+    type(None): lambda _value: "\\N",
+    bool: lambda value: "t" if value else "f",
+    dict: _encode_json,
+    list: _encode_json,
+}
+
+
+def copy_value(value: Any) -> str:
+    """Encode one value as a COPY text-format field."""
+
+    encoder = _ENCODERS.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (dict, list, tuple)):
+        return _encode_json(value)
+    return _escape_text(str(value))
+
+
+class _CopyStream(io.RawIOBase):
+    """Readable byte stream over encoded COPY lines, for ``cursor.copy_expert``."""
+
+    def __init__(self, lines: Iterator[str]):
+        self._lines = lines
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target: Any) -> int:
+        size = len(target)
+        while len(self._buffer) < size:
+            chunk = "".join(islice(self._lines, 512))
+            if not chunk:
+                break
+            self._buffer += chunk.encode("utf-8")
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        target[: len(data)] = data
+        return len(data)
+
+
+@dataclass
+class LoadStats:
+    rows: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+    dropped_columns: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class PostgresCopyLoader:
+    """Bulk-load rows into ``table`` via COPY into a staging table plus INSERT/upsert.
+
+    Args:
+        table: Target table (``name`` or ``schema.name``).
+        dsn: Connection string; ignored when ``connection`` is given.
+        conflict_key: Columns of the target's unique key; enables upsert.
+        columns: Column order; defaults to the target table's columns, minus
+            identity and generated ones and defaulted ones the first batch
+            never sets.
+        update_columns: Columns refreshed on conflict; defaults to every
+            non-key column.
+        batch_rows: Rows per COPY + INSERT round.
+        connection: An open psycopg2 connection to use (not closed here).
+        connect: Connection factory called with ``dsn``; defaults to
+            ``psycopg2.connect``.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        *,
+        dsn: Optional[str] = None,
+        conflict_key: Sequence[str] = (),
+        columns: Optional[Sequence[str]] = None,
+        update_columns: Optional[Sequence[str]] = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        connection: Any = None,
+        connect: Optional[Callable[[str], Any]] = None,
+    ):
+        self.table = table
+        self._target = quote_table(table)
+        self.dsn = dsn
+        self.conflict_key = tuple(conflict_key)
+        self.columns = list(columns) if columns else None
+        self.update_columns = list(update_columns) if update_columns is not None else None
+        self.batch_rows = max(1, batch_rows)
+        self._connection = connection
+        self._connect = connect
+
+    def load(self, rows: Iterable[Mapping[str, Any]]) -> LoadStats:
+        """Stream ``rows`` into the table; returns row count, batches and throughput."""
+
+        stats = LoadStats()
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if first is None:
+            log.info("pg_copy_loader: no rows to load", extra={"table": self.table})
+            return stats
+
+        started = time.perf_counter()
+        conn = self._open()
+        try:
+            with conn.cursor() as cur:
+                if self.columns:
+                    columns, sample = self.columns, [first]
+                else:
+                    # The first batch is buffered so defaulted columns it sets are kept
+                    sample = [first, *islice(iterator, self.batch_rows - 1)]
+                    columns = self._table_columns(cur, sample)
+                missing_key = [c for c in self.conflict_key if c not in columns]
+                if missing_key:
+                    raise ValueError(
+                        f"conflict key columns {missing_key} are not in the loaded "
+                        f"columns {columns}"
+                    )
+                self._create_staging(cur, columns)
+                rows_iter: Iterator[Mapping[str, Any]] = chain(sample, iterator)
+                for head in rows_iter:
+                    # Batches are streamed straight from the iterator; only the COPY buffer
+                    # is held in memory
+                    batch = chain([head], islice(rows_iter, self.batch_rows - 1))
+                    self._copy_batch(cur, columns, batch, stats)
+                    self._merge_batch(cur, columns)
+                    stats.batches += 1
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            if self._connection is None:
+                conn.close()
+
+        stats.seconds = time.perf_counter() - started
+        metrics.incr("db.copy.rows", amount=stats.rows, table=self.table)
+        metrics.set_gauge("db.copy.rows_per_second", stats.rows_per_second, table=self.table)
+        if stats.dropped_columns:
+            log.warning(
+                "pg_copy_loader: rows had keys outside the fixed column list; "
+                "extra keys were dropped",
+                extra={"table": self.table, "rows": stats.dropped_columns, "columns": columns},
+            )
+        log.info(
+            "pg_copy_loader: loaded %d rows into %s in %.2fs (%.0f rows/s)",
+            stats.rows,
+            self.table,
+            stats.seconds,
+            stats.rows_per_second,
+        )
+        return stats
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    def _open(self) -> Any:
+        if self._connection is not None:
+            return self._connection
+        if self._connect is not None:
+            return self._connect(self.dsn or "")
+        if psycopg2 is None:  # type: ignore[truthy-function]
+            raise RuntimeError(
+                "Database export requested but psycopg2 is not available. "
+                "Install psycopg2 or vendor it into the runtime."
+            )
+        return psycopg2.connect(self.dsn)  # type: ignore[call-arg]
+
+    def _table_columns(self, cur: Any, sample: Sequence[Mapping[str, Any]]) -> List[str]:
+        schema, _, name = self.table.rpartition(".")
+        cur.execute(_TABLE_COLUMNS_SQL, (schema or None, name))
+        keys = set().union(*(row.keys() for row in sample))
+        columns = [
+            column for column, has_default in cur.fetchall() if not has_default or column in keys
+        ]
+        if not columns:
+            raise RuntimeError(
+                f"No loadable columns found for table {self.table!r}; does it exist?"
+            )
+        return columns
+
+    def _create_staging(self, cur: Any, columns: List[str]) -> None:
+        # The loaded columns with the target's types (no constraints), so COPY parses
+        # values as INSERT would
+        col_list = ", ".join(quote_ident(c) for c in columns)
+        cur.execute(
+            f"CREATE TEMP TABLE {_STAGING_TABLE} ON COMMIT DROP AS "
+            f"SELECT {col_list} FROM {self._target} WITH NO DATA"
+        )
+        cur.execute(f"ALTER TABLE {_STAGING_TABLE} ADD COLUMN {_SEQ_COLUMN} BIGSERIAL")
+
+    def _copy_batch(
+        self,
+        cur: Any,
+        columns: List[str],
+        batch: Iterable[Mapping[str, Any]],
+        stats: LoadStats,
+    ) -> None:
+        column_set = frozenset(columns)
+
+        def lines() -> Iterator[str]:
+            for row in batch:
+                stats.rows += 1
+                if not row.keys() <= column_set:
+                    stats.dropped_columns += 1
+                yield "\t".join(map(copy_value, map(row.get, columns))) + "\n"
+
+        col_list = ", ".join(quote_ident(c) for c in columns)
+        cur.copy_expert(
+            f"COPY {_STAGING_TABLE} ({col_list}) FROM STDIN", _CopyStream(lines()), size=_READ_SIZE
+        )
+
+    def _merge_batch(self, cur: Any, columns: List[str]) -> None:
+        col_list = ", ".join(quote_ident(c) for c in columns)
+        if not self.conflict_key:
+            cur.execute(
+                f"INSERT INTO {self._target} ({col_list}) SELECT {col_list} FROM {_STAGING_TABLE}"
+            )
+        else:
+            key_list = ", ".join(quote_ident(c) for c in self.conflict_key)
+            updates = self.update_columns
+            if updates is None:
+                updates = [c for c in columns if c not in self.conflict_key]
+            if updates:
+                action = "DO UPDATE SET " + ", ".join(
+                    f"{quote_ident(c)} = EXCLUDED.{quote_ident(c)}" for c in updates
+                )
+            else:
+                action = "DO NOTHING"
+            # DISTINCT ON keeps the last staged row per key; ON CONFLICT cannot touch a row twice
+            cur.execute(
+                f"INSERT INTO {self._target} ({col_list}) "
+                f"SELECT DISTINCT ON ({key_list}) {col_list} FROM {_STAGING_TABLE} "
+                f"ORDER BY {key_list}, {_SEQ_COLUMN} DESC "
+                f"ON CONFLICT ({key_list}) {action}"
+            )
+        cur.execute(f"TRUNCATE {_STAGING_TABLE}")
+
+
+__all__ = [
+    "PostgresCopyLoader",
+    "LoadStats",
+    "copy_value",
+    "quote_ident",
+    "quote_table",
+    "DEFAULT_BATCH_ROWS",
+]
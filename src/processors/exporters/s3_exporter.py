@@ -2,15 +2,33 @@
 S3 exporter utilities.
 
 This module provides a thin wrapper around ``boto3`` to push processed
-records directly into an S3 bucket.
+records directly into an S3 bucket. Records are serialized as they are read
+and uploaded as a multipart upload with parallel part uploads (see
+``streaming_upload``), so memory stays bounded by the part buffers rather
+than the export size, and exports are not limited to ``put_object``'s 5 GB.
 """
 
 from __future__ import annotations
 
-import csv
-from io import StringIO
-from pathlib import Path
-from typing import Iterable, Mapping, Optional
+from itertools import chain
+from typing import Any, Iterable, Mapping, Optional
+
+from src.common.logging_utils import get_logger
+from src.processors.exporters.streaming_upload import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PART_SIZE,
+    UploadStats,
+    content_headers,
+    iter_csv_parts,
+    object_key,
+    upload_parts,
+)
+
+log = get_logger("s3-exporter")
+
+# S3 rejects multipart parts under 5 MiB (except the last) and uploads over 10,000 parts
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10_000
 
 
 def export_to_s3(
@@ -19,46 +37,95 @@ def export_to_s3(
     bucket: str,
     prefix: str | None = None,
     object_name: Optional[str] = None,
+    compression: Optional[str] = None,
+    part_size: int = DEFAULT_PART_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    client: Any = None,
 ) -> str:
     """
     Upload records as a CSV object to S3.
 
     Args:
-        records: Iterable of record mappings to serialize.
+        records: Iterable of record mappings to serialize; consumed lazily.
         bucket: Destination S3 bucket name.
         prefix: Optional key prefix (``"folder/"`` style) to prepend.
         object_name: Optional object name; defaults to ``export.csv`` when not
-            provided.
+            provided. ``.gz`` / ``.zst`` is appended when compressing.
+        compression: ``"gzip"``, ``"zstd"`` or ``None``.
+        part_size: Multipart part size in bytes (at least 5 MiB).
+        max_concurrency: Parts uploaded in parallel.
+        client: Optional boto3 S3 client; one is created when omitted.
 
     Returns:
-        The full object key uploaded to S3.
+        The full object key uploaded to S3, or ``""`` if there were no records.
 
     Raises:
-        botocore.exceptions.BotoCoreError or ClientError if the upload fails.
+        botocore.exceptions.BotoCoreError or ClientError if the upload fails
+        (a started multipart upload is aborted first).
         ImportError if ``boto3`` is not installed.
     """
 
-    rows = list(records)
-    if not rows:
-        return ""
-
-    import boto3
-
-    object_key = object_name or "export.csv"
-    normalized_prefix = prefix or ""
-    if normalized_prefix and not normalized_prefix.endswith("/"):
-        normalized_prefix = f"{normalized_prefix}/"
-    full_key = f"{normalized_prefix}{Path(object_key).name}" if normalized_prefix else Path(object_key).name
+    if part_size < MIN_PART_SIZE:
+        raise ValueError(f"S3 multipart parts must be at least {MIN_PART_SIZE} bytes")
 
-    buffer = StringIO()
-    fieldnames = list(rows[0].keys())
-    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(rows)
-
-    client = boto3.client("s3")
-    client.put_object(Bucket=bucket, Key=full_key, Body=buffer.getvalue().encode("utf-8"))
+    stats = UploadStats()
+    parts = iter_csv_parts(records, part_size=part_size, compression=compression, stats=stats)
+    first = next(parts, None)
+    if first is None:
+        return ""
 
+    if client is None:
+        import boto3
+
+        client = boto3.client("s3")
+
+    full_key = object_key(object_name, prefix, compression)
+    headers = content_headers(compression)
+    extra = {"ContentType": headers["content_type"]}
+    if "content_encoding" in headers:
+        extra["ContentEncoding"] = headers["content_encoding"]
+
+    second = next(parts, None)
+    if second is None:
+        # Fits in one part: a single PUT is cheaper than a three-call multipart upload
+        client.put_object(Bucket=bucket, Key=full_key, Body=first, **extra)
+    else:
+        upload_id = client.create_multipart_upload(Bucket=bucket, Key=full_key, **extra)["UploadId"]
+
+        def upload(number: int, data: bytes) -> str:
+            if number > MAX_PARTS:
+                raise ValueError(f"export needs more than {MAX_PARTS} parts; raise part_size")
+            response = client.upload_part(
+                Bucket=bucket, Key=full_key, UploadId=upload_id, PartNumber=number, Body=data
+            )
+            return response["ETag"]
+
+        try:
+            etags = upload_parts(
+                chain([first, second], parts), upload, max_concurrency=max_concurrency, backend="s3"
+            )
+            client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=full_key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"ETag": etag, "PartNumber": n} for n, etag in enumerate(etags, start=1)
+                    ]
+                },
+            )
+        except BaseException:
+            client.abort_multipart_upload(Bucket=bucket, Key=full_key, UploadId=upload_id)
+            raise
+
+    log.info(
+        "s3_exporter: uploaded %d rows (%d bytes, %d parts) to s3://%s/%s",
+        stats.rows,
+        stats.bytes,
+        stats.parts,
+        bucket,
+        full_key,
+    )
     return full_key
 
 
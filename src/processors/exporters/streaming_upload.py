@@ -0,0 +1,208 @@
+# file: src/processors/exporters/streaming_upload.py
+"""
+Streaming CSV serialization and parallel part uploads for object-store exporters.
+
+``iter_csv_parts`` turns a record iterable into fixed-size byte parts
+(optionally gzip or zstd compressed) without materializing the export: rows
+are written through a small text buffer, compressed incrementally and cut
+into parts of exactly ``part_size`` bytes (the last one may be shorter).
+Because the parts are plain slices of one compressed stream, concatenating
+them yields a valid ``.gz`` / ``.zst`` file.
+
+``upload_parts`` hands the parts to a thread pool, keeping at most
+``max_concurrency`` uploads in flight; the producer blocks instead of
+buffering ahead, so peak memory is about ``(max_concurrency + 1) * part_size``.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, TypeVar
+
+from src.observability import metrics
+
+T = TypeVar("T")
+
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Serialized text is flushed to the compressor in blocks of about this size
+_TEXT_BLOCK = 256 * 1024
+
+_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+@dataclass
+class UploadStats:
+    rows: int = 0
+    parts: int = 0
+    bytes: int = 0
+
+
+class _Identity:
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def _compressor(compression: Optional[str]) -> Any:
+    if compression is None:
+        return _Identity()
+    if compression == "gzip":
+        # wbits=31 writes a gzip header and trailer rather than raw zlib
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("zstd compression requires the 'zstandard' package") from exc
+        return zstandard.ZstdCompressor().compressobj()
+    raise ValueError(f"Unsupported compression {compression!r}; expected one of gzip, zstd or None")
+
+
+def object_suffix(compression: Optional[str]) -> str:
+    """File extension appended to object names for ``compression``."""
+
+    if compression not in _SUFFIXES:
+        raise ValueError(
+            f"Unsupported compression {compression!r}; expected one of gzip, zstd or None"
+        )
+    return _SUFFIXES[compression]
+
+
+def content_headers(compression: Optional[str]) -> Dict[str, str]:
+    headers = {"content_type": "text/csv"}
+    if compression:
+        headers["content_encoding"] = compression
+    return headers
+
+
+def object_key(
+    object_name: Optional[str], prefix: Optional[str], compression: Optional[str] = None
+) -> str:
+    """``prefix/name`` for an upload, with the compression suffix appended if missing."""
+
+    name = (object_name or "export.csv").rsplit("/", 1)[-1]
+    suffix = object_suffix(compression)
+    if suffix and not name.endswith(suffix):
+        name += suffix
+    normalized_prefix = prefix or ""
+    if normalized_prefix and not normalized_prefix.endswith("/"):
+        normalized_prefix = f"{normalized_prefix}/"
+    return f"{normalized_prefix}{name}"
+
+
+def iter_csv_parts(
+    records: Iterable[Mapping[str, object]],
+    *,
+    part_size: int = DEFAULT_PART_SIZE,
+    compression: Optional[str] = None,
+    stats: Optional[UploadStats] = None,
+) -> Iterator[bytes]:
+    """Yield the CSV export of ``records`` as byte parts of ``part_size``.
+
+    The header comes from the first record's keys, as in ``export_to_csv``.
+    Yields nothing for an empty iterable.
+    """
+
+    if part_size <= 0:
+        raise ValueError("part_size must be positive")
+    stats = stats if stats is not None else UploadStats()
+    iterator = iter(records)
+    first = next(iterator, None)
+    if first is None:
+        return
+
+    compressor = _compressor(compression)
+    text = io.StringIO()
+    writer = csv.DictWriter(text, fieldnames=list(first.keys()))
+    writer.writeheader()
+    pending = bytearray()
+
+    def drain(final: bool) -> Iterator[bytes]:
+        limit = 0 if final else part_size - 1
+        while len(pending) > limit:
+            part = bytes(pending[:part_size])
+            del pending[:part_size]
+            stats.parts += 1
+            stats.bytes += len(part)
+            yield part
+
+    for row in chain([first], iterator):
+        writer.writerow(row)
+        stats.rows += 1
+        if text.tell() >= _TEXT_BLOCK:
+            pending += compressor.compress(text.getvalue().encode("utf-8"))
+            text.seek(0)
+            text.truncate()
+            yield from drain(final=False)
+
+    pending += compressor.compress(text.getvalue().encode("utf-8"))
+    pending += compressor.flush()
+    yield from drain(final=True)
+
+
+def upload_parts(
+    parts: Iterable[bytes],
+    upload: Callable[[int, bytes], T],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    backend: str = "object-store",
+) -> List[T]:
+    """Run ``upload(part_number, data)`` for every part on a thread pool.
+
+    Part numbers start at 1. Results come back in part order. The first
+    failure cancels queued uploads and is re-raised.
+    """
+
+    max_concurrency = max(1, max_concurrency)
+    results: Dict[int, T] = {}
+    in_flight: Set[Future] = set()
+
+    def collect(done: Iterable[Future]) -> None:
+        for future in done:
+            number, result = future.result()
+            results[number] = result
+
+    def run(number: int, data: bytes) -> Any:
+        result = upload(number, data)
+        metrics.incr("export.upload.parts", backend=backend)
+        metrics.incr("export.upload.bytes", amount=len(data), backend=backend)
+        return number, result
+
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix=f"{backend}-upload"
+    ) as pool:
+        try:
+            for number, data in enumerate(parts, start=1):
+                if len(in_flight) >= max_concurrency:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+                in_flight.add(pool.submit(run, number, data))
+            done, in_flight = wait(in_flight)
+            collect(done)
+        except BaseException:
+            for future in in_flight:
+                future.cancel()
+            raise
+
+    return [results[number] for number in sorted(results)]
+
+
+__all__ = [
+    "DEFAULT_MAX_CONCURRENCY",
+    "DEFAULT_PART_SIZE",
+    "UploadStats",
+    "content_headers",
+    "iter_csv_parts",
+    "object_key",
+    "object_suffix",
+    "upload_parts",
+]
@@ -7,10 +7,10 @@ and LLM is only used if classic fails or quality is below threshold.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from src.common.logging_utils import get_logger
-from src.processors.pdf.pdf_text_extractor import extract_pdf_text_classic
+from src.processors.pdf.pdf_parallel import ParallelPDFExtractor, PDFExtractionSettings
 from src.processors.pdf.pdf_table_llm import extract_table_with_llm
 from src.processors.llm.llm_client import get_llm_client_from_config
 
@@ -72,67 +72,84 @@ def process_pdf_hybrid(
     llm_config = source_config.get("llm", {})
     llm_client = get_llm_client_from_config(source_config) if llm_config.get("enabled") else None
 
-    for record in records:
-        pdf_path = record.get("pdf_path")
-        if not pdf_path:
-            yield record
-            continue
-
-        try:
-            # Step 1: Try classic extraction
-            extracted = extract_pdf_text_classic(pdf_path)
-            score = score_classic_extraction(extracted)
-
-            record["pdf_pages"] = extracted["pages"]
-            record["pdf_raw_tables"] = extracted["raw_tables"]
-            record["pdf_extraction_method"] = extracted["extraction_method"]
-            record["_classic_score"] = score
-
-            # Step 2: Decide if we need LLM
-            if score >= quality_threshold and extracted.get("raw_tables"):
-                # Classic is good enough
-                log.info(
-                    "Using classic extraction (score >= threshold)",
-                    extra={"pdf_id": record.get("pdf_id"), "score": score},
-                )
-                record["_extraction_mode"] = "classic"
-            elif llm_client:
-                # Fallback to LLM
-                log.info(
-                    "Classic extraction insufficient, using LLM",
-                    extra={"pdf_id": record.get("pdf_id"), "score": score},
+    with ParallelPDFExtractor(PDFExtractionSettings.from_config(source_config)) as extractor:
+        for record, extracted, error in extractor.extract_records(records):
+            if extracted is not None or error is not None:
+                _apply_hybrid(
+                    record,
+                    extracted,
+                    error,
+                    source_config,
+                    table_schema,
+                    quality_threshold,
+                    llm_client,
                 )
+            yield record
 
-                # Get table schema
-                table_type = source_config.get("table_type", "default")
-                columns = table_schema.get(table_type, table_schema.get("default", []))
-
-                # Extract with LLM
-                pdf_text = "\n\n".join(extracted["pages"])
-                rows = extract_table_with_llm(pdf_text, columns, llm_client)
-
-                record["extracted_tables"] = {
-                    "table_type": table_type,
-                    "columns": columns,
-                    "rows": rows,
-                    "row_count": len(rows),
-                }
-                record["_extraction_mode"] = "llm"
-            else:
-                # No LLM available, use classic even if low quality
-                record["_extraction_mode"] = "classic"
-                log.warning(
-                    "Classic extraction low quality but LLM not available",
-                    extra={"pdf_id": record.get("pdf_id"), "score": score},
-                )
 
-        except Exception as exc:
-            log.error(
-                "Hybrid PDF processing failed",
-                extra={"pdf_id": record.get("pdf_id"), "error": str(exc)},
+def _apply_hybrid(
+    record: Dict[str, Any],
+    extracted: Optional[Dict[str, Any]],
+    error: Optional[BaseException],
+    source_config: Dict[str, Any],
+    table_schema: Dict[str, List[str]],
+    quality_threshold: float,
+    llm_client: Any,
+) -> None:
+    try:
+        # Step 1: Classic extraction (already run on the process pool)
+        if error is not None:
+            raise error
+        score = score_classic_extraction(extracted)
+
+        record["pdf_pages"] = extracted["pages"]
+        record["pdf_raw_tables"] = extracted["raw_tables"]
+        record["pdf_extraction_method"] = extracted["extraction_method"]
+        record["_classic_score"] = score
+
+        # Step 2: Decide if we need LLM
+        if score >= quality_threshold and extracted.get("raw_tables"):
+            # Classic is good enough
+            log.info(
+                "Using classic extraction (score >= threshold)",
+                extra={"pdf_id": record.get("pdf_id"), "score": score},
+            )
+            record["_extraction_mode"] = "classic"
+        elif llm_client:
+            # Fallback to LLM
+            log.info(
+                "Classic extraction insufficient, using LLM",
+                extra={"pdf_id": record.get("pdf_id"), "score": score},
+            )
+
+            # Get table schema
+            table_type = source_config.get("table_type", "default")
+            columns = table_schema.get(table_type, table_schema.get("default", []))
+
+            # Extract with LLM
+            pdf_text = "\n\n".join(extracted["pages"])
+            rows = extract_table_with_llm(pdf_text, columns, llm_client)
+
+            record["extracted_tables"] = {
+                "table_type": table_type,
+                "columns": columns,
+                "rows": rows,
+                "row_count": len(rows),
+            }
+            record["_extraction_mode"] = "llm"
+        else:
+            # No LLM available, use classic even if low quality
+            record["_extraction_mode"] = "classic"
+            log.warning(
+                "Classic extraction low quality but LLM not available",
+                extra={"pdf_id": record.get("pdf_id"), "score": score},
             )
 
-        yield record
+    except Exception as exc:
+        log.error(
+            "Hybrid PDF processing failed",
+            extra={"pdf_id": record.get("pdf_id"), "error": str(exc)},
+        )
 
 
 def should_use_llm(
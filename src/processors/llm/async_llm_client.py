@@ -0,0 +1,447 @@
+"""
+Async LLM client with concurrency control and provider-aware rate limiting.
+
+``AsyncLLMClient`` extends :class:`LLMClient` with ``acomplete`` /
+``aextract_json`` / ``astream`` built on the providers' async SDKs. Requests
+are admitted by:
+
+- a per-event-loop semaphore (``max_concurrency`` requests in flight), and
+- a process-wide :class:`ProviderBudget` per provider that reserves one
+  request against the requests-per-minute bucket and the prompt estimate plus
+  ``max_tokens`` against the tokens-per-minute bucket, which is how providers
+  account for a request before it runs. Clients of the same provider share
+  one budget; when they ask for different limits, the lower one applies.
+
+429s (and transient 5xx/connection errors) are retried with exponential
+backoff; a ``Retry-After`` header sets the delay and pauses the whole provider
+budget, so other in-flight callers back off too instead of piling on.
+
+Prompts match the sync client, so both share the response cache.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+import weakref
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from src.common.logging_utils import get_logger
+from src.observability import metrics
+from src.processors.llm.llm_cache import LLMResponseCache, cache_from_config, cache_key
+from src.processors.llm.llm_client import (
+    LLMClient,
+    estimate_tokens,
+    json_prompt,
+    parse_json_response,
+)
+from src.utils.token_bucket import TokenBucket
+
+log = get_logger("async-llm-client")
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_EXCEPTIONS = ("APIConnectionError", "APITimeoutError")
+
+
+class ProviderBudget:
+    """Requests-per-minute and tokens-per-minute budget shared by all callers of a provider."""
+
+    def __init__(
+        self,
+        provider: str,
+        *,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ) -> None:
+        self.provider = provider
+        self.requests: Optional[TokenBucket] = None
+        self.tokens: Optional[TokenBucket] = None
+        self._resume_at = 0.0
+        self.tighten(requests_per_minute, tokens_per_minute)
+
+    def tighten(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ) -> None:
+        """Apply the limits that are lower than the current ones; unset limits change nothing."""
+
+        requests = self.requests
+        if requests_per_minute and (requests is None or requests_per_minute < requests.burst):
+            self.requests = TokenBucket(
+                requests_per_minute / 60.0, requests_per_minute, key=f"llm:{self.provider}:rpm"
+            )
+        if tokens_per_minute and (self.tokens is None or tokens_per_minute < self.tokens.burst):
+            self.tokens = TokenBucket(
+                tokens_per_minute / 60.0, tokens_per_minute, key=f"llm:{self.provider}:tpm"
+            )
+
+    async def acquire(self, tokens: int) -> float:
+        """Wait until the provider can take a request of ``tokens``; returns seconds waited."""
+
+        waited = 0.0
+        pause = self._resume_at - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+            waited += pause
+        if self.requests is not None:
+            waited += await self.requests.async_wait()
+        if self.tokens is not None:
+            # A request larger than the whole budget still goes through, after a full refill
+            waited += await self.tokens.async_wait(min(float(tokens), self.tokens.burst))
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller of this provider for ``seconds`` (after a 429)."""
+
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+_BUDGETS: Dict[str, ProviderBudget] = {}
+_BUDGETS_LOCK = threading.Lock()
+
+
+def get_provider_budget(
+    provider: str,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+) -> ProviderBudget:
+    """Return the process-wide budget for ``provider``.
+
+    Every caller of a provider shares one budget. Limits passed here only
+    tighten it: when clients configure different limits, the lower one wins.
+    """
+
+    with _BUDGETS_LOCK:
+        budget = _BUDGETS.get(provider)
+        if budget is None:
+            budget = _BUDGETS[provider] = ProviderBudget(
+                provider,
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+            )
+        else:
+            budget.tighten(requests_per_minute, tokens_per_minute)
+    return budget
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Delay requested by the provider via ``retry-after-ms`` / ``Retry-After``."""
+
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        millis = headers.get("retry-after-ms")
+        if millis is not None:
+            return max(0.0, float(millis) / 1000.0)
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if _status_code(exc) in RETRY_STATUSES:
+        return True
+    if isinstance(exc, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    return type(exc).__name__ in _RETRY_EXCEPTIONS
+
+
+class AsyncLLMClient(LLMClient):
+    """:class:`LLMClient` with async, concurrency-limited and rate-budgeted calls."""
+
+    def __init__(
+        self,
+        provider: str = "openai",
+        model: str = "gpt-4o-mini",
+        api_key: Optional[str] = None,
+        max_tokens: int = 2048,
+        temperature: float = 0.0,
+        base_url: Optional[str] = None,
+        cache: Optional[LLMResponseCache] = None,
+        *,
+        max_concurrency: int = 8,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ) -> None:
+        """
+        Initialize async LLM client.
+
+        Args:
+            max_concurrency: Requests in flight per event loop
+            requests_per_minute: Provider RPM limit (``None`` = unlimited)
+            tokens_per_minute: Provider TPM limit (``None`` = unlimited)
+            max_retries: Retries on 429 / transient errors before giving up
+            backoff_base: First retry delay when no ``Retry-After`` is given
+            backoff_max: Cap on the retry delay
+
+        The remaining arguments are as for :class:`LLMClient`.
+        """
+        super().__init__(
+            provider=provider,
+            model=model,
+            api_key=api_key,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            base_url=base_url,
+            cache=cache,
+        )
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.budget = get_provider_budget(self.provider, requests_per_minute, tokens_per_minute)
+        self._async_client: Any = None
+        self._semaphores: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]"
+        ) = weakref.WeakKeyDictionary()
+
+    # ------------------------------------------------------------------ #
+    # Provider plumbing
+    # ------------------------------------------------------------------ #
+    def _build_async_client(self):
+        # SDK retries are disabled: retries go through the shared provider budget instead
+        if self.provider in ("openai", "deepseek"):
+            try:
+                from openai import AsyncOpenAI  # type: ignore[import]
+            except ImportError:
+                raise RuntimeError("openai package not installed. Install with: pip install openai")
+            default_url = "https://api.deepseek.com" if self.provider == "deepseek" else None
+            base_url = self.base_url or default_url
+            client_kwargs: Dict[str, Any] = {"api_key": self.api_key, "max_retries": 0}
+            if base_url:
+                client_kwargs["base_url"] = base_url
+            return AsyncOpenAI(**client_kwargs)
+        if self.provider == "groq":
+            try:
+                from groq import AsyncGroq  # type: ignore[import]
+            except ImportError as exc:  # pragma: no cover - optional dependency not installed
+                raise RuntimeError(
+                    "groq package not installed. Install with: pip install groq"
+                ) from exc
+            client_kwargs = {"api_key": self.api_key, "max_retries": 0}
+            if self.base_url:
+                client_kwargs["base_url"] = self.base_url
+            return AsyncGroq(**client_kwargs)
+        raise ValueError(f"Unsupported LLM provider: {self.provider}")
+
+    def _get_async_client(self):
+        """Get the async provider client, built once and reused across calls."""
+        if self._async_client is None:
+            with self._client_lock:
+                if self._async_client is None:
+                    self._async_client = self._build_async_client()
+        return self._async_client
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    @staticmethod
+    def _messages(prompt: str, system_prompt: Optional[str]) -> List[Dict[str, str]]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    async def _create(
+        self, messages: List[Dict[str, str]], max_tokens: int, temperature: float, **kwargs
+    ):
+        """Issue one chat completion under the budget, retrying 429s and transient errors."""
+
+        if not self.api_key:
+            raise RuntimeError(f"API key not configured for provider {self.provider}")
+
+        client = self._get_async_client()
+        reserve = sum(estimate_tokens(message["content"]) for message in messages) + max_tokens
+        attempt = 0
+        while True:
+            await self.budget.acquire(reserve)
+            try:
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    **kwargs,
+                )
+                metrics.incr("llm.requests", provider=self.provider, outcome="ok")
+                return response
+            except Exception as exc:
+                if attempt >= self.max_retries or not _is_retryable(exc):
+                    metrics.incr("llm.requests", provider=self.provider, outcome="error")
+                    log.error(
+                        "LLM completion failed",
+                        extra={"provider": self.provider, "error": str(exc)},
+                    )
+                    raise
+                status = _status_code(exc)
+                delay = retry_after_seconds(exc)
+                if delay is None:
+                    backoff = min(self.backoff_max, self.backoff_base * 2**attempt)
+                    delay = backoff * random.uniform(0.5, 1.0)
+                else:
+                    delay = min(self.backoff_max, delay)
+                if status == 429:
+                    self.budget.pause(delay)
+                attempt += 1
+                metrics.incr(
+                    "llm.retries", provider=self.provider, status=str(status or type(exc).__name__)
+                )
+                log.warning(
+                    "Retrying LLM completion",
+                    extra={
+                        "provider": self.provider,
+                        "status": status,
+                        "attempt": attempt,
+                        "delay": delay,
+                    },
+                )
+                await asyncio.sleep(delay)
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+    async def acomplete(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+    ) -> str:
+        """Async :meth:`LLMClient.complete`; at most ``max_concurrency`` run at once."""
+
+        max_tokens = max_tokens or self.max_tokens
+        temperature = temperature if temperature is not None else self.temperature
+
+        async def compute() -> str:
+            async with self._semaphore():
+                messages = self._messages(prompt, system_prompt)
+                response = await self._create(messages, max_tokens, temperature)
+            return response.choices[0].message.content or ""
+
+        if self.cache is None:
+            return await compute()
+        key = cache_key(
+            provider=self.provider,
+            model=self.model,
+            system_prompt=system_prompt,
+            prompt=prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        return await self.cache.aget_or_compute(key, compute, provider=self.provider)
+
+    async def aextract_json(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any] | List[Dict[str, Any]]:
+        """Async :meth:`LLMClient.extract_json`."""
+
+        response = await self.acomplete(json_prompt(prompt, schema), system_prompt=system_prompt)
+        return parse_json_response(response)
+
+    async def astream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """Yield the completion as it is generated.
+
+        A cached response is yielded as a single chunk; a fully streamed one
+        is stored in the cache afterwards.
+        """
+
+        max_tokens = max_tokens or self.max_tokens
+        temperature = temperature if temperature is not None else self.temperature
+        key = None
+        if self.cache is not None:
+            key = cache_key(
+                provider=self.provider,
+                model=self.model,
+                system_prompt=system_prompt,
+                prompt=prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        parts: List[str] = []
+        async with self._semaphore():
+            stream = await self._create(
+                self._messages(prompt, system_prompt), max_tokens, temperature, stream=True
+            )
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        if key is not None:
+            self.cache.set(key, "".join(parts))
+
+
+def get_async_llm_client_from_config(config: Dict[str, Any]) -> Optional[AsyncLLMClient]:
+    """
+    Create an async LLM client from source config.
+
+    Besides the settings read by ``get_llm_client_from_config``, the
+    ``llm.async`` section sets ``max_concurrency``, ``requests_per_minute``,
+    ``tokens_per_minute`` and ``max_retries``.
+
+    Returns:
+        AsyncLLMClient instance or None if LLM disabled
+    """
+    llm_config = config.get("llm", {})
+    if not llm_config.get("enabled", False):
+        return None
+
+    async_config = llm_config.get("async", {}) or {}
+    return AsyncLLMClient(
+        provider=llm_config.get("provider", "openai"),
+        model=llm_config.get("model", "gpt-4o-mini"),
+        max_tokens=llm_config.get("max_tokens", 2048),
+        temperature=llm_config.get("temperature", 0.0),
+        base_url=llm_config.get("base_url"),
+        cache=cache_from_config(llm_config),
+        max_concurrency=async_config.get("max_concurrency", 8),
+        requests_per_minute=async_config.get("requests_per_minute"),
+        tokens_per_minute=async_config.get("tokens_per_minute"),
+        max_retries=async_config.get("max_retries", 5),
+    )
+
+
+__all__ = [
+    "AsyncLLMClient",
+    "ProviderBudget",
+    "get_async_llm_client_from_config",
+    "get_provider_budget",
+    "retry_after_seconds",
+]
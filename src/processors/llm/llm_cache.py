@@ -0,0 +1,307 @@
+"""
+Persistent, content-addressed cache for LLM completions.
+
+Responses are stored in SQLite under a SHA-256 of everything that determines
+the output: provider, model, system prompt, prompt, temperature and
+max_tokens. Entries expire after ``ttl_seconds`` and the table is kept under
+``max_entries`` by evicting the least recently used rows, so repeated
+normalizations across runs are served from disk instead of the provider.
+
+Identical requests issued concurrently (e.g. parallel workers normalizing the
+same manufacturer) are coalesced: the first caller performs the completion
+and the others wait for its result.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from src.common.logging_utils import get_logger
+from src.common.paths import OUTPUT_DIR
+from src.observability import metrics
+
+log = get_logger("llm-cache")
+
+DEFAULT_CACHE_PATH = OUTPUT_DIR / "llm_cache" / "responses.sqlite"
+
+# Touching last_used on every hit would turn reads into writes; a coarse
+# resolution keeps LRU order useful without rewriting hot rows constantly.
+_TOUCH_RESOLUTION_SECONDS = 60.0
+
+
+def cache_key(
+    *,
+    provider: str,
+    model: str,
+    system_prompt: Optional[str],
+    prompt: str,
+    temperature: float,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """Content address of a completion request."""
+
+    payload = json.dumps(
+        [provider, model, system_prompt or "", prompt, float(temperature), max_tokens],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed TTL + LRU cache with in-flight request coalescing."""
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_CACHE_PATH,
+        *,
+        ttl_seconds: float = 30 * 24 * 3600,
+        max_entries: int = 200_000,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._writes_since_prune = 0
+
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses (last_used)"
+        )
+
+    # ------------------------------------------------------------------ #
+    # Storage
+    # ------------------------------------------------------------------ #
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at, last_used FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, created_at, last_used = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                return None
+            if now - last_used > _TOUCH_RESOLUTION_SECONDS:
+                self._conn.execute(
+                    "UPDATE llm_responses SET last_used = ? WHERE key = ?", (now, key)
+                )
+        return response
+
+    def set(self, key: str, response: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, response, created_at, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, response, now, now),
+            )
+            self._writes_since_prune += 1
+            # Amortize the COUNT(*) over a slice of the size bound
+            if self._writes_since_prune >= max(1, self.max_entries // 100):
+                self._writes_since_prune = 0
+                self._prune_locked(now)
+
+    def prune(self) -> int:
+        """Drop expired rows and evict least-recently-used rows above ``max_entries``."""
+
+        with self._lock:
+            return self._prune_locked(time.time())
+
+    def _prune_locked(self, now: float) -> int:
+        removed = self._conn.execute(
+            "DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            removed += self._conn.execute(
+                "DELETE FROM llm_responses WHERE key IN "
+                "(SELECT key FROM llm_responses ORDER BY last_used ASC LIMIT ?)",
+                (overflow,),
+            ).rowcount
+        if removed:
+            metrics.incr("llm.cache.evictions", amount=removed)
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------ #
+    # Lookup with coalescing
+    # ------------------------------------------------------------------ #
+    def get_or_compute(self, key: str, compute: Callable[[], str], *, provider: str = "") -> str:
+        """Return the cached response for ``key`` or compute it once.
+
+        Concurrent callers with the same key share a single ``compute()``;
+        its exception, if any, propagates to all of them and nothing is cached.
+        """
+
+        cached, pending, owner = self._claim(key, provider)
+        if cached is not None:
+            return cached
+        if not owner:
+            return pending.result()
+        try:
+            response = compute()
+        except BaseException as exc:
+            self._settle(key)
+            pending.set_exception(exc)
+            raise
+        return self._resolve(key, pending, response)
+
+    async def aget_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[str]], *, provider: str = ""
+    ) -> str:
+        """Async variant of :meth:`get_or_compute`; coalesces with sync callers too."""
+
+        cached, pending, owner = self._claim(key, provider)
+        if cached is not None:
+            return cached
+        if not owner:
+            return await asyncio.wrap_future(pending)
+        try:
+            response = await compute()
+        except BaseException as exc:
+            self._settle(key)
+            pending.set_exception(exc)
+            raise
+        return self._resolve(key, pending, response)
+
+    def _claim(self, key: str, provider: str) -> Tuple[Optional[str], Optional[Future], bool]:
+        """Return ``(cached, pending, owner)``; the owner must compute and resolve."""
+
+        cached = self.get(key)
+        if cached is not None:
+            self._record("hits", provider)
+            return cached, None, False
+
+        with self._lock:
+            pending = self._inflight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._inflight[key] = Future()
+        if not owner:
+            self._record("coalesced", provider)
+            return None, pending, False
+
+        # The previous owner may have finished between our miss and taking ownership
+        cached = self.get(key)
+        if cached is not None:
+            self._settle(key)
+            pending.set_result(cached)
+            self._record("hits", provider)
+            return cached, None, False
+
+        self._record("misses", provider)
+        return None, pending, True
+
+    def _resolve(self, key: str, pending: Future, response: str) -> str:
+        try:
+            self.set(key, response)
+        except sqlite3.Error as exc:
+            log.warning("Failed to store LLM response in cache", extra={"error": str(exc)})
+        finally:
+            self._settle(key)
+            pending.set_result(response)
+        return response
+
+    def _settle(self, key: str) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    def hit_rate(self) -> float:
+        served = self.hits + self.coalesced
+        total = served + self.misses
+        return served / total if total else 0.0
+
+    def _record(self, outcome: str, provider: str) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+        metrics.incr(f"llm.cache.{outcome}", provider=provider)
+        metrics.set_gauge("llm.cache.hit_rate", self.hit_rate(), path=str(self.path))
+
+
+_CACHES: Dict[Tuple[str, float, int], LLMResponseCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_llm_cache(
+    path: Path | str | None = None,
+    *,
+    ttl_seconds: float = 30 * 24 * 3600,
+    max_entries: int = 200_000,
+) -> LLMResponseCache:
+    """Return the shared cache for ``path`` (``LLM_CACHE_PATH`` or the default)."""
+
+    resolved = str(path or os.getenv("LLM_CACHE_PATH") or DEFAULT_CACHE_PATH)
+    key = (resolved, float(ttl_seconds), int(max_entries))
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            cache = LLMResponseCache(resolved, ttl_seconds=ttl_seconds, max_entries=max_entries)
+            _CACHES[key] = cache
+        return cache
+
+
+def cache_from_config(llm_config: Dict[str, Any]) -> Optional[LLMResponseCache]:
+    """Build the cache described by the ``llm.cache`` config section (enabled by default)."""
+
+    cache_cfg = llm_config.get("cache", {})
+    if cache_cfg is False or os.getenv("LLM_CACHE_DISABLED") == "1":
+        return None
+    cache_cfg = cache_cfg if isinstance(cache_cfg, dict) else {}
+    if not cache_cfg.get("enabled", True):
+        return None
+    try:
+        return get_llm_cache(
+            cache_cfg.get("path"),
+            ttl_seconds=float(cache_cfg.get("ttl_seconds", 30 * 24 * 3600)),
+            max_entries=int(cache_cfg.get("max_entries", 200_000)),
+        )
+    except (sqlite3.Error, OSError) as exc:
+        log.warning("LLM cache unavailable; continuing without it", extra={"error": str(exc)})
+        return None
+
+
+__all__ = [
+    "LLMResponseCache",
+    "cache_key",
+    "cache_from_config",
+    "get_llm_cache",
+    "DEFAULT_CACHE_PATH",
+]
@@ -6,10 +6,13 @@ Provides a unified interface for LLM calls with config-driven provider selection
 
 from __future__ import annotations
 
+import json
 import os
+import threading
 from typing import Any, Dict, List, Optional
 
 from src.common.logging_utils import get_logger
+from src.processors.llm.llm_cache import LLMResponseCache, cache_from_config, cache_key
 
 log = get_logger("llm-client")
 
@@ -25,6 +28,7 @@ class LLMClient:
         max_tokens: int = 2048,
         temperature: float = 0.0,
         base_url: Optional[str] = None,
+        cache: Optional[LLMResponseCache] = None,
     ) -> None:
         """
         Initialize LLM client.
@@ -36,12 +40,16 @@ class LLMClient:
             max_tokens: Maximum tokens in response
             temperature: Temperature (0.0 = deterministic)
             base_url: Custom base URL (for compatible APIs)
+            cache: Optional response cache; identical requests are served from it
         """
         self.provider = provider.lower()
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
         self.base_url = base_url
+        self.cache = cache
+        self._client: Any = None
+        self._client_lock = threading.Lock()
 
         # Get API key
         if api_key:
@@ -98,7 +106,14 @@ class LLMClient:
         return Groq(**client_kwargs)
 
     def _get_client(self):
-        """Get appropriate client for provider."""
+        """Get the provider client, built once and reused across calls."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._build_client()
+        return self._client
+
+    def _build_client(self):
         if self.provider == "openai":
             return self._get_openai_client()
         elif self.provider == "deepseek":
@@ -127,6 +142,32 @@ class LLMClient:
         Returns:
             Generated text
         """
+        max_tokens = max_tokens or self.max_tokens
+        temperature = temperature if temperature is not None else self.temperature
+        if self.cache is None:
+            return self._complete_uncached(prompt, system_prompt, max_tokens, temperature)
+
+        key = cache_key(
+            provider=self.provider,
+            model=self.model,
+            system_prompt=system_prompt,
+            prompt=prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        return self.cache.get_or_compute(
+            key,
+            lambda: self._complete_uncached(prompt, system_prompt, max_tokens, temperature),
+            provider=self.provider,
+        )
+
+    def _complete_uncached(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+    ) -> str:
         if not self.api_key:
             raise RuntimeError(f"API key not configured for provider {self.provider}")
 
@@ -140,8 +181,8 @@ class LLMClient:
             response = client.chat.completions.create(
                 model=self.model,
                 messages=messages,
-                max_tokens=max_tokens or self.max_tokens,
-                temperature=temperature if temperature is not None else self.temperature,
+                max_tokens=max_tokens,
+                temperature=temperature,
             )
             return response.choices[0].message.content or ""
         except Exception as exc:
@@ -165,36 +206,51 @@ class LLMClient:
         Returns:
             Parsed JSON (dict or list)
         """
-        import json
-
-        # Enhance prompt to request JSON
-        json_prompt = f"{prompt}\n\nReturn only valid JSON, no markdown, no explanation."
-        if schema:
-            json_prompt += f"\n\nSchema: {json.dumps(schema, indent=2)}"
-
-        response = self.complete(json_prompt, system_prompt=system_prompt)
-        
-        # Try to extract JSON from response
-        response = response.strip()
-        if response.startswith("```json"):
-            response = response[7:]
-        if response.startswith("```"):
-            response = response[3:]
-        if response.endswith("```"):
-            response = response[:-3]
-        response = response.strip()
+        response = self.complete(json_prompt(prompt, schema), system_prompt=system_prompt)
+        return parse_json_response(response)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) for packing and rate budgets."""
+
+    return len(text) // 4 + 1
 
-        try:
-            return json.loads(response)
-        except json.JSONDecodeError as exc:
-            log.error("Failed to parse LLM JSON response", extra={"response": response[:200]})
-            raise ValueError(f"Invalid JSON from LLM: {exc}") from exc
+
+def json_prompt(prompt: str, schema: Optional[Dict[str, Any]] = None) -> str:
+    """Append the JSON-only instruction (and optional schema) to ``prompt``."""
+
+    enhanced = f"{prompt}\n\nReturn only valid JSON, no markdown, no explanation."
+    if schema:
+        enhanced += f"\n\nSchema: {json.dumps(schema, indent=2)}"
+    return enhanced
+
+
+def parse_json_response(response: str) -> Dict[str, Any] | List[Dict[str, Any]]:
+    """Parse a JSON completion, tolerating markdown code fences."""
+
+    response = response.strip()
+    if response.startswith("```json"):
+        response = response[7:]
+    if response.startswith("```"):
+        response = response[3:]
+    if response.endswith("```"):
+        response = response[:-3]
+    response = response.strip()
+
+    try:
+        return json.loads(response)
+    except json.JSONDecodeError as exc:
+        log.error("Failed to parse LLM JSON response", extra={"response": response[:200]})
+        raise ValueError(f"Invalid JSON from LLM: {exc}") from exc
 
 
 def get_llm_client_from_config(config: Dict[str, Any]) -> Optional[LLMClient]:
     """
     Create LLM client from source config.
 
+    Responses are cached on disk unless ``llm.cache`` is ``false`` or has
+    ``enabled: false`` (``path``, ``ttl_seconds`` and ``max_entries`` tune it).
+
     Args:
         config: Source config dict with 'llm' section
 
@@ -218,5 +274,6 @@ def get_llm_client_from_config(config: Dict[str, Any]) -> Optional[LLMClient]:
         max_tokens=max_tokens,
         temperature=temperature,
         base_url=base_url,
+        cache=cache_from_config(llm_config),
     )
 
@@ -2,17 +2,68 @@
 LLM-based field normalizer.
 
 Uses LLM to normalize ambiguous text fields (product names, manufacturers, etc.).
+
+Records are normalized in batches: distinct values are collected per field
+type across a slice of records, packed into JSON-array prompts that fit a
+token budget, and the batches run concurrently up to ``max_in_flight``. A
+batch whose response cannot be parsed falls back to one call per value.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from src.common.logging_utils import get_logger
-from src.processors.llm.llm_client import LLMClient, get_llm_client_from_config
+from src.core_kernel.utils import iter_chunks
+from src.observability import metrics
+from src.processors.llm.llm_client import LLMClient, estimate_tokens, get_llm_client_from_config
 
 log = get_logger("llm-normalizer")
 
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+@dataclass
+class BatchSettings:
+    """Knobs for batched normalization, read from ``llm.normalize_batch`` in the source config."""
+
+    enabled: bool = True
+    token_budget: int = 1500  # estimated prompt tokens of packed values per call
+    max_values_per_batch: int = 100
+    max_in_flight: int = 4
+    records_per_slice: int = 5000  # records whose distinct values are deduplicated together
+
+    @classmethod
+    def from_config(cls, llm_config: Mapping[str, Any]) -> "BatchSettings":
+        cfg = llm_config.get("normalize_batch", {})
+        if cfg is False:
+            return cls(enabled=False)
+        cfg = cfg if isinstance(cfg, Mapping) else {}
+        return cls(
+            enabled=bool(cfg.get("enabled", cls.enabled)),
+            token_budget=max(1, int(cfg.get("token_budget", cls.token_budget))),
+            max_values_per_batch=max(
+                1, int(cfg.get("max_values_per_batch", cls.max_values_per_batch))
+            ),
+            max_in_flight=max(1, int(cfg.get("max_in_flight", cls.max_in_flight))),
+            records_per_slice=max(1, int(cfg.get("records_per_slice", cls.records_per_slice))),
+        )
+
+
+def _system_prompt(field_type: str) -> str:
+    return f"""You are a data normalization specialist. \
+Normalize {field_type} values to canonical forms.
+
+Rules:
+- Remove extra whitespace
+- Standardize abbreviations
+- Fix common typos
+- Use consistent casing"""
+
 
 def normalize_field_with_llm(
     value: str,
@@ -32,14 +83,9 @@ def normalize_field_with_llm(
     Returns:
         Normalized value
     """
-    system_prompt = f"""You are a data normalization specialist. Normalize {field_type} values to canonical forms.
-
-Rules:
-- Remove extra whitespace
-- Standardize abbreviations
-- Fix common typos
-- Use consistent casing
-- Return only the normalized value, no explanation"""
+    system_prompt = (
+        _system_prompt(field_type) + "\n- Return only the normalized value, no explanation"
+    )
 
     prompt = f"Normalize this {field_type} value: {value}"
     if examples:
@@ -94,6 +140,153 @@ def normalize_record_with_llm(
     return normalized
 
 
+def pack_batches(values: Iterable[str], token_budget: int, max_values: int) -> List[List[str]]:
+    """Group ``values`` into batches whose JSON encoding fits ``token_budget``.
+
+    A value larger than the budget on its own still gets a batch of one.
+    """
+
+    batches: List[List[str]] = []
+    current: List[str] = []
+    used = 0
+    for value in values:
+        cost = estimate_tokens(json.dumps(value, ensure_ascii=False))
+        if current and (used + cost > token_budget or len(current) >= max_values):
+            batches.append(current)
+            current, used = [], 0
+        current.append(value)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _parse_batch_response(response: str, expected: int) -> List[Any]:
+    text = _FENCE_RE.sub("", response.strip())
+    parsed = json.loads(text)
+    if not isinstance(parsed, list) or len(parsed) != expected:
+        raise ValueError(f"expected a JSON array of {expected} items")
+    return parsed
+
+
+def normalize_values_batch(
+    values: List[str],
+    field_type: str,
+    llm_client: LLMClient,
+    examples: Optional[List[str]] = None,
+) -> Dict[str, str]:
+    """
+    Normalize several values of one field type with a single LLM call.
+
+    Values whose batch response is unusable (unparseable, wrong length, or a
+    non-string item) are normalized one by one with
+    :func:`normalize_field_with_llm`. If the call itself fails the values are
+    returned unchanged, as the per-value path does.
+
+    Returns:
+        Mapping of raw value to normalized value
+    """
+    system_prompt = (
+        _system_prompt(field_type)
+        + "\n- The input is a JSON array of values; reply with only a JSON array of the"
+        " normalized values, same length and order, no explanation"
+    )
+    prompt = f"Normalize these {field_type} values:\n{json.dumps(values, ensure_ascii=False)}"
+    if examples:
+        prompt += f"\n\nExamples of normalized values: {', '.join(examples)}"
+
+    try:
+        response = llm_client.complete(prompt, system_prompt=system_prompt)
+    except Exception as exc:
+        # Transport/auth/rate-limit errors would fail per value too; don't multiply them
+        log.warning(
+            "Batch LLM normalization failed, returning originals",
+            extra={"field_type": field_type, "values": len(values), "error": str(exc)},
+        )
+        metrics.incr("llm.normalize.batch_errors", field_type=field_type)
+        return {value: value for value in values}
+
+    results: Dict[str, str] = {}
+    try:
+        parsed = _parse_batch_response(response, len(values))
+        metrics.incr("llm.normalize.batches", field_type=field_type)
+    except ValueError as exc:  # includes json.JSONDecodeError
+        log.warning(
+            "Batch LLM response unusable, falling back per value",
+            extra={"field_type": field_type, "values": len(values), "error": str(exc)},
+        )
+        parsed = [None] * len(values)
+
+    for value, item in zip(values, parsed):
+        if isinstance(item, str) and item.strip():
+            results[value] = item.strip()
+        else:
+            metrics.incr("llm.normalize.fallbacks", field_type=field_type)
+            results[value] = normalize_field_with_llm(value, field_type, llm_client, examples)
+    return results
+
+
+def normalize_records_batch(
+    records: List[Dict[str, Any]],
+    fields_to_normalize: List[str],
+    llm_client: LLMClient,
+    field_types: Optional[Dict[str, str]] = None,
+    settings: Optional[BatchSettings] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Normalize fields across many records with as few LLM calls as possible.
+
+    Distinct values are deduplicated per field type (fields sharing a type
+    share results), packed into batches under ``settings.token_budget`` and
+    normalized concurrently with at most ``settings.max_in_flight`` calls.
+
+    Returns:
+        Copies of ``records`` with normalized fields, in input order
+    """
+    field_types = field_types or {}
+    settings = settings or BatchSettings()
+
+    distinct: Dict[str, Dict[str, None]] = {}
+    for record in records:
+        for field in fields_to_normalize:
+            value = record.get(field)
+            if isinstance(value, str) and value.strip():
+                distinct.setdefault(field_types.get(field, field), {})[value] = None
+
+    # Responses are roughly as long as the packed values, so keep them within max_tokens
+    max_tokens = getattr(llm_client, "max_tokens", None) or settings.token_budget
+    budget = min(settings.token_budget, max_tokens)
+    jobs: List[Tuple[str, List[str]]] = [
+        (field_type, batch)
+        for field_type, values in distinct.items()
+        for batch in pack_batches(values, budget, settings.max_values_per_batch)
+    ]
+
+    normalized_values: Dict[Tuple[str, str], str] = {}
+    if jobs:
+        with ThreadPoolExecutor(
+            max_workers=min(settings.max_in_flight, len(jobs)), thread_name_prefix="llm-normalize"
+        ) as executor:
+            futures = [
+                (field_type, executor.submit(normalize_values_batch, batch, field_type, llm_client))
+                for field_type, batch in jobs
+            ]
+            for field_type, future in futures:
+                for raw, value in future.result().items():
+                    normalized_values[(field_type, raw)] = value
+
+    out: List[Dict[str, Any]] = []
+    for record in records:
+        normalized = record.copy()
+        for field in fields_to_normalize:
+            value = record.get(field)
+            key = (field_types.get(field, field), value)
+            if isinstance(value, str) and key in normalized_values:
+                normalized[field] = normalized_values[key]
+        out.append(normalized)
+    return out
+
+
 def process_llm_normalization(
     records: Iterable[Dict[str, Any]],
     source_config: Dict[str, Any],
@@ -102,6 +295,10 @@ def process_llm_normalization(
     """
     Process records and normalize fields using LLM.
 
+    Records are consumed in slices of ``records_per_slice`` and normalized with
+    :func:`normalize_records_batch`; set ``llm.normalize_batch: false`` to make
+    one call per field per record instead.
+
     Args:
         records: Records to normalize
         source_config: Source config with LLM settings
@@ -134,6 +331,22 @@ def process_llm_normalization(
         return
 
     field_types = llm_config.get("field_types", {})
+    settings = BatchSettings.from_config(llm_config)
+
+    if settings.enabled:
+        for chunk in iter_chunks(records, settings.records_per_slice):
+            try:
+                normalized_chunk = normalize_records_batch(
+                    chunk, fields_to_normalize, llm_client, field_types, settings
+                )
+            except Exception as exc:
+                log.error(
+                    "LLM normalization failed for slice",
+                    extra={"records": len(chunk), "error": str(exc)},
+                )
+                normalized_chunk = chunk  # Return originals on error
+            yield from normalized_chunk
+        return
 
     for record in records:
         try:
@@ -2,17 +2,31 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
+
+from src.common.logging_utils import get_logger
 from src.core_kernel.models import NormalizedRecord, PCIDMatchResult, RawRecord
-from src.governance.openfeature import is_enabled
+from src.governance.openfeature import flag_snapshot, is_enabled
 from src.processors.vector_store import (
     BasePCIDVectorBackend,
     PCIDVectorStore,
     connect_vector_store_backend,
     embed_pcid_record,
+    embed_pcid_records,
+    load_index_array,
+    read_index_manifest,
+    save_index_array,
+    write_index_manifest,
 )
+from src.utils.hash_utils import file_sha256, stable_hash64
+
+log = get_logger(__name__)
+
+_DEFAULT_CURRENCY: str = NormalizedRecord.model_fields["currency"].default
 
 
 def _normalize_field(value: Optional[str]) -> str:
@@ -107,8 +121,177 @@ def build_vector_store(records: Iterable[Mapping[str, Any]], dims: int = 48) ->
     return store
 
 
-def persist_pcid_mappings(mappings: Iterable[PCIDMatchResult | Mapping[str, Any]], path: Path) -> None:
-    """Write PCID mapping decisions to JSONL for downstream auditing."""
+def _key_hash(key: Tuple[str, str, str]) -> int:
+    return stable_hash64("\x1f".join(key))
+
+
+class MappedPcidIndex:
+    """Exact-match PCID lookup backed by memory-mapped sorted key hashes.
+
+    Behaves like the ``{(name, company, currency): pcid}`` dict returned by
+    :func:`build_pcid_index` for ``get``/``[]``/``in``, but only stores 64-bit
+    key hashes (sorted, searched with ``np.searchsorted``) and row numbers
+    into the shared pcid column, so loading it costs no parsing. Keys
+    themselves are not retained and cannot be iterated.
+    """
+
+    def __init__(self, hashes: np.ndarray, rows: np.ndarray, pcids: Sequence[str]) -> None:
+        self._hashes = hashes
+        self._rows = rows
+        self._pcids = pcids
+
+    @classmethod
+    def build(
+        cls, keys: Sequence[Tuple[str, str, str]], pcids: Sequence[str]
+    ) -> "MappedPcidIndex":
+        # Later rows win on duplicate keys, matching build_pcid_index
+        latest: Dict[int, int] = {}
+        for row, key in enumerate(keys):
+            latest[_key_hash(key)] = row
+        hashes = np.fromiter(latest.keys(), dtype=np.uint64, count=len(latest))
+        rows = np.fromiter(latest.values(), dtype=np.int64, count=len(latest))
+        order = np.argsort(hashes, kind="stable")
+        return cls(hashes[order], rows[order], pcids)
+
+    def _row(self, key: Tuple[str, str, str]) -> Optional[int]:
+        target = np.uint64(_key_hash(key))
+        pos = int(np.searchsorted(self._hashes, target))
+        if pos < len(self._hashes) and self._hashes[pos] == target:
+            return int(self._rows[pos])
+        return None
+
+    def get_many(self, keys: Sequence[Tuple[str, str, str]]) -> List[Optional[str]]:
+        """Vectorized ``get`` for many keys: one hash pass and one ``searchsorted``."""
+
+        if not keys:
+            return []
+        if not len(self._hashes):
+            return [None] * len(keys)
+        targets = np.fromiter((_key_hash(key) for key in keys), dtype=np.uint64, count=len(keys))
+        pos = np.minimum(np.searchsorted(self._hashes, targets), len(self._hashes) - 1)
+        hit = self._hashes[pos] == targets
+        rows = self._rows[pos]
+        pcids = self._pcids
+        return [pcids[int(row)] if found else None for row, found in zip(rows, hit)]
+
+    def get(self, key: Tuple[str, str, str], default: Optional[str] = None) -> Optional[str]:
+        row = self._row(key)
+        return default if row is None else self._pcids[row]
+
+    def __getitem__(self, key: Tuple[str, str, str]) -> str:
+        row = self._row(key)
+        if row is None:
+            raise KeyError(key)
+        return self._pcids[row]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, tuple) and self._row(key) is not None  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __bool__(self) -> bool:
+        return len(self._hashes) > 0
+
+
+def _master_is_current(
+    manifest: Optional[Mapping[str, Any]], master_path: Path, dims: int
+) -> Tuple[bool, Optional[str]]:
+    """Check the cached index against the master file.
+
+    Size + mtime match is trusted without hashing; otherwise the SHA-256 is
+    compared so a touched-but-unchanged master does not trigger a rebuild.
+    Returns ``(is_current, sha256_if_computed)``.
+    """
+
+    if manifest is None or int(manifest.get("dims", -1)) != dims:
+        return False, None
+    stat = master_path.stat()
+    if (
+        manifest.get("master_size") == stat.st_size
+        and manifest.get("master_mtime_ns") == stat.st_mtime_ns
+    ):
+        return True, None
+    digest = file_sha256(master_path)
+    return manifest.get("master_sha256") == digest, digest
+
+
+def load_or_build_pcid_resources(
+    master_path: Path,
+    cache_base: Path,
+    *,
+    dims: int = 48,
+) -> Tuple[MappedPcidIndex, PCIDVectorStore]:
+    """Return the exact-match index and vector store for a PCID master file.
+
+    The binary index at ``cache_base`` is memory-mapped when it was built from
+    the same master contents (tracked by SHA-256 in the manifest); otherwise
+    it is rebuilt from ``master_path`` and written back atomically.
+    """
+
+    manifest = read_index_manifest(cache_base)
+    current, digest = _master_is_current(manifest, master_path, dims)
+    stat = master_path.stat()
+
+    if current and manifest is not None:
+        try:
+            store = PCIDVectorStore.load(cache_base)
+            index = MappedPcidIndex(
+                load_index_array(cache_base, "keyhash.npy"),
+                load_index_array(cache_base, "keyrow.npy"),
+                store._pcids,
+            )
+        except (OSError, ValueError) as exc:
+            log.warning(
+                "PCID index cache unreadable; rebuilding",
+                extra={"path": str(cache_base), "error": str(exc)},
+            )
+        else:
+            if manifest.get("master_mtime_ns") != stat.st_mtime_ns:
+                write_index_manifest(
+                    cache_base,
+                    {**manifest, "master_size": stat.st_size, "master_mtime_ns": stat.st_mtime_ns},
+                )
+            return index, store
+
+    digest = digest or file_sha256(master_path)
+    keys: List[Tuple[str, str, str]] = []
+    payloads: List[Dict[str, Any]] = []
+    for record in load_pcid_master(master_path):
+        normalized = _coerce_normalized_record(record)
+        if not normalized.pcid:
+            continue
+        keys.append(_make_key(normalized))
+        payloads.append(normalized.model_dump())
+
+    store = build_vector_store(payloads, dims=dims)
+    index = MappedPcidIndex.build(keys, store.pcids)
+    save_index_array(cache_base, "keyhash.npy", index._hashes)
+    save_index_array(cache_base, "keyrow.npy", index._rows)
+    store.save(
+        cache_base,
+        extra={
+            "master_path": str(master_path),
+            "master_sha256": digest,
+            "master_size": stat.st_size,
+            "master_mtime_ns": stat.st_mtime_ns,
+        },
+    )
+    log.info(
+        "Rebuilt PCID index cache",
+        extra={"rows": len(store), "path": str(cache_base), "master_sha256": digest},
+    )
+    return index, store
+
+
+def persist_pcid_mappings(
+    mappings: Iterable[PCIDMatchResult | Mapping[str, Any]], path: Path, *, append: bool = False
+) -> None:
+    """Write PCID mapping decisions to JSONL for downstream auditing.
+
+    ``append`` adds to an existing file instead of replacing it, which lets
+    streaming runs persist mappings chunk by chunk.
+    """
 
     path.parent.mkdir(parents=True, exist_ok=True)
     lines = []
@@ -118,7 +301,14 @@ def persist_pcid_mappings(mappings: Iterable[PCIDMatchResult | Mapping[str, Any]
         else:
             payload = dict(mapping)
         lines.append(json.dumps(payload))
-    path.write_text("\n".join(lines), encoding="utf-8")
+    if not append:
+        path.write_text("\n".join(lines), encoding="utf-8")
+        return
+    if not lines:
+        return
+    prefix = "\n" if path.exists() and path.stat().st_size else ""
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(prefix + "\n".join(lines))
 
 
 def match_pcid_with_confidence(
@@ -144,11 +334,12 @@ def match_pcid_with_confidence(
     if exact:
         return exact, 1.0
 
-    if not is_enabled("pcid.vector_store.similarity_fallback", default=True):
+    flags = flag_snapshot()
+    if not flags.is_enabled("pcid.vector_store.similarity_fallback", default=True):
         return None, 0.0
 
     backend: Optional[BasePCIDVectorBackend] = vector_store
-    if backend is None and is_enabled("pcid.vector_store.remote_backend", default=True):
+    if backend is None and flags.is_enabled("pcid.vector_store.remote_backend", default=True):
         backend = connect_vector_store_backend()
 
     if backend is None:
@@ -194,6 +385,266 @@ def match_pcid(
     return pcid
 
 
+def _field_value(record: NormalizedRecord | RawRecord | Mapping[str, Any], field: str) -> Any:
+    if isinstance(record, Mapping):
+        return record.get(field)
+    if isinstance(record, (NormalizedRecord, RawRecord)):
+        return getattr(record, field)
+    raise TypeError(f"Unsupported record type for normalization: {type(record)!r}")
+
+
+def _key_column(
+    records: Sequence[NormalizedRecord | RawRecord | Mapping[str, Any]],
+    field: str,
+    *,
+    plain_dicts: bool,
+    default: str = "",
+) -> Tuple[np.ndarray, List[str]]:
+    """Normalize one key field for all records into ``(row codes, labels)``.
+
+    Scraped columns repeat heavily (companies, currencies), so each distinct
+    raw value is normalized once (``_normalize_field`` semantics) and rows
+    only carry an integer code into ``labels``.
+    """
+
+    if plain_dicts:
+        values = [record.get(field) for record in records]  # type: ignore[union-attr]
+    else:
+        values = [_field_value(record, field) for record in records]
+    labels: Dict[str, int] = {}
+    raw_codes = {
+        value: labels.setdefault(
+            default if value is None else str(value).strip().lower(), len(labels)
+        )
+        for value in dict.fromkeys(values)
+    }
+    codes = np.fromiter(map(raw_codes.__getitem__, values), dtype=np.int64, count=len(values))
+    return codes, list(labels)
+
+
+def _combine_codes(
+    columns: Sequence[np.ndarray], sizes: Sequence[int]
+) -> Tuple[np.ndarray, List[List[int]]]:
+    """Dense row codes for the tuples formed by ``columns``, plus each code's parts.
+
+    The columns are packed into one int64 (mixed radix) and deduplicated with
+    a single ``np.unique``.
+    """
+
+    packed = np.zeros(len(columns[0]), dtype=np.int64)
+    for column, size in zip(columns, sizes):
+        packed *= max(size, 1)
+        packed += column
+    distinct, codes = np.unique(packed, return_inverse=True)
+    parts: List[List[int]] = []
+    for size in reversed(sizes):
+        distinct, part = np.divmod(distinct, max(size, 1))
+        parts.append(part.tolist())
+    return codes.reshape(-1), parts[::-1]
+
+
+def _batch_keys(
+    records: Sequence[NormalizedRecord | RawRecord | Mapping[str, Any]]
+) -> Tuple[np.ndarray, List[Tuple[str, str, str]]]:
+    """``_make_key`` for every record, as row codes into the distinct keys.
+
+    Built column by column without pydantic. A missing or null currency
+    falls back to the ``NormalizedRecord`` default, as
+    :meth:`NormalizedRecord.from_raw` does.
+    """
+
+    plain_dicts = set(map(type, records)) <= {dict}
+    name_codes, names = _key_column(records, "name", plain_dicts=plain_dicts)
+    company_codes, companies = _key_column(records, "company", plain_dicts=plain_dicts)
+    currency_codes, currencies = _key_column(
+        records, "currency", plain_dicts=plain_dicts, default=_DEFAULT_CURRENCY.lower()
+    )
+
+    sizes = (len(names), len(companies), len(currencies))
+    if sizes[0] * sizes[1] * sizes[2] < 2**62:
+        codes, (name_of, company_of, currency_of) = _combine_codes(
+            (name_codes, company_codes, currency_codes), sizes
+        )
+    else:
+        # Pack pairwise so the radix product cannot overflow int64
+        pair_codes, (name_of, company_of) = _combine_codes((name_codes, company_codes), sizes[:2])
+        codes, (pair_of, currency_of) = _combine_codes(
+            (pair_codes, currency_codes), (len(name_of), sizes[2])
+        )
+        name_of = [name_of[pair] for pair in pair_of]
+        company_of = [company_of[pair] for pair in pair_of]
+    keys = [
+        (names[name], companies[company], currencies[currency])
+        for name, company, currency in zip(name_of, company_of, currency_of)
+    ]
+    return codes.astype(np.int32), keys
+
+
+def _best_match(matches: Sequence[Mapping[str, Any]]) -> Tuple[Optional[str], float]:
+    """Reduce backend matches to ``(pcid, score)`` like ``match_pcid_with_confidence``."""
+
+    if not matches:
+        return None, 0.0
+    best = matches[0]
+    if not isinstance(best, Mapping):
+        return None, 0.0
+    pcid = best.get("pcid")
+    score = float(best.get("score", 0.0))
+    if not pcid:
+        return None, score
+    if score <= 0:
+        return None, 0.0
+    return str(pcid), score
+
+
+def _query_backend_batch(
+    backend: BasePCIDVectorBackend,
+    keys: Sequence[Tuple[str, str, str]],
+    payloads: Sequence[Mapping[str, Any]],
+    min_similarity: float,
+) -> List[Sequence[Mapping[str, Any]]]:
+    """Top-1 matches for every miss, using the backend's batch API when it has one."""
+
+    if hasattr(backend, "query_records_many"):
+        return backend.query_records_many(  # type: ignore[attr-defined]
+            payloads, top_k=1, threshold=min_similarity
+        )
+    if hasattr(backend, "query_record"):
+        query_record = backend.query_record  # type: ignore[attr-defined]
+        return [query_record(payload, top_k=1, threshold=min_similarity) for payload in payloads]
+
+    # Keys are already stripped/lowercased, which is all the embedding looks at.
+    dims = getattr(backend, "dims", 48)
+    queries = embed_pcid_records(
+        (
+            {"name": name, "company": company, "currency": currency}
+            for name, company, currency in keys
+        ),
+        dims=dims,
+    )
+    if hasattr(backend, "query_many"):
+        return backend.query_many(  # type: ignore[attr-defined]
+            queries, top_k=1, threshold=min_similarity
+        )
+    return [backend.query(row, top_k=1, threshold=min_similarity) for row in queries]
+
+
+@dataclass
+class PCIDBatchMatches:
+    """Compact PCID decisions for the records passed to :func:`match_records_batch`.
+
+    Decisions are stored once per distinct match key (``slot_*``) and
+    ``codes`` maps each input row to its slot, so repeated products cost one
+    int32 per row. Iterating yields ``(pcid, confidence, method)`` per row.
+    """
+
+    codes: np.ndarray
+    slot_pcids: List[Optional[str]]
+    slot_confidence: np.ndarray
+    slot_methods: List[str]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[Tuple[Optional[str], float, str]]:
+        decisions = list(zip(self.slot_pcids, self.slot_confidence.tolist(), self.slot_methods))
+        return (decisions[code] for code in self.codes.tolist())
+
+    @property
+    def pcids(self) -> List[Optional[str]]:
+        return [self.slot_pcids[code] for code in self.codes.tolist()]
+
+    @property
+    def confidence(self) -> np.ndarray:
+        return self.slot_confidence[self.codes]
+
+    @property
+    def methods(self) -> List[str]:
+        return [self.slot_methods[code] for code in self.codes.tolist()]
+
+    @property
+    def matched(self) -> int:
+        hit = np.fromiter(
+            (bool(pcid) for pcid in self.slot_pcids), dtype=bool, count=len(self.slot_pcids)
+        )
+        return int(np.count_nonzero(hit[self.codes])) if len(self.codes) else 0
+
+    def to_match_results(
+        self, records: Sequence[NormalizedRecord | RawRecord | Mapping[str, Any]]
+    ) -> List[PCIDMatchResult]:
+        """Expand into :class:`PCIDMatchResult` objects (validates each record once)."""
+
+        return [
+            PCIDMatchResult(
+                record=_coerce_normalized_record(record),
+                pcid=pcid,
+                confidence=confidence,
+                method=method,
+            )
+            for record, (pcid, confidence, method) in zip(records, self)
+        ]
+
+
+def match_records_batch(
+    records: Iterable[NormalizedRecord | RawRecord | Mapping[str, Any]],
+    pcid_index: Mapping[Tuple[str, str, str], str],
+    *,
+    vector_store: Optional[BasePCIDVectorBackend] = None,
+    min_similarity: float = 0.8,
+) -> PCIDBatchMatches:
+    """Match many records at once and return compact decisions.
+
+    Produces the same ``(pcid, confidence)`` as calling
+    :func:`match_pcid_with_confidence` per record, but normalizes keys
+    column-wise without pydantic, resolves each distinct key against the
+    index once, evaluates feature flags once per batch, and sends only the
+    distinct misses to the vector backend in a single batched query.
+    """
+
+    records = records if isinstance(records, Sequence) else list(records)
+    codes, index_keys = _batch_keys(records)
+    if isinstance(pcid_index, MappedPcidIndex):
+        found = pcid_index.get_many(index_keys)
+    else:
+        lookup = pcid_index.get
+        found = [lookup(key) for key in index_keys]
+
+    pcids: List[Optional[str]] = [pcid or None for pcid in found]
+    confidence = np.array([1.0 if pcid else 0.0 for pcid in pcids], dtype=np.float64)
+    methods = ["exact" if pcid else "none" for pcid in pcids]
+
+    misses = [slot for slot, pcid in enumerate(pcids) if pcid is None]
+    backend: Optional[BasePCIDVectorBackend] = None
+    if misses and is_enabled("pcid.vector_store.similarity_fallback", default=True):
+        backend = vector_store
+        if backend is None and is_enabled("pcid.vector_store.remote_backend", default=True):
+            backend = connect_vector_store_backend()
+
+    if backend is not None:
+        # First record per missed key stands in for the whole group
+        _, first_rows = np.unique(codes, return_index=True)
+        payloads = []
+        for slot in misses:
+            record = records[int(first_rows[slot])]
+            payloads.append(dict(record) if isinstance(record, Mapping) else record.model_dump())
+        matches = _query_backend_batch(
+            backend, [index_keys[slot] for slot in misses], payloads, min_similarity
+        )
+        for slot, candidates in zip(misses, matches):
+            pcid, score = _best_match(candidates)
+            confidence[slot] = score
+            if pcid:
+                pcids[slot] = pcid
+                methods[slot] = "vector"
+
+    return PCIDBatchMatches(
+        codes=codes,
+        slot_pcids=pcids,
+        slot_confidence=confidence,
+        slot_methods=methods,
+    )
+
+
 def match_records(
     records: Iterable[NormalizedRecord | RawRecord | Mapping[str, Any]],
     pcid_index: Mapping[Tuple[str, str, str], str],
@@ -206,25 +657,15 @@ def match_records(
     The helper is designed for pipeline integration and plugin discovery,
     returning structured :class:`PCIDMatchResult` objects. It intentionally
     leaves side effects to callers so it can be used safely in both
-    synchronous and async contexts.
+    synchronous and async contexts. Matching itself goes through
+    :func:`match_records_batch`.
     """
 
-    results: List[PCIDMatchResult] = []
-    for record in records:
-        normalized = _coerce_normalized_record(record)
-        pcid, confidence = match_pcid_with_confidence(
-            normalized,
-            pcid_index,
-            vector_store=vector_store,
-            min_similarity=min_similarity,
-        )
-        results.append(
-            PCIDMatchResult(
-                record=normalized,
-                pcid=pcid,
-                confidence=confidence,
-                method="exact" if confidence >= 1.0 else "vector" if pcid else "none",
-            )
-        )
-    return results
-
+    records = list(records)
+    batch = match_records_batch(
+        records,
+        pcid_index,
+        vector_store=vector_store,
+        min_similarity=min_similarity,
+    )
+    return batch.to_match_results(records)
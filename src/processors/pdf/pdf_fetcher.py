@@ -2,132 +2,441 @@
 PDF fetcher processor.
 
 Downloads PDFs from URLs and stores them for later processing.
+
+PDFs are stored by content: the file name is derived from the SHA-256 of the
+bytes, so the same document behind two URLs is stored once. A small SQLite
+index maps each URL to its content hash together with the ``ETag`` /
+``Last-Modified`` validators the server sent.
+
+Downloads go through a shared pooled session on a bounded thread pool. They
+stream into a temp file that is renamed into place only once complete. An
+interrupted download is resumed with ``Range`` + ``If-Range``, so a changed
+document restarts from scratch instead of being spliced.
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
 from src.common.logging_utils import get_logger
 from src.common.paths import OUTPUT_DIR
+from src.observability import metrics
 
 log = get_logger("pdf-fetcher")
 
 PDF_STORAGE_DIR = OUTPUT_DIR / "pdfs"
 
+_CHUNK_SIZE = 64 * 1024
 
-def fetch_and_store_pdf(pdf_url: str, metadata: Dict[str, Any] | None = None) -> Dict[str, Any]:
-    """
-    Fetch PDF from URL and store locally.
 
-    Args:
-        pdf_url: URL of PDF to fetch
-        metadata: Optional metadata to attach
+def _url_key(pdf_url: str) -> str:
+    return hashlib.sha256(pdf_url.encode()).hexdigest()[:16]
 
-    Returns:
-        Dict with:
-            - pdf_id: Unique identifier for stored PDF
-            - pdf_path: Local file path
-            - pdf_url: Original URL
-            - size_bytes: File size
-            - metadata: Attached metadata
+
+def _extension(pdf_url: str) -> str:
+    ext = Path(urlparse(pdf_url).path).suffix or ".pdf"
+    return ext if ext.startswith(".") else f".{ext}"
+
+
+class PDFIndex:
+    """URL → content-hash index with the HTTP validators of the stored copy."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pdf_urls (
+                url TEXT PRIMARY KEY,
+                content_sha256 TEXT NOT NULL,
+                pdf_path TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                size_bytes INTEGER NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_sha256, pdf_path, etag, last_modified, size_bytes "
+                "FROM pdf_urls WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("content_sha256", "pdf_path", "etag", "last_modified", "size_bytes")
+        return dict(zip(keys, row))
+
+    def put(self, url: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pdf_urls "
+                "(url, content_sha256, pdf_path, etag, last_modified, size_bytes, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    entry["content_sha256"],
+                    entry["pdf_path"],
+                    entry.get("etag"),
+                    entry.get("last_modified"),
+                    entry["size_bytes"],
+                    time.time(),
+                ),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class PDFFetcher:
+    """Concurrent, resumable, content-addressed PDF downloader.
+
+    Args:
+        storage_dir: Where PDFs, partial downloads and the URL index live
+        max_workers: Downloads in flight (also the session's connection pool size)
+        timeout: Per-request timeout in seconds
+        revalidate: Send ``If-None-Match`` / ``If-Modified-Since`` for URLs that
+            are already stored instead of trusting the stored copy outright
+        session: Optional pre-configured session (tests, proxies)
     """
-    PDF_STORAGE_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Generate PDF ID from URL hash
-    pdf_id = hashlib.sha256(pdf_url.encode()).hexdigest()[:16]
-    pdf_id = f"PDF-{pdf_id}"
+    def __init__(
+        self,
+        storage_dir: Path | str = PDF_STORAGE_DIR,
+        *,
+        max_workers: int = 8,
+        timeout: float = 30.0,
+        revalidate: bool = False,
+        session: Optional[requests.Session] = None,
+    ):
+        self.storage_dir = Path(storage_dir)
+        self.partial_dir = self.storage_dir / ".partial"
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.revalidate = revalidate
+        self.index = PDFIndex(self.storage_dir / "index.sqlite")
+        self.session = session or self._build_session()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
 
-    # Determine file extension
-    parsed = urlparse(pdf_url)
-    ext = Path(parsed.path).suffix or ".pdf"
-    if not ext.startswith("."):
-        ext = f".{ext}"
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
-    pdf_path = PDF_STORAGE_DIR / f"{pdf_id}{ext}"
+    def __enter__(self) -> "PDFFetcher":
+        return self
 
-    # Skip if already exists
-    if pdf_path.exists():
-        log.debug("PDF already cached", extra={"pdf_id": pdf_id, "url": pdf_url})
-        return {
-            "pdf_id": pdf_id,
-            "pdf_path": str(pdf_path),
-            "pdf_url": pdf_url,
-            "size_bytes": pdf_path.stat().st_size,
-            "metadata": metadata or {},
-        }
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
-    # Fetch PDF
-    try:
-        resp = requests.get(pdf_url, timeout=30, stream=True)
-        resp.raise_for_status()
-
-        # Verify content type
-        content_type = resp.headers.get("content-type", "").lower()
-        if "pdf" not in content_type and not pdf_url.lower().endswith(".pdf"):
-            log.warning(
-                "URL may not be a PDF",
-                extra={"url": pdf_url, "content_type": content_type},
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.index.close()
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+    def fetch(self, pdf_url: str, metadata: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        """Fetch ``pdf_url`` (or reuse the stored copy) and return its storage info."""
+
+        with self._url_lock(pdf_url):
+            entry = self._stored(pdf_url)
+            if entry is not None and not self.revalidate:
+                log.debug("PDF already cached", extra={"pdf_id": entry["pdf_id"], "url": pdf_url})
+                metrics.incr("pdf.fetch.cached")
+                return self._info(pdf_url, entry, metadata)
+            entry = self._download(pdf_url, entry)
+            return self._info(pdf_url, entry, metadata)
+
+    def fetch_records(
+        self, records: Iterable[Dict[str, Any]]
+    ) -> Iterator[Tuple[Dict[str, Any], Any]]:
+        """Yield ``(record, info_or_exception)`` in input order.
+
+        At most ``max_workers`` downloads run at a time.
+
+        Records without ``pdf_url`` come back as ``(record, None)``.
+        """
+
+        window: Deque[Tuple[Dict[str, Any], Optional[Future]]] = deque()
+        for record in records:
+            pdf_url = record.get("pdf_url")
+            future = None
+            if pdf_url:
+                future = self._pool().submit(self.fetch, pdf_url, record.get("metadata"))
+            window.append((record, future))
+            while len(window) > 2 * self.max_workers or (window and _done(window[0][1])):
+                yield _settle(*window.popleft())
+        while window:
+            yield _settle(*window.popleft())
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="pdf-fetch"
             )
+        return self._executor
+
+    def _url_lock(self, pdf_url: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._url_locks.setdefault(pdf_url, threading.Lock())
+
+    def _stored(self, pdf_url: str) -> Optional[Dict[str, Any]]:
+        entry = self.index.get(pdf_url)
+        if entry is not None and Path(entry["pdf_path"]).exists():
+            entry["pdf_id"] = _pdf_id(entry["content_sha256"])
+            return entry
+
+        # Files stored before the content index existed are named by URL hash
+        legacy = self.storage_dir / f"PDF-{_url_key(pdf_url)}{_extension(pdf_url)}"
+        if legacy.exists():
+            return self._register(pdf_url, legacy, _file_sha256(legacy), None, None)
+        return None
+
+    def _register(
+        self,
+        pdf_url: str,
+        path: Path,
+        content_sha256: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> Dict[str, Any]:
+        entry = {
+            "content_sha256": content_sha256,
+            "pdf_path": str(path),
+            "etag": etag,
+            "last_modified": last_modified,
+            "size_bytes": path.stat().st_size,
+        }
+        self.index.put(pdf_url, entry)
+        entry["pdf_id"] = _pdf_id(content_sha256)
+        return entry
+
+    def _download(self, pdf_url: str, stored: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        part = self.partial_dir / f"{_url_key(pdf_url)}.part"
+        meta_path = part.with_suffix(".meta")
+        meta = _read_meta(meta_path) if part.exists() else {}
+        offset = part.stat().st_size if part.exists() and meta.get("url") == pdf_url else 0
 
-        # Save to disk
-        with pdf_path.open("wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
+        headers: Dict[str, str] = {}
+        validator = meta.get("etag") or meta.get("last_modified")
+        if offset and validator:
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+        else:
+            offset = 0
+            if stored is not None:
+                if stored.get("etag"):
+                    headers["If-None-Match"] = stored["etag"]
+                if stored.get("last_modified"):
+                    headers["If-Modified-Since"] = stored["last_modified"]
 
-        size_bytes = pdf_path.stat().st_size
+        try:
+            response = self.session.get(pdf_url, headers=headers, timeout=self.timeout, stream=True)
+            with response as resp:
+                if resp.status_code == 304 and stored is not None:
+                    metrics.incr("pdf.fetch.not_modified")
+                    return stored
+                if resp.status_code == 416 and offset:
+                    # The partial file is not a prefix the server recognizes; start over
+                    part.unlink(missing_ok=True)
+                    meta_path.unlink(missing_ok=True)
+                    return self._download(pdf_url, stored)
+                resp.raise_for_status()
+                resumed = resp.status_code == 206 and offset > 0
+                if not resumed:
+                    offset = 0
+
+                content_type = resp.headers.get("content-type", "").lower()
+                if "pdf" not in content_type and not pdf_url.lower().endswith(".pdf"):
+                    log.warning(
+                        "URL may not be a PDF",
+                        extra={"url": pdf_url, "content_type": content_type},
+                    )
+
+                etag = resp.headers.get("ETag") or (meta.get("etag") if resumed else None)
+                last_modified = resp.headers.get("Last-Modified") or (
+                    meta.get("last_modified") if resumed else None
+                )
+                meta_path.write_text(
+                    json.dumps({"url": pdf_url, "etag": etag, "last_modified": last_modified}),
+                    encoding="utf-8",
+                )
+
+                digest = hashlib.sha256()
+                if resumed:
+                    _hash_into(digest, part)
+                    metrics.incr("pdf.fetch.resumed")
+                with part.open("ab" if resumed else "wb") as fh:
+                    for chunk in resp.iter_content(chunk_size=_CHUNK_SIZE):
+                        fh.write(chunk)
+                        digest.update(chunk)
+        except Exception as exc:
+            log.error("Failed to fetch PDF", extra={"url": pdf_url, "error": str(exc)})
+            raise
+
+        content_sha256 = digest.hexdigest()
+        final = self.storage_dir / f"{_pdf_id(content_sha256)}{_extension(pdf_url)}"
+        if final.exists():
+            part.unlink()
+            metrics.incr("pdf.fetch.deduplicated")
+        else:
+            os.replace(part, final)
+        meta_path.unlink(missing_ok=True)
+
+        entry = self._register(pdf_url, final, content_sha256, etag, last_modified)
+        metrics.incr("pdf.fetch.downloaded")
         log.info(
             "PDF fetched and stored",
-            extra={"pdf_id": pdf_id, "url": pdf_url, "size_bytes": size_bytes},
+            extra={"pdf_id": entry["pdf_id"], "url": pdf_url, "size_bytes": entry["size_bytes"]},
         )
+        return entry
 
+    @staticmethod
+    def _info(
+        pdf_url: str, entry: Dict[str, Any], metadata: Dict[str, Any] | None
+    ) -> Dict[str, Any]:
         return {
-            "pdf_id": pdf_id,
-            "pdf_path": str(pdf_path),
+            "pdf_id": entry["pdf_id"],
+            "pdf_path": entry["pdf_path"],
             "pdf_url": pdf_url,
-            "size_bytes": size_bytes,
+            "size_bytes": entry["size_bytes"],
+            "content_sha256": entry["content_sha256"],
             "metadata": metadata or {},
         }
 
+
+def _pdf_id(content_sha256: str) -> str:
+    return f"PDF-{content_sha256[:16]}"
+
+
+def _hash_into(digest: "hashlib._Hash", path: Path) -> None:
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    _hash_into(digest, path)
+    return digest.hexdigest()
+
+
+def _read_meta(path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _done(future: Optional[Future]) -> bool:
+    return future is None or future.done()
+
+
+def _settle(record: Dict[str, Any], future: Optional[Future]) -> Tuple[Dict[str, Any], Any]:
+    if future is None:
+        return record, None
+    try:
+        return record, future.result()
     except Exception as exc:
-        log.error("Failed to fetch PDF", extra={"url": pdf_url, "error": str(exc)})
-        raise
+        return record, exc
+
 
+_FETCHERS: Dict[str, PDFFetcher] = {}
+_FETCHERS_LOCK = threading.Lock()
 
-def process_pdf_urls(records: Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
+
+def get_pdf_fetcher(storage_dir: Path | str = PDF_STORAGE_DIR) -> PDFFetcher:
+    """Shared fetcher (and pooled session) for ``storage_dir``."""
+
+    key = str(storage_dir)
+    with _FETCHERS_LOCK:
+        fetcher = _FETCHERS.get(key)
+        if fetcher is None:
+            fetcher = _FETCHERS[key] = PDFFetcher(
+                storage_dir, max_workers=int(os.getenv("PDF_FETCH_WORKERS", "8"))
+            )
+        return fetcher
+
+
+def fetch_and_store_pdf(pdf_url: str, metadata: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    """
+    Fetch PDF from URL and store locally.
+
+    Args:
+        pdf_url: URL of PDF to fetch
+        metadata: Optional metadata to attach
+
+    Returns:
+        Dict with:
+            - pdf_id: Identifier derived from the content hash
+            - pdf_path: Local file path
+            - pdf_url: Original URL
+            - size_bytes: File size
+            - content_sha256: SHA-256 of the stored bytes
+            - metadata: Attached metadata
+    """
+    return get_pdf_fetcher().fetch(pdf_url, metadata)
+
+
+def process_pdf_urls(
+    records: Iterable[Dict[str, Any]],
+    fetcher: Optional[PDFFetcher] = None,
+) -> Iterable[Dict[str, Any]]:
     """
     Process records that contain PDF URLs.
 
     Expects records with 'pdf_url' field.
-    Adds 'pdf_id' and 'pdf_path' fields.
+    Adds 'pdf_id', 'pdf_path', 'pdf_size_bytes' and 'pdf_sha256' fields.
+    Downloads run concurrently; records are yielded in input order.
 
     Args:
         records: Iterable of records with 'pdf_url'
+        fetcher: Optional fetcher (defaults to the shared one)
 
     Yields:
         Records with added PDF metadata
     """
-    for record in records:
-        pdf_url = record.get("pdf_url")
-        if not pdf_url:
-            yield record
-            continue
-
-        try:
-            pdf_info = fetch_and_store_pdf(pdf_url, metadata=record.get("metadata"))
-            record["pdf_id"] = pdf_info["pdf_id"]
-            record["pdf_path"] = pdf_info["pdf_path"]
-            record["pdf_size_bytes"] = pdf_info["size_bytes"]
-            yield record
-        except Exception as exc:
+    fetcher = fetcher or get_pdf_fetcher()
+    for record, result in fetcher.fetch_records(records):
+        if isinstance(result, Exception):
             log.error(
                 "Failed to process PDF URL",
-                extra={"pdf_url": pdf_url, "error": str(exc)},
+                extra={"pdf_url": record.get("pdf_url"), "error": str(result)},
             )
             # Continue without PDF data
-            yield record
-
+        elif result is not None:
+            record["pdf_id"] = result["pdf_id"]
+            record["pdf_path"] = result["pdf_path"]
+            record["pdf_size_bytes"] = result["size_bytes"]
+            record["pdf_sha256"] = result["content_sha256"]
+        yield record
@@ -0,0 +1,318 @@
+"""
+Process-pool PDF extraction.
+
+Documents are split into page-range shards (``pages_per_task`` pages each)
+and the shards of every document in a batch are extracted on a process pool,
+so one large price list spreads across all cores and many small PDFs run side
+by side. Pages are available as soon as their shard finishes
+(:meth:`ParallelPDFExtractor.iter_pages`); records come back in input order
+(:meth:`ParallelPDFExtractor.extract_records`).
+
+Results are cached on disk by document content. The key combines the record's
+``pdf_id`` with the file's SHA-256, taken from ``pdf_sha256`` (set by
+``pdf_fetcher``) when the record has it, so cache hits never re-read the file;
+only records without it have their bytes hashed here.
+
+Settings come from the ``pdf_extraction`` section of the source config
+(``workers``, ``pages_per_task``, ``detect_tables``, ``cache``); the
+``PDF_WORKERS`` environment variable overrides ``workers``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from src.common.logging_utils import get_logger
+from src.common.paths import OUTPUT_DIR
+from src.observability import metrics
+from src.processors.pdf.pdf_text_extractor import (
+    extract_pdf_pages,
+    merge_page_results,
+    pdf_page_count,
+)
+
+log = get_logger("pdf-parallel")
+
+DEFAULT_CACHE_DIR = OUTPUT_DIR / "pdf_cache"
+
+# Bumped whenever the cached result shape or extraction logic changes
+_CACHE_VERSION = 1
+
+
+@dataclass
+class PDFExtractionSettings:
+    """Knobs for parallel extraction, read from ``pdf_extraction:`` in the source config."""
+
+    workers: int = field(default_factory=lambda: max(1, (os.cpu_count() or 2) - 1))
+    pages_per_task: int = 16
+    detect_tables: bool = True
+    cache: bool = True
+    cache_dir: Path = DEFAULT_CACHE_DIR
+
+    @classmethod
+    def from_config(
+        cls, source_config: Optional[Mapping[str, Any]] = None
+    ) -> "PDFExtractionSettings":
+        cfg = (source_config or {}).get("pdf_extraction") or {}
+        settings = cls()
+        settings.workers = int(os.getenv("PDF_WORKERS") or cfg.get("workers", settings.workers))
+        settings.pages_per_task = max(1, int(cfg.get("pages_per_task", settings.pages_per_task)))
+        settings.detect_tables = bool(cfg.get("detect_tables", settings.detect_tables))
+        settings.cache = bool(cfg.get("cache", settings.cache))
+        settings.cache_dir = Path(cfg.get("cache_dir", settings.cache_dir))
+        settings.workers = max(1, settings.workers)
+        return settings
+
+
+class PDFExtractionCache:
+    """Extraction results stored as JSON files keyed by document content."""
+
+    def __init__(self, cache_dir: Path | str = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(
+        pdf_path: Path | str,
+        pdf_id: Optional[str] = None,
+        detect_tables: bool = True,
+        content_sha256: Optional[str] = None,
+    ) -> str:
+        if not content_sha256:
+            content = hashlib.sha256()
+            with Path(pdf_path).open("rb") as fh:
+                for block in iter(lambda: fh.read(1 << 20), b""):
+                    content.update(block)
+            content_sha256 = content.hexdigest()
+        seed = f"v{_CACHE_VERSION}|tables={int(detect_tables)}|{content_sha256}"
+        digest = hashlib.sha256(seed.encode())
+        prefix = f"{pdf_id}-" if pdf_id else ""
+        return f"{prefix}{digest.hexdigest()[:32]}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self.cache_dir / f"{key}.json"
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            log.warning(
+                "Ignoring unreadable PDF cache entry",
+                extra={"path": str(path), "error": str(exc)},
+            )
+            return None
+
+    def set(self, key: str, extracted: Dict[str, Any]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.json"
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(extracted, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+class _Document:
+    """Book-keeping for one document whose shards are in flight."""
+
+    def __init__(self, record: Dict[str, Any]):
+        self.record = record
+        self.cache_key: Optional[str] = None
+        self.pending = 0
+        self.pages: List[Dict[str, Any]] = []
+        self.page_count = 0
+        self.method = ""
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+class ParallelPDFExtractor:
+    """Extract PDFs on a process pool, sharded by document and page range.
+
+    With ``workers == 1`` everything runs in the calling process. Use as a
+    context manager (or call :meth:`close`) to shut the pool down.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[PDFExtractionSettings] = None,
+        *,
+        executor: Optional[Executor] = None,
+    ):
+        self.settings = settings or PDFExtractionSettings()
+        self.cache = PDFExtractionCache(self.settings.cache_dir) if self.settings.cache else None
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    def __enter__(self) -> "ParallelPDFExtractor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+    def iter_pages(self, pdf_path: Path | str) -> Iterator[Dict[str, Any]]:
+        """Yield ``{"page", "text", "tables", "table_scanned"}`` dicts as their shards finish.
+
+        Pages of one shard arrive in order; shards arrive in completion order.
+        """
+
+        futures = [self._submit(pdf_path, start, end) for start, end in self._shards(pdf_path)]
+        for future in as_completed(futures):
+            yield from future.result()["pages"]
+
+    def extract(self, pdf_path: Path | str, pdf_id: Optional[str] = None) -> Dict[str, Any]:
+        """Extract one document; same result shape as ``extract_pdf_text_classic``."""
+
+        record = {"pdf_path": str(pdf_path), "pdf_id": pdf_id}
+        _, extracted, error = next(self.extract_records([record]))
+        if error is not None:
+            raise error
+        return extracted
+
+    def extract_records(
+        self, records: Iterable[Dict[str, Any]]
+    ) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[BaseException]]]:
+        """Yield ``(record, extracted, error)`` for every record, in input order.
+
+        Records without ``pdf_path`` come back as ``(record, None, None)``.
+        At most ``2 * workers`` documents are in flight, so a long stream of
+        records never has to be held in memory.
+        """
+
+        window = 2 * self.settings.workers
+        in_order: Deque[_Document] = deque()
+        futures: Dict[Future, _Document] = {}
+
+        def collect(block: bool) -> None:
+            if futures:
+                done, _ = wait(
+                    list(futures), timeout=None if block else 0, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    self._collect(futures.pop(future), future)
+
+        def ready() -> Iterator[
+            Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[BaseException]]
+        ]:
+            while in_order and in_order[0].pending == 0:
+                doc = in_order.popleft()
+                yield doc.record, doc.result, doc.error
+
+        for record in records:
+            doc = _Document(record)
+            self._start(doc, futures)
+            in_order.append(doc)
+            collect(block=False)
+            yield from ready()
+            while len(in_order) > window:
+                collect(block=True)
+                yield from ready()
+
+        while in_order:
+            collect(block=True)
+            yield from ready()
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            # PDF libraries are not fork-safe; spawn keeps workers independent of the
+            # parent's threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.settings.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def _shards(self, pdf_path: Path | str) -> List[Tuple[int, int]]:
+        page_count = pdf_page_count(pdf_path)
+        step = self.settings.pages_per_task
+        shards = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        return shards or [(0, 0)]
+
+    def _submit(self, pdf_path: Path | str, start: int, end: int) -> Future:
+        args = (str(pdf_path), start, end, self.settings.detect_tables)
+        if self.settings.workers <= 1 and self._owns_executor:
+            future: Future = Future()
+            try:
+                future.set_result(extract_pdf_pages(*args))
+            except Exception as exc:
+                future.set_exception(exc)
+            return future
+        return self._pool().submit(extract_pdf_pages, *args)
+
+    def _start(self, doc: _Document, futures: Dict[Future, _Document]) -> None:
+        pdf_path = doc.record.get("pdf_path")
+        if not pdf_path:
+            return
+        try:
+            if not Path(pdf_path).exists():
+                raise FileNotFoundError(f"PDF not found: {pdf_path}")
+            if self.cache is not None:
+                doc.cache_key = self.cache.key(
+                    pdf_path,
+                    doc.record.get("pdf_id"),
+                    self.settings.detect_tables,
+                    content_sha256=doc.record.get("pdf_sha256"),
+                )
+                cached = self.cache.get(doc.cache_key)
+                if cached is not None:
+                    metrics.incr("pdf.extract.cache_hits")
+                    doc.result = cached
+                    return
+            shards = self._shards(pdf_path)
+        except Exception as exc:
+            doc.error = exc
+            return
+        metrics.incr("pdf.extract.documents")
+        doc.pending = len(shards)
+        for start, end in shards:
+            futures[self._submit(pdf_path, start, end)] = doc
+
+    def _collect(self, doc: _Document, future: Future) -> None:
+        doc.pending -= 1
+        try:
+            shard = future.result()
+        except Exception as exc:
+            doc.error = doc.error or exc
+        else:
+            doc.pages.extend(shard["pages"])
+            doc.page_count = shard["page_count"]
+            doc.method = shard["extraction_method"]
+            metrics.incr("pdf.extract.pages", amount=len(shard["pages"]))
+        if doc.pending or doc.error is not None:
+            return
+        doc.result = merge_page_results(doc.pages, doc.page_count, doc.method)
+        doc.pages = []
+        if self.cache is not None and doc.cache_key:
+            try:
+                self.cache.set(doc.cache_key, doc.result)
+            except OSError as exc:
+                log.warning("Failed to cache PDF extraction", extra={"error": str(exc)})
+
+
+__all__ = [
+    "PDFExtractionSettings",
+    "PDFExtractionCache",
+    "ParallelPDFExtractor",
+    "DEFAULT_CACHE_DIR",
+]
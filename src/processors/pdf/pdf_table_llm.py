@@ -6,14 +6,45 @@ Uses LLM to extract structured tables from PDF text chunks.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 from src.common.logging_utils import get_logger
 from src.processors.llm.llm_client import LLMClient, get_llm_client_from_config
 from src.processors.pdf.pdf_text_extractor import chunk_pdf_text
 
+if TYPE_CHECKING:  # pragma: no cover
+    from src.processors.llm.async_llm_client import AsyncLLMClient
+
 log = get_logger("pdf-table-llm")
 
+DEFAULT_SYSTEM_PROMPT = (
+    "You are a data extraction specialist. Extract structured data from text "
+    "and return it as a JSON array of objects."
+)
+
+
+def _table_prompt(text_chunk: str, columns: List[str]) -> str:
+    columns_str = ", ".join(columns)
+    return f"""Extract a table from the following text with columns: {columns_str}
+
+Text:
+{text_chunk}
+
+Return a JSON array where each object has these keys: {columns_str}
+Only include rows where you can extract all required columns.
+Return only valid JSON, no markdown, no explanation."""
+
+
+def _as_rows(result: Any) -> List[Dict[str, Any]]:
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict):
+        # Sometimes LLM returns single object
+        return [result]
+    log.warning("Unexpected LLM response format", extra={"result_type": type(result)})
+    return []
+
 
 def extract_table_with_llm(
     text_chunk: str,
@@ -33,35 +64,46 @@ def extract_table_with_llm(
     Returns:
         List of row dicts
     """
-    if not system_prompt:
-        system_prompt = (
-            "You are a data extraction specialist. Extract structured data from text "
-            "and return it as a JSON array of objects."
+    try:
+        result = llm_client.extract_json(
+            _table_prompt(text_chunk, columns), system_prompt=system_prompt or DEFAULT_SYSTEM_PROMPT
         )
+        return _as_rows(result)
+    except Exception as exc:
+        log.error("LLM table extraction failed", extra={"error": str(exc)})
+        return []
 
-    columns_str = ", ".join(columns)
-    prompt = f"""Extract a table from the following text with columns: {columns_str}
-
-Text:
-{text_chunk}
 
-Return a JSON array where each object has these keys: {columns_str}
-Only include rows where you can extract all required columns.
-Return only valid JSON, no markdown, no explanation."""
+async def extract_tables_with_llm_async(
+    text_chunks: List[str],
+    columns: List[str],
+    llm_client: "AsyncLLMClient",
+    system_prompt: Optional[str] = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Extract tables from many text chunks concurrently (async batch variant of
+    ``extract_table_with_llm``).
 
-    try:
-        result = llm_client.extract_json(prompt, system_prompt=system_prompt)
-        if isinstance(result, list):
-            return result
-        elif isinstance(result, dict):
-            # Sometimes LLM returns single object
-            return [result]
+    Returns:
+        One list of row dicts per chunk, in input order; failed chunks yield ``[]``
+    """
+    results = await asyncio.gather(
+        *(
+            llm_client.aextract_json(
+                _table_prompt(chunk, columns), system_prompt=system_prompt or DEFAULT_SYSTEM_PROMPT
+            )
+            for chunk in text_chunks
+        ),
+        return_exceptions=True,
+    )
+    tables = []
+    for result in results:
+        if isinstance(result, BaseException):
+            log.error("LLM table extraction failed", extra={"error": str(result)})
+            tables.append([])
         else:
-            log.warning("Unexpected LLM response format", extra={"result_type": type(result)})
-            return []
-    except Exception as exc:
-        log.error("LLM table extraction failed", extra={"error": str(exc)})
-        return []
+            tables.append(_as_rows(result))
+    return tables
 
 
 def process_pdf_table_llm(
@@ -7,101 +7,160 @@ Extracts raw text and basic table structures from PDFs.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from src.common.logging_utils import get_logger
 
 log = get_logger("pdf-text-extractor")
 
+# Table finders in both backends work off ruling lines by default; a page
+# with fewer line/rect segments than this has no grid to find.
+_MIN_RULING_SEGMENTS = 2
 
-def extract_pdf_text_classic(pdf_path: str | Path) -> Dict[str, Any]:
-    """
-    Extract text and basic tables from PDF using classic libraries.
 
-    Tries PyMuPDF first, falls back to pdfplumber if available.
+def _open_pdf(pdf_path: Path) -> Tuple[str, Any]:
+    """Open ``pdf_path`` with PyMuPDF (faster) or pdfplumber; returns ``(method, doc)``."""
 
-    Args:
-        pdf_path: Path to PDF file
+    try:
+        import fitz  # PyMuPDF  # type: ignore[import]
+
+        return "pymupdf", fitz.open(str(pdf_path))
+    except ImportError:
+        pass  # Try pdfplumber
+
+    try:
+        import pdfplumber  # type: ignore[import]
+
+        return "pdfplumber", pdfplumber.open(str(pdf_path))
+    except ImportError:
+        raise RuntimeError(
+            "No PDF extraction library available. Install one of: "
+            "pip install pymupdf OR pip install pdfplumber"
+        )
+
+
+def _doc_pages(method: str, doc: Any) -> List[Any]:
+    return doc if method == "pymupdf" else doc.pages
+
+
+def _has_ruling(method: str, page: Any) -> bool:
+    """Whether ``page`` has any ruling lines or rectangles a table grid could use."""
+
+    try:
+        if method == "pymupdf":
+            segments = 0
+            for path in page.get_drawings():
+                segments += sum(
+                    1 for item in path.get("items", ()) if item and item[0] in ("l", "re", "qu")
+                )
+                if segments >= _MIN_RULING_SEGMENTS:
+                    return True
+            return False
+        return len(page.edges) >= _MIN_RULING_SEGMENTS
+    except Exception:
+        return True  # If drawings cannot be inspected, fall back to scanning the page
+
+
+def _extract_page(method: str, page: Any, page_num: int, detect_tables: bool) -> Dict[str, Any]:
+    text = page.get_text() if method == "pymupdf" else (page.extract_text() or "")
+    tables: List[List[Any]] = []
+    scanned = detect_tables and _has_ruling(method, page)
+    if scanned:
+        try:
+            if method == "pymupdf":
+                tables = [table.extract() for table in page.find_tables()]
+            else:
+                tables = list(page.extract_tables())
+        except Exception:
+            pass  # Table extraction not available or failed
+    return {"page": page_num, "text": text, "tables": tables, "table_scanned": scanned}
+
+
+def pdf_page_count(pdf_path: str | Path) -> int:
+    """Number of pages in ``pdf_path``."""
+
+    method, doc = _open_pdf(Path(pdf_path))
+    try:
+        return len(_doc_pages(method, doc))
+    finally:
+        doc.close()
+
+
+def extract_pdf_pages(
+    pdf_path: str | Path,
+    start: int = 0,
+    end: Optional[int] = None,
+    detect_tables: bool = True,
+) -> Dict[str, Any]:
+    """
+    Extract pages ``[start, end)`` (0-based) of a PDF.
+
+    Table detection only runs on pages that have ruling lines.
 
     Returns:
         Dict with:
-            - pages: List of page text
-            - raw_tables: List of detected tables (if any)
-            - page_count: Number of pages
+            - pages: List of ``{"page", "text", "tables", "table_scanned"}`` (1-based ``page``)
+            - page_count: Number of pages in the document
             - extraction_method: Library used
     """
     pdf_path = Path(pdf_path)
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-    # Try PyMuPDF first (faster)
+    method, doc = _open_pdf(pdf_path)
     try:
-        import fitz  # PyMuPDF  # type: ignore[import]
+        pages = _doc_pages(method, doc)
+        page_count = len(pages)
+        stop = page_count if end is None else min(end, page_count)
+        results = [
+            _extract_page(method, pages[idx], idx + 1, detect_tables)
+            for idx in range(max(0, start), stop)
+        ]
+    finally:
+        doc.close()
+    return {"pages": results, "page_count": page_count, "extraction_method": method}
 
-        doc = fitz.open(str(pdf_path))
-        pages: List[str] = []
-        raw_tables: List[Dict[str, Any]] = []
-
-        for page_num, page in enumerate(doc, start=1):
-            text = page.get_text()
-            pages.append(text)
-
-            # Try to detect tables (basic approach)
-            # PyMuPDF can extract tables with newer versions
-            try:
-                tables = page.find_tables()
-                for table in tables:
-                    raw_tables.append({
-                        "page": page_num,
-                        "rows": table.extract(),
-                    })
-            except Exception:
-                pass  # Table extraction not available or failed
 
-        doc.close()
+def merge_page_results(
+    pages: Iterable[Dict[str, Any]], page_count: int, extraction_method: str
+) -> Dict[str, Any]:
+    """Assemble per-page results (any order) into the ``extract_pdf_text_classic`` shape."""
 
-        return {
-            "pages": pages,
-            "raw_tables": raw_tables,
-            "page_count": len(pages),
-            "extraction_method": "pymupdf",
-        }
+    ordered = sorted(pages, key=lambda page: page["page"])
+    return {
+        "pages": [page["text"] for page in ordered],
+        "raw_tables": [
+            {"page": page["page"], "rows": rows} for page in ordered for rows in page["tables"]
+        ],
+        "page_count": page_count,
+        "extraction_method": extraction_method,
+        "table_pages_scanned": sum(1 for page in ordered if page.get("table_scanned")),
+    }
 
-    except ImportError:
-        pass  # Try pdfplumber
 
-    # Fallback to pdfplumber
-    try:
-        import pdfplumber  # type: ignore[import]
+def extract_pdf_text_classic(pdf_path: str | Path, detect_tables: bool = True) -> Dict[str, Any]:
+    """
+    Extract text and basic tables from PDF using classic libraries.
 
-        pages: List[str] = []
-        raw_tables: List[Dict[str, Any]] = []
-
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            for page_num, page in enumerate(pdf.pages, start=1):
-                text = page.extract_text() or ""
-                pages.append(text)
-
-                # Extract tables
-                tables = page.extract_tables()
-                for table in tables:
-                    raw_tables.append({
-                        "page": page_num,
-                        "rows": table,
-                    })
-
-        return {
-            "pages": pages,
-            "raw_tables": raw_tables,
-            "page_count": len(pages),
-            "extraction_method": "pdfplumber",
-        }
+    Tries PyMuPDF first, falls back to pdfplumber if available. Pages without
+    ruling lines are not scanned for tables.
 
-    except ImportError:
-        raise RuntimeError(
-            "No PDF extraction library available. Install one of: "
-            "pip install pymupdf OR pip install pdfplumber"
-        )
+    Args:
+        pdf_path: Path to PDF file
+        detect_tables: Run table detection on ruled pages
+
+    Returns:
+        Dict with:
+            - pages: List of page text
+            - raw_tables: List of detected tables (if any)
+            - page_count: Number of pages
+            - extraction_method: Library used
+            - table_pages_scanned: Pages table detection ran on
+    """
+    extracted = extract_pdf_pages(pdf_path, detect_tables=detect_tables)
+    return merge_page_results(
+        extracted["pages"], extracted["page_count"], extracted["extraction_method"]
+    )
 
 
 def chunk_pdf_text(
@@ -177,37 +236,38 @@ def chunk_pdf_text(
     return chunks
 
 
-def process_pdf_extraction(records: Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
+def process_pdf_extraction(
+    records: Iterable[Dict[str, Any]],
+    source_config: Optional[Dict[str, Any]] = None,
+) -> Iterable[Dict[str, Any]]:
     """
     Process records with PDF paths and extract text.
 
-    Expects records with 'pdf_path' or 'pdf_id'.
-    Adds 'pdf_text', 'pdf_pages', 'pdf_chunks' fields.
+    Expects records with 'pdf_path' (and optionally 'pdf_id').
+    Adds 'pdf_text', 'pdf_pages', 'pdf_raw_tables' and related fields.
+    Documents are extracted in parallel (see ``pdf_parallel``) and records
+    are yielded in input order.
 
     Args:
         records: Iterable of records with PDF info
+        source_config: Optional source config (``pdf_extraction`` section)
 
     Yields:
         Records with extracted text
     """
-    for record in records:
-        pdf_path = record.get("pdf_path")
-        if not pdf_path:
-            yield record
-            continue
-
-        try:
-            extracted = extract_pdf_text_classic(pdf_path)
-            record["pdf_text"] = "\n\n".join(extracted["pages"])
-            record["pdf_pages"] = extracted["pages"]
-            record["pdf_raw_tables"] = extracted["raw_tables"]
-            record["pdf_page_count"] = extracted["page_count"]
-            record["pdf_extraction_method"] = extracted["extraction_method"]
+    from src.processors.pdf.pdf_parallel import ParallelPDFExtractor, PDFExtractionSettings
+
+    with ParallelPDFExtractor(PDFExtractionSettings.from_config(source_config)) as extractor:
+        for record, extracted, error in extractor.extract_records(records):
+            if error is not None:
+                log.error(
+                    "Failed to extract PDF text",
+                    extra={"pdf_path": record.get("pdf_path"), "error": str(error)},
+                )
+            elif extracted is not None:
+                record["pdf_text"] = "\n\n".join(extracted["pages"])
+                record["pdf_pages"] = extracted["pages"]
+                record["pdf_raw_tables"] = extracted["raw_tables"]
+                record["pdf_page_count"] = extracted["page_count"]
+                record["pdf_extraction_method"] = extracted["extraction_method"]
             yield record
-        except Exception as exc:
-            log.error(
-                "Failed to extract PDF text",
-                extra={"pdf_path": pdf_path, "error": str(exc)},
-            )
-            yield record
-
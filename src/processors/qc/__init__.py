@@ -10,14 +10,18 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from .columnar import ColumnBatch
 from .rules import (
+    CompiledRuleset,
+    QCBatchOutcome,
     QCRule,
     QCRuleResult,
+    compile_ruleset,
     get_default_ruleset,
     run_qc_for_record,
     run_qc_batch as _run_qc_batch,
 )
-from .dedupe import dedupe_records as _dedupe_records, DuplicateInfo
+from .dedupe import dedupe_records as _dedupe_records, DuplicateInfo, iter_unique_records
 
 
 Record = Dict[str, Any]
@@ -26,11 +30,16 @@ Record = Dict[str, Any]
 __all__ = [
     "QCRule",
     "QCRuleResult",
+    "QCBatchOutcome",
+    "CompiledRuleset",
+    "ColumnBatch",
     "DuplicateInfo",
     "get_default_ruleset",
+    "compile_ruleset",
     "run_qc_for_record",
     "run_qc_batch",
     "dedupe_records",
+    "iter_unique_records",
 ]
 
 
@@ -39,7 +48,7 @@ def run_qc_batch(
     *,
     source: Optional[str] = None,
     rules: Optional[Sequence[QCRule]] = None,
-) -> Tuple[List[Record], List[Record], List[List[QCRuleResult]]]:
+) -> Tuple[List[Record], List[Record], Sequence[List[QCRuleResult]]]:
     """
     Public batch QC function.
 
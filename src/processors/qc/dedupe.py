@@ -5,13 +5,17 @@ This is intentionally separate from QC rules so that:
     - you can run QC on *all* records
     - then dedupe only the ones that passed QC
 
-Dedupe is based on a configurable composite key.
+Dedupe is based on a configurable composite key. Keys are tracked as 64-bit
+hashes; for streams too large to hold in memory use iter_unique_records,
+which spills to disk via src.processors.dedupe.StreamingDeduper.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from src.processors.dedupe import StreamingDeduper, key_hash64
 
 from . import validators
 
@@ -40,14 +44,15 @@ def dedupe_records(
     - unique_records: list of records we keep (first occurrence wins)
     - duplicates_info: metadata about what was dropped and why
     """
-    seen: Dict[Tuple[Any, ...], int] = {}
+    seen: Dict[int, int] = {}  # key hash -> kept index
     unique: List[Record] = []
     dup_info: List[DuplicateInfo] = []
 
     for idx, rec in enumerate(records):
         key = validators.build_dedupe_key(rec, key_fields)
-        if key in seen:
-            kept_idx = seen[key]
+        key_hash = key_hash64(key)
+        if key_hash in seen:
+            kept_idx = seen[key_hash]
             dup_info.append(
                 DuplicateInfo(
                     key=key,
@@ -59,7 +64,25 @@ def dedupe_records(
             # do not append this record
             continue
 
-        seen[key] = idx
+        seen[key_hash] = idx
         unique.append(rec)
 
     return unique, dup_info
+
+
+def iter_unique_records(
+    records: Iterable[Record],
+    key_fields: Sequence[str],
+    **options: Any,
+) -> Iterator[Record]:
+    """
+    Streaming counterpart of dedupe_records.
+
+    Yields the first record per key with memory bounded by the deduper's
+    budget; duplicates are only counted (dedupe.* metrics), not listed.
+    ``options`` are passed to StreamingDeduper (memory_budget, spill_dir, ...).
+    """
+    with StreamingDeduper(
+        key_fields, key_fn=lambda rec: validators.build_dedupe_key(rec, key_fields), **options
+    ) as deduper:
+        yield from deduper.filter(records)
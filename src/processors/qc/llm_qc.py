@@ -6,13 +6,72 @@ Uses LLM to validate records, detect anomalies, and flag issues.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 from src.common.logging_utils import get_logger
 from src.processors.llm.llm_client import LLMClient, get_llm_client_from_config
 
+if TYPE_CHECKING:  # pragma: no cover
+    from src.processors.llm.async_llm_client import AsyncLLMClient
+
 log = get_logger("llm-qc")
 
+_SYSTEM_PROMPT = """You are a data quality validator. Analyze records and identify issues.
+
+Check for:
+- Missing or null required fields
+- Invalid data types
+- Suspicious values (e.g., prices that are too high/low)
+- Inconsistent data
+- Duplicate indicators
+
+Return JSON with: {"valid": bool, "issues": [str], "score": float}"""
+
+
+def _assume_valid() -> Dict[str, Any]:
+    return {"valid": True, "issues": [], "score": 1.0}
+
+
+def _missing_fields_result(
+    record: Dict[str, Any], required_fields: List[str]
+) -> Optional[Dict[str, Any]]:
+    missing_fields = [f for f in required_fields if not record.get(f)]
+    if not missing_fields:
+        return None
+    return {
+        "valid": False,
+        "issues": [f"Missing required fields: {', '.join(missing_fields)}"],
+        "score": 0.0,
+    }
+
+
+def _validation_prompt(
+    record: Dict[str, Any],
+    required_fields: List[str],
+    validation_rules: Optional[Dict[str, Any]],
+) -> str:
+    record_str = "\n".join(f"{k}: {v}" for k, v in record.items() if v is not None)
+    prompt = f"""Validate this record:
+
+{record_str}
+
+Required fields: {', '.join(required_fields)}
+"""
+    if validation_rules:
+        prompt += f"\nValidation rules: {validation_rules}"
+    return prompt
+
+
+def _qc_result(result: Any) -> Dict[str, Any]:
+    if not isinstance(result, dict):
+        return _assume_valid()
+    return {
+        "valid": result.get("valid", True),
+        "issues": result.get("issues", []),
+        "score": float(result.get("score", 1.0)),
+    }
+
 
 def validate_record_with_llm(
     record: Dict[str, Any],
@@ -36,50 +95,51 @@ def validate_record_with_llm(
             - score: float (0.0 to 1.0)
     """
     # Check required fields first (fast)
-    missing_fields = [f for f in required_fields if not record.get(f)]
-    if missing_fields:
-        return {
-            "valid": False,
-            "issues": [f"Missing required fields: {', '.join(missing_fields)}"],
-            "score": 0.0,
-        }
-
-    # Build validation prompt
-    system_prompt = """You are a data quality validator. Analyze records and identify issues.
+    missing = _missing_fields_result(record, required_fields)
+    if missing:
+        return missing
 
-Check for:
-- Missing or null required fields
-- Invalid data types
-- Suspicious values (e.g., prices that are too high/low)
-- Inconsistent data
-- Duplicate indicators
+    try:
+        result = llm_client.extract_json(
+            _validation_prompt(record, required_fields, validation_rules),
+            system_prompt=_SYSTEM_PROMPT,
+        )
+        return _qc_result(result)
+    except Exception as exc:
+        log.warning("LLM validation failed, assuming valid", extra={"error": str(exc)})
+        return _assume_valid()
 
-Return JSON with: {"valid": bool, "issues": [str], "score": float}"""
 
-    record_str = "\n".join(f"{k}: {v}" for k, v in record.items() if v is not None)
-    prompt = f"""Validate this record:
+async def validate_records_with_llm_async(
+    records: List[Dict[str, Any]],
+    required_fields: List[str],
+    llm_client: "AsyncLLMClient",
+    validation_rules: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Validate many records concurrently (async batch variant of ``validate_record_with_llm``).
 
-{record_str}
+    Records missing required fields are rejected without an LLM call.
 
-Required fields: {', '.join(required_fields)}
-"""
+    Returns:
+        One QC result dict per record, in input order
+    """
 
-    if validation_rules:
-        prompt += f"\nValidation rules: {validation_rules}"
+    async def validate(record: Dict[str, Any]) -> Dict[str, Any]:
+        missing = _missing_fields_result(record, required_fields)
+        if missing:
+            return missing
+        try:
+            result = await llm_client.aextract_json(
+                _validation_prompt(record, required_fields, validation_rules),
+                system_prompt=_SYSTEM_PROMPT,
+            )
+            return _qc_result(result)
+        except Exception as exc:
+            log.warning("LLM validation failed, assuming valid", extra={"error": str(exc)})
+            return _assume_valid()
 
-    try:
-        result = llm_client.extract_json(prompt, system_prompt=system_prompt)
-        if isinstance(result, dict):
-            return {
-                "valid": result.get("valid", True),
-                "issues": result.get("issues", []),
-                "score": float(result.get("score", 1.0)),
-            }
-        else:
-            return {"valid": True, "issues": [], "score": 1.0}
-    except Exception as exc:
-        log.warning("LLM validation failed, assuming valid", extra={"error": str(exc)})
-        return {"valid": True, "issues": [], "score": 1.0}
+    return list(await asyncio.gather(*(validate(record) for record in records)))
 
 
 def process_llm_qc(
@@ -9,14 +9,31 @@ This module works at the *rule* level:
 High-level pipeline code should call:
     - run_qc_for_record(record, rules)
     - run_qc_batch(records, rules)
+
+Batches go through a CompiledRuleset: rules that carry a ``columnar`` check
+(see columnar.py) are screened column-wise over the whole batch, and
+``check_fn`` only runs on the records the screen flags. Results are kept as
+per-rule failure bitmaps; QCRuleResult objects are built for failures only.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence as SequenceABC
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from itertools import compress
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union, overload
+
+import numpy as np
 
 from . import validators
+from .columnar import (
+    AllowedValues,
+    ColumnBatch,
+    ColumnCheck,
+    NotGreaterThan,
+    NumericRange,
+    RequiredFields,
+)
 
 
 Record = Dict[str, Any]
@@ -37,6 +54,8 @@ class QCRule:
     severity: str  # "error" | "warning" | "info"
     # Function that takes a record and returns (passed: bool, message: str)
     check_fn: Callable[[Record], Tuple[bool, str]]
+    # Optional batch screen; must flag every record check_fn would fail
+    columnar: Optional[ColumnCheck] = None
 
 
 def _rule_required_core_fields() -> QCRule:
@@ -61,16 +80,20 @@ def _rule_required_core_fields() -> QCRule:
         description="Core source/country/url/name/company/price/currency must be present",
         severity="error",
         check_fn=check,
+        columnar=RequiredFields(tuple(required)),
     )
 
 
 def _rule_price_non_negative_and_sane() -> QCRule:
+    min_price = validators.Decimal("0.01")
+    max_price = validators.Decimal("1000000")
+
     def check(record: Record) -> Tuple[bool, str]:
         msg = validators.check_price_range(
             record,
             field="price",
-            min_price=validators.Decimal("0.01"),
-            max_price=validators.Decimal("1000000"),
+            min_price=min_price,
+            max_price=max_price,
         )
         if msg:
             return False, msg
@@ -81,6 +104,7 @@ def _rule_price_non_negative_and_sane() -> QCRule:
         description="Price must be non-negative and within a sane range",
         severity="error",
         check_fn=check,
+        columnar=NumericRange("price", min_price, max_price),
     )
 
 
@@ -96,6 +120,7 @@ def _rule_currency_allowed() -> QCRule:
         description="Currency must be in allowed set",
         severity="error",
         check_fn=check,
+        columnar=AllowedValues("currency"),
     )
 
 
@@ -115,6 +140,7 @@ def _rule_reimbursed_leq_retail() -> QCRule:
         description="Reimbursed price must be <= retail price when both present",
         severity="warning",
         check_fn=check,
+        columnar=NotGreaterThan("reimbursed_price", "retail_price"),
     )
 
 
@@ -138,6 +164,13 @@ def get_default_ruleset(source: Optional[str] = None) -> List[QCRule]:
     return rules
 
 
+def _check(rule: QCRule, record: Record) -> Tuple[bool, str]:
+    try:
+        return rule.check_fn(record)
+    except Exception as exc:
+        return False, f"rule execution error: {exc!r}"
+
+
 def run_qc_for_record(
     record: Record,
     rules: Sequence[QCRule],
@@ -155,11 +188,7 @@ def run_qc_for_record(
     has_error_failure = False
 
     for rule in rules:
-        try:
-            passed, msg = rule.check_fn(record)
-        except Exception as exc:
-            passed = False
-            msg = f"rule execution error: {exc!r}"
+        passed, msg = _check(rule, record)
 
         results.append(
             QCRuleResult(
@@ -176,33 +205,163 @@ def run_qc_for_record(
     return (not has_error_failure), results
 
 
+@dataclass
+class QCBatchOutcome:
+    """
+    Result of a CompiledRuleset over a batch.
+
+    bitmaps[k] is the np.packbits failure bitmap of rules[k] (bit i set when
+    record i failed it). failures maps a record index to the results of the
+    rules it failed, in rule order; passing records have no entry.
+    """
+
+    rules: Tuple[QCRule, ...]
+    size: int
+    bitmaps: Tuple[np.ndarray, ...]
+    failures: Dict[int, List[QCRuleResult]]
+
+    def failed_mask(self, rule_id: str) -> np.ndarray:
+        for rule, bitmap in zip(self.rules, self.bitmaps):
+            if rule.rule_id == rule_id:
+                return np.unpackbits(bitmap, count=self.size).astype(bool)
+        raise KeyError(rule_id)
+
+    def passed_mask(self) -> np.ndarray:
+        """Records with no failing severity="error" rule (the run_qc_for_record verdict)."""
+        failed = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        for rule, bitmap in zip(self.rules, self.bitmaps):
+            if rule.severity == "error":
+                failed |= bitmap
+        return ~np.unpackbits(failed, count=self.size).astype(bool)
+
+    def failure_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for rule, bitmap in zip(self.rules, self.bitmaps):
+            failed = int(np.unpackbits(bitmap, count=self.size).sum())
+            counts[rule.rule_id] = counts.get(rule.rule_id, 0) + failed
+        return counts
+
+
+class CompiledRuleset:
+    """
+    A ruleset prepared for batch execution.
+
+    Records are processed in chunks of ``chunk_size``. Rules with a
+    ``columnar`` check are screened column-wise per chunk and confirmed with
+    check_fn on flagged records only; rules without one run check_fn on every
+    record. Verdicts and messages match run_qc_for_record exactly.
+    """
+
+    def __init__(self, rules: Sequence[QCRule], chunk_size: int = 65536):
+        self.rules: Tuple[QCRule, ...] = tuple(rules)
+        # Whole bytes per chunk, so packed chunk bitmaps concatenate cleanly
+        self.chunk_size = max(8, chunk_size - chunk_size % 8)
+
+    def run(self, batch: Union[Sequence[Record], ColumnBatch]) -> QCBatchOutcome:
+        """Run over a list of records (chunked) or a prepared ColumnBatch (one chunk)."""
+        if isinstance(batch, ColumnBatch):
+            size = batch.size
+            chunks: Iterable[Tuple[int, ColumnBatch]] = [(0, batch)]
+        else:
+            size = len(batch)
+            chunks = (
+                (start, ColumnBatch(batch[start : start + self.chunk_size]))
+                for start in range(0, size, self.chunk_size)
+            )
+
+        parts: List[List[np.ndarray]] = [[] for _ in self.rules]
+        failures: Dict[int, List[QCRuleResult]] = {}
+        for start, chunk in chunks:
+            for k, rule in enumerate(self.rules):
+                parts[k].append(np.packbits(self._screen(rule, chunk, start, failures)))
+
+        bitmaps = tuple(np.concatenate(p) if p else np.zeros(0, dtype=np.uint8) for p in parts)
+        # Index order, so iterating failures walks the batch front to back
+        return QCBatchOutcome(
+            rules=self.rules, size=size, bitmaps=bitmaps, failures=dict(sorted(failures.items()))
+        )
+
+    @staticmethod
+    def _screen(
+        rule: QCRule,
+        chunk: ColumnBatch,
+        offset: int,
+        failures: Dict[int, List[QCRuleResult]],
+    ) -> np.ndarray:
+        failed = np.zeros(chunk.size, dtype=bool)
+        if rule.columnar is not None:
+            candidates: Iterable[int] = np.flatnonzero(rule.columnar.suspects(chunk)).tolist()
+        else:
+            candidates = range(chunk.size)
+        for i in candidates:
+            passed, msg = _check(rule, chunk.record(i))
+            if passed:
+                continue
+            failed[i] = True
+            failures.setdefault(offset + i, []).append(
+                QCRuleResult(
+                    rule_id=rule.rule_id, passed=False, severity=rule.severity, message=msg
+                )
+            )
+        return failed
+
+
+def compile_ruleset(rules: Sequence[QCRule], chunk_size: int = 65536) -> CompiledRuleset:
+    return CompiledRuleset(rules, chunk_size=chunk_size)
+
+
+class QCResultsView(SequenceABC):
+    """
+    Lazy per-record results for run_qc_batch.
+
+    Behaves like List[List[QCRuleResult]] aligned with the input records, but
+    a record's full result list (passing rules included) is only built when
+    it is indexed.
+    """
+
+    def __init__(self, records: Sequence[Record], rules: Sequence[QCRule]):
+        self._records = records
+        self._rules = rules
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @overload
+    def __getitem__(self, index: int) -> List[QCRuleResult]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[List[QCRuleResult]]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[List[QCRuleResult], List[List[QCRuleResult]]]:
+        if isinstance(index, slice):
+            return [run_qc_for_record(rec, self._rules)[1] for rec in self._records[index]]
+        return run_qc_for_record(self._records[index], self._rules)[1]
+
+
 def run_qc_batch(
     records: Iterable[Record],
     rules: Optional[Sequence[QCRule]] = None,
     source: Optional[str] = None,
-) -> Tuple[List[Record], List[Record], List[List[QCRuleResult]]]:
+) -> Tuple[List[Record], List[Record], Sequence[List[QCRuleResult]]]:
     """
-    Batch wrapper over run_qc_for_record.
+    Batch QC over a CompiledRuleset.
 
     Returns:
         (passed_records, failed_records, all_results)
 
-    all_results is a list aligned with the original input order:
+    all_results is a sequence aligned with the original input order:
         all_results[i] → QC results for the i-th input record.
+    It is a QCResultsView, built on access; use compile_ruleset(...).run()
+    directly for failure bitmaps and failing results only.
     """
     if rules is None:
         rules = get_default_ruleset(source=source)
 
-    passed_records: List[Record] = []
-    failed_records: List[Record] = []
-    all_results: List[List[QCRuleResult]] = []
-
-    for rec in records:
-        ok, res = run_qc_for_record(rec, rules)
-        all_results.append(res)
-        if ok:
-            passed_records.append(rec)
-        else:
-            failed_records.append(rec)
+    records = records if isinstance(records, list) else list(records)
+    ok = compile_ruleset(rules).run(records).passed_mask()
 
-    return passed_records, failed_records, all_results
+    passed_records: List[Record] = list(compress(records, ok.tolist()))
+    failed_records: List[Record] = list(compress(records, (~ok).tolist()))
+    return passed_records, failed_records, QCResultsView(records, rules)
@@ -1,11 +1,16 @@
 """Lightweight in-memory vector store for PCID matching.
 
-This module intentionally avoids heavyweight dependencies so it can operate in
-unit tests and constrained environments. It offers:
+This module intentionally avoids heavyweight dependencies (beyond NumPy) so it
+can operate in unit tests and constrained environments. It offers:
 
-- Hash-based text embeddings for name/company/currency fields.
-- Cosine similarity search with configurable thresholds.
+- Hash-based text embeddings for name/company/currency fields, using a stable
+  token hash so vectors are identical across processes and PYTHONHASHSEED.
+- A matrix-backed cosine similarity index (contiguous float32 rows) with
+  batched ``query_many`` and ``argpartition`` top-k selection.
 - JSONL persistence helpers so offline-built indices can be loaded at runtime.
+- A versioned binary format (``.npy`` float32 matrix plus pcid/metadata
+  sidecars and a JSON manifest) that loads via ``np.memmap`` so worker
+  processes share one copy of the index through the page cache.
 
 It is not a production-grade ANN implementation, but provides a functional
 backend for local PCID matching and replay scenarios until a dedicated service
@@ -19,14 +24,32 @@ import math
 import os
 from pathlib import Path
 import time
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Protocol, Sequence, Tuple
-
+import zlib
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+)
+
+import numpy as np
 import requests
 
 from src.common.logging_utils import get_logger
 
 log = get_logger(__name__)
 
+# Upper bound for the (queries x entries) score block materialized per matmul
+_SCORE_BLOCK_BYTES = 64 * 1024 * 1024
+
+INDEX_FORMAT = "pcid-vector-index"
+INDEX_FORMAT_VERSION = 1
+
 
 def _normalize(vec: Sequence[float]) -> List[float]:
     norm = math.sqrt(sum(v * v for v in vec))
@@ -35,16 +58,34 @@ def _normalize(vec: Sequence[float]) -> List[float]:
     return [v / norm for v in vec]
 
 
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows in place; all-zero rows are left untouched."""
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
 def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
     if not a or not b or len(a) != len(b):
         return 0.0
     return sum(x * y for x, y in zip(a, b))
 
 
+def stable_token_hash(token: str) -> int:
+    """Process-independent 32-bit hash for embedding buckets.
+
+    ``hash(str)`` is salted per interpreter (PYTHONHASHSEED), which made
+    persisted indices and multi-process workers disagree on embeddings.
+    """
+
+    return zlib.crc32(token.encode("utf-8"))
+
+
 def _text_to_vector(text: str, dims: int = 48) -> List[float]:
     vec = [0.0] * dims
     for token in text.lower().split():
-        vec[hash(token) % dims] += 1.0
+        vec[stable_token_hash(token) % dims] += 1.0
     return vec
 
 
@@ -60,6 +101,131 @@ def _record_embedding(record: Mapping[str, str], dims: int = 48) -> List[float]:
     return _normalize(raw_vec)
 
 
+def embedding_width(dims: int = 48) -> int:
+    """Length of the vectors produced by :func:`embed_pcid_record`."""
+
+    return dims * 2 + dims // 2
+
+
+def embed_pcid_records(records: Iterable[Mapping[str, Any]], dims: int = 48) -> np.ndarray:
+    """Embed many records at once into a normalized ``(n, width)`` float32 matrix.
+
+    Produces the same vectors as :func:`embed_pcid_record`, but scatters token
+    counts straight into a preallocated array instead of building lists.
+    """
+
+    rows: List[int] = []
+    cols: List[int] = []
+    n = 0
+    fields = (("name", 0, dims), ("company", dims, dims), ("currency", dims * 2, dims // 2))
+    for n, record in enumerate(records, start=1):
+        for field, offset, width in fields:
+            text = (record.get(field) or "").strip().lower()
+            if not text or width <= 0:
+                continue
+            for token in text.split():
+                rows.append(n - 1)
+                cols.append(offset + stable_token_hash(token) % width)
+
+    matrix = np.zeros((n, embedding_width(dims)), dtype=np.float32)
+    if rows:
+        np.add.at(matrix, (np.asarray(rows), np.asarray(cols)), 1.0)
+    return _normalize_rows(matrix)
+
+
+def index_file(base: Path, part: str) -> Path:
+    """Path of one component of a binary index rooted at ``base``.
+
+    Parts: ``vectors.npy``, ``pcids.npy``, ``metadata.jsonl``, ``manifest.json``
+    (plus any extra arrays callers store alongside, e.g. ``keyhash.npy``).
+    """
+
+    return base.with_name(f"{base.name}.{part}")
+
+
+def _atomic_write(path: Path, write) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as fh:
+            write(fh)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def save_index_array(base: Path, part: str, array: np.ndarray) -> None:
+    """Atomically write ``array`` as ``<base>.<part>`` in ``.npy`` format."""
+
+    _atomic_write(index_file(base, part), lambda fh: np.save(fh, array, allow_pickle=False))
+
+
+def load_index_array(base: Path, part: str, *, mmap: bool = True) -> np.ndarray:
+    return np.load(index_file(base, part), mmap_mode="r" if mmap else None, allow_pickle=False)
+
+
+def read_index_manifest(base: Path) -> Optional[Dict[str, Any]]:
+    """Return the manifest of a binary index, or None if absent/incompatible."""
+
+    path = index_file(base, "manifest.json")
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if manifest.get("format") != INDEX_FORMAT or manifest.get("version") != INDEX_FORMAT_VERSION:
+        log.info("Ignoring PCID index with unsupported format", extra={"path": str(path)})
+        return None
+    return manifest
+
+
+def write_index_manifest(base: Path, manifest: Mapping[str, Any]) -> None:
+    payload = json.dumps(dict(manifest), indent=2, sort_keys=True).encode("utf-8")
+    _atomic_write(index_file(base, "manifest.json"), lambda fh: fh.write(payload))
+
+
+class _MappedStrings(Sequence[str]):
+    """Read-only str view over a (memory-mapped) fixed-width bytes array."""
+
+    def __init__(self, array: np.ndarray) -> None:
+        self._array = array
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __getitem__(self, idx):  # type: ignore[override]
+        if isinstance(idx, slice):
+            return [value.decode("utf-8") for value in self._array[idx]]
+        return self._array[idx].decode("utf-8")
+
+
+class _LazyJsonl(Sequence[Dict]):
+    """Per-row metadata read from a JSONL sidecar on first access."""
+
+    def __init__(self, path: Path, count: int) -> None:
+        self._path = path
+        self._count = count
+        self._rows: Optional[List[Dict]] = None
+
+    def _load(self) -> List[Dict]:
+        if self._rows is None:
+            rows: List[Dict] = []
+            if self._path.exists():
+                with self._path.open(encoding="utf-8") as fh:
+                    rows = [json.loads(line) for line in fh if line.strip()]
+            self._rows = rows if len(rows) == self._count else [{} for _ in range(self._count)]
+        return self._rows
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, idx):  # type: ignore[override]
+        return self._load()[idx]
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self._load())
+
+
 class BasePCIDVectorBackend(Protocol):
     """Minimal interface for PCID vector backends."""
 
@@ -79,50 +245,224 @@ def embed_pcid_record(record: Mapping[str, str], dims: int = 48) -> List[float]:
 
 
 class PCIDVectorStore:
-    """In-memory vector store to support PCID similarity lookups."""
+    """In-memory vector store to support PCID similarity lookups.
+
+    Vectors live in one contiguous, row-normalized float32 matrix so a block of
+    queries is scored with a single matrix multiply.
+    """
 
     def __init__(self, dims: int = 48):
         self.dims = dims
-        self._entries: List[Tuple[str, List[float], Dict]] = []
+        self._pcids: List[str] = []
+        self._metadata: List[Dict] = []
+        self._matrix: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Read-only view of the populated ``(n, width)`` float32 matrix."""
+
+        view = self._matrix[: self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def pcids(self) -> List[str]:
+        return list(self._pcids)
+
+    def _reserve(self, width: int, extra: int) -> None:
+        if self._size == 0 and self._matrix.shape[1] != width:
+            self._matrix = np.zeros((0, width), dtype=np.float32)
+        elif self._matrix.shape[1] != width:
+            raise ValueError(
+                f"Vector width {width} does not match index width {self._matrix.shape[1]}"
+            )
+        needed = self._size + extra
+        if needed > self._matrix.shape[0]:
+            capacity = max(needed, self._matrix.shape[0] * 2, 1024)
+            grown = np.zeros((capacity, width), dtype=np.float32)
+            grown[: self._size] = self._matrix[: self._size]
+            self._matrix = grown
 
     def add(self, pcid: str, vector: Sequence[float], metadata: Optional[Dict] = None) -> None:
-        self._entries.append((pcid, _normalize(vector), metadata or {}))
+        row = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        self.add_many([pcid], row, [metadata or {}])
+
+    def add_many(
+        self,
+        pcids: Sequence[str],
+        vectors: np.ndarray,
+        metadata: Optional[Sequence[Dict]] = None,
+    ) -> None:
+        """Append a block of vectors (normalized on the way in)."""
+
+        block = np.array(vectors, dtype=np.float32, ndmin=2)
+        if len(pcids) != block.shape[0]:
+            raise ValueError("pcids and vectors must have the same length")
+        if not isinstance(self._pcids, list):
+            # Copy-on-write for indices loaded from disk
+            self._pcids = list(self._pcids)
+            self._metadata = list(self._metadata)
+        self._reserve(block.shape[1], block.shape[0])
+        self._matrix[self._size : self._size + block.shape[0]] = _normalize_rows(block)
+        self._size += block.shape[0]
+        self._pcids.extend(str(p) for p in pcids)
+        self._metadata.extend(metadata if metadata is not None else [{} for _ in pcids])
 
     def embed_record(self, record: Mapping[str, str]) -> List[float]:
         return embed_pcid_record(record, dims=self.dims)
 
+    def embed_records(self, records: Iterable[Mapping[str, Any]]) -> np.ndarray:
+        return embed_pcid_records(records, dims=self.dims)
+
     def query(
         self, vector: Sequence[float], top_k: int = 3, threshold: float = 0.75
     ) -> Sequence[Mapping[str, Any]]:
-        vector = _normalize(vector)
-        scored = [
-            {"pcid": pcid, "score": _cosine(vector, candidate_vec), "metadata": meta}
-            for pcid, candidate_vec, meta in self._entries
-        ]
-        above_threshold = [row for row in scored if row["score"] >= threshold]
-        if not above_threshold and scored and threshold <= 0.1:
-            best = max(scored, key=lambda row: row["score"])
-            above_threshold = [best]
-        above_threshold.sort(key=lambda row: row["score"], reverse=True)
-        return above_threshold[:top_k]
+        return self.query_many([vector], top_k=top_k, threshold=threshold)[0]
+
+    def query_many(
+        self,
+        vectors: Sequence[Sequence[float]] | np.ndarray,
+        top_k: int = 3,
+        threshold: float = 0.75,
+    ) -> List[List[Mapping[str, Any]]]:
+        """Top-k matches for each query row, scored block-wise with one matmul per block.
+
+        Semantics match :meth:`query`: results are sorted by descending score
+        and filtered by ``threshold``; when nothing clears a threshold of 0.1 or
+        less, the single best candidate is returned instead.
+        """
+
+        queries = np.array(vectors, dtype=np.float32, ndmin=2)
+        if queries.shape[0] == 0:
+            return []
+        if self._size == 0 or top_k <= 0:
+            return [[] for _ in range(queries.shape[0])]
+        if queries.shape[1] != self._matrix.shape[1]:
+            # Mismatched widths never score (mirrors _cosine's length guard)
+            return [[] for _ in range(queries.shape[0])]
+
+        _normalize_rows(queries)
+        index = self._matrix[: self._size]
+        k = min(top_k, self._size)
+        block_rows = max(1, _SCORE_BLOCK_BYTES // (self._size * 4))
+
+        results: List[List[Mapping[str, Any]]] = []
+        for start in range(0, queries.shape[0], block_rows):
+            scores = queries[start : start + block_rows] @ index.T
+            if k == 1:
+                top = scores.argmax(axis=1)[:, None]
+            elif k < self._size:
+                top = np.argpartition(scores, self._size - k, axis=1)[:, self._size - k :]
+            else:
+                top = np.broadcast_to(np.arange(self._size), scores.shape)
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+            for row_idx, row_scores in zip(top, top_scores):
+                keep = row_scores >= threshold
+                if not keep.any() and threshold <= 0.1:
+                    keep[0] = True
+                results.append(
+                    [
+                        {
+                            "pcid": self._pcids[i],
+                            "score": float(score),
+                            "metadata": self._metadata[i],
+                        }
+                        for i, score in zip(row_idx[keep], row_scores[keep])
+                    ]
+                )
+        return results
 
     @classmethod
     def from_jsonl(cls, path: Path, dims: int = 48) -> "PCIDVectorStore":
         store = cls(dims=dims)
+        pcids: List[str] = []
+        vectors: List[List[float]] = []
+        metadata: List[Dict] = []
         for line in path.read_text(encoding="utf-8").splitlines():
             if not line.strip():
                 continue
             entry = json.loads(line)
-            store.add(entry["pcid"], entry["vector"], entry.get("metadata") or {})
+            pcids.append(entry["pcid"])
+            vectors.append(entry["vector"])
+            metadata.append(entry.get("metadata") or {})
+        if pcids:
+            store.add_many(pcids, np.asarray(vectors, dtype=np.float32), metadata)
         return store
 
     def to_jsonl(self, path: Path) -> None:
         lines = []
-        for pcid, vector, metadata in self._entries:
+        for pcid, vector, metadata in zip(self._pcids, self.matrix.tolist(), self._metadata):
             lines.append(json.dumps({"pcid": pcid, "vector": vector, "metadata": metadata}))
         path.write_text("\n".join(lines), encoding="utf-8")
 
+    def save(self, base: Path, extra: Optional[Mapping[str, Any]] = None) -> None:
+        """Persist the index in the versioned binary format rooted at ``base``.
+
+        Every file is written atomically and the manifest goes last, so a
+        reader never sees a manifest that points at half-written sidecars.
+        ``extra`` is merged into the manifest (e.g. the master file hash).
+        """
+
+        pcids = np.array([p.encode("utf-8") for p in self._pcids], dtype=np.bytes_)
+        if pcids.size == 0:
+            pcids = np.zeros(0, dtype="S1")
+        save_index_array(base, "vectors.npy", np.ascontiguousarray(self.matrix))
+        save_index_array(base, "pcids.npy", pcids)
+
+        def _write_metadata(fh) -> None:
+            for meta in self._metadata:
+                fh.write(json.dumps(meta, default=str).encode("utf-8") + b"\n")
+
+        _atomic_write(index_file(base, "metadata.jsonl"), _write_metadata)
+        write_index_manifest(
+            base,
+            {
+                **(extra or {}),
+                "format": INDEX_FORMAT,
+                "version": INDEX_FORMAT_VERSION,
+                "dims": self.dims,
+                "width": int(self._matrix.shape[1]),
+                "count": self._size,
+            },
+        )
+
+    @classmethod
+    def load(cls, base: Path, *, mmap: bool = True) -> "PCIDVectorStore":
+        """Load an index written by :meth:`save`.
+
+        With ``mmap=True`` (default) the vectors and pcids stay memory-mapped
+        read-only; the first ``add`` copies them into private memory.
+        """
+
+        manifest = read_index_manifest(base)
+        if manifest is None:
+            raise ValueError(f"No compatible PCID index at {base}")
+
+        store = cls(dims=int(manifest.get("dims", 48)))
+        vectors = load_index_array(base, "vectors.npy", mmap=mmap)
+        pcids = load_index_array(base, "pcids.npy", mmap=mmap)
+        count = int(manifest.get("count", vectors.shape[0]))
+        if vectors.shape[0] != count or pcids.shape[0] != count:
+            raise ValueError(f"PCID index at {base} is inconsistent with its manifest")
+
+        store._matrix = vectors
+        store._size = count
+        store._pcids = _MappedStrings(pcids)  # type: ignore[assignment]
+        metadata = _LazyJsonl(index_file(base, "metadata.jsonl"), count)
+        store._metadata = metadata  # type: ignore[assignment]
+        return store
+
     def populate_from_records(self, records: Iterable[Mapping[str, str]]) -> None:
+        pcids: List[str] = []
+        payloads: List[Mapping[str, Any]] = []
         for record in records:
             if hasattr(record, "model_dump"):
                 record = record.model_dump()
@@ -132,8 +472,15 @@ class PCIDVectorStore:
             pcid = record.get("pcid")
             if not pcid:
                 continue
-            vector = self.embed_record(record)
-            self.add(pcid, vector, metadata={"source": record.get("source")})
+            pcids.append(pcid)
+            payloads.append(record)
+
+        if payloads:
+            self.add_many(
+                pcids,
+                self.embed_records(payloads),
+                [{"source": record.get("source")} for record in payloads],
+            )
 
 
 class HashVectorBackend(BasePCIDVectorBackend):
@@ -160,6 +507,14 @@ class HashVectorBackend(BasePCIDVectorBackend):
     ) -> Sequence[Mapping[str, Any]]:
         return self.store.query(vector, top_k=top_k, threshold=threshold)
 
+    def query_many(
+        self,
+        vectors: Sequence[Sequence[float]] | np.ndarray,
+        top_k: int = 3,
+        threshold: float = 0.75,
+    ) -> List[List[Mapping[str, Any]]]:
+        return self.store.query_many(vectors, top_k=top_k, threshold=threshold)
+
 
 class InMemoryVectorStore:
     def _embed(self, text: str) -> List[float]:
@@ -173,7 +528,7 @@ class InMemoryVectorStore:
         return self._hash_embedding(text)
 
     def _hash_embedding(self, text: str) -> List[float]:
-        h = hash(text)
+        h = stable_token_hash(text)
         return [(h % 1_000_000) / 1_000_000.0]
 
 
@@ -272,6 +627,48 @@ class RemotePCIDVectorBackend(BasePCIDVectorBackend):
             matches = data
         return [match for match in (matches or []) if isinstance(match, Mapping)]
 
+    def query_records_many(
+        self,
+        records: Sequence[Mapping[str, Any]],
+        top_k: int = 3,
+        threshold: float = 0.75,
+        *,
+        batch_size: int = 256,
+    ) -> List[List[Mapping[str, Any]]]:
+        """Query many raw records via ``/query/batch``, ``batch_size`` per request.
+
+        Services without the batch endpoint (404/405, or a response that does
+        not carry one result list per record) are queried record by record.
+        """
+
+        results: List[List[Mapping[str, Any]]] = []
+        for start in range(0, len(records), batch_size):
+            chunk = [dict(record) for record in records[start : start + batch_size]]
+            payload = {"records": chunk, "top_k": top_k, "threshold": threshold}
+            try:
+                data = self._post("/query/batch", payload)
+            except requests.HTTPError as exc:
+                if getattr(exc.response, "status_code", None) not in (404, 405):
+                    raise
+                data = {}
+            batch = data.get("results") if isinstance(data, Mapping) else None
+            if not isinstance(batch, list) or len(batch) != len(chunk):
+                log.debug(
+                    "Remote PCID backend returned no batch results; querying per record",
+                    extra={"records": len(chunk)},
+                )
+                results.extend(
+                    self.query_record(record, top_k=top_k, threshold=threshold) for record in chunk
+                )
+                continue
+            results.extend(
+                [match for match in (matches or []) if isinstance(match, Mapping)]
+                if isinstance(matches, list)
+                else []
+                for matches in batch
+            )
+        return results
+
 
 def connect_vector_store_backend() -> Optional[RemotePCIDVectorBackend]:
     """Instantiate a remote backend if configured via env vars."""
@@ -314,11 +711,13 @@ def get_pcid_backend(
 
         index_path = hash_cfg.get("index_path")
         if index_path and vector_store is None:
-            index_file = Path(index_path)
-            if index_file.exists():
-                store = PCIDVectorStore.from_jsonl(index_file, dims=dims)
+            index_base = Path(index_path)
+            if read_index_manifest(index_base) is not None:
+                store = PCIDVectorStore.load(index_base)
+            elif index_base.is_file():
+                store = PCIDVectorStore.from_jsonl(index_base, dims=dims)
             else:
-                log.warning("Configured PCID hash index not found", extra={"path": str(index_file)})
+                log.warning("Configured PCID hash index not found", extra={"path": str(index_base)})
 
         if getattr(store, "dims", dims) != dims:
             log.warning("PCID vector store dims mismatch; expected %s", dims)
@@ -3,70 +3,83 @@
 
 from __future__ import annotations
 
-import time
+import asyncio
 import threading
-from collections import deque
-from contextlib import contextmanager
-from typing import Deque, Dict, Optional
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, Mapping, Optional
 
 from src.common.logging_utils import get_logger, safe_log
 from src.observability import metrics
 from src.resource_manager.settings import get_rate_limit_settings
+from src.utils.token_bucket import TokenBucket
 
 
 log = get_logger("rate-limiter")
 
 
 class RateLimiter:
-    """Simple rate limiter supporting QPS and concurrency caps."""
-
-    def __init__(self, key: str, *, max_qps: Optional[float], max_concurrent: Optional[int]):
+    """Per-source limiter combining a token bucket (QPS/burst) and a concurrency cap.
+
+    The token bucket is reservation based, so the QPS wait happens outside any
+    lock and concurrent callers are spread across consecutive slots.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        max_qps: Optional[float],
+        max_concurrent: Optional[int],
+        burst: Optional[float] = None,
+    ):
         self.key = key
-        self.max_qps = max_qps or 0.0
-        self.max_concurrent = max_concurrent or 0
-        self._timestamps: Deque[float] = deque()
-        self._lock = threading.Lock()
+        self.max_qps = float(max_qps or 0.0)
+        self.max_concurrent = int(max_concurrent or 0)
+        self._bucket = (
+            TokenBucket(self.max_qps, burst or max(1.0, self.max_qps), key=key)
+            if self.max_qps > 0
+            else None
+        )
         self._sem = threading.Semaphore(self.max_concurrent) if self.max_concurrent else None
+        self._stats_lock = threading.Lock()
+        self.concurrency_waited_seconds = 0.0
+
+    @property
+    def qps_waited_seconds(self) -> float:
+        return self._bucket.waited_seconds if self._bucket else 0.0
 
-    def _acquire_concurrency(self) -> bool:
+    @property
+    def waited_seconds(self) -> float:
+        """Total time callers have spent blocked on this source."""
+        return self.qps_waited_seconds + self.concurrency_waited_seconds
+
+    def _acquire_concurrency(self) -> float:
         if not self._sem:
-            return False
+            return 0.0
         if self._sem.acquire(blocking=False):
-            return False
-        metrics.incr("rate_limit_hits", source=self.key)
+            return 0.0
+        start = time.monotonic()
         self._sem.acquire()
-        return True
-
-    def _respect_qps(self) -> bool:
-        if self.max_qps <= 0:
-            return False
-
-        waited = False
-        with self._lock:
-            now = time.time()
-            window_start = now - 1.0
-            while self._timestamps and self._timestamps[0] < window_start:
-                self._timestamps.popleft()
-
-            if len(self._timestamps) >= self.max_qps:
-                sleep_for = self._timestamps[0] + 1.0 - now
-                if sleep_for > 0:
-                    metrics.incr("rate_limit_hits", source=self.key)
-                    waited = True
-                    time.sleep(sleep_for)
-
-                now = time.time()
-                window_start = now - 1.0
-                while self._timestamps and self._timestamps[0] < window_start:
-                    self._timestamps.popleft()
-
-            self._timestamps.append(time.time())
+        return self._record_concurrency_wait(time.monotonic() - start)
 
+    async def _async_acquire_concurrency(self) -> float:
+        if not self._sem:
+            return 0.0
+        if self._sem.acquire(blocking=False):
+            return 0.0
+        start = time.monotonic()
+        await asyncio.to_thread(self._sem.acquire)
+        return self._record_concurrency_wait(time.monotonic() - start)
+
+    def _record_concurrency_wait(self, waited: float) -> float:
+        with self._stats_lock:
+            self.concurrency_waited_seconds += waited
+        metrics.incr("rate_limit_hits", source=self.key)
+        metrics.incr("rate_limit_wait_seconds", amount=waited, source=self.key)
         return waited
 
-    def _acquire(self) -> None:
-        waited_concurrency = self._acquire_concurrency()
-        waited_qps = self._respect_qps()
+    def _log_wait(self, waited_concurrency: float, waited_qps: float) -> None:
         if waited_concurrency or waited_qps:
             safe_log(
                 log,
@@ -74,11 +87,21 @@ class RateLimiter:
                 "rate_limit_wait",
                 {
                     "source": self.key,
-                    "waited_for_concurrency": waited_concurrency,
-                    "waited_for_qps": waited_qps,
+                    "waited_for_concurrency": round(waited_concurrency, 4),
+                    "waited_for_qps": round(waited_qps, 4),
                 },
             )
 
+    def _acquire(self) -> None:
+        waited_concurrency = self._acquire_concurrency()
+        waited_qps = self._bucket.wait() if self._bucket else 0.0
+        self._log_wait(waited_concurrency, waited_qps)
+
+    async def _async_acquire(self) -> None:
+        waited_concurrency = await self._async_acquire_concurrency()
+        waited_qps = await self._bucket.async_wait() if self._bucket else 0.0
+        self._log_wait(waited_concurrency, waited_qps)
+
     def _release(self) -> None:
         if self._sem:
             self._sem.release()
@@ -93,24 +116,65 @@ class RateLimiter:
         finally:
             self._release()
 
+    @asynccontextmanager
+    async def async_limit(self):
+        """Async counterpart of :meth:`limit` for coroutine callers."""
+
+        await self._async_acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
     def wait(self) -> None:
         """Maintain compatibility with SimpleRateLimiter-like interface."""
 
         with self.limit():
             return None
 
+    async def async_wait(self) -> None:
+        """Awaitable ``wait`` used by async engines via ``EngineConfig.rate_limiter``."""
+
+        async with self.async_limit():
+            return None
+
 
 _default_limiters: Dict[str, RateLimiter] = {}
+_default_limiters_lock = threading.Lock()
 
 
-def get_rate_limiter(key: str) -> RateLimiter:
-    """Obtain (or create) a rate limiter keyed by source using config defaults."""
+def get_rate_limiter(key: str, settings: Optional[Mapping[str, Any]] = None) -> RateLimiter:
+    """Obtain (or create) a rate limiter keyed by source using config defaults.
 
-    if key not in _default_limiters:
-        settings = get_rate_limit_settings(key)
-        _default_limiters[key] = RateLimiter(
-            key,
-            max_qps=settings.get("max_qps"),
-            max_concurrent=settings.get("max_concurrent"),
-        )
-    return _default_limiters[key]
+    ``settings`` (``max_qps``/``max_concurrent``/``burst``) is only consulted
+    the first time a key is seen; later callers share the same limiter so the
+    budget is enforced process-wide.
+    """
+
+    limiter = _default_limiters.get(key)
+    if limiter is not None:
+        return limiter
+
+    with _default_limiters_lock:
+        if key not in _default_limiters:
+            resolved = dict(settings) if settings is not None else get_rate_limit_settings(key)
+            _default_limiters[key] = RateLimiter(
+                key,
+                max_qps=resolved.get("max_qps"),
+                max_concurrent=resolved.get("max_concurrent"),
+                burst=resolved.get("burst"),
+            )
+        return _default_limiters[key]
+
+
+def get_wait_stats() -> Dict[str, Dict[str, float]]:
+    """Seconds spent waiting per source, split by QPS and concurrency."""
+
+    return {
+        key: {
+            "qps_waited_seconds": limiter.qps_waited_seconds,
+            "concurrency_waited_seconds": limiter.concurrency_waited_seconds,
+            "waited_seconds": limiter.waited_seconds,
+        }
+        for key, limiter in list(_default_limiters.items())
+    }
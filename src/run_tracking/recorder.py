@@ -1,16 +1,36 @@
+"""
+Run lifecycle recording with a write-behind buffer.
+
+``start_run``, ``record_step`` and ``finish_run`` append events to an
+in-process buffer and return immediately; a background thread writes them
+in batches through :func:`scheduler_db_adapter.write_tracking_batch` (one
+multi-row upsert per table on Postgres, ``executemany`` on SQLite).
+``finish_run`` flushes synchronously, and the buffer is also flushed at
+process exit, so a completed run is always persisted when its caller
+returns.
+
+Set ``RUN_TRACKING_WRITE_BEHIND=0`` to write every event synchronously;
+``RUN_TRACKING_FLUSH_SECONDS`` and ``RUN_TRACKING_BATCH_SIZE`` tune the
+background flush cadence.
+"""
 from __future__ import annotations
 
+import atexit
 from datetime import datetime
-import uuid
-from typing import Dict, Optional
 import os
+import threading
+import uuid
+from typing import Dict, List, Optional
 
 from src.common.logging_utils import get_logger
+from src.observability import metrics
 from src.scheduler import scheduler_db_adapter as db
-from src.run_tracking.db_session import get_session
 
 log = get_logger("run-tracking")
 
+# Buffered events are retried once per flush; past this size the oldest are dropped
+_MAX_BUFFERED_EVENTS = 50_000
+
 
 def _is_db_enabled() -> bool:
     """Return True when database-backed run tracking should be used."""
@@ -25,6 +45,135 @@ def _prepare_metadata(metadata: Optional[Dict[str, object]], variant_id: Optiona
     return prepared or None
 
 
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+class WriteBehindBuffer:
+    """Buffers run/step rows and flushes them in batches from a daemon thread."""
+
+    def __init__(self, *, flush_interval: float = 0.5, batch_size: int = 500) -> None:
+        self.flush_interval = flush_interval
+        self.batch_size = max(1, batch_size)
+        self._runs: List[Dict[str, object]] = []
+        self._steps: List[Dict[str, object]] = []
+        self._lock = threading.Lock()
+        # Serializes writers so batches reach the DB in enqueue order
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def add_run(self, row: Dict[str, object]) -> None:
+        self._add(row, self._runs)
+
+    def add_step(self, row: Dict[str, object]) -> None:
+        self._add(row, self._steps)
+
+    def _add(self, row: Dict[str, object], target: List[Dict[str, object]]) -> None:
+        with self._lock:
+            target.append(row)
+            pending = len(self._runs) + len(self._steps)
+        if pending >= self.batch_size:
+            self._wake.set()
+        if self._pid != os.getpid():
+            self._start()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._runs) + len(self._steps)
+
+    def flush(self) -> int:
+        """Write everything buffered so far; returns the number of events written."""
+
+        with self._flush_lock:
+            with self._lock:
+                runs, self._runs = self._runs, []
+                steps, self._steps = self._steps, []
+            if not runs and not steps:
+                return 0
+            try:
+                db.write_tracking_batch(runs, steps)
+            except Exception:
+                metrics.incr("run_tracking.flush_failures")
+                log.exception(
+                    "Failed to flush %d run-tracking events; will retry", len(runs) + len(steps)
+                )
+                self._requeue(runs, steps)
+                raise
+            metrics.incr("run_tracking.events_flushed", amount=len(runs) + len(steps))
+            return len(runs) + len(steps)
+
+    def _requeue(self, runs: List[Dict[str, object]], steps: List[Dict[str, object]]) -> None:
+        with self._lock:
+            self._runs[:0] = runs
+            self._steps[:0] = steps
+            overflow = len(self._runs) + len(self._steps) - _MAX_BUFFERED_EVENTS
+            if overflow > 0:
+                dropped_steps = min(overflow, len(self._steps))
+                del self._steps[:dropped_steps]
+                del self._runs[: overflow - dropped_steps]
+                metrics.incr("run_tracking.events_dropped", amount=overflow)
+
+    def _start(self) -> None:
+        with self._lock:
+            pid = os.getpid()
+            if self._pid == pid:
+                return
+            # After a fork the parent's flush thread does not exist in the child
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name="run-tracking-flush", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass  # logged in flush(); events stay buffered for the next attempt
+
+
+_BUFFER = WriteBehindBuffer(
+    flush_interval=_env_float("RUN_TRACKING_FLUSH_SECONDS", 0.5),
+    batch_size=int(_env_float("RUN_TRACKING_BATCH_SIZE", 500)),
+)
+# Metadata from start_run, so finish_run can carry it forward without a DB read
+_RUN_METADATA: Dict[str, Optional[Dict[str, object]]] = {}
+
+
+def _write_behind() -> bool:
+    return os.getenv("RUN_TRACKING_WRITE_BEHIND", "1") != "0"
+
+
+def _enqueue(add, row: Dict[str, object]) -> None:
+    add(row)
+    if not _write_behind():
+        _BUFFER.flush()
+
+
+def flush() -> int:
+    """Synchronously persist all buffered run-tracking events."""
+
+    return _BUFFER.flush()
+
+
+def _flush_at_exit() -> None:
+    try:
+        _BUFFER.flush()
+    except Exception:  # pragma: no cover - already logged; nothing left to do at exit
+        pass
+
+
+atexit.register(_flush_at_exit)
+
+
 def start_run(
     run_id: str,
     source: str,
@@ -39,17 +188,23 @@ def start_run(
         log.debug("DB disabled; skipping run start persist", extra={"run_id": run_id, "source": source})
         return run_id
 
-    started_at = datetime.utcnow()
-    with get_session() as session:
-        db.upsert_run(
-            run_id=run_id,
-            source=source,
-            tenant_id=tenant_id,
-            status="running",
-            started_at=started_at,
-            metadata=_prepare_metadata(metadata, variant_id),
-            conn=session.conn,
-        )
+    prepared_metadata = _prepare_metadata(metadata, variant_id)
+    _RUN_METADATA[run_id] = prepared_metadata
+    _enqueue(
+        _BUFFER.add_run,
+        {
+            "run_id": run_id,
+            "source": source,
+            # Tenant comes from the caller's context, so resolve it before buffering
+            "tenant_id": db._resolve_tenant_id(tenant_id),
+            "status": "running",
+            "started_at": datetime.utcnow(),
+            "finished_at": None,
+            "duration_seconds": None,
+            "stats": None,
+            "metadata": prepared_metadata,
+        },
+    )
     log.info("Recorded run start", extra={"run_id": run_id, "source": source})
     return run_id
 
@@ -65,7 +220,7 @@ def finish_run(
     started_at: Optional[datetime] = None,
     tenant_id: Optional[str] = None,
 ) -> None:
-    """Mark a run complete and store summary stats."""
+    """Mark a run complete, store summary stats and flush the run's buffered events."""
 
     if not _is_db_enabled():
         log.debug("DB disabled; skipping run finish persist", extra={"run_id": run_id, "source": source})
@@ -78,22 +233,30 @@ def finish_run(
 
     prepared_metadata = _prepare_metadata(metadata, variant_id)
     if prepared_metadata is None:
-        prior_run = db.fetch_run_detail(run_id)
-        prepared_metadata = _prepare_metadata(prior_run.metadata if prior_run else None, variant_id)
+        if run_id in _RUN_METADATA:
+            prepared_metadata = _RUN_METADATA[run_id]
+        else:
+            # Run started elsewhere (another process): read what was persisted
+            _BUFFER.flush()
+            prior_run = db.fetch_run_detail(run_id)
+            prior_metadata = prior_run.metadata if prior_run else None
+            prepared_metadata = _prepare_metadata(prior_metadata, variant_id)
+    _RUN_METADATA.pop(run_id, None)
 
-    with get_session() as session:
-        db.upsert_run(
-            run_id=run_id,
-            source=source,
-            tenant_id=tenant_id,
-            status=status,
-            started_at=started_at or finished_at,
-            finished_at=finished_at,
-            duration_seconds=duration_seconds,
-            stats=stats,
-            metadata=prepared_metadata,
-            conn=session.conn,
-        )
+    _BUFFER.add_run(
+        {
+            "run_id": run_id,
+            "source": source,
+            "tenant_id": db._resolve_tenant_id(tenant_id),
+            "status": status,
+            "started_at": started_at or finished_at,
+            "finished_at": finished_at,
+            "duration_seconds": duration_seconds,
+            "stats": stats,
+            "metadata": prepared_metadata,
+        }
+    )
+    _BUFFER.flush()
     log.info("Recorded run finish", extra={"run_id": run_id, "status": status})
 
 
@@ -106,25 +269,25 @@ def record_step(
     duration_seconds: Optional[int] = None,
     tenant_id: Optional[str] = None,
 ) -> str:
-    """Store a run step for UI visualization."""
+    """Store a run step for UI visualization (buffered; see module docstring)."""
 
+    step_id = f"{run_id}-{uuid.uuid4().hex[:8]}"
     if not _is_db_enabled():
         log.debug("DB disabled; skipping step persist", extra={"run_id": run_id, "name": name})
-        return f"{run_id}-{uuid.uuid4().hex[:8]}"
+        return step_id
 
-    started_at = started_at or datetime.utcnow()
-    step_id = f"{run_id}-{uuid.uuid4().hex[:8]}"
-    with get_session() as session:
-        db.record_run_step(
-            step_id=step_id,
-            run_id=run_id,
-            tenant_id=tenant_id,
-            name=name,
-            status=status,
-            started_at=started_at,
-            duration_seconds=duration_seconds,
-            conn=session.conn,
-        )
+    _enqueue(
+        _BUFFER.add_step,
+        {
+            "step_id": step_id,
+            "run_id": run_id,
+            "tenant_id": db._resolve_tenant_id(tenant_id),
+            "name": name,
+            "status": status,
+            "started_at": started_at or datetime.utcnow(),
+            "duration_seconds": duration_seconds,
+        },
+    )
     return step_id
 
 
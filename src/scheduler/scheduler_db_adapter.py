@@ -7,7 +7,7 @@ import threading
 from contextlib import contextmanager
 from typing import Dict, List, Optional
 
-from psycopg2.extras import Json, RealDictCursor
+from psycopg2.extras import Json, RealDictCursor, execute_values
 
 import os
 import sqlite3
@@ -25,11 +25,12 @@ STEPS_TABLE = "scraper.run_tracking_steps"
 
 _SCHEMA_INITIALIZED = False
 _SCHEMA_LOCK = threading.Lock()
-_CONN = db._CONN  # Expose underlying connection for tests
+_CONN = db._CONN  # Legacy handle kept for tests; pooled checkouts go through db.transaction()
 _MEM_RUNS: Dict[str, Dict[str, object]] = {}
 _MEM_STEPS: Dict[str, List[Dict[str, object]]] = {}
 _SQLITE_CONN: sqlite3.Connection | None = None
 _SQLITE_PATH: str | None = None
+_SQLITE_WRITE_LOCK = threading.Lock()
 
 
 def _use_sqlite() -> bool:
@@ -44,7 +45,8 @@ def _get_sqlite_conn() -> sqlite3.Connection:
     global _SQLITE_CONN, _SQLITE_PATH, _SCHEMA_INITIALIZED
     path = os.getenv("RUN_DB_PATH", ":memory:")
     if _SQLITE_CONN is None or _SQLITE_PATH != path:
-        _SQLITE_CONN = sqlite3.connect(path)
+        # Shared with the run recorder's background flush thread
+        _SQLITE_CONN = sqlite3.connect(path, check_same_thread=False)
         _SQLITE_PATH = path
         _SCHEMA_INITIALIZED = False
     return _SQLITE_CONN
@@ -112,8 +114,7 @@ def _ensure_schema() -> None:
     with _SCHEMA_LOCK:
         if _SCHEMA_INITIALIZED:
             return
-        conn = db.get_conn()
-        with conn.cursor() as cur:
+        with db.transaction() as conn, conn.cursor() as cur:
             cur.execute("CREATE SCHEMA IF NOT EXISTS scraper")
             cur.execute(
                 f"""
@@ -149,7 +150,6 @@ def _ensure_schema() -> None:
             cur.execute(
                 f"CREATE INDEX IF NOT EXISTS idx_run_tracking_steps_tenant_run ON {STEPS_TABLE} (tenant_id, run_id)"
             )
-        conn.commit()
         _SCHEMA_INITIALIZED = True
 
 
@@ -200,15 +200,19 @@ def fetch_source_metrics(tenant_id: Optional[str] = None) -> List[SourceRunMetri
     _ensure_schema()
     effective_tenant_id = _resolve_tenant_id(tenant_id)
     
-    conn = db.get_conn()
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+    with db.transaction() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
         cur.execute(
             f"""
             SELECT
                 source,
                 MAX(started_at) AS last_run_at,
                 MAX(finished_at) FILTER (WHERE status = 'success') AS last_success_at,
-                COUNT(*) FILTER (WHERE status != 'success' AND started_at > NOW() - INTERVAL '7 days') AS consecutive_failures
+                COUNT(*) FILTER (
+                    WHERE status != 'success' AND started_at > NOW() - INTERVAL '7 days'
+                ) AS consecutive_failures,
+                (ARRAY_AGG((stats->>'change_ratio')::float ORDER BY finished_at DESC)
+                    FILTER (WHERE status = 'success' AND stats ? 'change_ratio'))[1]
+                    AS last_change_ratio
             FROM {RUNS_TABLE}
             WHERE tenant_id = %s
             GROUP BY source
@@ -224,7 +228,7 @@ def fetch_source_metrics(tenant_id: Optional[str] = None) -> List[SourceRunMetri
                 source=row["source"],
                 last_run_at=row["last_run_at"],
                 last_success_at=row["last_success_at"],
-                last_change_ratio=0.0,
+                last_change_ratio=float(row.get("last_change_ratio") or 0.0),
                 consecutive_failures=int(row.get("consecutive_failures") or 0),
                 budget_exhausted=False,
             )
@@ -316,8 +320,7 @@ def fetch_run_summaries(*, tenant_id: Optional[str] = None) -> List[RunSummaryRo
         ]
 
     _ensure_schema()
-    conn = db.get_conn()
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+    with db.transaction() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
         query = f"""
             SELECT run_id, source, tenant_id, status, started_at, duration_seconds, metadata
             FROM {RUNS_TABLE}
@@ -386,8 +389,7 @@ def fetch_run_detail(run_id: str, *, tenant_id: Optional[str] = None) -> Optiona
         )
 
     _ensure_schema()
-    conn = db.get_conn()
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+    with db.transaction() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
         cur.execute(
             f"""
             SELECT run_id, source, tenant_id, status, started_at, finished_at, duration_seconds, stats, metadata
@@ -447,8 +449,7 @@ def fetch_run_steps(run_id: str, *, tenant_id: Optional[str] = None) -> List[Run
         ]
 
     _ensure_schema()
-    conn = db.get_conn()
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+    with db.transaction() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
         cur.execute(
             f"""
             SELECT step_id, name, status, started_at, duration_seconds
@@ -481,7 +482,6 @@ def fetch_runs_with_stats(source: Optional[str] = None, tenant_id: Optional[str]
         tenant_id: Optional tenant_id for isolation (defaults to 'default')
     """
     _ensure_schema()
-    conn = db.get_conn()
     effective_tenant_id = tenant_id or "default"
     
     query = f"""
@@ -498,7 +498,7 @@ def fetch_runs_with_stats(source: Optional[str] = None, tenant_id: Optional[str]
         else:
             table_schema, table_name = "public", RUNS_TABLE
 
-        with conn.cursor() as check_cur:
+        with db.transaction() as conn, conn.cursor() as check_cur:
             check_cur.execute(
                 """
                 SELECT column_name
@@ -526,7 +526,7 @@ def fetch_runs_with_stats(source: Optional[str] = None, tenant_id: Optional[str]
     
     query += " ORDER BY started_at DESC"
 
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+    with db.transaction() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
         cur.execute(query, params)
         rows = cur.fetchall()
 
@@ -798,6 +798,181 @@ def record_run_step(
         raise
 
 
+def _last_by(rows: List[Dict[str, object]], key: str) -> List[Dict[str, object]]:
+    # A multi-row upsert may not touch the same key twice; keep the latest event
+    return list({row[key]: row for row in rows}.values())
+
+
+def _merge_runs(rows: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    """Collapse run events per ``run_id``: the latest wins, but keeps the earliest start.
+
+    A finish row written without ``started_at`` would otherwise replace the
+    start row's time with the finish time when both land in one flush.
+    """
+
+    merged: Dict[object, Dict[str, object]] = {}
+    for row in rows:
+        prior = merged.get(row["run_id"])
+        if prior is not None:
+            row = dict(row)
+            started = prior.get("started_at")
+            if started and (not row.get("started_at") or started < row["started_at"]):
+                row["started_at"] = started
+                finished = row.get("finished_at")
+                if finished and row.get("duration_seconds") is None:
+                    row["duration_seconds"] = int((finished - started).total_seconds())
+            if row.get("metadata") is None:
+                row["metadata"] = prior.get("metadata")
+        merged[row["run_id"]] = row
+    return list(merged.values())
+
+
+def write_tracking_batch(
+    runs: List[Dict[str, object]],
+    steps: List[Dict[str, object]],
+) -> None:
+    """Persist buffered run and step events in one transaction.
+
+    Rows carry the same fields as :func:`upsert_run` / :func:`record_run_step`
+    with ``tenant_id`` already resolved. Postgres gets one multi-row
+    ``INSERT ... ON CONFLICT`` per table, SQLite one ``executemany``. Runs are
+    written before steps so step foreign keys resolve.
+    """
+
+    runs = _merge_runs(runs)
+    steps = _last_by(steps, "step_id")
+    if not runs and not steps:
+        return
+
+    if not _is_db_enabled():
+        if _use_sqlite():
+            _write_sqlite_batch(runs, steps)
+        else:
+            for row in runs:
+                _MEM_RUNS[str(row["run_id"])] = dict(row)
+            for row in steps:
+                step = {k: v for k, v in row.items() if k != "run_id"}
+                _MEM_STEPS.setdefault(str(row["run_id"]), []).append(step)
+        return
+
+    _ensure_schema()
+    with transaction() as conn, conn.cursor() as cur:
+        if runs:
+            execute_values(
+                cur,
+                f"""
+                INSERT INTO {RUNS_TABLE} (
+                    run_id, source, tenant_id, status, started_at, finished_at,
+                    duration_seconds, stats, metadata
+                )
+                VALUES %s
+                ON CONFLICT (run_id) DO UPDATE SET
+                    status = EXCLUDED.status,
+                    finished_at = EXCLUDED.finished_at,
+                    duration_seconds = EXCLUDED.duration_seconds,
+                    stats = EXCLUDED.stats,
+                    metadata = EXCLUDED.metadata,
+                    tenant_id = EXCLUDED.tenant_id
+                """,
+                [
+                    (
+                        row["run_id"],
+                        row["source"],
+                        row["tenant_id"],
+                        row["status"],
+                        row["started_at"],
+                        row.get("finished_at"),
+                        row.get("duration_seconds"),
+                        Json(row["stats"]) if row.get("stats") else None,
+                        Json(row["metadata"]) if row.get("metadata") else None,
+                    )
+                    for row in runs
+                ],
+            )
+        if steps:
+            execute_values(
+                cur,
+                f"""
+                INSERT INTO {STEPS_TABLE} (
+                    step_id, run_id, tenant_id, name, status, started_at, duration_seconds
+                )
+                VALUES %s
+                ON CONFLICT (step_id) DO UPDATE SET
+                    status = EXCLUDED.status,
+                    duration_seconds = EXCLUDED.duration_seconds
+                """,
+                [
+                    (
+                        row["step_id"],
+                        row["run_id"],
+                        row["tenant_id"],
+                        row["name"],
+                        row["status"],
+                        row["started_at"],
+                        row.get("duration_seconds"),
+                    )
+                    for row in steps
+                ],
+            )
+
+
+def _write_sqlite_batch(runs: List[Dict[str, object]], steps: List[Dict[str, object]]) -> None:
+    with _SQLITE_WRITE_LOCK:
+        conn = _get_sqlite_conn()
+        _ensure_schema()  # after the connection: a new RUN_DB_PATH needs its tables
+        try:
+            cur = conn.cursor()
+            if runs:
+                cur.executemany(
+                    """
+                    INSERT OR REPLACE INTO runs
+                    (run_id, source, tenant_id, status, started_at, finished_at,
+                     duration_seconds, stats, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            row["run_id"],
+                            row["source"],
+                            row["tenant_id"],
+                            row["status"],
+                            row["started_at"].isoformat(),
+                            row["finished_at"].isoformat() if row.get("finished_at") else None,
+                            row.get("duration_seconds"),
+                            json.dumps(row["stats"]) if row.get("stats") else None,
+                            json.dumps(row["metadata"]) if row.get("metadata") else None,
+                        )
+                        for row in runs
+                    ],
+                )
+            if steps:
+                step_rows = [
+                    (
+                        row["step_id"],
+                        row["run_id"],
+                        row["tenant_id"],
+                        row["name"],
+                        row["status"],
+                        row["started_at"].isoformat(),
+                        row.get("duration_seconds"),
+                    )
+                    for row in steps
+                ]
+                for table in ("steps", "run_steps"):
+                    cur.executemany(
+                        f"""
+                        INSERT OR REPLACE INTO {table}
+                        (step_id, run_id, tenant_id, name, status, started_at, duration_seconds)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        step_rows,
+                    )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+
 def fetch_run_stats(run_id: str) -> Optional[RunStatsRow]:
     detail = fetch_run_detail(run_id)
     if not detail:
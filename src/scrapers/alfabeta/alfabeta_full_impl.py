@@ -1,11 +1,14 @@
+from __future__ import annotations
+
 import re
 from pathlib import Path
-from typing import Dict, Optional
-
-from bs4 import BeautifulSoup
-from selenium.webdriver.remote.webdriver import WebDriver
+from typing import TYPE_CHECKING, Dict, Optional
 
 from src.common.logging_utils import get_logger, sanitize_for_log, safe_log
+from src.scrapers.alfabeta.dom import parse_html, selector_set
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
 log = get_logger("alfabeta-full-impl")
 
@@ -37,25 +40,21 @@ def extract_product(
     """Extract product data from a product detail page."""
 
     selectors = selectors or {}
-    name_sel = selectors.get("product_name_selector", "h1.product-name")
-    lab_sel = selectors.get("lab_name_selector", "div.lab-name")
-    presentation_sel = selectors.get("presentation_selector", "div.presentation")
-    price_sel = selectors.get("price_selector", "div.price")
+    fields = selector_set(
+        {
+            "name": selectors.get("product_name_selector", "h1.product-name"),
+            "lab": selectors.get("lab_name_selector", "div.lab-name"),
+            "presentation": selectors.get("presentation_selector", "div.presentation"),
+            "price": selectors.get("price_selector", "div.price"),
+        }
+    )
     currency_hint = selectors.get("currency_hint", "ARS")
 
-    html = _load_html(driver)
-    soup = BeautifulSoup(html, "lxml")
-
-    def _text(selector: str) -> Optional[str]:
-        node = soup.select_one(selector)
-        if not node:
-            return None
-        return node.get_text(strip=True)
-
-    name = _text(name_sel)
-    lab = _text(lab_sel)
-    presentation = _text(presentation_sel)
-    price_raw = _text(price_sel)
+    texts = fields.first_texts(parse_html(_load_html(driver)))
+    name = texts["name"]
+    lab = texts["lab"]
+    presentation = texts["presentation"]
+    price_raw = texts["price"]
     price = _parse_price(price_raw) if price_raw else None
 
     record = {
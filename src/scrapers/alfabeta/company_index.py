@@ -1,11 +1,14 @@
-from pathlib import Path
-from typing import Dict, List, Optional
+from __future__ import annotations
 
-from bs4 import BeautifulSoup
-from selenium.webdriver.remote.webdriver import WebDriver
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
 from urllib.parse import urljoin
 
 from src.common.logging_utils import get_logger, sanitize_for_log, safe_log
+from src.scrapers.alfabeta.dom import parse_html, selector_set
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
 log = get_logger("alfabeta-company-index")
 
@@ -44,15 +47,9 @@ def fetch_company_urls(
         ),
     )
 
-    html = _load_html(driver)
-    soup = BeautifulSoup(html, "lxml")
-    company_links = []
-
-    for a in soup.select(company_selector):
-        href = a.get("href")
-        if not href:
-            continue
-        company_links.append(urljoin(base_url, href))
+    doc = parse_html(_load_html(driver))
+    links = selector_set({"links": company_selector})
+    company_links = [urljoin(base_url, href) for href in links.hrefs(doc, "links")]
 
     log.info("Found %d company URLs", len(company_links))
     return company_links
@@ -0,0 +1,124 @@
+"""
+Shared parsed-document layer for the AlfaBeta extractors.
+
+Each page is parsed once with ``lxml.html`` and the resulting tree is shared
+by every extractor that looks at it. CSS selectors from ``selectors.json`` are
+translated to XPath and compiled once per selector set, so extracting a page
+is one parse plus one precompiled XPath evaluation per field, all against the
+same tree.
+
+Translation uses ``cssselect``'s ``HTMLTranslator``, the same translator
+behind ``lxml.cssselect``, so quoted attribute values and pseudo-classes
+such as ``:first-child`` work as they did with soupsieve.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from cssselect import HTMLTranslator
+from lxml import etree, html as lxml_html
+
+_CSS_TRANSLATOR = HTMLTranslator()
+
+_PARSE_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=256)
+def css_to_xpath(selector: str) -> str:
+    """Translate a CSS selector to an XPath expression rooted at the context node.
+
+    Raises ``cssselect.SelectorError`` for invalid or unsupported CSS.
+    """
+
+    return _CSS_TRANSLATOR.css_to_xpath(selector)
+
+
+_local = threading.local()
+
+
+def compile_css(selector: str) -> etree.XPath:
+    """Return a compiled XPath evaluator for ``selector``.
+
+    Evaluators are compiled once per thread, since lxml XPath objects must
+    not be shared between threads.
+    """
+
+    compiled = getattr(_local, "compiled", None)
+    if compiled is None:
+        compiled = _local.compiled = {}
+    evaluator = compiled.get(selector)
+    if evaluator is None:
+        evaluator = compiled[selector] = etree.XPath(css_to_xpath(selector))
+    return evaluator
+
+
+def node_text(node: etree._Element) -> str:
+    """Stripped text of ``node`` and its descendants, like ``get_text(strip=True)``."""
+
+    return "".join(piece.strip() for piece in node.itertext())
+
+
+class SelectorSet:
+    """A named group of selectors, e.g. the product detail fields, translated once."""
+
+    def __init__(self, selectors: Mapping[str, str]):
+        self.selectors = dict(selectors)
+        # Translate eagerly so bad selectors fail at load rather than per page
+        self.xpaths = {field: css_to_xpath(selector) for field, selector in self.selectors.items()}
+
+    def _evaluator(self, field: str) -> etree.XPath:
+        return compile_css(self.selectors[field])
+
+    def select(self, doc: etree._Element, field: str) -> List[etree._Element]:
+        return self._evaluator(field)(doc)
+
+    def first_texts(self, doc: etree._Element) -> Dict[str, Optional[str]]:
+        """Text of the first match for every field, evaluated against one tree."""
+
+        texts: Dict[str, Optional[str]] = {}
+        for field in self.selectors:
+            nodes = self._evaluator(field)(doc)
+            texts[field] = node_text(nodes[0]) if nodes else None
+        return texts
+
+    def hrefs(self, doc: etree._Element, field: str) -> List[str]:
+        return [href for href in (node.get("href") for node in self.select(doc, field)) if href]
+
+
+@lru_cache(maxsize=64)
+def _selector_set(items: FrozenSet[Tuple[str, str]]) -> SelectorSet:
+    return SelectorSet(dict(items))
+
+
+def selector_set(selectors: Mapping[str, str]) -> SelectorSet:
+    """Return the :class:`SelectorSet` for ``selectors``, built once per distinct set."""
+
+    return _selector_set(frozenset(selectors.items()))
+
+
+def parse_html(html: str) -> etree._Element:
+    """Parse ``html`` once; repeated calls with the same page reuse the tree.
+
+    The cache is per thread and holds the last few pages, so extractors that
+    look at the same page source share one tree. Callers treat it as read-only.
+    """
+
+    parsed: Optional["OrderedDict[str, etree._Element]"] = getattr(_local, "parsed", None)
+    if parsed is None:
+        parsed = _local.parsed = OrderedDict()
+    doc = parsed.get(html)
+    if doc is not None:
+        parsed.move_to_end(html)
+        return doc
+
+    doc = lxml_html.fromstring(html) if html.strip() else lxml_html.fromstring("<html></html>")
+    parsed[html] = doc
+    while len(parsed) > _PARSE_CACHE_SIZE:
+        parsed.popitem(last=False)
+    return doc
+
+
+__all__ = ["css_to_xpath", "compile_css", "node_text", "SelectorSet", "selector_set", "parse_html"]
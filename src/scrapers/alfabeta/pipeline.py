@@ -1,38 +1,48 @@
 import csv
 import json
 import os
+import threading
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, Tuple
-
-from selenium.common.exceptions import NoSuchElementException
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 from src.common.config_loader import load_config, load_source_config
 from src.common.logging_utils import get_logger, sanitize_for_log, safe_log
 from src.common.paths import OUTPUT_DIR
-from src.agents.agent_orchestrator import orchestrate_source_repair, load_recent_output_counts
+from src.core_kernel.utils import iter_chunks
 from src.engines.selenium_engine import open_with_session
 from src.observability import metrics
 from src.observability.cost_tracking import record_run_cost
 from src.observability.run_trace_context import get_current_run_id, start_run_context
 from src.run_tracking import recorder as run_recorder
+from src.etl import kafka_producer
+from src.processors.change_detection import (
+    CHANGE_CHANGED,
+    CHANGE_NEW,
+    CHANGE_REMOVED,
+    DEFAULT_STORE_NAME,
+    ChangeSummary,
+    ChangeTracker,
+    FingerprintStore,
+    IncrementalSettings,
+)
 from src.processors.exporters import database_loader, gcs_exporter, s3_exporter
 from src.processors.qc_rules import is_valid
-from src.processors.dedupe import dedupe_records
+from src.processors.dedupe import StreamingDeduper, dedupe_records
 from src.processors.pcid_matcher import (
-    build_pcid_index,
-    build_vector_store,
-    load_pcid_master,
-    match_pcid_with_confidence,
+    load_or_build_pcid_resources,
+    match_records_batch,
     persist_pcid_mappings,
 )
 from src.processors.vector_store import BasePCIDVectorBackend, get_pcid_backend
 from src.processors.unify_fields import unify_record
 from src.resource_manager import ResourceManager, get_default_resource_manager
+from src.resource_manager.settings import get_rate_limit_settings
 from src.scrapers.alfabeta.alfabeta_full_impl import extract_product
 from src.scrapers.alfabeta.company_index import fetch_company_urls
 from src.scrapers.alfabeta.product_index import fetch_product_urls
+from src.scrapers.alfabeta.streaming import DetailWorker, StreamingSettings, stream_details
 from src.sessions.session_manager import create_session_record
 from src.versioning.version_manager import (
     attach_version_metadata,
@@ -42,9 +52,29 @@ from src.versioning.version_manager import (
 
 log = get_logger("alfabeta-pipeline")
 
+# Loaded PCID index/vector store per (master, cache dir, dims), reused while
+# the master's size and mtime are unchanged so runs in a long-lived worker
+# skip re-opening the index.
+_PCID_RESOURCES: Dict[Tuple[str, str, int], Tuple[Tuple[int, int], Any]] = {}
+_PCID_RESOURCES_LOCK = threading.Lock()
+
 DEFAULT_COMPANIES_URL = "https://example.com/companies"
 
 
+# The agent stack (LLM clients, bs4, repair engine) is only needed after a run
+# or on a real browser start; these wrappers keep it out of module import.
+def orchestrate_source_repair(*args: Any, **kwargs: Any) -> Any:
+    from src.agents.agent_orchestrator import orchestrate_source_repair as _orchestrate
+
+    return _orchestrate(*args, **kwargs)
+
+
+def load_recent_output_counts(*args: Any, **kwargs: Any) -> Any:
+    from src.agents.agent_orchestrator import load_recent_output_counts as _load_counts
+
+    return _load_counts(*args, **kwargs)
+
+
 @dataclass
 class PipelineContext:
     source: str
@@ -55,7 +85,7 @@ class PipelineContext:
     version_info: Dict[str, Any]
     driver: Any
     base_url: str
-    pcid_index: Dict[Tuple[str, str, str], str]
+    pcid_index: Mapping[Tuple[str, str, str], str]
     pcid_vector_store: Optional[BasePCIDVectorBackend]
     pcid_min_similarity: float
     baseline_rows: int
@@ -73,12 +103,17 @@ def _resolve_pcid_master_path() -> Path:
     return Path(__file__).resolve().parents[3] / "config" / "pcid_master.jsonl"
 
 
+def _resolve_pcid_index_cache(hash_cfg: Mapping[str, Any], master_path: Path) -> Path:
+    configured = os.getenv("PCID_INDEX_CACHE_DIR") or hash_cfg.get("cache_dir")
+    cache_dir = Path(configured) if configured else OUTPUT_DIR / "pcid_index"
+    return cache_dir / master_path.stem
+
+
 def _prepare_pcid_resources(
     platform_config: Mapping[str, Any]
-) -> Tuple[Dict[Tuple[str, str, str], str], Optional[BasePCIDVectorBackend]]:
+) -> Tuple[Mapping[Tuple[str, str, str], str], Optional[BasePCIDVectorBackend]]:
     pcid_master_path = _resolve_pcid_master_path()
-    master_records = load_pcid_master(pcid_master_path)
-    if not master_records:
+    if not pcid_master_path.exists() or pcid_master_path.stat().st_size == 0:
         log.info(
             "PCID master missing or empty; skipping similarity index build",
             extra={"path": str(pcid_master_path)},
@@ -86,18 +121,52 @@ def _prepare_pcid_resources(
         return {}, get_pcid_backend(platform_config)
 
     hash_cfg = platform_config.get("pcid", {}).get("hash", {}) if isinstance(platform_config, Mapping) else {}
-    dims = int(hash_cfg.get("dims", 48)) if isinstance(hash_cfg, Mapping) else 48
+    if not isinstance(hash_cfg, Mapping):
+        hash_cfg = {}
+    dims = int(hash_cfg.get("dims", 48))
+
+    pcid_index, vector_store = _load_pcid_resources(
+        pcid_master_path, _resolve_pcid_index_cache(hash_cfg, pcid_master_path), dims
+    )
+    if not len(vector_store):
+        log.info(
+            "PCID master has no usable rows; skipping similarity index",
+            extra={"path": str(pcid_master_path)},
+        )
+        return {}, get_pcid_backend(platform_config)
 
-    pcid_index = build_pcid_index(master_records)
-    vector_store = build_vector_store(master_records, dims=dims)
     backend = get_pcid_backend(platform_config, vector_store=vector_store)
     log.info(
         "Loaded PCID master",
-        extra={"rows": len(master_records), "index_keys": len(pcid_index), "path": str(pcid_master_path)},
+        extra={
+            "rows": len(vector_store),
+            "index_keys": len(pcid_index),
+            "path": str(pcid_master_path),
+        },
     )
     return pcid_index, backend
 
 
+def _load_pcid_resources(master_path: Path, cache_base: Path, dims: int) -> Tuple[Any, Any]:
+    stat = master_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = (str(master_path), str(cache_base), dims)
+    with _PCID_RESOURCES_LOCK:
+        cached = _PCID_RESOURCES.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        # Memory-mapped binary index, rebuilt only when the master's SHA-256 changes
+        resources = load_or_build_pcid_resources(master_path, cache_base, dims=dims)
+        _PCID_RESOURCES[key] = (stamp, resources)
+        return resources
+
+
+def prewarm(env: Optional[str] = None) -> None:
+    """Load config and the PCID index ahead of the first run (used by the pipeline worker)."""
+
+    _prepare_pcid_resources(load_config(env))
+
+
 def _load_selectors() -> Dict[str, str]:
     selectors_path = Path(__file__).with_name("selectors.json")
     if not selectors_path.exists():
@@ -111,6 +180,8 @@ def _is_logged_in(driver, logged_in_selector: Optional[str]) -> bool:
     if not logged_in_selector or not hasattr(driver, "find_elements"):
         return False
 
+    from selenium.common.exceptions import NoSuchElementException
+
     try:
         elements = driver.find_elements("css selector", logged_in_selector)
         return bool(elements)
@@ -152,6 +223,8 @@ def ensure_logged_in(
         log.warning("Login enabled but selectors or URL are incomplete; skipping login")
         return
 
+    from selenium.common.exceptions import NoSuchElementException
+
     safe_log(
         log,
         "info",
@@ -199,19 +272,21 @@ def fetch_listings(ctx: PipelineContext) -> List[str]:
     return companies
 
 
-def fetch_details(ctx: PipelineContext, listings: List[str]) -> List[str]:
-    """Expand company listings into product detail URLs."""
+def iter_product_urls(ctx: PipelineContext, listings: Iterable[str]) -> Iterator[str]:
+    """Yield product detail URLs company by company as each listing is visited."""
 
     driver = ctx.driver
-    product_urls: List[str] = []
     for company_url in listings:
         driver.get(company_url)
-        product_urls.extend(
-            fetch_product_urls(driver, company_url, ctx.selectors, run_id=ctx.run_id)
-        )
+        yield from fetch_product_urls(driver, company_url, ctx.selectors, run_id=ctx.run_id)
 
     run_recorder.record_step(ctx.run_id, name="product_index", status="success")
-    return product_urls
+
+
+def fetch_details(ctx: PipelineContext, listings: List[str]) -> List[str]:
+    """Expand company listings into product detail URLs."""
+
+    return list(iter_product_urls(ctx, listings))
 
 
 def parse_raw(ctx: PipelineContext, details: List[str]) -> List[Dict[str, Any]]:
@@ -243,20 +318,18 @@ def normalize_records(ctx: PipelineContext, parsed: List[Dict[str, Any]]) -> Lis
 def match_pcid(ctx: PipelineContext, normalized: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Augment normalized records with PCID matches when available."""
 
-    matched_records: List[Dict[str, Any]] = []
-    for record in normalized:
-        pcid, confidence = match_pcid_with_confidence(
-            record,
-            ctx.pcid_index,
-            vector_store=ctx.pcid_vector_store,
-            min_similarity=ctx.pcid_min_similarity,
-        )
+    matches = match_records_batch(
+        normalized,
+        ctx.pcid_index,
+        vector_store=ctx.pcid_vector_store,
+        min_similarity=ctx.pcid_min_similarity,
+    )
+    for record, (pcid, confidence, _method) in zip(normalized, matches):
         if pcid:
             record["pcid"] = pcid
             record["pcid_confidence"] = confidence
-        matched_records.append(record)
 
-    return matched_records
+    return normalized
 
 
 def run_qc(ctx: PipelineContext, matched: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -281,19 +354,34 @@ def run_qc(ctx: PipelineContext, matched: List[Dict[str, Any]]) -> List[Dict[str
     return deduped
 
 
-def export_records(ctx: PipelineContext, final: List[Dict[str, Any]]) -> Path:
-    """Persist output artifacts and run bookkeeping."""
+EXPORT_FIELDNAMES = [
+    "product_url",
+    "name",
+    "price",
+    "currency",
+    "company",
+    "source",
+    "pcid",
+    "pcid_confidence",
+    "run_id",
+    "_version",
+]
+
 
+def _export_settings(ctx: PipelineContext) -> Tuple[Mapping[str, Any], List[str]]:
     export_cfg = ctx.platform_config.get("export", {}) if isinstance(ctx.platform_config, Mapping) else {}
     backends = export_cfg.get("backends") or ["csv"]
-    backends = [backend.lower() for backend in backends]
+    return export_cfg, [backend.lower() for backend in backends]
+
 
+def _daily_output_path(ctx: PipelineContext) -> Path:
     daily_dir = ctx.output_dir / ctx.source / "daily"
     daily_dir.mkdir(parents=True, exist_ok=True)
-    filename = f"alfabeta_labs_{date.today().isoformat()}.csv"
-    out_path = daily_dir / filename
+    return daily_dir / f"alfabeta_labs_{date.today().isoformat()}.csv"
 
-    pcid_mappings: List[Dict[str, Any]] = [
+
+def _pcid_mapping_rows(ctx: PipelineContext, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
         {
             "product_url": rec.get("product_url"),
             "pcid": rec.get("pcid"),
@@ -301,58 +389,118 @@ def export_records(ctx: PipelineContext, final: List[Dict[str, Any]]) -> Path:
             "source": ctx.source,
             "run_id": ctx.run_id,
         }
-        for rec in final
+        for rec in records
         if rec.get("pcid")
     ]
 
-    if final:
-        if "csv" in backends:
-            with out_path.open("w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=[
-                        "product_url",
-                        "name",
-                        "price",
-                        "currency",
-                        "company",
-                        "source",
-                        "pcid",
-                        "pcid_confidence",
-                        "run_id",
-                        "_version",
-                    ],
-                )
-                writer.writeheader()
-                writer.writerows(final)
-            log.info("Wrote %d records to %s", len(final), out_path)
-        else:
-            log.info("CSV backend disabled; skipping local write")
 
-        validation_rate = len(final) / max(len(final) + ctx.invalid_records, 1)
-        if ctx.baseline_rows:
-            orchestrate_source_repair(
-                source=ctx.source,
-                baseline_rows=ctx.baseline_rows,
-                current_rows=len(final),
-                validation_rate=validation_rate,
-                selectors_path=Path(__file__).with_name("selectors.json"),
-            )
+def _pcid_mapping_path(ctx: PipelineContext) -> Path:
+    file_name = f"{ctx.source}_pcid_{date.today().isoformat()}.jsonl"
+    return ctx.output_dir / ctx.source / "pcid_mappings" / file_name
 
-        if pcid_mappings:
-            pcid_mapping_dir = ctx.output_dir / ctx.source / "pcid_mappings"
-            mapping_path = pcid_mapping_dir / f"{ctx.source}_pcid_{date.today().isoformat()}.jsonl"
-            persist_pcid_mappings(pcid_mappings, mapping_path)
-            log.info("Persisted %d PCID mappings to %s", len(pcid_mappings), mapping_path)
-    else:
-        log.warning("No valid records to write for AlfaBeta run.")
+
+def _open_change_tracker(
+    ctx: PipelineContext, export_cfg: Mapping[str, Any]
+) -> Optional[ChangeTracker]:
+    """Start change detection against the previous run, unless ``export.incremental`` is off."""
+
+    settings = IncrementalSettings.from_config(export_cfg)
+    if not settings.enabled:
+        return None
+    store_path = settings.store_path or ctx.output_dir / ctx.source / DEFAULT_STORE_NAME
+    store = FingerprintStore(store_path, ctx.source)
+    return store.begin(
+        ctx.run_id,
+        key_fields=settings.key_fields,
+        ignore_fields=settings.ignore_fields,
+        max_removed_ratio=settings.max_removed_ratio,
+    )
+
+
+def _deltas(
+    records: List[Dict[str, Any]], statuses: List[str]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """New and changed records with their statuses; unchanged ones are not re-exported."""
+
+    pairs = [
+        (rec, status)
+        for rec, status in zip(records, statuses)
+        if status in (CHANGE_NEW, CHANGE_CHANGED)
+    ]
+    return [rec for rec, _ in pairs], [status for _, status in pairs]
+
+
+def _kafka_topic(export_cfg: Mapping[str, Any]) -> Optional[str]:
+    kafka_cfg = export_cfg.get("kafka", {}) if isinstance(export_cfg, Mapping) else {}
+    return kafka_cfg.get("topic") if isinstance(kafka_cfg, Mapping) else None
+
+
+def _publish_removed(
+    ctx: PipelineContext,
+    summary: ChangeSummary,
+    export_cfg: Mapping[str, Any],
+    backends: List[str],
+) -> None:
+    """Announce keys that disappeared since the previous run (Kafka only)."""
+
+    topic = _kafka_topic(export_cfg)
+    if "kafka" not in backends or not topic or not summary.removed_keys:
+        return
+    events = [
+        {**key, "source": ctx.source, "run_id": ctx.run_id, "_change": CHANGE_REMOVED}
+        for key in summary.removed_keys
+    ]
+    kafka_producer.publish_records(topic, events)
+    log.info("Published %d removal events to Kafka topic %s", len(events), topic)
+
+
+def _commit_changes(
+    ctx: PipelineContext,
+    tracker: ChangeTracker,
+    export_cfg: Mapping[str, Any],
+    backends: List[str],
+) -> ChangeSummary:
+    """Publish removals and advance the snapshot, unless the run looks broken.
+
+    An empty run, or one removing more than ``export.incremental.max_removed_ratio``
+    of the known keys, is aborted instead: the previous snapshot is kept and
+    no removal events are sent.
+    """
+
+    summary = tracker.finalize()
+    problem = tracker.removal_problem()
+    if problem:
+        log.error(
+            "Not committing %s change snapshot for run %s: %s", ctx.source, ctx.run_id, problem
+        )
+        tracker.abort()
+        return summary
+    _publish_removed(ctx, summary, export_cfg, backends)
+    tracker.commit()
+    return summary
+
+
+def _export_to_backends(
+    ctx: PipelineContext,
+    records: List[Dict[str, Any]],
+    export_cfg: Mapping[str, Any],
+    backends: List[str],
+    object_name: str,
+    changes: Optional[List[str]] = None,
+) -> None:
+    """Send ``records`` to every non-CSV backend (DB, S3, GCS, Kafka).
+
+    ``changes`` holds each record's change status; Kafka messages carry it as
+    ``_change``.
+    """
 
     for backend in backends:
         if backend == "csv":
             continue
         if backend == "db":
-            database_loader.export_records(final)
-            log.info("Exported %d records to DB backend", len(final))
+            # Explicit columns: optional fields such as pcid are absent from unmatched records
+            database_loader.export_records(records, columns=EXPORT_FIELDNAMES)
+            log.info("Exported %d records to DB backend", len(records))
         elif backend == "s3":
             s3_cfg = export_cfg.get("s3", {}) if isinstance(export_cfg, Mapping) else {}
             bucket = s3_cfg.get("bucket") if isinstance(s3_cfg, Mapping) else None
@@ -360,8 +508,14 @@ def export_records(ctx: PipelineContext, final: List[Dict[str, Any]]) -> Path:
             if not bucket:
                 log.warning("S3 backend configured without a bucket; skipping upload")
                 continue
-            key = s3_exporter.export_to_s3(final, bucket=bucket, prefix=prefix, object_name=filename)
-            log.info("Uploaded %d records to s3://%s/%s", len(final), bucket, key)
+            key = s3_exporter.export_to_s3(
+                records,
+                bucket=bucket,
+                prefix=prefix,
+                object_name=object_name,
+                compression=s3_cfg.get("compression") or None,
+            )
+            log.info("Uploaded %d records to s3://%s/%s", len(records), bucket, key)
         elif backend == "gcs":
             gcs_cfg = export_cfg.get("gcs", {}) if isinstance(export_cfg, Mapping) else {}
             bucket = gcs_cfg.get("bucket") if isinstance(gcs_cfg, Mapping) else None
@@ -369,11 +523,59 @@ def export_records(ctx: PipelineContext, final: List[Dict[str, Any]]) -> Path:
             if not bucket:
                 log.warning("GCS backend configured without a bucket; skipping upload")
                 continue
-            key = gcs_exporter.export_to_gcs(final, bucket=bucket, prefix=prefix, object_name=filename)
-            log.info("Uploaded %d records to gs://%s/%s", len(final), bucket, key)
+            key = gcs_exporter.export_to_gcs(
+                records,
+                bucket=bucket,
+                prefix=prefix,
+                object_name=object_name,
+                compression=gcs_cfg.get("compression") or None,
+            )
+            log.info("Uploaded %d records to gs://%s/%s", len(records), bucket, key)
+        elif backend == "kafka":
+            topic = _kafka_topic(export_cfg)
+            if not topic:
+                log.warning("Kafka backend configured without a topic; skipping publish")
+                continue
+            messages = records
+            if changes is not None:
+                messages = [{**rec, "_change": c} for rec, c in zip(records, changes)]
+            kafka_producer.publish_records(topic, messages)
+            log.info("Published %d records to Kafka topic %s", len(messages), topic)
         else:
             log.warning("Unknown export backend '%s'; skipping", backend)
 
+
+def _complete_run(
+    ctx: PipelineContext,
+    total_records: int,
+    out_path: Path,
+    changes: Optional[ChangeSummary] = None,
+) -> None:
+    """Run-level bookkeeping shared by the batch and streaming exports.
+
+    With change detection on, the run stats carry the new/changed/unchanged/
+    removed counts and ``change_ratio``, which the scheduler reads back as
+    ``last_change_ratio``.
+    """
+
+    stats: Dict[str, Any] = {
+        "records": total_records,
+        "invalid": ctx.invalid_records,
+    }
+    if changes is not None:
+        stats.update(changes.as_stats())
+        metrics.set_gauge("scraper.change_ratio", changes.change_ratio, source=ctx.source)
+
+    if total_records and ctx.baseline_rows:
+        validation_rate = total_records / max(total_records + ctx.invalid_records, 1)
+        orchestrate_source_repair(
+            source=ctx.source,
+            baseline_rows=ctx.baseline_rows,
+            current_rows=total_records,
+            validation_rate=validation_rate,
+            selectors_path=Path(__file__).with_name("selectors.json"),
+        )
+
     record_run_cost(
         source=ctx.source,
         run_id=ctx.run_id,
@@ -386,26 +588,256 @@ def export_records(ctx: PipelineContext, final: List[Dict[str, Any]]) -> Path:
         ctx.run_id,
         source=ctx.source,
         status="success",
-        stats={
-            "records": len(final),
-            "invalid": ctx.invalid_records,
-        },
+        stats=stats,
         metadata={"output_path": str(out_path)},
         variant_id=ctx.variant_id,
         started_at=ctx.run_started_at,
     )
+
+
+def export_records(ctx: PipelineContext, final: List[Dict[str, Any]]) -> Path:
+    """Persist output artifacts and run bookkeeping.
+
+    The daily CSV always holds the full snapshot. With change detection on
+    (``export.incremental``, the default) DB/S3/GCS/Kafka only receive records
+    that are new or changed since the previous run, and Kafka also gets one
+    removal event per key that disappeared.
+    """
+
+    export_cfg, backends = _export_settings(ctx)
+    out_path = _daily_output_path(ctx)
+    pcid_mappings = _pcid_mapping_rows(ctx, final)
+
+    if final:
+        if "csv" in backends:
+            with out_path.open("w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=EXPORT_FIELDNAMES)
+                writer.writeheader()
+                writer.writerows(final)
+            log.info("Wrote %d records to %s", len(final), out_path)
+        else:
+            log.info("CSV backend disabled; skipping local write")
+
+        if pcid_mappings:
+            mapping_path = _pcid_mapping_path(ctx)
+            persist_pcid_mappings(pcid_mappings, mapping_path)
+            log.info("Persisted %d PCID mappings to %s", len(pcid_mappings), mapping_path)
+    else:
+        log.warning("No valid records to write for AlfaBeta run.")
+
+    tracker = _open_change_tracker(ctx, export_cfg)
+    summary: Optional[ChangeSummary] = None
+    if tracker is None:
+        _export_to_backends(ctx, final, export_cfg, backends, out_path.name)
+    else:
+        try:
+            delta, changes = _deltas(final, tracker.classify(final))
+            if delta:
+                _export_to_backends(ctx, delta, export_cfg, backends, out_path.name, changes)
+            # Only advance the snapshot once every backend has the deltas
+            summary = _commit_changes(ctx, tracker, export_cfg, backends)
+        except Exception:
+            tracker.abort()
+            raise
+        finally:
+            tracker.store.close()
+        log.info("Change detection for %s: %s", ctx.source, summary.as_stats())
+
+    _complete_run(ctx, len(final), out_path, summary)
     log.info("Wrote %d records to %s", len(final), out_path)
     return out_path
 
 
+class ChunkedExport:
+    """Incremental counterpart of :func:`export_records` for streaming runs.
+
+    The CSV and the PCID mapping file are appended chunk by chunk, the DB
+    backend receives each chunk as it arrives, and S3/GCS get one
+    ``.partNNNNN.csv`` object per chunk. With change detection on, backends
+    only receive each chunk's new and changed records. :meth:`close` performs
+    the same run bookkeeping as :func:`export_records`; :meth:`abort` releases
+    everything without committing when the run fails.
+    """
+
+    def __init__(self, ctx: PipelineContext):
+        self.ctx = ctx
+        self.export_cfg, self.backends = _export_settings(ctx)
+        self.out_path = _daily_output_path(ctx)
+        self.mapping_path = _pcid_mapping_path(ctx)
+        self.total = 0
+        self.chunks = 0
+        self._mappings = 0
+        self._file = None
+        self._writer: Optional[csv.DictWriter] = None
+        self._tracker = _open_change_tracker(ctx, self.export_cfg)
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        self.chunks += 1
+        self.total += len(records)
+
+        if "csv" in self.backends:
+            if self._writer is None:
+                self._file = self.out_path.open("w", newline="", encoding="utf-8")
+                self._writer = csv.DictWriter(self._file, fieldnames=EXPORT_FIELDNAMES)
+                self._writer.writeheader()
+            self._writer.writerows(records)
+            self._file.flush()
+
+        mappings = _pcid_mapping_rows(self.ctx, records)
+        if mappings:
+            persist_pcid_mappings(mappings, self.mapping_path, append=self._mappings > 0)
+            self._mappings += len(mappings)
+
+        part_name = f"{self.out_path.stem}.part{self.chunks:05d}{self.out_path.suffix}"
+        if self._tracker is None:
+            _export_to_backends(self.ctx, records, self.export_cfg, self.backends, part_name)
+        else:
+            delta, changes = _deltas(records, self._tracker.classify(records))
+            if delta:
+                _export_to_backends(
+                    self.ctx, delta, self.export_cfg, self.backends, part_name, changes
+                )
+        log.info("Exported chunk %d (%d records, %d total)", self.chunks, len(records), self.total)
+
+    def close(self) -> Path:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if not self.total:
+            log.warning("No valid records to write for AlfaBeta run.")
+        elif self._mappings:
+            log.info("Persisted %d PCID mappings to %s", self._mappings, self.mapping_path)
+        summary: Optional[ChangeSummary] = None
+        if self._tracker is not None:
+            try:
+                summary = _commit_changes(self.ctx, self._tracker, self.export_cfg, self.backends)
+            except Exception:
+                self._tracker.abort()
+                raise
+            finally:
+                self._tracker.store.close()
+                self._tracker = None
+            log.info("Change detection for %s: %s", self.ctx.source, summary.as_stats())
+        _complete_run(self.ctx, self.total, self.out_path, summary)
+        log.info("Wrote %d records to %s in %d chunks", self.total, self.out_path, self.chunks)
+        return self.out_path
+
+    def abort(self) -> None:
+        """Close the CSV and drop the staged change snapshot after a failed run."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+        if self._tracker is not None:
+            try:
+                self._tracker.abort()
+            finally:
+                self._tracker.store.close()
+                self._tracker = None
+
+
+def run_streaming(
+    ctx: PipelineContext,
+    listings: Iterable[str],
+    settings: StreamingSettings,
+    resource_manager: ResourceManager,
+    *,
+    worker_factory: Optional[Callable[[int], DetailWorker]] = None,
+) -> Path:
+    """Streaming variant of ``fetch_details`` through ``export_records``.
+
+    Product URLs are discovered on ``ctx.driver`` while ``settings.workers``
+    workers extract them in parallel; every ``settings.chunk_size`` records are
+    normalized, PCID-matched, QC'd and exported before the next chunk, so
+    memory stays bounded by the queue and chunk sizes.
+    """
+
+    if worker_factory is None:
+
+        def worker_factory(worker_id: int) -> DetailWorker:
+            return DetailWorker(
+                worker_id,
+                source=ctx.source,
+                base_url=ctx.base_url,
+                selectors=ctx.selectors,
+                run_id=ctx.run_id,
+                resource_manager=resource_manager,
+                mode=settings.mode,
+                login=lambda driver, user, pwd: ensure_logged_in(
+                    driver,
+                    ctx.selectors,
+                    ctx.source_config,
+                    account_username=user,
+                    account_password=pwd,
+                ),
+            )
+
+    exporter = ChunkedExport(ctx)
+    # Bounded memory across chunks; spills key hashes to disk on very large runs
+    deduper = StreamingDeduper(source=ctx.source)
+    invalid_total = 0
+    details = stream_details(
+        iter_product_urls(ctx, listings),
+        worker_factory,
+        workers=settings.workers,
+        queue_size=settings.queue_size,
+        source=ctx.source,
+    )
+    try:
+        for chunk in iter_chunks(details, settings.chunk_size):
+            matched = match_pcid(ctx, normalize_records(ctx, chunk))
+            passed = run_qc(ctx, matched)
+            invalid_total += ctx.invalid_records
+
+            # run_qc dedupes within the chunk; this catches repeats across chunks
+            fresh = deduper.filter_chunk(passed)
+            if len(fresh) < len(passed):
+                metrics.incr(
+                    "scraper.records_duplicate", amount=len(passed) - len(fresh), source=ctx.source
+                )
+            exporter.write(fresh)
+    except Exception:
+        exporter.abort()
+        raise
+    finally:
+        ctx.invalid_records = invalid_total
+        details.close()
+        deduper.close()
+
+    run_recorder.record_step(ctx.run_id, name="extract_product", status="success")
+    return exporter.close()
+
+
+def _streaming_settings(
+    source: str, source_config: Mapping[str, Any], streaming: Optional[bool]
+) -> StreamingSettings:
+    settings = StreamingSettings.from_config(source_config)
+    if streaming is not None:
+        settings.enabled = streaming
+    # The main run already holds one account; leave it a slot in the account gate
+    max_concurrent = int(get_rate_limit_settings(source).get("max_concurrent") or 0)
+    if max_concurrent > 0:
+        settings.workers = min(settings.workers, max(1, max_concurrent - 1))
+    return settings
+
+
 def run_alfabeta(
-    env: Optional[str] = None, variant_id: Optional[str] = None, resource_manager: Optional[ResourceManager] = None
+    env: Optional[str] = None,
+    variant_id: Optional[str] = None,
+    resource_manager: Optional[ResourceManager] = None,
+    streaming: Optional[bool] = None,
 ) -> Path:
     """End-to-end pipeline for AlfaBeta.
 
     The flow stitches together config loading, account/proxy routing, session
     management, engine execution, processors, observability, and versioning to
     mirror the v4.9 dependency model.
+
+    With ``streaming`` enabled (argument, ``streaming.enabled`` in the source
+    config or ``ALFABETA_STREAMING=1``) detail pages are extracted by parallel
+    workers and processed in chunks via :func:`run_streaming`.
     """
     source = "alfabeta"
     log.info("Starting AlfaBeta pipeline run")
@@ -436,7 +868,8 @@ def run_alfabeta(
         selectors_payload=selectors,
     )
 
-    active_resource_manager = get_default_resource_manager()
+    active_resource_manager = resource_manager or get_default_resource_manager()
+    streaming_settings = _streaming_settings(source, source_config, streaming)
 
     # 1) ACCOUNT + PROXY
     account_key, username, password = active_resource_manager.account_router.acquire_account(source)
@@ -483,6 +916,12 @@ def run_alfabeta(
         )
 
         listings = fetch_listings(ctx)
+        if streaming_settings.enabled:
+            log.info(
+                "Streaming detail extraction enabled",
+                extra={"workers": streaming_settings.workers, "mode": streaming_settings.mode},
+            )
+            return run_streaming(ctx, listings, streaming_settings, active_resource_manager)
         details = fetch_details(ctx, listings)
         parsed = parse_raw(ctx, details)
         normalized = normalize_records(ctx, parsed)
@@ -0,0 +1,288 @@
+"""
+Streaming, parallel detail-page extraction for the AlfaBeta pipeline.
+
+Product URLs flow through a bounded queue to ``workers`` extraction workers.
+Each worker owns an account and a proxy from the ``ResourceManager`` plus its
+own page driver: a Selenium session in ``browser`` mode, or a plain
+``requests`` session in ``http`` mode. Extracted records are yielded as soon
+as they are ready, so downstream stages can normalize, match and export in
+chunks while extraction is still running. Both queues are bounded, which
+keeps memory flat regardless of how many pages a run visits.
+"""
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional
+
+import requests
+
+from src.common.logging_utils import get_logger, safe_log
+from src.engines.http_client import HttpRequestConfig, send_request
+from src.engines.selenium_engine import BrowserSession, open_with_session
+from src.observability import metrics
+from src.resource_manager import ResourceManager
+from src.resource_manager.rate_limiter import get_rate_limiter
+from src.scrapers.alfabeta.alfabeta_full_impl import extract_product
+from src.sessions.session_manager import create_session_record
+
+log = get_logger("alfabeta-streaming")
+
+LoginFn = Callable[[Any, Optional[str], Optional[str]], None]
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+@dataclass
+class StreamingSettings:
+    """Knobs for the streaming pipeline, read from ``streaming:`` in the source config."""
+
+    enabled: bool = False
+    workers: int = 4
+    mode: str = "browser"  # "browser" | "http"
+    queue_size: int = 256
+    chunk_size: int = 500
+
+    @classmethod
+    def from_config(cls, source_config: Mapping[str, Any]) -> "StreamingSettings":
+        """Build settings from config; ``ALFABETA_STREAMING[_WORKERS]`` env vars win."""
+
+        cfg = source_config.get("streaming") if isinstance(source_config, Mapping) else None
+        cfg = cfg if isinstance(cfg, Mapping) else {}
+        settings = cls(
+            enabled=bool(cfg.get("enabled", cls.enabled)),
+            workers=int(cfg.get("workers", cls.workers)),
+            mode=str(cfg.get("mode", cls.mode)).lower(),
+            queue_size=int(cfg.get("queue_size", cls.queue_size)),
+            chunk_size=int(cfg.get("chunk_size", cls.chunk_size)),
+        )
+        env_enabled = os.getenv("ALFABETA_STREAMING")
+        if env_enabled is not None:
+            settings.enabled = env_enabled.strip().lower() in {"1", "true", "yes", "on"}
+        env_workers = os.getenv("ALFABETA_STREAMING_WORKERS")
+        if env_workers:
+            settings.workers = int(env_workers)
+        settings.workers = max(1, settings.workers)
+        settings.queue_size = max(1, settings.queue_size)
+        settings.chunk_size = max(1, settings.chunk_size)
+        return settings
+
+
+class HttpPage:
+    """Minimal driver stand-in that fetches pages over HTTP for ``extract_product``."""
+
+    def __init__(self, proxy: Optional[str] = None, session: Optional[requests.Session] = None):
+        self.proxy = proxy or None
+        self.session = session or requests.Session()
+        self.current_url = ""
+        self.page_source = ""
+
+    def get(self, url: str) -> None:
+        result = send_request(HttpRequestConfig(url=url, proxy=self.proxy), session=self.session)
+        self.current_url = result.url
+        self.page_source = result.text
+
+    def quit(self) -> None:
+        self.session.close()
+
+
+class DetailWorker:
+    """Extraction worker bound to one account, one proxy and one page driver."""
+
+    def __init__(
+        self,
+        worker_id: int,
+        *,
+        source: str,
+        base_url: str,
+        selectors: Dict[str, str],
+        run_id: str,
+        resource_manager: ResourceManager,
+        mode: str = "browser",
+        login: Optional[LoginFn] = None,
+    ):
+        self.worker_id = worker_id
+        self.source = source
+        self.base_url = base_url
+        self.selectors = selectors
+        self.run_id = run_id
+        self.resource_manager = resource_manager
+        self.mode = mode
+        self.login = login
+        self.account_key: Optional[str] = None
+        self.proxy = ""
+        self.page: Any = None
+        self._browser: Optional[BrowserSession] = None
+        self._limiter = get_rate_limiter(source)
+
+    def open(self) -> None:
+        """Acquire an account and proxy, then start the page driver."""
+
+        router = self.resource_manager.account_router
+        self.account_key, username, password = router.acquire_account(self.source)
+        self.proxy = self.resource_manager.proxy_pool.choose_proxy(self.source) or ""
+        if self.mode == "http":
+            self.page = HttpPage(self.proxy)
+        else:
+            account_id = self.account_key.split(":", 1)[1]
+            session_record = create_session_record(self.source, account_id, self.proxy)
+            self._browser = open_with_session(self.base_url, session_record)
+            self.page = self._browser.driver
+            if self.login is not None:
+                self.login(self.page, username, password)
+        safe_log(
+            log,
+            "info",
+            "Detail worker ready",
+            {"worker": self.worker_id, "account_key": self.account_key, "mode": self.mode},
+        )
+
+    def extract(self, url: str) -> Dict[str, Any]:
+        """Load ``url`` and extract its product record, tracking account/proxy health."""
+
+        router = self.resource_manager.account_router
+        proxy_pool = self.resource_manager.proxy_pool
+        try:
+            with self._limiter.limit():
+                self.page.get(url)
+            record = extract_product(self.page, url, self.selectors, self.run_id)
+        except Exception:
+            if self.account_key:
+                router.mark_account_error(self.account_key)
+            if self.proxy:
+                proxy_pool.mark_failure(self.source, self.proxy)
+            raise
+        if self.account_key:
+            router.mark_account_success(self.account_key)
+        if self.proxy:
+            proxy_pool.mark_success(self.source, self.proxy)
+        return record
+
+    def close(self) -> None:
+        try:
+            if self._browser is not None:
+                self._browser.quit()
+            elif self.page is not None and hasattr(self.page, "quit"):
+                self.page.quit()
+        finally:
+            if self.account_key:
+                self.resource_manager.account_router.release_account(self.account_key)
+                self.account_key = None
+
+
+def stream_details(
+    urls: Iterable[str],
+    worker_factory: Callable[[int], DetailWorker],
+    *,
+    workers: int,
+    queue_size: int,
+    source: str = "alfabeta",
+) -> Iterator[Dict[str, Any]]:
+    """Extract ``urls`` with ``workers`` parallel workers, yielding records as they finish.
+
+    ``urls`` is consumed lazily by a producer thread, so discovery overlaps
+    extraction. A URL that fails to extract is logged and skipped; failures
+    to discover URLs or to open a worker abort the stream and are re-raised
+    here. Records arrive in completion order, not URL order. Closing the
+    generator early stops the workers after their current page.
+    """
+
+    url_queue: "queue.Queue[object]" = queue.Queue(maxsize=queue_size)
+    out_queue: "queue.Queue[object]" = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    errors: List[BaseException] = []
+
+    def _put(target: "queue.Queue[object]", item: object) -> bool:
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fail(exc: BaseException) -> None:
+        errors.append(exc)
+        stop.set()
+
+    def _produce() -> None:
+        try:
+            for url in urls:
+                if not _put(url_queue, url):
+                    return
+        except BaseException as exc:  # surfaced to the consumer below
+            _fail(exc)
+        finally:
+            for _ in range(workers):
+                if not _put(url_queue, _DONE):
+                    break
+
+    def _work(worker_id: int) -> None:
+        worker: Optional[DetailWorker] = None
+        try:
+            worker = worker_factory(worker_id)
+            worker.open()
+            while not stop.is_set():
+                try:
+                    url = url_queue.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+                if url is _DONE:
+                    break
+                try:
+                    record = worker.extract(str(url))
+                except Exception as exc:
+                    metrics.incr("scraper.detail_failures", source=source)
+                    safe_log(
+                        log,
+                        "warning",
+                        "Detail extraction failed; skipping URL",
+                        {"worker": worker_id, "url": url, "error": str(exc)},
+                    )
+                    continue
+                metrics.incr("scraper.details_extracted", source=source)
+                if not _put(out_queue, record):
+                    break
+        except BaseException as exc:  # surfaced to the consumer below
+            _fail(exc)
+        finally:
+            try:
+                if worker is not None:
+                    worker.close()
+            finally:
+                _put(out_queue, _DONE)
+
+    producer = threading.Thread(target=_produce, name="alfabeta-url-producer", daemon=True)
+    threads = [
+        threading.Thread(target=_work, args=(idx,), name=f"alfabeta-detail-{idx}", daemon=True)
+        for idx in range(workers)
+    ]
+    producer.start()
+    for thread in threads:
+        thread.start()
+
+    finished = 0
+    try:
+        while finished < len(threads) and not errors:
+            try:
+                item = out_queue.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                finished += 1
+                continue
+            metrics.set_gauge("scraper.detail_queue_depth", url_queue.qsize(), source=source)
+            yield item  # type: ignore[misc]
+    finally:
+        stop.set()
+        producer.join()
+        for thread in threads:
+            thread.join()
+    if errors:
+        raise errors[0]
+
+
+__all__ = ["StreamingSettings", "HttpPage", "DetailWorker", "stream_details"]
@@ -3,8 +3,17 @@ Generic utilities shared across subsystems.
 """
 from .retry import retry
 from .circuit_breaker import CircuitBreaker
-from .hash_utils import stable_hash
+from .hash_utils import file_sha256, stable_hash, stable_hash64
 from .timer import Timer
+from .token_bucket import LeakyBucket, TokenBucket
 
-__all__ = ["retry", "CircuitBreaker", "stable_hash", "Timer"]
-
+__all__ = [
+    "retry",
+    "CircuitBreaker",
+    "stable_hash",
+    "stable_hash64",
+    "file_sha256",
+    "Timer",
+    "TokenBucket",
+    "LeakyBucket",
+]
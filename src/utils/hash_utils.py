@@ -4,6 +4,7 @@ Hash helpers for deterministic identifiers.
 from __future__ import annotations
 
 import hashlib
+from pathlib import Path
 from typing import Any
 
 
@@ -11,3 +12,19 @@ def stable_hash(value: Any) -> str:
     payload = repr(value).encode("utf-8")
     return hashlib.sha256(payload).hexdigest()
 
+
+def stable_hash64(value: str) -> int:
+    """Deterministic unsigned 64-bit hash of a string (independent of PYTHONHASHSEED)."""
+
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Streaming SHA-256 of a file's contents."""
+
+    sha = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
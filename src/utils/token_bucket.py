@@ -0,0 +1,162 @@
+"""
+Token-bucket and leaky-bucket limiters with sync and async waiters.
+
+Both limiters work by *reservation*: under a short lock the caller claims the
+next free slot and computes how long it has to wait for it, then sleeps
+outside the lock. Concurrent waiters therefore queue up on distinct slots
+instead of serializing behind whichever thread happens to be sleeping.
+
+Time spent waiting is accumulated per limiter key and exported through the
+``rate_limit_wait_seconds`` / ``rate_limit_hits`` counters.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+from src.observability import metrics
+
+
+class _ReservationLimiter:
+    """Shared wait/accounting logic; subclasses implement ``_reserve``."""
+
+    def __init__(self, key: str, clock: Callable[[], float] = time.monotonic) -> None:
+        self.key = key
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.waited_seconds = 0.0
+
+    def _reserve(self, now: float, cost: float = 1.0) -> float:
+        """Claim the next slot (``cost`` units) and return the delay until it opens."""
+        raise NotImplementedError
+
+    def _peek(self, now: float) -> float:
+        """Delay the next caller would face, without reserving."""
+        raise NotImplementedError
+
+    def reserve(self, cost: float = 1.0) -> float:
+        with self._lock:
+            delay = self._reserve(self._clock(), cost)
+        if delay > 0:
+            self._account(delay)
+        return delay
+
+    def try_acquire(self) -> bool:
+        """Take a slot only if it is available right now."""
+        with self._lock:
+            now = self._clock()
+            if self._peek(now) > 0:
+                return False
+            self._reserve(now)
+            return True
+
+    def wait(self, cost: float = 1.0) -> float:
+        """Block until a slot is available; returns seconds waited."""
+        delay = self.reserve(cost)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def async_wait(self, cost: float = 1.0) -> float:
+        """Awaitable variant of :meth:`wait` that never blocks the loop."""
+        delay = self.reserve(cost)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def _account(self, delay: float) -> None:
+        with self._lock:
+            self.waits += 1
+            self.waited_seconds += delay
+        metrics.incr("rate_limit_hits", source=self.key)
+        metrics.incr("rate_limit_wait_seconds", amount=delay, source=self.key)
+
+
+class TokenBucket(_ReservationLimiter):
+    """Classic token bucket: ``rate`` tokens/second, up to ``burst`` banked.
+
+    ``rate`` may be fractional (``0.2`` = one request every five seconds).
+    The bucket starts full, so an idle source never waits for its first
+    ``burst`` requests. A reservation may take more than one token (``cost``),
+    e.g. the estimated LLM tokens of a request against a tokens-per-minute budget.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        key: str = "default",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        super().__init__(key, clock)
+        self.rate = float(rate)
+        self.burst = float(burst) if burst else max(1.0, self.rate)
+        self._tokens = self.burst
+        self._updated = clock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def _peek(self, now: float) -> float:
+        self._refill(now)
+        return max(0.0, (1.0 - self._tokens) / self.rate)
+
+    def _reserve(self, now: float, cost: float = 1.0) -> float:
+        # Tokens may go negative: each waiter owns the debt it has to sleep off
+        self._refill(now)
+        self._tokens -= cost
+        return max(0.0, -self._tokens / self.rate)
+
+
+class LeakyBucket(_ReservationLimiter):
+    """Leaky bucket (as a queue): requests leave at most every ``interval``.
+
+    An optional ``jitter`` adds a random ``[0, jitter)`` seconds to each
+    spacing so traffic does not look machine-regular. Unlike a fixed sleep,
+    a source that has been idle for longer than the interval does not wait.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        *,
+        jitter: float = 0.0,
+        key: str = "default",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if interval < 0 or jitter < 0:
+            raise ValueError("interval and jitter must be non-negative")
+        super().__init__(key, clock)
+        self.interval = float(interval)
+        self.jitter = float(jitter)
+        self._next_free: Optional[float] = None
+
+    @classmethod
+    def from_rate(cls, rate: float, **kwargs) -> "LeakyBucket":
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        return cls(1.0 / rate, **kwargs)
+
+    def _peek(self, now: float) -> float:
+        if self._next_free is None:
+            return 0.0
+        return max(0.0, self._next_free - now)
+
+    def _reserve(self, now: float, cost: float = 1.0) -> float:
+        start = now if self._next_free is None else max(now, self._next_free)
+        spacing = self.interval + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        self._next_free = start + spacing
+        return start - now
+
+
+__all__ = ["TokenBucket", "LeakyBucket"]
@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+from tools.bench_alfabeta_parse import (
+    SAMPLES_DIR,
+    _bs4_extract,
+    _dom_extract,
+    _selectors,
+    run_benchmark,
+)
+
+
+@pytest.mark.parametrize("page", sorted(SAMPLES_DIR.glob("*.html")), ids=lambda path: path.name)
+def test_shared_dom_extracts_what_beautifulsoup_extracts(page):
+    html = page.read_text(encoding="utf-8")
+    selectors = _selectors()
+
+    assert _dom_extract(html, selectors) == _bs4_extract(html, selectors)
+
+
+@pytest.mark.skipif(not os.getenv("PERF_BENCH"), reason="PERF_BENCH not set")
+def test_shared_dom_parses_sample_pages_faster_than_bs4():
+    stats = run_benchmark(iterations=100, repeat=3)
+
+    assert stats["pages"] >= 3
+    assert stats["speedup"] > 3
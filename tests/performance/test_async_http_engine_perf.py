@@ -0,0 +1,79 @@
+"""Throughput of AsyncHttpEngine against a local stand-in server.
+
+The server adds a fixed per-request latency, so throughput should scale close
+to linearly with concurrency until the per-host limit is reached. The
+throughput ratios are timing-sensitive, so they only run with ``PERF_BENCH=1``.
+"""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.engines.async_http_engine import AsyncHttpEngine
+from src.engines.base_engine import EngineConfig
+
+LATENCY_SECONDS = 0.02
+REQUESTS = 64
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        time.sleep(LATENCY_SECONDS)
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        return None
+
+
+def _throughput(base_url: str, concurrency: int) -> float:
+    urls = [f"{base_url}/item/{i}" for i in range(REQUESTS)]
+    with AsyncHttpEngine(
+        EngineConfig(timeout=5.0, max_retries=0),
+        max_concurrency=concurrency,
+        max_per_host=concurrency,
+    ) as engine:
+        engine.fetch(urls[0])  # warm the pool
+        start = time.perf_counter()
+        results = engine.fetch_many(urls)
+        elapsed = time.perf_counter() - start
+    assert all(r.status_code == 200 for r in results)
+    return REQUESTS / elapsed
+
+
+@pytest.fixture()
+def base_url():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_fetch_many_returns_every_response_in_order(base_url):
+    urls = [f"{base_url}/item/{i}" for i in range(16)]
+    config = EngineConfig(timeout=5.0, max_retries=0)
+    with AsyncHttpEngine(config, max_concurrency=8, max_per_host=8) as engine:
+        results = engine.fetch_many(urls)
+
+    assert [r.url for r in results] == urls
+    assert all(r.status_code == 200 for r in results)
+
+
+@pytest.mark.skipif(not os.getenv("PERF_BENCH"), reason="PERF_BENCH not set")
+def test_async_http_engine_throughput_scales_with_concurrency(base_url):
+    rates = {c: _throughput(base_url, c) for c in (1, 4, 16)}
+
+    assert rates[4] > rates[1] * 2
+    assert rates[16] > rates[4] * 1.5
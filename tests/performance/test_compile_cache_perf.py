@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from src.pipeline import compile_cache
+from tools.bench_compile_cache import run_benchmark
+
+
+def test_cached_compile_matches_cold_compile():
+    pipelines = sorted((compile_cache.DSL_ROOT / "pipelines").glob("*.yaml"))
+    components = compile_cache.DSL_ROOT / "components.yaml"
+    cached = [compile_cache.compile_cached(path, components) for path in pipelines]
+
+    compile_cache.clear_compile_cache()
+    cold = [compile_cache.compile_cached(path, components) for path in pipelines]
+
+    assert pipelines
+    assert [(c.name, c.order, c.dependents, c.metadata["content_hash"]) for c in cached] == [
+        (c.name, c.order, c.dependents, c.metadata["content_hash"]) for c in cold
+    ]
+
+
+@pytest.mark.skipif(not os.getenv("PERF_BENCH"), reason="PERF_BENCH not set")
+def test_cached_compile_is_10x_faster_than_cold():
+    stats = run_benchmark(repeat=5)
+
+    assert stats["pipelines"] > 0
+    assert stats["speedup"] > 10
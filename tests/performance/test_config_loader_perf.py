@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+from src.common import config_loader
+from tools.bench_config_loader import run_benchmark
+
+
+def test_warm_config_matches_cold_load():
+    sources = config_loader.prewarm()
+    warm = [config_loader.load_config()]
+    warm += [config_loader.load_source_config(source) for source in sources]
+
+    config_loader.get_config_cache().clear()
+    cold = [config_loader.load_config()]
+    cold += [config_loader.load_source_config(source) for source in sources]
+
+    assert sources
+    assert [config_loader.thaw(cfg) for cfg in warm] == [config_loader.thaw(cfg) for cfg in cold]
+
+
+@pytest.mark.skipif(not os.getenv("PERF_BENCH"), reason="PERF_BENCH not set")
+def test_warm_config_access_is_5x_faster_than_cold():
+    stats = run_benchmark(repeat=5)
+
+    assert stats["sources"] > 0
+    assert stats["speedup"] > 5
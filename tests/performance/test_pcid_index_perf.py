@@ -0,0 +1,49 @@
+import json
+import os
+import time
+
+import pytest
+
+from src.processors.pcid_matcher import load_or_build_pcid_resources
+from src.processors.vector_store import PCIDVectorStore
+from tools.bench_pcid_index import run_benchmark, synthetic_records
+
+
+def test_query_many_matches_per_record_query():
+    store = PCIDVectorStore(dims=16)
+    store.populate_from_records(synthetic_records(2_000, seed=1))
+    scraped = synthetic_records(300, seed=2, with_pcid=False)
+    queries = store.embed_records(scraped)
+
+    batched = store.query_many(queries, top_k=3, threshold=0.5)
+    for row, expected in zip(queries, batched):
+        single = store.query(row, top_k=3, threshold=0.5)
+        assert [m["score"] for m in single] == pytest.approx([m["score"] for m in expected])
+
+
+@pytest.mark.skipif(not os.getenv("PERF_BENCH"), reason="PERF_BENCH not set")
+def test_query_many_outperforms_list_scoring():
+    stats = run_benchmark(20_000, 2_000, loop_sample=5)
+
+    assert stats["speedup"] > 10
+
+
+@pytest.mark.skipif(not os.getenv("PERF_BENCH"), reason="PERF_BENCH not set")
+def test_warm_pcid_index_startup_is_milliseconds(tmp_path):
+    master_path = tmp_path / "pcid_master.jsonl"
+    with master_path.open("w", encoding="utf-8") as fh:
+        for record in synthetic_records(100_000, seed=3):
+            fh.write(json.dumps(record) + "\n")
+    cache_base = tmp_path / "cache" / "pcid_master"
+
+    start = time.perf_counter()
+    load_or_build_pcid_resources(master_path, cache_base)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index, store = load_or_build_pcid_resources(master_path, cache_base)
+    warm = time.perf_counter() - start
+
+    assert len(store) == 100_000
+    assert warm < 0.1
+    assert warm * 20 < cold
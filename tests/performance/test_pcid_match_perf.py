@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+from src.processors.pcid_matcher import (
+    build_pcid_index,
+    build_vector_store,
+    match_pcid_with_confidence,
+    match_records_batch,
+)
+from src.processors.vector_store import HashVectorBackend
+from tools.bench_pcid_index import synthetic_records
+from tools.bench_pcid_match import run_benchmark, scraped_batch
+
+
+def test_batch_matches_per_record_decisions():
+    master = synthetic_records(1_000, seed=1)
+    records = scraped_batch(master, 2_000, exact_ratio=0.6)
+    index = build_pcid_index(master)
+    backend = HashVectorBackend(build_vector_store(master, dims=16))
+
+    batch = match_records_batch(records, index, vector_store=backend, min_similarity=0.6)
+    for record, (pcid, confidence, method) in zip(records, batch):
+        expected_pcid, expected_score = match_pcid_with_confidence(
+            record, index, vector_store=backend, min_similarity=0.6
+        )
+        assert confidence == pytest.approx(expected_score, abs=1e-6)
+        if method == "exact":
+            assert pcid == expected_pcid
+        else:
+            # Vector ties may resolve to a different PCID with the same score
+            assert (pcid is None) == (expected_pcid is None)
+
+
+@pytest.mark.skipif(not os.getenv("PERF_BENCH"), reason="PERF_BENCH not set")
+def test_batch_matching_100k_exact_hits_is_10x_faster():
+    stats = run_benchmark(20_000, 100_000, exact_ratio=1.0, loop_sample=5_000, repeat=5)
+
+    assert stats["matched"] == 100_000
+    assert stats["speedup"] > 10
+
+
+@pytest.mark.skipif(not os.getenv("PERF_BENCH"), reason="PERF_BENCH not set")
+def test_batch_matching_with_vector_misses_is_faster():
+    # Misses are bound by the similarity matmul, so the gain is smaller here
+    stats = run_benchmark(5_000, 20_000, exact_ratio=0.8, loop_sample=1_000)
+
+    assert stats["speedup"] > 2
@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+from tools.bench_pg_copy import run_benchmark
+
+
+def test_copy_encoding_streams_every_row_without_a_database():
+    stats = run_benchmark(10_000)
+
+    assert stats["rows"] == 10_000
+
+
+@pytest.mark.skipif(not os.getenv("PERF_BENCH"), reason="PERF_BENCH not set")
+def test_copy_encoding_keeps_up_without_a_database():
+    stats = run_benchmark(100_000)
+
+    # Loose floor for slow CI hosts; row-at-a-time INSERTs manage a few thousand rows/s
+    assert stats["copy_rows_per_second"] > 25_000
+
+
+@pytest.mark.skipif(not os.getenv("PG_BENCH_DSN"), reason="PG_BENCH_DSN not set")
+def test_copy_upsert_1m_rows_is_20x_faster_than_inserts():
+    stats = run_benchmark(1_000_000, dsn=os.environ["PG_BENCH_DSN"])
+
+    assert stats["rows"] == 1_000_000
+    assert stats["speedup"] > 20
@@ -0,0 +1,26 @@
+import os
+
+import pytest
+
+from src.processors.qc.rules import compile_ruleset, get_default_ruleset, run_qc_for_record
+from tools.bench_qc_rules import run_benchmark, synthetic_batch
+
+
+def test_compiled_failures_match_per_record_loop():
+    records = synthetic_batch(20_000, defect_ratio=0.05)
+    ruleset = get_default_ruleset()
+
+    outcome = compile_ruleset(ruleset).run(records)
+    passed = outcome.passed_mask().tolist()
+    for idx, record in enumerate(records):
+        ok, results = run_qc_for_record(record, ruleset)
+        assert outcome.failures.get(idx, []) == [r for r in results if not r.passed]
+        assert passed[idx] == ok
+
+
+@pytest.mark.skipif(not os.getenv("PERF_BENCH"), reason="PERF_BENCH not set")
+def test_compiled_qc_500k_records_is_3x_faster():
+    stats = run_benchmark(500_000, defect_ratio=0.01, loop_sample=20_000, repeat=3)
+
+    assert stats["failed_records"] > 0
+    assert stats["speedup"] > 3
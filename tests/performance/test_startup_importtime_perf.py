@@ -0,0 +1,32 @@
+import os
+
+import pytest
+
+from tools.bench_startup import run_benchmark
+
+# Cumulative ``-X importtime`` budgets in milliseconds, roughly 1.5x the
+# lazy-import figures; eager engine/agent/exporter imports blow through them.
+BUDGETS_MS = {
+    "src.entrypoints.run_pipeline": 250,
+    "src.scrapers.alfabeta.pipeline": 750,
+    "src.engines.engine_factory": 150,
+    "src.pipeline": 120,
+    "src.integrations.jira_airflow_integration": 60,
+}
+
+
+@pytest.fixture(scope="module")
+def startup_stats():
+    # Best of three only matters for the timing budgets
+    return run_benchmark(list(BUDGETS_MS), repeat=3 if os.getenv("PERF_BENCH") else 1)
+
+
+@pytest.mark.parametrize("module", list(BUDGETS_MS))
+def test_entry_module_does_not_load_optional_backends(startup_stats, module):
+    assert startup_stats[module]["heavy"] == []
+
+
+@pytest.mark.skipif(not os.getenv("PERF_BENCH"), reason="PERF_BENCH not set")
+@pytest.mark.parametrize("module", list(BUDGETS_MS))
+def test_entry_module_import_within_budget(startup_stats, module):
+    assert startup_stats[module]["ms"] < BUDGETS_MS[module]
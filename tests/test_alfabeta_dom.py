@@ -0,0 +1,58 @@
+import pytest
+from bs4 import BeautifulSoup
+from cssselect import SelectorError
+
+from src.scrapers.alfabeta.dom import node_text, parse_html, selector_set
+
+HTML = """
+<html><body>
+  <div id="main">
+    <a class="company-link primary" href="/c/1">One</a>
+    <a class="company-link" href="/c/2">Two</a>
+    <a class="company-linked" href="/c/3">Not a match</a>
+    <p><span class="price"> ARS <b>12.50</b> </span></p>
+  </div>
+  <form><input name="username"><button type="submit" title="Log In">Go</button></form>
+  <ul><li>First</li><li>Second</li><li class="last">Third</li></ul>
+</body></html>
+"""
+
+SELECTORS = [
+    "a.company-link",
+    "a.company-link.primary",
+    "#main > a",
+    "#main span.price",
+    "input[name='username']",
+    'button[type="submit"]',
+    "a[href^='/c/'], button",
+    "div > p > span",
+    "[href$='3']",
+    'button[title="Log In"]',
+    "li:first-child",
+    "li:nth-child(2)",
+    "li:not(.last)",
+]
+
+
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_compiled_selectors_match_beautifulsoup(selector):
+    soup = BeautifulSoup(HTML, "lxml")
+    expected = [node.get_text(strip=True) for node in soup.select(selector)]
+
+    nodes = selector_set({"field": selector}).select(parse_html(HTML), "field")
+    assert sorted(node_text(node) for node in nodes) == sorted(expected)
+
+
+def test_invalid_selector_fails_at_compile():
+    with pytest.raises(SelectorError):
+        selector_set({"field": "li:not("})
+
+
+def test_page_is_parsed_once_and_fields_read_in_one_call():
+    doc = parse_html(HTML)
+    assert parse_html(HTML) is doc
+
+    fields = selector_set({"price": "span.price", "missing": "h1.product-name"})
+    assert fields is selector_set({"price": "span.price", "missing": "h1.product-name"})
+    assert fields.first_texts(doc) == {"price": "ARS12.50", "missing": None}
+    assert selector_set({"links": "a.company-link"}).hrefs(doc, "links") == ["/c/1", "/c/2"]
@@ -1,12 +1,6 @@
-import os
-import sys
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
+from src.common.config_loader import load_config, thaw
 from src.engines.selenium_engine import FakeDriver
+from src.scrapers.alfabeta import pipeline
 from src.scrapers.alfabeta.alfabeta_full_impl import extract_product
 from src.scrapers.alfabeta.company_index import fetch_company_urls
 from src.scrapers.alfabeta.pipeline import run_alfabeta
@@ -45,6 +39,15 @@ def test_run_alfabeta_end_to_end(monkeypatch, tmp_path):
     # Isolate output directory
     monkeypatch.setenv("SCRAPER_PLATFORM_VERSION", "4.9.0-test")
 
+    # Keep the change-detection snapshot out of the repo's output directory
+    def isolated_config(env=None):
+        config = thaw(load_config(env))
+        store_path = str(tmp_path / "fingerprints.sqlite")
+        config.setdefault("export", {})["incremental"] = {"store_path": store_path}
+        return config
+
+    monkeypatch.setattr(pipeline, "load_config", isolated_config)
+
     output_path = run_alfabeta()
     assert output_path.exists()
 
@@ -0,0 +1,264 @@
+import sqlite3
+import time
+from datetime import datetime
+
+import pytest
+
+from src.common.config_loader import load_config, thaw
+from src.core_kernel.utils import iter_chunks
+from src.engines.selenium_engine import FakeDriver
+from src.scrapers.alfabeta import pipeline
+from src.scrapers.alfabeta.alfabeta_full_impl import extract_product
+from src.scrapers.alfabeta.pipeline import (
+    PipelineContext,
+    fetch_listings,
+    run_alfabeta,
+    run_streaming,
+)
+from src.scrapers.alfabeta.streaming import StreamingSettings, stream_details
+from src.versioning.version_manager import build_version_info
+
+
+class SleepyWorker:
+    """Stand-in worker whose extraction is I/O bound."""
+
+    def __init__(self, delay=0.0, fail_on=(), opened=None):
+        self.delay = delay
+        self.fail_on = set(fail_on)
+        self.opened = opened if opened is not None else []
+
+    def open(self):
+        self.opened.append(self)
+
+    def extract(self, url):
+        time.sleep(self.delay)
+        if url in self.fail_on:
+            raise ValueError(f"bad page {url}")
+        return {"product_url": url}
+
+    def close(self):
+        self.opened.remove(self)
+
+
+def _timed_stream(urls, workers, delay):
+    start = time.perf_counter()
+    records = list(
+        stream_details(urls, lambda _idx: SleepyWorker(delay), workers=workers, queue_size=8)
+    )
+    return records, time.perf_counter() - start
+
+
+def test_stream_details_scales_with_workers():
+    urls = [f"https://example.com/p/{idx}" for idx in range(24)]
+
+    serial, serial_s = _timed_stream(urls, workers=1, delay=0.02)
+    parallel, parallel_s = _timed_stream(urls, workers=4, delay=0.02)
+
+    assert sorted(r["product_url"] for r in serial) == sorted(urls)
+    assert sorted(r["product_url"] for r in parallel) == sorted(urls)
+    assert parallel_s * 2 < serial_s
+
+
+def test_stream_details_applies_backpressure():
+    produced = []
+
+    def urls():
+        for idx in range(200):
+            produced.append(idx)
+            yield f"https://example.com/p/{idx}"
+
+    stream = stream_details(urls(), lambda _idx: SleepyWorker(), workers=2, queue_size=4)
+    first = next(stream)
+    time.sleep(0.3)
+    # url queue + out queue + one item held by each worker + the producer's pending put
+    assert len(produced) <= 4 + 4 + 2 + 2
+    stream.close()
+    assert first["product_url"].startswith("https://example.com/p/")
+
+
+def test_stream_details_skips_bad_pages_and_releases_workers():
+    opened = []
+    urls = [f"https://example.com/p/{idx}" for idx in range(6)]
+
+    records = list(
+        stream_details(
+            urls,
+            lambda _idx: SleepyWorker(fail_on={urls[2]}, opened=opened),
+            workers=3,
+            queue_size=2,
+        )
+    )
+
+    assert len(records) == 5
+    assert opened == []
+
+
+def test_stream_details_surfaces_discovery_errors():
+    def urls():
+        yield "https://example.com/p/0"
+        raise RuntimeError("listing page changed")
+
+    with pytest.raises(RuntimeError, match="listing page changed"):
+        list(stream_details(urls(), lambda _idx: SleepyWorker(), workers=2, queue_size=2))
+
+
+def test_iter_chunks_is_lazy():
+    pulled = []
+
+    def numbers():
+        for idx in range(5):
+            pulled.append(idx)
+            yield idx
+
+    chunks = iter_chunks(numbers(), 2)
+    assert next(chunks) == [0, 1]
+    assert pulled == [0, 1]
+    assert list(chunks) == [[2, 3], [4]]
+
+
+def test_streaming_settings_env_overrides(monkeypatch):
+    cfg = {"streaming": {"enabled": False, "workers": 2, "chunk_size": 10}}
+    monkeypatch.setenv("ALFABETA_STREAMING", "1")
+    monkeypatch.setenv("ALFABETA_STREAMING_WORKERS", "6")
+
+    settings = StreamingSettings.from_config(cfg)
+    assert settings.enabled is True
+    assert settings.workers == 6
+    assert settings.chunk_size == 10
+
+
+class FakeDetailWorker:
+    def __init__(self):
+        self.driver = FakeDriver()
+
+    def open(self):
+        return None
+
+    def extract(self, url):
+        self.driver.get(url)
+        return extract_product(self.driver, url, {}, "test-run")
+
+    def close(self):
+        return None
+
+
+def _streaming_ctx(monkeypatch, tmp_path):
+    monkeypatch.setenv("SCRAPER_PLATFORM_FAKE_BROWSER", "1")
+    for target in (
+        "run_recorder.record_step",
+        "run_recorder.finish_run",
+        "record_run_cost",
+        "orchestrate_source_repair",
+    ):
+        monkeypatch.setattr(
+            f"src.scrapers.alfabeta.pipeline.{target}", lambda *args, **kwargs: None
+        )
+
+    return PipelineContext(
+        source="alfabeta",
+        platform_config={},
+        source_config={"schema_name": "product_record"},
+        selectors={},
+        run_id="test-run",
+        version_info=build_version_info(
+            "alfabeta", scraper_version="1.0.0", schema_version="1.0.0"
+        ),
+        driver=FakeDriver(),
+        base_url="https://example.com/companies",
+        pcid_index={("alpha med", "acme pharma", "ars"): "PCID-ALPHA"},
+        pcid_vector_store=None,
+        pcid_min_similarity=0.8,
+        baseline_rows=0,
+        run_started_at=datetime.utcnow(),
+        env="test",
+        output_dir=tmp_path,
+    )
+
+
+def test_run_streaming_exports_in_chunks(monkeypatch, tmp_path):
+    ctx = _streaming_ctx(monkeypatch, tmp_path)
+    listings = fetch_listings(ctx)
+    settings = StreamingSettings(enabled=True, workers=2, queue_size=2, chunk_size=1)
+
+    out_path = run_streaming(
+        ctx,
+        listings,
+        settings,
+        resource_manager=None,
+        worker_factory=lambda _idx: FakeDetailWorker(),
+    )
+
+    # The sample listings repeat the same two products; chunks of one record
+    # are deduped across chunk boundaries.
+    rows = out_path.read_text(encoding="utf-8").strip().splitlines()
+    assert rows[0].startswith("product_url,name,price")
+    assert len(rows) == 1 + 2
+    (mapping_path,) = (tmp_path / "alfabeta" / "pcid_mappings").glob("*.jsonl")
+    mapping_lines = mapping_path.read_text(encoding="utf-8").splitlines()
+    assert len(mapping_lines) == 2
+    assert all("PCID-ALPHA" in line for line in mapping_lines)
+
+
+def test_failed_streaming_run_aborts_the_export(monkeypatch, tmp_path):
+    ctx = _streaming_ctx(monkeypatch, tmp_path)
+    listings = fetch_listings(ctx)
+    exporters = []
+
+    class SpyExport(pipeline.ChunkedExport):
+        def __init__(self, ctx):
+            super().__init__(ctx)
+            exporters.append(self)
+
+    qc_calls = []
+    real_qc = pipeline.run_qc
+
+    def failing_qc(ctx, records):
+        qc_calls.append(len(records))
+        if len(qc_calls) == 2:
+            raise RuntimeError("qc failed")
+        return real_qc(ctx, records)
+
+    monkeypatch.setattr(pipeline, "ChunkedExport", SpyExport)
+    monkeypatch.setattr(pipeline, "run_qc", failing_qc)
+    settings = StreamingSettings(enabled=True, workers=1, queue_size=2, chunk_size=1)
+
+    with pytest.raises(RuntimeError, match="qc failed"):
+        run_streaming(
+            ctx,
+            listings,
+            settings,
+            resource_manager=None,
+            worker_factory=lambda _idx: FakeDetailWorker(),
+        )
+
+    (exporter,) = exporters
+    assert exporter._file is None and exporter._tracker is None
+    with sqlite3.connect(tmp_path / "alfabeta" / "fingerprints.sqlite") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM staged").fetchone() == (0,)
+        assert conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone() == (0,)
+
+
+def test_run_alfabeta_streaming_end_to_end(monkeypatch, tmp_path):
+    monkeypatch.setenv("SCRAPER_PLATFORM_FAKE_BROWSER", "1")
+    monkeypatch.setenv("ALFABETA_USER_1", "demo")
+    monkeypatch.setenv("ALFABETA_PASS_1", "demo-pass")
+    monkeypatch.setenv("ALFABETA_USER_2", "demo2")
+    monkeypatch.setenv("ALFABETA_PASS_2", "demo-pass2")
+    monkeypatch.setenv("SCRAPER_SECRET_KEY", "cJJS2KEJeyfjovwfsMboxchO5s-uWq-XzXjt6Uh85fU=")
+    monkeypatch.setenv("ALFABETA_STREAMING_WORKERS", "2")
+
+    # Keep the change-detection snapshot out of the repo's output directory
+    def isolated_config(env=None):
+        config = thaw(load_config(env))
+        store_path = str(tmp_path / "fingerprints.sqlite")
+        config.setdefault("export", {})["incremental"] = {"store_path": store_path}
+        return config
+
+    monkeypatch.setattr(pipeline, "load_config", isolated_config)
+
+    output_path = run_alfabeta(streaming=True)
+    assert output_path.exists()
+
+    content = output_path.read_text(encoding="utf-8").strip().splitlines()
+    assert len(content) >= 2
+    output_path.unlink(missing_ok=True)
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.engines.async_http_engine import AsyncHttpEngine
+from src.engines.base_engine import EngineConfig, EngineError
+from src.engines.engine_factory import create_engine
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    active = 0
+    peak = 0
+    flaky_hits = 0
+    served = []
+    lock = threading.Lock()
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+            cls.served.append(self.path)
+        try:
+            if self.path.startswith("/flaky"):
+                with cls.lock:
+                    cls.flaky_hits += 1
+                    fail = cls.flaky_hits == 1
+                status, body = (503, b"busy") if fail else (200, b"recovered")
+            elif self.path.startswith("/missing"):
+                status, body = 404, b"nope"
+            else:
+                time.sleep(0.05)
+                status, body = 200, self.path.encode()
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, *_args):
+        return None
+
+
+@pytest.fixture
+def server():
+    _Handler.active = _Handler.peak = _Handler.flaky_hits = 0
+    _Handler.served = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _config(**overrides):
+    defaults = dict(timeout=5.0, max_retries=2, retry_backoff=0.01, retry_jitter=0.0)
+    defaults.update(overrides)
+    return EngineConfig(**defaults)
+
+
+def test_fetch_many_returns_results_in_order(server):
+    urls = [f"{server}/page/{i}" for i in range(6)]
+    with AsyncHttpEngine(_config(), max_concurrency=6) as engine:
+        results = engine.fetch_many(urls)
+
+    assert [r.content for r in results] == [f"/page/{i}" for i in range(6)]
+    assert all(r.status_code == 200 for r in results)
+
+
+def test_fetch_many_respects_per_host_limit(server):
+    urls = [f"{server}/page/{i}" for i in range(12)]
+    with AsyncHttpEngine(_config(), max_concurrency=12, max_per_host=3) as engine:
+        engine.fetch_many(urls)
+
+    assert _Handler.peak <= 3
+
+
+def test_busy_host_does_not_hold_global_slots(server):
+    other_host = server.replace("127.0.0.1", "localhost")
+    urls = [f"{server}/page/{i}" for i in range(6)] + [f"{other_host}/page/other"]
+    with AsyncHttpEngine(_config(), max_concurrency=2, max_per_host=1) as engine:
+        engine.fetch_many(urls)
+
+    # The other host gets the free global slot instead of queueing behind the busy one
+    assert "/page/other" in _Handler.served[:2]
+
+
+def test_retry_on_server_error_then_succeeds(server):
+    with AsyncHttpEngine(_config()) as engine:
+        result = engine.fetch_with_retry(f"{server}/flaky")
+
+    assert result.content == "recovered"
+    assert _Handler.flaky_hits == 2
+
+
+def test_failed_urls_are_returned_as_errors(server):
+    with AsyncHttpEngine(_config(max_retries=0)) as engine:
+        results = engine.fetch_many(["http://127.0.0.1:1/closed", f"{server}/page/ok"])
+
+    assert isinstance(results[0], EngineError)
+    assert results[0].retries_exhausted
+    assert results[1].content == "/page/ok"
+
+
+def test_connection_pool_is_reused_across_sync_calls(server):
+    engine = AsyncHttpEngine(_config())
+    engine.fetch(f"{server}/page/a")
+    loop = engine._sync_loop
+    clients = dict(engine._states[loop].clients)
+    engine.fetch(f"{server}/page/b")
+
+    assert engine._states[loop].clients == clients
+    engine.cleanup()
+    assert engine.is_closed()
+
+
+def test_async_api_runs_on_caller_loop(server):
+    async def _run():
+        engine = AsyncHttpEngine(_config())
+        try:
+            return await engine.afetch_many([f"{server}/page/x", f"{server}/page/y"])
+        finally:
+            await engine.aclose()
+
+    results = asyncio.run(_run())
+    assert [r.content for r in results] == ["/page/x", "/page/y"]
+
+
+def test_factory_builds_async_engine():
+    engine = create_engine(
+        "async_http", {"engine": {"max_concurrency": 4, "max_per_host": 2}}
+    )
+    assert isinstance(engine, AsyncHttpEngine)
+    assert engine.max_concurrency == 4
+    assert engine.max_per_host == 2
+    engine.cleanup()
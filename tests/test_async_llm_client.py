@@ -0,0 +1,185 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.observability import metrics
+from src.processors.enrichment.llm_enricher import translate_records_async
+from src.processors.llm import async_llm_client
+from src.processors.llm.async_llm_client import (
+    AsyncLLMClient,
+    ProviderBudget,
+    get_provider_budget,
+    retry_after_seconds,
+)
+from src.processors.llm.llm_cache import LLMResponseCache
+from src.processors.qc.llm_qc import validate_records_with_llm_async
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+class FakeCompletions:
+    def __init__(self, delay=0.0, failures=(), reply=None):
+        self.delay = delay
+        self.failures = list(failures)
+        self.reply = reply or (lambda prompt: f"<{prompt}>")
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def create(self, *, messages, stream=False, **kwargs):
+        self.calls.append(messages[-1]["content"])
+        if self.failures:
+            raise self.failures.pop(0)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        content = self.reply(messages[-1]["content"])
+        if stream:
+            return self._stream(content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    async def _stream(self, content):
+        for idx in range(0, len(content), 3):
+            delta = SimpleNamespace(content=content[idx : idx + 3])
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+@pytest.fixture(autouse=True)
+def _fresh_budgets(monkeypatch):
+    # Budgets are process-wide per provider; keep pauses from one test out of the next
+    monkeypatch.setattr(async_llm_client, "_BUDGETS", {})
+
+
+def _client(monkeypatch, completions, **kwargs):
+    monkeypatch.setattr(
+        AsyncLLMClient,
+        "_build_async_client",
+        lambda self: SimpleNamespace(chat=SimpleNamespace(completions=completions)),
+    )
+    kwargs.setdefault("backoff_base", 0.01)
+    return AsyncLLMClient(provider="openai", model="gpt-test", api_key="sk-test", **kwargs)
+
+
+def test_requests_run_concurrently_up_to_the_limit(monkeypatch):
+    completions = FakeCompletions(delay=0.05)
+    client = _client(monkeypatch, completions, max_concurrency=4)
+
+    async def main():
+        return await asyncio.gather(*(client.acomplete(f"p{i}") for i in range(20)))
+
+    started = time.perf_counter()
+    results = asyncio.run(main())
+    elapsed = time.perf_counter() - started
+
+    assert results == [f"<p{i}>" for i in range(20)]
+    assert completions.peak == 4
+    assert elapsed < 20 * 0.05 / 2
+
+
+def test_rate_limited_requests_honor_retry_after(monkeypatch):
+    completions = FakeCompletions(failures=[ProviderError(429, {"retry-after": "0.1"})])
+    client = _client(monkeypatch, completions)
+
+    started = time.perf_counter()
+    assert asyncio.run(client.acomplete("hello")) == "<hello>"
+
+    assert time.perf_counter() - started >= 0.1
+    assert len(completions.calls) == 2
+    retries = [
+        s
+        for s in metrics.dump_metrics()["counters"]
+        if s.name == "llm.retries" and s.labels["status"] == "429"
+    ]
+    assert retries and retries[0].value >= 1
+
+
+def test_non_retryable_errors_and_exhausted_retries_raise(monkeypatch):
+    client = _client(monkeypatch, FakeCompletions(failures=[ProviderError(400)]))
+    with pytest.raises(ProviderError):
+        asyncio.run(client.acomplete("bad request"))
+
+    completions = FakeCompletions(failures=[ProviderError(503)] * 3)
+    client = _client(monkeypatch, completions, max_retries=2)
+    with pytest.raises(ProviderError):
+        asyncio.run(client.acomplete("down"))
+    assert len(completions.calls) == 3
+
+
+def test_retry_after_header_formats():
+    assert retry_after_seconds(ProviderError(429, {"retry-after-ms": "250"})) == 0.25
+    assert retry_after_seconds(ProviderError(429, {"retry-after": "3"})) == 3.0
+    past_date = ProviderError(429, {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert retry_after_seconds(past_date) == 0.0
+    assert retry_after_seconds(ProviderError(429)) is None
+
+
+def test_provider_budget_reserves_requests_and_tokens():
+    budget = ProviderBudget("budget-test", requests_per_minute=60, tokens_per_minute=6000)
+    assert budget.tokens.reserve(6000) == 0.0
+    # The bucket refills at 100 tokens/s, so the next 50 tokens wait about half a second
+    assert budget.tokens.reserve(50) == pytest.approx(0.5, abs=0.05)
+    assert budget.requests.rate == 1.0
+
+
+def test_provider_budget_is_shared_and_keeps_the_lower_limit():
+    first = get_provider_budget("shared-test", requests_per_minute=120)
+    assert get_provider_budget("shared-test") is first
+    assert first.requests.burst == 120
+
+    again = get_provider_budget("shared-test", requests_per_minute=600, tokens_per_minute=9000)
+    assert again is first
+    assert first.requests.burst == 120
+    assert first.tokens.burst == 9000
+
+    get_provider_budget("shared-test", requests_per_minute=30)
+    assert first.requests.burst == 30
+    assert get_provider_budget("other-test").requests is None
+
+
+def test_stream_yields_chunks_and_fills_the_cache(monkeypatch, tmp_path):
+    completions = FakeCompletions()
+    client = _client(monkeypatch, completions, cache=LLMResponseCache(tmp_path / "llm.sqlite"))
+
+    async def collect(prompt):
+        return [chunk async for chunk in client.astream(prompt)]
+
+    chunks = asyncio.run(collect("streamed"))
+    assert len(chunks) > 1 and "".join(chunks) == "<streamed>"
+    assert asyncio.run(collect("streamed")) == ["<streamed>"]
+    assert asyncio.run(client.acomplete("streamed")) == "<streamed>"
+    assert len(completions.calls) == 1
+
+
+def test_async_batch_entry_points(monkeypatch, tmp_path):
+    completions = FakeCompletions(
+        delay=0.01,
+        reply=lambda prompt: '{"valid": false, "issues": ["price"], "score": 0.2}'
+        if prompt.startswith("Validate")
+        else prompt.rsplit("\n", 1)[-1].upper(),
+    )
+    client = _client(monkeypatch, completions, cache=LLMResponseCache(tmp_path / "llm.sqlite"))
+    records = [{"name": f"ibuprofeno {i % 2}", "company": "bayer", "price": 10} for i in range(6)]
+
+    translated = asyncio.run(
+        translate_records_async(records, "en", client, fields=["name", "company"])
+    )
+    assert [r["name"] for r in translated[:2]] == ["IBUPROFENO 0", "IBUPROFENO 1"]
+    assert records[0]["name"] == "ibuprofeno 0"
+    # Identical prompts are coalesced/cached: 2 names + 1 company
+    assert len(completions.calls) == 3
+
+    results = asyncio.run(
+        validate_records_with_llm_async([records[0], {"name": "x"}], ["name", "price"], client)
+    )
+    assert results[0] == {"valid": False, "issues": ["price"], "score": 0.2}
+    assert results[1]["valid"] is False and "price" in results[1]["issues"][0]
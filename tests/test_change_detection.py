@@ -0,0 +1,197 @@
+from datetime import datetime
+
+import pytest
+
+from src.engines.selenium_engine import FakeDriver
+from src.processors.change_detection import (
+    CHANGE_CHANGED,
+    CHANGE_NEW,
+    CHANGE_UNCHANGED,
+    FingerprintStore,
+    IncrementalSettings,
+    content_hash64,
+)
+from src.scrapers.alfabeta import pipeline
+from src.versioning.version_manager import build_version_info
+
+
+def _rec(url, price, run_id="r1"):
+    return {
+        "product_url": url,
+        "name": "N",
+        "price": price,
+        "run_id": run_id,
+        "_version": {"v": run_id},
+    }
+
+
+def test_content_hash_ignores_bookkeeping_fields():
+    assert content_hash64(_rec("a", 1, "r1")) == content_hash64(_rec("a", 1, "r2"))
+    assert content_hash64(_rec("a", 1)) != content_hash64(_rec("a", 2))
+
+
+def test_runs_are_classified_against_previous_snapshot(tmp_path):
+    store = FingerprintStore(tmp_path / "fp.sqlite", "src")
+    first = store.begin("r1")
+    assert first.classify([_rec("a", 1), _rec("b", 2), _rec("c", 3)]) == [CHANGE_NEW] * 3
+    assert first.commit().change_ratio == 1.0
+
+    second = store.begin("r2")
+    statuses = second.classify([_rec("a", 1, "r2"), _rec("b", 5, "r2")])
+    statuses += second.classify([_rec("d", 4, "r2"), _rec("a", 9, "r2")])
+    assert statuses == [CHANGE_UNCHANGED, CHANGE_CHANGED, CHANGE_NEW, CHANGE_UNCHANGED]
+    summary = second.commit()
+    assert (summary.new, summary.changed, summary.unchanged, summary.removed) == (1, 1, 1, 1)
+    assert summary.removed_keys == [{"product_url": "c", "name": "N"}]
+    assert summary.change_ratio == pytest.approx(0.75)
+    assert store.size() == 3
+    assert store.last_change_ratio() == pytest.approx(0.75)
+
+    third = store.begin("r3")
+    assert third.classify([_rec("b", 5), _rec("d", 4)]) == [CHANGE_UNCHANGED, CHANGE_UNCHANGED]
+
+
+def test_aborted_run_leaves_snapshot_untouched(tmp_path):
+    store = FingerprintStore(tmp_path / "fp.sqlite", "src")
+    run = store.begin("r1")
+    run.classify([_rec("a", 1)])
+    run.commit()
+
+    failed = store.begin("r2")
+    assert failed.classify([_rec("a", 2)]) == [CHANGE_CHANGED]
+    failed.abort()
+
+    retry = store.begin("r3")
+    assert retry.classify([_rec("a", 2)]) == [CHANGE_CHANGED]
+
+
+def test_removal_problem_flags_empty_and_mass_removal_runs(tmp_path):
+    store = FingerprintStore(tmp_path / "fp.sqlite", "src")
+    first = store.begin("r1")
+    first.classify([_rec(f"u{i}", i) for i in range(10)])
+    assert first.removal_problem() is None
+    first.commit()
+
+    assert "no records" in store.begin("r2").removal_problem()
+
+    partial = store.begin("r3", max_removed_ratio=0.3)
+    partial.classify([_rec(f"u{i}", i) for i in range(6)])
+    assert "4 of 10" in partial.removal_problem()
+
+    tolerated = store.begin("r4", max_removed_ratio=0.5)
+    tolerated.classify([_rec(f"u{i}", i) for i in range(6)])
+    assert tolerated.removal_problem() is None
+
+
+def test_incremental_settings_from_config():
+    assert IncrementalSettings.from_config({}).enabled
+    assert not IncrementalSettings.from_config({"incremental": False}).enabled
+    settings = IncrementalSettings.from_config(
+        {"incremental": {"key_fields": ["pcid"], "ignore_fields": [], "max_removed_ratio": 0.2}}
+    )
+    assert settings.key_fields == ("pcid",) and settings.ignore_fields == frozenset()
+    assert settings.max_removed_ratio == 0.2
+
+
+@pytest.fixture()
+def export_ctx(monkeypatch, tmp_path):
+    ctx = pipeline.PipelineContext(
+        source="alfabeta",
+        platform_config={
+            "export": {"backends": ["csv", "db", "kafka"], "kafka": {"topic": "prices"}}
+        },
+        source_config={},
+        selectors={},
+        run_id="run-1",
+        version_info=build_version_info(
+            "alfabeta", scraper_version="1.0.0", schema_version="1.0.0"
+        ),
+        driver=FakeDriver(),
+        base_url="https://example.com",
+        pcid_index={},
+        pcid_vector_store=None,
+        pcid_min_similarity=0.8,
+        baseline_rows=0,
+        run_started_at=datetime.utcnow(),
+        output_dir=tmp_path,
+    )
+    calls = {"db": [], "kafka": [], "stats": []}
+    monkeypatch.setattr(
+        pipeline.database_loader,
+        "export_records",
+        lambda recs, **kw: calls["db"].append(list(recs)),
+    )
+    monkeypatch.setattr(
+        pipeline.kafka_producer,
+        "publish_records",
+        lambda topic, msgs: calls["kafka"].append(list(msgs)),
+    )
+    monkeypatch.setattr(
+        pipeline.run_recorder, "finish_run", lambda *a, **kw: calls["stats"].append(kw["stats"])
+    )
+    monkeypatch.setattr(pipeline, "record_run_cost", lambda **kw: None)
+    return ctx, calls
+
+
+def test_export_records_sends_only_deltas(export_ctx):
+    ctx, calls = export_ctx
+    catalog = [_rec(f"u{i}", i) for i in range(20)]
+    pipeline.export_records(ctx, catalog)
+    assert len(calls["db"][0]) == 20
+
+    ctx.run_id = "run-2"
+    catalog = [_rec(f"u{i}", i, "run-2") for i in range(1, 20)]
+    catalog[0]["price"] = 99
+    out = pipeline.export_records(ctx, catalog)
+
+    assert [r["product_url"] for r in calls["db"][1]] == ["u1"]
+    assert [m["_change"] for m in calls["kafka"][1]] == [CHANGE_CHANGED]
+    assert calls["kafka"][2] == [
+        {
+            "product_url": "u0",
+            "name": "N",
+            "source": "alfabeta",
+            "run_id": "run-2",
+            "_change": "removed",
+        }
+    ]
+    assert calls["stats"][1]["change_ratio"] == pytest.approx(2 / 20)
+    # The daily CSV is still the full snapshot
+    assert len(out.read_text(encoding="utf-8").strip().splitlines()) == 1 + 19
+
+
+def test_chunked_export_classifies_across_chunks(export_ctx):
+    ctx, calls = export_ctx
+    pipeline.export_records(ctx, [_rec("a", 1), _rec("b", 2)])
+
+    ctx.run_id = "run-2"
+    exporter = pipeline.ChunkedExport(ctx)
+    exporter.write([_rec("a", 1, "run-2")])
+    exporter.write([_rec("c", 3, "run-2")])
+    exporter.close()
+
+    assert [[r["product_url"] for r in batch] for batch in calls["db"][1:]] == [["c"]]
+    assert calls["stats"][-1]["removed"] == 1
+
+
+@pytest.mark.parametrize("broken_run", [[], [_rec("u0", 0, "run-2")]])
+def test_broken_run_keeps_previous_snapshot(export_ctx, broken_run):
+    ctx, calls = export_ctx
+    pipeline.export_records(ctx, [_rec(f"u{i}", i) for i in range(100)])
+
+    ctx.run_id = "run-2"
+    pipeline.export_records(ctx, broken_run)
+    ctx.run_id = "run-3"
+    exporter = pipeline.ChunkedExport(ctx)
+    exporter.write(broken_run)
+    exporter.close()
+
+    # No removal events, and the snapshot still knows every key
+    assert not any(m.get("_change") == "removed" for batch in calls["kafka"] for m in batch)
+    store = FingerprintStore(ctx.output_dir / "alfabeta" / "fingerprints.sqlite", "alfabeta")
+    assert store.size() == 100
+
+    ctx.run_id = "run-4"
+    calls["db"].clear()
+    pipeline.export_records(ctx, [_rec(f"u{i}", i, "run-4") for i in range(100)])
+    assert calls["db"] == []
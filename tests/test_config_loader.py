@@ -267,3 +267,84 @@ def test_load_source_config_missing_file(tmp_path):
     config_dir = tmp_path / "config"
     with pytest.raises(FileNotFoundError):
         config_loader.load_source_config("alfabeta", config_dir=config_dir)
+
+
+def _write_source(config_dir, name, engine="selenium"):
+    sources_dir = config_dir / "sources"
+    sources_dir.mkdir(parents=True, exist_ok=True)
+    path = sources_dir / f"{name}.yaml"
+    path.write_text(f"source: {name}\nengine: {engine}\nurls: [a, b]\n", encoding="utf-8")
+    return path
+
+
+def test_source_config_is_cached_until_file_changes(tmp_path):
+    import os
+
+    config_dir = tmp_path / "config"
+    path = _write_source(config_dir, "alfabeta")
+
+    first = config_loader.load_source_config("alfabeta", config_dir=config_dir)
+    assert config_loader.load_source_config("alfabeta", config_dir=config_dir) is first
+
+    path.write_text("source: alfabeta\nengine: playwright\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = config_loader.load_source_config("alfabeta", config_dir=config_dir)
+    assert reloaded is not first
+    assert reloaded["engine"] == "playwright"
+
+
+def test_loaded_configs_are_read_only(tmp_path):
+    import copy
+    import pickle
+
+    import yaml
+
+    config_dir = tmp_path / "config"
+    _write_source(config_dir, "alfabeta")
+    cfg = config_loader.load_source_config("alfabeta", config_dir=config_dir)
+
+    assert isinstance(cfg, dict) and isinstance(cfg["urls"], list)
+    with pytest.raises(TypeError):
+        cfg["engine"] = "other"
+    with pytest.raises(TypeError):
+        cfg.setdefault("new", 1)
+    with pytest.raises(TypeError):
+        cfg["urls"].append("c")
+    assert copy.deepcopy(cfg) is cfg
+
+    mutable = config_loader.thaw(cfg)
+    mutable["urls"].append("c")
+    assert cfg["urls"] == ["a", "b"]
+    assert pickle.loads(pickle.dumps(cfg)) == cfg
+    assert yaml.safe_load(yaml.safe_dump(cfg)) == config_loader.thaw(cfg)
+
+
+def test_merged_config_is_cached_per_environment(tmp_path, monkeypatch):
+    monkeypatch.delenv("SCRAPER_PLATFORM_ENV", raising=False)
+    monkeypatch.delenv("SCRAPER_ENV", raising=False)
+    monkeypatch.delenv("ENV", raising=False)
+    config_dir = tmp_path / "config"
+    env_dir = config_dir / "env"
+    env_dir.mkdir(parents=True)
+    (config_dir / "settings.yaml").write_text(
+        "app: {name: t, environment: dev}\nlogging: {level: INFO}\nscraping: {max_retries: 3}\n",
+        encoding="utf-8",
+    )
+    (env_dir / "dev.yaml").write_text("logging: {level: DEBUG}\n", encoding="utf-8")
+    (env_dir / "prod.yaml").write_text("logging: {level: WARNING}\n", encoding="utf-8")
+
+    dev = config_loader.load_config(config_dir=config_dir)
+    prod = config_loader.load_config(env="prod", config_dir=config_dir)
+
+    assert config_loader.load_config(config_dir=config_dir) is dev
+    assert (dev["logging"]["level"], prod["logging"]["level"]) == ("DEBUG", "WARNING")
+
+
+def test_prewarm_loads_valid_sources_and_skips_invalid(tmp_path):
+    config_dir = tmp_path / "config"
+    _write_source(config_dir, "alfabeta")
+    _write_source(config_dir, "lafa")
+    (config_dir / "sources" / "broken.yaml").write_text("source: broken\n", encoding="utf-8")
+
+    assert config_loader.prewarm(config_dir=config_dir) == ["alfabeta", "lafa"]
@@ -0,0 +1,191 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from psycopg2 import extensions
+
+from src.common import db
+from src.common.db import ConnectionPool, PoolTimeout
+from src.observability import metrics
+
+
+class FakeConn:
+    def __init__(self):
+        self.closed = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self.broken = False
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+        self.info = self
+
+    @property
+    def transaction_status(self):
+        return self.status
+
+    def cursor(self, *args, **kwargs):
+        conn = self
+
+        class _Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, *args):
+                if conn.broken:
+                    raise RuntimeError("server closed the connection unexpectedly")
+                conn.status = extensions.TRANSACTION_STATUS_INTRANS
+
+        return _Cursor()
+
+    def commit(self):
+        self.commits += 1
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+def _pool(**kwargs):
+    created = []
+
+    def connect(_dsn):
+        conn = FakeConn()
+        created.append(conn)
+        return conn
+
+    kwargs.setdefault("name", "test")
+    return ConnectionPool("postgresql://test", connect=connect, **kwargs), created
+
+
+def _gauge(name, pool="test"):
+    for sample in metrics.dump_metrics()["gauges"]:
+        if sample.name == name and sample.labels == {"pool": pool}:
+            return sample.value
+    return None
+
+
+def test_pool_runs_transactions_concurrently_up_to_max_size():
+    pool, created = _pool(max_size=3, timeout=5)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def work():
+        with pool.connection() as conn:
+            with lock:
+                active.append(conn)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(conn)
+
+    threads = [threading.Thread(target=work) for _ in range(9)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 3
+    assert len(created) == 3  # connections are reused, not reopened
+    assert pool.stats()["in_use"] == 0
+    assert _gauge("db.pool.utilization") == 0.0
+
+
+def test_pool_checkout_times_out_when_exhausted():
+    pool, _ = _pool(max_size=1, timeout=0.05)
+    held = pool.getconn()
+    with pytest.raises(PoolTimeout):
+        pool.getconn()
+    assert _gauge("db.pool.utilization") == 1.0
+    pool.putconn(held)
+    assert pool.getconn() is held
+
+
+def test_failed_transaction_only_discards_its_connection(monkeypatch):
+    pool, created = _pool(max_size=2)
+    monkeypatch.setattr(db, "get_pool", lambda: pool)
+
+    with db.transaction() as healthy:
+        with healthy.cursor() as cur:
+            cur.execute("SELECT 1")
+    assert healthy.commits == 1
+
+    with pytest.raises(ValueError):
+        with db.transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute("INSERT ...")
+            raise ValueError("bad row")
+    assert conn is healthy and conn.rollbacks == 1 and not conn.closed
+
+    # A connection that died mid-transaction is dropped and replaced
+    with pytest.raises(RuntimeError):
+        with db.transaction() as conn:
+            conn.closed = 2
+            raise RuntimeError("connection lost")
+    with db.transaction() as replacement:
+        pass
+    assert replacement is not healthy
+    assert len(created) == 2
+    assert pool.stats()["size"] == 1
+
+
+def test_idle_connections_are_health_checked_before_reuse():
+    pool, created = _pool(max_size=2, health_check_interval=0)
+    first = pool.getconn()
+    pool.putconn(first)
+    first.broken = True
+
+    conn = pool.getconn()
+    assert conn is not first and first.closed
+    assert len(created) == 2
+
+
+def test_connections_left_in_transaction_are_rolled_back_on_return():
+    pool, _ = _pool(max_size=1)
+    conn = pool.getconn()
+    with conn.cursor() as cur:
+        cur.execute("SELECT 1")
+    pool.putconn(conn)
+    assert conn.rollbacks == 1
+    assert pool.getconn() is conn
+
+
+def test_idle_connections_above_min_size_are_trimmed():
+    pool, _ = _pool(min_size=1, max_size=3, max_idle=0)
+    conns = [pool.getconn() for _ in range(3)]
+    for conn in conns:
+        pool.putconn(conn)
+    assert pool.stats()["idle"] == 3
+
+    kept = pool.getconn()
+    assert pool.stats()["size"] == 1
+    assert sum(1 for conn in conns if conn.closed) == 2 and not kept.closed
+
+
+def test_transaction_async_runs_off_the_event_loop(monkeypatch):
+    pool, _ = _pool(max_size=2)
+    monkeypatch.setattr(db, "get_pool", lambda: pool)
+    monkeypatch.setattr(db, "_EXECUTOR", None)
+    loop_thread = threading.get_ident()
+
+    def work(conn):
+        assert threading.get_ident() != loop_thread
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        return conn
+
+    async def main():
+        return await asyncio.gather(*(db.transaction_async(work) for _ in range(4)))
+
+    results = asyncio.run(main())
+    assert all(conn.commits for conn in results)
+    assert pool.stats()["in_use"] == 0
+    db._EXECUTOR.shutdown(wait=True)
+    monkeypatch.setattr(db, "_EXECUTOR", None)
@@ -0,0 +1,133 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.observability import metrics
+from src.processors.llm import llm_cache
+from src.processors.llm.llm_cache import LLMResponseCache, cache_from_config, cache_key
+from src.processors.llm.llm_client import LLMClient
+
+
+class FakeCompletions:
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def create(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs)
+        time.sleep(self.delay)
+        content = f"answer to {kwargs['messages'][-1]['content']}"
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def _client(monkeypatch, cache, delay=0.0):
+    completions = FakeCompletions(delay)
+    builds = []
+
+    def build(self):
+        builds.append(self)
+        return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    monkeypatch.setattr(LLMClient, "_build_client", build)
+    client = LLMClient(provider="openai", model="gpt-test", api_key="sk-test", cache=cache)
+    return client, completions, builds
+
+
+def _gauge(name, path):
+    for sample in metrics.dump_metrics()["gauges"]:
+        if sample.name == name and sample.labels == {"path": str(path)}:
+            return sample.value
+    return None
+
+
+def test_identical_requests_are_served_from_disk_across_restarts(monkeypatch, tmp_path):
+    path = tmp_path / "llm.sqlite"
+    client, completions, builds = _client(monkeypatch, LLMResponseCache(path))
+
+    first = client.complete("normalize ACME S.A.", system_prompt="sys")
+    assert client.complete("normalize ACME S.A.", system_prompt="sys") == first
+    assert len(completions.calls) == 1
+
+    # Anything that changes the output changes the key
+    client.complete("normalize ACME S.A.", system_prompt="sys", temperature=0.7)
+    client.complete("normalize ACME S.A.", system_prompt="other")
+    assert len(completions.calls) == 3
+    assert len(builds) == 1  # the provider client is reused
+
+    client.cache.close()
+    restarted, completions, _ = _client(monkeypatch, LLMResponseCache(path))
+    assert restarted.complete("normalize ACME S.A.", system_prompt="sys") == first
+    assert completions.calls == []
+    assert restarted.cache.hit_rate() == 1.0
+    assert _gauge("llm.cache.hit_rate", path) == 1.0
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite", ttl_seconds=0.05)
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+    time.sleep(0.1)
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(monkeypatch, tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite", max_entries=2)
+    clock = iter(range(1000, 2000, 100))
+    monkeypatch.setattr(llm_cache.time, "time", lambda: float(next(clock)))
+
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"  # touched: "b" is now the oldest
+    cache.set("c", "3")
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "1" and cache.get("c") == "3"
+
+
+def test_concurrent_identical_requests_are_coalesced(monkeypatch, tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite")
+    client, completions, _ = _client(monkeypatch, cache, delay=0.1)
+    results = []
+
+    def work():
+        results.append(client.complete("same prompt"))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(completions.calls) == 1
+    assert len(set(results)) == 1 and len(results) == 8
+    assert client.cache.misses == 1 and client.cache.hits + client.cache.coalesced == 7
+
+
+def test_failures_reach_every_waiter_and_are_not_cached(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite")
+    key = cache_key(provider="openai", model="m", system_prompt=None, prompt="p", temperature=0.0)
+
+    def boom():
+        raise RuntimeError("rate limited")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute(key, boom)
+    assert cache.get(key) is None
+    assert cache.get_or_compute(key, lambda: "ok") == "ok"
+
+
+def test_cache_from_config_respects_opt_out(monkeypatch, tmp_path):
+    path = tmp_path / "cfg.sqlite"
+    assert cache_from_config({"cache": False}) is None
+    assert cache_from_config({"cache": {"enabled": False}}) is None
+    enabled = cache_from_config({"cache": {"path": str(path), "ttl_seconds": 60}})
+    assert enabled is not None and enabled.path == path and enabled.ttl_seconds == 60
+    assert cache_from_config({"cache": {"path": str(path), "ttl_seconds": 60}}) is enabled
+    monkeypatch.setenv("LLM_CACHE_DISABLED", "1")
+    assert cache_from_config({"cache": {"path": str(path)}}) is None
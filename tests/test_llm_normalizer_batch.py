@@ -0,0 +1,166 @@
+import json
+import threading
+import time
+
+from src.processors.llm import llm_normalizer
+from src.processors.llm.llm_normalizer import (
+    BatchSettings,
+    normalize_records_batch,
+    pack_batches,
+    process_llm_normalization,
+)
+
+
+class FakeLLM:
+    """Upper-cases values; batch prompts get a JSON array back."""
+
+    max_tokens = 2048
+
+    def __init__(self, delay=0.0, broken_batches=False, down=False):
+        self.delay = delay
+        self.broken_batches = broken_batches
+        self.down = down
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def complete(self, prompt, system_prompt=None, **_):
+        with self._lock:
+            self.calls.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.down:
+                raise ConnectionError("provider unavailable")
+            if "values:\n" in prompt:
+                if self.broken_batches:
+                    return "Sure! Here are the normalized values."
+                values = json.loads(prompt.split("values:\n", 1)[1])
+                return "```json\n" + json.dumps([v.upper() for v in values]) + "\n```"
+            return prompt.rsplit(": ", 1)[1].upper()
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _records(n):
+    return [
+        {
+            "name": f"drug {i % 10}",
+            "manufacturer": f"lab {i % 3}",
+            "marketer": f"lab {i % 3}",
+            "price": i,
+        }
+        for i in range(n)
+    ]
+
+
+def test_distinct_values_are_deduplicated_and_mapped_back():
+    llm = FakeLLM()
+    records = _records(300)
+    out = normalize_records_batch(
+        records,
+        ["name", "manufacturer", "marketer"],
+        llm,
+        field_types={"manufacturer": "company", "marketer": "company"},
+    )
+
+    # 10 distinct names + 3 distinct companies shared by two fields -> one call per field type
+    assert len(llm.calls) == 2
+    assert out[7] == {"name": "DRUG 7", "manufacturer": "LAB 1", "marketer": "LAB 1", "price": 7}
+    assert records[7]["name"] == "drug 7"  # inputs are not mutated
+
+
+def test_batches_respect_token_budget_and_in_flight_limit():
+    packed = pack_batches(["a" * 40] * 5, token_budget=30, max_values=100)
+    assert packed == [["a" * 40] * 2] * 2 + [["a" * 40]]
+    assert [len(b) for b in pack_batches(["x"] * 5, token_budget=1000, max_values=2)] == [2, 2, 1]
+    assert pack_batches(["y" * 400], token_budget=10, max_values=10) == [["y" * 400]]
+
+    llm = FakeLLM(delay=0.05)
+    settings = BatchSettings(token_budget=20, max_in_flight=3)
+    records = [{"name": f"value {i:03d}"} for i in range(60)]
+    out = normalize_records_batch(records, ["name"], llm, settings=settings)
+
+    assert len(llm.calls) > 3
+    assert llm.peak == 3
+    assert [r["name"] for r in out] == [f"VALUE {i:03d}" for i in range(60)]
+
+
+def test_unparseable_batch_falls_back_per_value(monkeypatch):
+    fallbacks = []
+    original = llm_normalizer.normalize_field_with_llm
+
+    def spy(value, *args, **kwargs):
+        fallbacks.append(value)
+        return original(value, *args, **kwargs)
+
+    monkeypatch.setattr(llm_normalizer, "normalize_field_with_llm", spy)
+    llm = FakeLLM(broken_batches=True)
+    out = normalize_records_batch(_records(20), ["manufacturer"], llm)
+
+    assert sorted(fallbacks) == ["lab 0", "lab 1", "lab 2"]
+    assert {r["manufacturer"] for r in out} == {"LAB 0", "LAB 1", "LAB 2"}
+
+
+def test_failed_batch_call_keeps_originals_without_per_value_calls():
+    llm = FakeLLM(down=True)
+    records = _records(20)
+
+    out = normalize_records_batch(records, ["manufacturer"], llm)
+
+    assert len(llm.calls) == 1
+    assert out == records
+
+
+def test_process_llm_normalization_streams_slices(monkeypatch):
+    llm = FakeLLM()
+    monkeypatch.setattr(llm_normalizer, "get_llm_client_from_config", lambda _cfg: llm)
+    config = {
+        "llm": {
+            "enabled": True,
+            "normalize_fields": ["name"],
+            "normalize_batch": {"records_per_slice": 100},
+        }
+    }
+
+    out = list(process_llm_normalization(iter(_records(250)), config))
+
+    assert len(out) == 250 and out[249]["name"] == "DRUG 9"
+    assert len(llm.calls) == 3  # one batch per slice
+
+    config["llm"]["normalize_batch"] = False
+    llm.calls.clear()
+    list(process_llm_normalization(_records(5), config))
+    assert len(llm.calls) == 5
+
+
+def test_failed_slice_yields_originals_and_stream_continues(monkeypatch):
+    llm = FakeLLM()
+    monkeypatch.setattr(llm_normalizer, "get_llm_client_from_config", lambda _cfg: llm)
+    original = llm_normalizer.normalize_records_batch
+    calls = []
+
+    def flaky(chunk, *args, **kwargs):
+        calls.append(len(chunk))
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return original(chunk, *args, **kwargs)
+
+    monkeypatch.setattr(llm_normalizer, "normalize_records_batch", flaky)
+    config = {
+        "llm": {
+            "enabled": True,
+            "normalize_fields": ["name"],
+            "normalize_batch": {"records_per_slice": 10},
+        }
+    }
+    records = _records(20)
+
+    out = list(process_llm_normalization(iter(records), config))
+
+    assert calls == [10, 10]
+    assert out[:10] == records[:10]
+    assert out[19]["name"] == "DRUG 9"
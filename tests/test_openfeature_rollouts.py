@@ -2,7 +2,7 @@ import os
 
 import pytest
 
-from src.governance.openfeature import is_enabled, override_flags
+from src.governance.openfeature import FeatureFlagClient, is_enabled, override_flags
 from src.governance.openfeature_flags import FEATURE_FLAGS, FeatureFlag
 from src.governance.rollout_strategies import AttributeEqualsStrategy, EnvironmentMatchStrategy, PercentageRollout
 
@@ -84,3 +84,69 @@ def test_env_overrides_apply():
         os.environ["FEATURE_FLAGS"] = original
     else:
         os.environ.pop("FEATURE_FLAGS", None)
+
+
+def test_compiled_flag_matches_evaluate():
+    flag = FeatureFlag(
+        key="example.compiled",
+        default=True,
+        strategies=[
+            EnvironmentMatchStrategy(allowed=("prod",)),
+            AttributeEqualsStrategy(key="tenant", expected_value="beta"),
+            PercentageRollout(percentage=30.0),
+        ],
+    )
+    predicate = flag.compile()
+    contexts = [None, {}, {"env": "prod"}, {"env": "qa"}, {"tenant": "beta"}, {"tenant": None}]
+    contexts += [{"actor_id": f"actor-{i}"} for i in range(200)]
+
+    assert [predicate(ctx) for ctx in contexts] == [flag.evaluate(ctx) for ctx in contexts]
+
+
+def test_snapshot_precedence_and_evaluate_many(tmp_path):
+    flags_file = tmp_path / "flags.json"
+    flags_file.write_text('{"example.plain": false, "example.rollout": true}')
+    catalog = {
+        "example.plain": FeatureFlag(key="example.plain", default=True),
+        "example.rollout": FeatureFlag(
+            key="example.rollout", strategies=[PercentageRollout(percentage=50.0)]
+        ),
+        "example.env": FeatureFlag(
+            key="example.env", strategies=[EnvironmentMatchStrategy(allowed=("qa",))]
+        ),
+    }
+    client = FeatureFlagClient(catalog, overrides_file=str(flags_file))
+
+    assert client.is_enabled("example.plain", default=True) is False
+    assert client.is_enabled("example.rollout", context={"actor_id": "actor-5"}) is True
+    client.set_overrides({"example.plain": True})
+    assert client.is_enabled("example.plain") is True
+
+    contexts = [{"env": "qa"}, {"env": "prod"}, None]
+    assert client.evaluate_many(["example.env", "example.plain", "missing"], contexts) == {
+        "example.env": [True, False, False],
+        "example.plain": [True, True, True],
+        "missing": [False, False, False],
+    }
+
+
+def test_snapshot_rebuilds_on_env_and_file_changes(tmp_path, monkeypatch):
+    flags_file = tmp_path / "flags.json"
+    flags_file.write_text('{"example.plain": true}')
+    client = FeatureFlagClient(
+        {"example.plain": FeatureFlag(key="example.plain")},
+        overrides_file=str(flags_file),
+        file_check_interval=0,
+    )
+    first = client.snapshot()
+    assert first.is_enabled("example.plain") is True
+    assert client.snapshot() is first  # nothing changed: same snapshot
+
+    flags_file.write_text('{"example.plain": false}')
+    os.utime(flags_file, (first.version + 10, first.version + 10))
+    assert client.is_enabled("example.plain") is False
+
+    monkeypatch.setenv("FEATURE_FLAGS", '{"example.plain": true}')
+    assert client.is_enabled("example.plain") is True
+    monkeypatch.setenv("FEATURE_FLAGS", "not json")
+    assert client.is_enabled("example.plain") is False
@@ -0,0 +1,134 @@
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.processors.pdf.pdf_fetcher import PDFFetcher, process_pdf_urls
+
+DOC_A = b"%PDF-1.4 price list A " + b"x" * 200_000
+DOC_B = b"%PDF-1.4 price list B " + b"y" * 50_000
+
+
+class _Handler(BaseHTTPRequestHandler):
+    files = {}
+    requests = []
+    cut_after = None  # bytes sent before dropping the connection once
+    delay = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body, etag = self.files[self.path]
+        self.requests.append((self.path, dict(self.headers)))
+        time.sleep(self.delay)
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range") == etag:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        payload = body[start:]
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        cut = type(self).cut_after
+        if cut is not None:
+            type(self).cut_after = None
+            self.wfile.write(payload[:cut])
+            self.wfile.flush()
+            self.connection.shutdown(2)
+            return
+        self.wfile.write(payload)
+
+
+@pytest.fixture()
+def server():
+    _Handler.files = {
+        "/a.pdf": (DOC_A, '"etag-a"'),
+        "/mirror/a.pdf": (DOC_A, '"etag-a2"'),
+        "/b.pdf": (DOC_B, '"etag-b"'),
+    }
+    _Handler.requests = []
+    _Handler.cut_after = None
+    _Handler.delay = 0.0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+def test_same_content_behind_two_urls_is_stored_once(server, tmp_path):
+    with PDFFetcher(tmp_path, max_workers=4) as fetcher:
+        a = fetcher.fetch(f"{server}/a.pdf")
+        mirror = fetcher.fetch(f"{server}/mirror/a.pdf")
+        again = fetcher.fetch(f"{server}/a.pdf")
+
+    assert a["pdf_id"] == mirror["pdf_id"] == f"PDF-{hashlib.sha256(DOC_A).hexdigest()[:16]}"
+    assert a["pdf_path"] == mirror["pdf_path"] == again["pdf_path"]
+    assert sorted(p.name for p in tmp_path.glob("*.pdf")) == [a["pdf_id"] + ".pdf"]
+    assert len(_Handler.requests) == 2  # the third call is served from the index
+    assert not list((tmp_path / ".partial").iterdir())
+
+
+def test_interrupted_download_resumes_with_range(server, tmp_path):
+    _Handler.cut_after = 120_000
+    with PDFFetcher(tmp_path) as fetcher:
+        with pytest.raises(Exception):
+            fetcher.fetch(f"{server}/a.pdf")
+        assert list((tmp_path / ".partial").glob("*.part"))
+        info = fetcher.fetch(f"{server}/a.pdf")
+
+    assert (tmp_path / f"{info['pdf_id']}.pdf").read_bytes() == DOC_A
+    _, headers = _Handler.requests[-1]
+    # Whatever reached the partial file before the cut is not downloaded again
+    resumed_from = int(headers["Range"].split("=")[1].rstrip("-"))
+    assert 0 < resumed_from <= 120_000 and headers["If-Range"] == '"etag-a"'
+
+
+def test_changed_document_is_not_spliced_onto_a_partial(server, tmp_path):
+    _Handler.cut_after = 1000
+    with PDFFetcher(tmp_path) as fetcher:
+        with pytest.raises(Exception):
+            fetcher.fetch(f"{server}/b.pdf")
+        _Handler.files["/b.pdf"] = (DOC_A, '"etag-b2"')
+        info = fetcher.fetch(f"{server}/b.pdf")
+    assert (tmp_path / f"{info['pdf_id']}.pdf").read_bytes() == DOC_A
+
+
+def test_revalidation_uses_etag(server, tmp_path):
+    with PDFFetcher(tmp_path) as fetcher:
+        first = fetcher.fetch(f"{server}/b.pdf")
+    with PDFFetcher(tmp_path, revalidate=True) as fetcher:
+        second = fetcher.fetch(f"{server}/b.pdf")
+    assert second["pdf_path"] == first["pdf_path"]
+    assert _Handler.requests[-1][1]["If-None-Match"] == '"etag-b"'
+
+
+def test_process_pdf_urls_downloads_concurrently_in_order(server, tmp_path):
+    _Handler.delay = 0.2
+    names = ["a.pdf", "b.pdf", "mirror/a.pdf"]
+    records = [{"pdf_url": f"{server}/{name}", "idx": idx} for idx, name in enumerate(names)]
+    records.insert(1, {"idx": "no-url"})
+    records.append({"pdf_url": f"{server}/missing.pdf", "idx": "missing"})
+
+    started = time.perf_counter()
+    with PDFFetcher(tmp_path, max_workers=4) as fetcher:
+        out = list(process_pdf_urls(records, fetcher=fetcher))
+    elapsed = time.perf_counter() - started
+
+    assert [r["idx"] for r in out] == [0, "no-url", 1, 2, "missing"]
+    assert out[0]["pdf_sha256"] == out[3]["pdf_sha256"] == hashlib.sha256(DOC_A).hexdigest()
+    assert out[2]["pdf_size_bytes"] == len(DOC_B)
+    assert "pdf_path" not in out[1] and "pdf_path" not in out[4]
+    assert elapsed < 0.6  # four 0.2s requests overlap
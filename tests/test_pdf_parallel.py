@@ -0,0 +1,154 @@
+import hashlib
+import sys
+import textwrap
+
+import pytest
+
+from src.processors.pdf import pdf_parallel
+from src.processors.pdf.pdf_parallel import (
+    ParallelPDFExtractor,
+    PDFExtractionCache,
+    PDFExtractionSettings,
+)
+from src.processors.pdf.pdf_text_extractor import extract_pdf_text_classic, process_pdf_extraction
+
+# Stand-in for PyMuPDF: a "PDF" is a text file with pages separated by form
+# feeds. Pages containing "[grid]" have ruling lines; "a|b" lines are table rows.
+FAKE_FITZ = '''
+import builtins
+
+
+class _Table:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def extract(self):
+        return self.rows
+
+
+class _Page:
+    def __init__(self, text):
+        self.text = text
+
+    def get_text(self):
+        return self.text
+
+    def get_drawings(self):
+        if "[grid]" in self.text:
+            return [{"items": [("l", 0, 0), ("l", 0, 1), ("re", 0)]}]
+        return [{"items": [("c", 0)]}]
+
+    def find_tables(self):
+        rows = [line.split("|") for line in self.text.splitlines() if "|" in line]
+        return [_Table(rows)] if rows else []
+
+
+class _Document(list):
+    def close(self):
+        pass
+
+
+def open(path):
+    with builtins.open(path, encoding="utf-8") as fh:
+        return _Document(_Page(text) for text in fh.read().split("\\f"))
+'''
+
+
+@pytest.fixture()
+def fake_fitz(tmp_path, monkeypatch):
+    module_dir = tmp_path / "fake_libs"
+    module_dir.mkdir()
+    (module_dir / "fitz.py").write_text(textwrap.dedent(FAKE_FITZ), encoding="utf-8")
+    monkeypatch.syspath_prepend(str(module_dir))
+    monkeypatch.delitem(sys.modules, "fitz", raising=False)
+    yield
+    sys.modules.pop("fitz", None)
+
+
+def _write_pdf(path, pages):
+    texts = []
+    for idx in range(pages):
+        if idx % 5 == 0:
+            texts.append(f"[grid] page {idx + 1}\ndrug|price\nibuprofeno|{idx}")
+        else:
+            texts.append(f"page {idx + 1}\nnot|a table without ruling")
+    path.write_text("\f".join(texts), encoding="utf-8")
+    return path
+
+
+def _settings(tmp_path, **kwargs):
+    kwargs.setdefault("cache_dir", tmp_path / "cache")
+    return PDFExtractionSettings(**kwargs)
+
+
+def test_sharded_extraction_matches_sequential_and_skips_unruled_pages(fake_fitz, tmp_path):
+    pdf = _write_pdf(tmp_path / "price-list.pdf", 40)
+    sequential = extract_pdf_text_classic(pdf)
+
+    assert sequential["page_count"] == 40
+    assert sequential["table_pages_scanned"] == 8
+    assert [t["page"] for t in sequential["raw_tables"]] == list(range(1, 41, 5))
+
+    settings = _settings(tmp_path, workers=3, pages_per_task=7, cache=False)
+    with ParallelPDFExtractor(settings) as extractor:
+        assert extractor.extract(pdf) == sequential
+        pages = list(extractor.iter_pages(pdf))
+    assert sorted(page["page"] for page in pages) == list(range(1, 41))
+
+
+def test_records_keep_input_order_and_report_errors(fake_fitz, tmp_path):
+    records = [
+        {"pdf_path": str(_write_pdf(tmp_path / f"doc{idx}.pdf", 3 + idx)), "pdf_id": f"PDF-{idx}"}
+        for idx in range(6)
+    ]
+    records.insert(2, {"name": "no pdf"})
+    records.insert(4, {"pdf_path": str(tmp_path / "missing.pdf")})
+
+    with ParallelPDFExtractor(_settings(tmp_path, workers=2, pages_per_task=2)) as extractor:
+        results = list(extractor.extract_records(records))
+
+    assert [record for record, _, _ in results] == records
+    assert results[2][1:] == (None, None)
+    assert isinstance(results[4][2], FileNotFoundError)
+    page_counts = [extracted["page_count"] for _, extracted, error in results if extracted]
+    assert page_counts == [3, 4, 5, 6, 7, 8]
+
+
+def test_extractions_are_cached_by_pdf_id_and_content(fake_fitz, tmp_path, monkeypatch):
+    pdf = _write_pdf(tmp_path / "cached.pdf", 6)
+    config = {"pdf_extraction": {"workers": 1, "cache_dir": str(tmp_path / "cache")}}
+
+    first = list(process_pdf_extraction([{"pdf_path": str(pdf), "pdf_id": "PDF-abc"}], config))
+    assert first[0]["pdf_page_count"] == 6
+    assert len(list((tmp_path / "cache").glob("PDF-abc-*.json"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached documents must not be re-extracted")
+
+    monkeypatch.setattr(pdf_parallel, "extract_pdf_pages", fail)
+    second = list(process_pdf_extraction([{"pdf_path": str(pdf), "pdf_id": "PDF-abc"}], config))
+    assert second[0]["pdf_pages"] == first[0]["pdf_pages"]
+
+    # Same pdf_id (same URL) but new content must be extracted again
+    _write_pdf(pdf, 7)
+    third = list(process_pdf_extraction([{"pdf_path": str(pdf), "pdf_id": "PDF-abc"}], config))
+    assert "pdf_pages" not in third[0]
+
+
+def test_cache_key_uses_the_fetcher_content_hash(tmp_path):
+    pdf = _write_pdf(tmp_path / "fetched.pdf", 2)
+    sha = hashlib.sha256(pdf.read_bytes()).hexdigest()
+
+    hashed = PDFExtractionCache.key(pdf, "PDF-abc")
+    # With the fetcher's hash the file is never opened
+    assert PDFExtractionCache.key(tmp_path / "gone.pdf", "PDF-abc", content_sha256=sha) == hashed
+    assert PDFExtractionCache.key(pdf, "PDF-abc", content_sha256="0" * 64) != hashed
+
+
+def test_settings_from_config(monkeypatch):
+    settings = PDFExtractionSettings.from_config(
+        {"pdf_extraction": {"workers": 3, "pages_per_task": 0}}
+    )
+    assert settings.workers == 3 and settings.pages_per_task == 1
+    monkeypatch.setenv("PDF_WORKERS", "5")
+    assert PDFExtractionSettings.from_config({}).workers == 5
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from src.observability import metrics
+from src.processors.exporters import database_loader
+from src.processors.exporters.pg_copy_loader import PostgresCopyLoader, copy_value, quote_table
+
+
+class FakeCursor:
+    def __init__(self, conn: "FakeConnection"):
+        self.conn = conn
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        self.conn.statements.append(sql)
+        self.conn.params.append(params)
+
+    def fetchall(self) -> List[Any]:
+        # (name, has_default); plain names have no default
+        return [(col, False) if isinstance(col, str) else col for col in self.conn.table_columns]
+
+    def copy_expert(self, sql: str, stream: Any, size: int = 8192) -> None:
+        self.conn.statements.append(sql)
+        chunks = []
+        while True:
+            chunk = stream.read(size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        self.conn.copies.append(b"".join(chunks).decode("utf-8"))
+
+
+class FakeConnection:
+    def __init__(self, table_columns: Any = ("sku", "price")) -> None:
+        self.table_columns = list(table_columns)
+        self.statements: List[str] = []
+        self.params: List[Any] = []
+        self.copies: List[str] = []
+        self.committed = False
+        self.rolled_back = False
+        self.closed = False
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def commit(self) -> None:
+        self.committed = True
+
+    def rollback(self) -> None:
+        self.rolled_back = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _rows(n: int) -> Iterator[Dict[str, Any]]:
+    for i in range(n):
+        yield {"sku": f"S{i}", "price": i * 1.5}
+
+
+def test_copy_value_encoding():
+    assert copy_value(None) == "\\N"
+    assert copy_value(True) == "t"
+    assert copy_value(3) == "3"
+    assert copy_value("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+    assert copy_value({"k": "v\t"}) == '{"k": "v\\\\t"}'
+
+
+def test_quote_table_rejects_unsafe_names():
+    assert quote_table("public.products") == '"public"."products"'
+    with pytest.raises(RuntimeError):
+        quote_table("products; DROP TABLE x")
+
+
+def test_load_streams_batches_from_generator():
+    conn = FakeConnection()
+    loader = PostgresCopyLoader("products", connection=conn, batch_rows=4)
+
+    stats = loader.load(_rows(10))
+
+    assert stats.rows == 10
+    assert stats.batches == 3
+    assert [copy.count("\n") for copy in conn.copies] == [4, 4, 2]
+    assert conn.copies[0].splitlines()[1] == "S1\t1.5"
+    assert conn.committed and not conn.closed  # caller-owned connection stays open
+    assert "information_schema.columns" in conn.statements[0]
+    assert conn.params[0] == (None, "products")
+    assert conn.statements[1].startswith(
+        'CREATE TEMP TABLE _copy_stage ON COMMIT DROP AS SELECT "sku", "price" FROM "products"'
+    )
+    inserts = [s for s in conn.statements if s.startswith("INSERT")]
+    insert = 'INSERT INTO "products" ("sku", "price") SELECT "sku", "price" FROM _copy_stage'
+    assert inserts == [insert] * 3
+
+
+def test_columns_come_from_target_table_not_first_row():
+    conn = FakeConnection(table_columns=["sku", "pcid", "price"])
+    loader = PostgresCopyLoader("public.products", connection=conn)
+
+    loader.load([{"sku": "A", "price": 1}, {"sku": "B", "pcid": "P1", "price": 2}])
+
+    assert conn.params[0] == ("public", "products")
+    assert conn.copies == ["A\t\\N\t1\nB\tP1\t2\n"]
+
+    with pytest.raises(RuntimeError):
+        loader = PostgresCopyLoader("missing", connection=FakeConnection(table_columns=[]))
+        loader.load([{"sku": "A"}])
+
+
+def test_defaulted_columns_load_only_when_rows_set_them():
+    table = ["sku", ("price", True), ("scraped_at", True)]
+    conn = FakeConnection(table_columns=table)
+    loader = PostgresCopyLoader("products", connection=conn, batch_rows=2)
+
+    stats = loader.load([{"sku": "A"}, {"sku": "B", "price": 0.5}, {"sku": "C", "price": 2}])
+
+    assert conn.copies == ["A\t\\N\nB\t0.5\n", "C\t2\n"]
+    assert stats.rows == 3 and stats.dropped_columns == 0
+    assert conn.statements[1].startswith(
+        'CREATE TEMP TABLE _copy_stage ON COMMIT DROP AS SELECT "sku", "price" '
+    )
+
+    conn = FakeConnection(table_columns=table)
+    PostgresCopyLoader("products", connection=conn).load([{"sku": "A"}])
+    assert conn.copies == ["A\n"]
+
+
+def test_upsert_sql_and_column_order_fixed_once():
+    conn = FakeConnection()
+    loader = PostgresCopyLoader(
+        "products", connection=conn, conflict_key=["sku"], columns=["sku", "price"]
+    )
+    rows = [{"sku": "A", "price": 1}, {"price": 2, "sku": "B", "extra": "x"}, {"sku": "C"}]
+
+    stats = loader.load(rows)
+
+    assert conn.copies == ["A\t1\nB\t2\nC\t\\N\n"]
+    assert stats.dropped_columns == 1
+    upsert = next(s for s in conn.statements if s.startswith("INSERT"))
+    assert 'SELECT DISTINCT ON ("sku")' in upsert
+    assert 'ORDER BY "sku", _copy_seq DESC' in upsert
+    assert upsert.endswith('ON CONFLICT ("sku") DO UPDATE SET "price" = EXCLUDED."price"')
+
+
+def test_conflict_key_must_be_loaded():
+    loader = PostgresCopyLoader("products", connection=FakeConnection(), conflict_key=["id"])
+    with pytest.raises(ValueError):
+        loader.load([{"sku": "A"}])
+
+
+def test_failure_rolls_back_and_closes_owned_connection():
+    conn = FakeConnection()
+
+    def broken() -> Iterator[Dict[str, Any]]:
+        yield {"sku": "A"}
+        raise RuntimeError("source failed")
+
+    loader = PostgresCopyLoader("products", dsn="postgresql://x", connect=lambda dsn: conn)
+    with pytest.raises(RuntimeError):
+        loader.load(broken())
+    assert conn.rolled_back and conn.closed and not conn.committed
+
+
+def test_database_loader_export_records_uses_copy(monkeypatch):
+    conn = FakeConnection()
+    monkeypatch.setenv("DB_DSN", "postgresql://user@localhost/db")
+    monkeypatch.setenv("DB_TABLE", "copy_loader_products")
+    monkeypatch.setenv("DB_CONFLICT_KEY", "sku")
+    monkeypatch.setattr(database_loader, "psycopg2", object())
+    monkeypatch.setattr(
+        "src.processors.exporters.pg_copy_loader.psycopg2.connect", lambda dsn: conn
+    )
+
+    assert database_loader.export_records(iter([])) == 0
+    assert database_loader.export_records(_rows(3)) == 3
+
+    assert conn.committed and conn.closed
+    assert any('ON CONFLICT ("sku")' in s for s in conn.statements)
+    assert [
+        s.value
+        for s in metrics.dump_metrics()["counters"]
+        if s.name == "db.copy.rows" and s.labels.get("table") == "copy_loader_products"
+    ] == [3]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.core_kernel.pipeline_compiler import compile_pipeline_file
+from src.pipeline import compile_cache
+from src.pipeline.compile_cache import compile_cached, precompile
+from src.processors.dedupe import dedupe_records
+
+COMPONENTS = """
+components:
+  demo.fetch:
+    module: src.processors.dedupe
+    callable: dedupe_records
+    type: fetch
+  demo.export:
+    module: src.processors.dedupe
+    callable: dedupe_records
+    type: export
+"""
+
+PIPELINE = """
+pipeline:
+  name: {name}
+  steps:
+    - id: fetch_a
+      component: demo.fetch
+    - id: fetch_b
+      component: demo.fetch
+    - id: merge
+      component: demo.fetch
+      depends_on: [fetch_a, fetch_b]
+    - id: export
+      component: demo.export
+      depends_on: [{export_dep}]
+"""
+
+
+def _dsl(root: Path, name: str = "demo", export_dep: str = "merge") -> Path:
+    (root / "pipelines").mkdir(parents=True, exist_ok=True)
+    (root / "components.yaml").write_text(COMPONENTS, encoding="utf-8")
+    (root / "pipelines" / f"{name}.yaml").write_text(
+        textwrap.dedent(PIPELINE.format(name=name, export_dep=export_dep)), encoding="utf-8"
+    )
+    return root
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    compile_cache.clear_compile_cache()
+    yield
+    compile_cache.clear_compile_cache()
+
+
+def test_compiled_pipeline_carries_graph_and_resolved_callables(tmp_path):
+    root = _dsl(tmp_path)
+
+    compiled = compile_cached(root / "pipelines" / "demo.yaml", root / "components.yaml")
+
+    assert compiled.order == ["fetch_a", "fetch_b", "merge", "export"]
+    assert compiled.dependents == {"fetch_a": ["merge"], "fetch_b": ["merge"], "merge": ["export"]}
+    assert compiled.critical_path == {"fetch_a": 3, "fetch_b": 3, "merge": 2, "export": 1}
+    assert all(step.callable is dedupe_records for step in compiled.steps)
+    assert len(compiled.metadata["content_hash"]) == 64
+
+
+def test_recompiles_only_when_content_changes(tmp_path):
+    root = _dsl(tmp_path)
+    pipeline_path, components_path = root / "pipelines" / "demo.yaml", root / "components.yaml"
+
+    first = compile_cached(pipeline_path, components_path)
+    stat = pipeline_path.stat()
+    os.utime(pipeline_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert compile_cached(pipeline_path, components_path) is first
+    assert compile_cache.compile_cache_stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    components_path.write_text(COMPONENTS + "    description: changed\n", encoding="utf-8")
+    second = compile_cached(pipeline_path, components_path)
+    assert second is not first
+    assert second.metadata["content_hash"] != first.metadata["content_hash"]
+
+
+def test_core_kernel_compile_is_cached_by_content(tmp_path):
+    root = _dsl(tmp_path)
+
+    pipeline_path, registry_path = root / "pipelines" / "demo.yaml", root / "components.yaml"
+    registry, compiled = compile_pipeline_file(pipeline_path, registry_path)
+
+    assert compile_pipeline_file(pipeline_path, registry_path)[1] is compiled
+    assert registry.get("demo.export").type == "export"
+
+
+def test_precompile_reports_every_invalid_pipeline(tmp_path):
+    root = _dsl(tmp_path)
+    _dsl(root, name="unknown_dep", export_dep="missing")
+    (root / "pipelines" / "no_steps.yaml").write_text(
+        "pipeline:\n  name: no_steps\n  steps: []\n", encoding="utf-8"
+    )
+    (root / "pipelines" / "cycle.yaml").write_text(
+        "pipeline:\n  name: cycle\n  steps:\n"
+        "    - {id: a, component: demo.fetch, depends_on: [b]}\n"
+        "    - {id: b, component: demo.fetch, depends_on: [a]}\n",
+        encoding="utf-8",
+    )
+    (root / "pipelines" / "bad_component.yaml").write_text(
+        "pipeline:\n  name: bad\n  steps:\n    - id: a\n      component: nope\n", encoding="utf-8"
+    )
+
+    results = precompile(root)
+
+    assert results["demo"] is None
+    assert "unknown step 'missing'" in results["unknown_dep"]
+    assert "no_steps" in results["no_steps"]
+    assert "cycle" in results["cycle"]
+    assert "not registered" in results["bad_component"]
+
+
+def test_repository_pipelines_precompile_cleanly():
+    assert all(error is None for error in precompile().values())
@@ -0,0 +1,173 @@
+import threading
+import time
+
+from src.pipeline.compiler import CompiledPipeline
+from src.pipeline.runner import PipelineRunner
+from src.pipeline.step import PipelineStep, StepType
+
+
+def _pipeline(*steps: PipelineStep) -> CompiledPipeline:
+    return CompiledPipeline(
+        name="unit", description="", steps=list(steps), variants=[], metadata={}
+    )
+
+
+def _step(step_id, fn, depends_on=None, type=StepType.TRANSFORM, **kwargs) -> PipelineStep:
+    return PipelineStep(
+        id=step_id,
+        type=type,
+        callable=fn,
+        depends_on=depends_on or [],
+        **kwargs,
+    )
+
+
+def test_runner_passes_dependency_outputs_and_succeeds():
+    pipeline = _pipeline(
+        _step("a", lambda **_: 1),
+        _step("b", lambda a, **_: a + 1, depends_on=["a"]),
+        _step("c", lambda a, b, **_: [a, b], depends_on=["a", "b"]),
+    )
+
+    result = PipelineRunner(max_workers=2).run(pipeline, source="unit")
+
+    assert result.success
+    assert result.step_results["c"].output == [1, 2]
+    assert set(result.metadata["queue_wait_seconds"]) == {"a", "b", "c"}
+
+
+def test_runner_releases_dependents_without_waiting_for_siblings():
+    slow_started = threading.Event()
+    finished_at = {}
+
+    def slow(**_):
+        slow_started.set()
+        time.sleep(0.5)
+        finished_at["slow"] = time.monotonic()
+
+    def fast(**_):
+        slow_started.wait(1)
+        return "fast"
+
+    def child(**_):
+        finished_at["child"] = time.monotonic()
+
+    pipeline = _pipeline(
+        _step("slow", slow),
+        _step("fast", fast),
+        _step("child", child, depends_on=["fast"]),
+    )
+
+    result = PipelineRunner(max_workers=2).run(pipeline, source="unit")
+
+    assert result.success
+    assert finished_at["child"] < finished_at["slow"]
+
+
+def test_runner_prefers_critical_path_steps():
+    started = []
+    lock = threading.Lock()
+
+    def record(name):
+        def _fn(**_):
+            with lock:
+                started.append(name)
+
+        return _fn
+
+    pipeline = _pipeline(
+        _step("leaf", record("leaf")),
+        _step("head", record("head")),
+        _step("mid", record("mid"), depends_on=["head"]),
+        _step("tail", record("tail"), depends_on=["mid"]),
+    )
+
+    PipelineRunner(max_workers=1).run(pipeline, source="unit")
+
+    assert started[0] == "head"
+
+
+def test_runner_late_critical_step_overtakes_queued_leaves():
+    started = []
+    lock = threading.Lock()
+
+    def record(name):
+        def _fn(**_):
+            with lock:
+                started.append(name)
+
+        return _fn
+
+    pipeline = _pipeline(
+        _step("head", record("head")),
+        _step("leaf1", record("leaf1")),
+        _step("leaf2", record("leaf2")),
+        _step("leaf3", record("leaf3")),
+        _step("mid", record("mid"), depends_on=["head"]),
+        _step("tail", record("tail"), depends_on=["mid"]),
+    )
+
+    PipelineRunner(max_workers=1).run(pipeline, source="unit")
+
+    assert started[:2] == ["head", "mid"]
+
+
+def test_runner_enforces_step_timeout():
+    release = threading.Event()
+
+    def hangs(**_):
+        release.wait(5)
+
+    pipeline = _pipeline(
+        _step("hangs", hangs, timeout=0.2),
+        _step("after", lambda **_: "ran", depends_on=["hangs"]),
+    )
+
+    start = time.monotonic()
+    result = PipelineRunner().run(pipeline, source="unit")
+    release.set()
+
+    assert time.monotonic() - start < 2
+    assert result.status == "failed"
+    assert "timed out" in result.step_results["hangs"].error
+    assert result.step_results["after"].output == "ran"
+
+
+def test_runner_runs_exports_in_declaration_order():
+    order = []
+
+    def export(name, delay):
+        def _fn(**_):
+            time.sleep(delay)
+            order.append(name)
+
+        return _fn
+
+    pipeline = _pipeline(
+        _step("first", export("first", 0.2), type=StepType.EXPORT),
+        _step("second", export("second", 0.0), type=StepType.EXPORT),
+    )
+
+    result = PipelineRunner(max_workers=4).run(pipeline, source="unit")
+
+    assert result.success
+    assert order == ["first", "second"]
+
+
+def test_runner_reports_unmet_dependencies():
+    pipeline = _pipeline(_step("orphan", lambda **_: None, depends_on=["missing"]))
+
+    result = PipelineRunner().run(pipeline, source="unit")
+
+    assert result.status == "failed"
+    assert "deadlock" in result.error
+
+
+def test_runner_scheduling_overhead_is_small_for_wide_dag():
+    steps = [_step("root", lambda **_: None)]
+    steps += [_step(f"s{i}", lambda **_: None, depends_on=["root"]) for i in range(40)]
+
+    result = PipelineRunner(max_workers=8).run(_pipeline(*steps), source="unit")
+
+    assert result.success
+    assert result.duration_seconds < 1.0
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import textwrap
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from src.entrypoints import pipeline_worker
+from src.entrypoints.pipeline_worker import (
+    PipelineWorker,
+    WarmPipelineState,
+    WorkerBusyError,
+    WorkerClient,
+    WorkerDrainingError,
+    WorkerUnavailableError,
+    make_server,
+)
+
+
+def _write_dsl(root: Path, module: str = "warm_component") -> Path:
+    (root / "pipelines").mkdir(parents=True)
+    (root / "components.yaml").write_text(
+        textwrap.dedent(
+            f"""
+            components:
+              demo.step:
+                module: {module}
+                callable: run_step
+                type: transform
+            """
+        ),
+        encoding="utf-8",
+    )
+    (root / "pipelines" / "demo.yaml").write_text(
+        "pipeline:\n  name: demo\n  steps:\n    - id: step\n      component: demo.step\n",
+        encoding="utf-8",
+    )
+    return root
+
+
+@pytest.fixture
+def dsl_root(tmp_path, monkeypatch):
+    package = tmp_path / "modules"
+    package.mkdir()
+    (package / "warm_component.py").write_text(
+        "PREWARMED = []\n\n\ndef prewarm():\n    PREWARMED.append(True)\n\n\n"
+        "def run_step(ctx):\n    return [1, 2, 3]\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(package))
+    return _write_dsl(tmp_path / "dsl")
+
+
+class _BlockingRun:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+        self.calls: List[Dict[str, Any]] = []
+
+    def __call__(self, **kwargs: Any) -> Dict[str, Any]:
+        self.calls.append(kwargs)
+        self.started.release()
+        assert self.release.wait(5)
+        return {
+            "status": "success",
+            "run_id": "RUN-1",
+            "source": kwargs["source"],
+            "item_count": 3,
+            "duration": 0.0,
+            "error": None,
+        }
+
+
+def test_warm_state_reuses_compiled_pipeline_until_content_changes(dsl_root):
+    state = WarmPipelineState(dsl_root)
+
+    first = state.compiled("demo")
+    assert state.compiled("demo") is first
+
+    pipeline_file = dsl_root / "pipelines" / "demo.yaml"
+    pipeline_file.write_text(
+        pipeline_file.read_text(encoding="utf-8") + "      retry: 1\n", encoding="utf-8"
+    )
+    assert state.compiled("demo") is not first
+
+    with pytest.raises(FileNotFoundError):
+        state.compiled("missing")
+
+
+def test_warm_compiles_sources_and_calls_module_prewarm(dsl_root):
+    import warm_component
+
+    state = WarmPipelineState(dsl_root)
+
+    assert state.warm() == ["demo"]
+    assert warm_component.PREWARMED == [True]
+    assert state.warm_sources() == ["demo"]
+
+
+def test_worker_bounds_queue_and_passes_warm_pipeline(dsl_root):
+    run = _BlockingRun()
+    worker = PipelineWorker(
+        WarmPipelineState(dsl_root), max_concurrency=1, queue_size=1, run=run
+    ).start()
+
+    running = worker.submit({"source": "demo", "params": {"a": 1}, "ignored": True})
+    assert run.started.acquire(timeout=5)
+    queued = worker.submit({"source": "demo"})
+    with pytest.raises(WorkerBusyError):
+        worker.submit({"source": "demo"})
+    assert worker.stats()["running"] == 1
+
+    run.release.set()
+    assert worker.wait(running.job_id, timeout=5).result["item_count"] == 3
+    assert worker.wait(queued.job_id, timeout=5).status == "done"
+    assert run.calls[0]["params"] == {"a": 1}
+    assert "ignored" not in run.calls[0]
+    assert run.calls[0]["compiled"] is run.calls[1]["compiled"]
+    assert worker.drain(timeout=5)
+
+
+def test_drain_finishes_queued_runs_and_rejects_new_ones(dsl_root):
+    run = _BlockingRun()
+    worker = PipelineWorker(
+        WarmPipelineState(dsl_root), max_concurrency=1, queue_size=4, run=run
+    ).start()
+    jobs = [worker.submit({"source": "demo"}) for _ in range(3)]
+
+    run.release.set()
+    assert worker.drain(timeout=5)
+    assert all(job.status == "done" for job in jobs)
+    with pytest.raises(WorkerDrainingError):
+        worker.submit({"source": "demo"})
+
+
+def test_compile_failure_returns_failed_result(dsl_root):
+    worker = PipelineWorker(WarmPipelineState(dsl_root), run=_BlockingRun()).start()
+
+    job = worker.wait(worker.submit({"source": "missing"}).job_id, timeout=5)
+
+    assert job.result["status"] == "failed"
+    assert "missing.yaml" in job.result["error"]
+    assert worker.drain(timeout=5)
+
+
+def test_client_runs_over_unix_socket_and_falls_back_when_draining(dsl_root, tmp_path, monkeypatch):
+    run = _BlockingRun()
+    run.release.set()
+    worker = PipelineWorker(
+        WarmPipelineState(dsl_root), max_concurrency=1, queue_size=1, run=run
+    ).start()
+    socket_path = str(tmp_path / "worker.sock")
+    server = make_server(worker, socket_path=socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = WorkerClient(socket_path=socket_path)
+        assert client.run(source="demo", run_type="DELTA")["status"] == "success"
+        assert run.calls[-1]["run_type"] == "DELTA"
+        assert client.health()["warm_pipelines"] == ["demo"]
+
+        monkeypatch.setenv(pipeline_worker.SOCKET_ENV_VAR, socket_path)
+        assert pipeline_worker.run_pipeline_via_worker(source="demo")["run_id"] == "RUN-1"
+
+        with pytest.raises(RuntimeError, match=r"refused run \(400\)"):
+            client.submit(run_type="DELTA")
+
+        assert worker.drain(timeout=5)
+        with pytest.raises(WorkerDrainingError):
+            client.submit(source="demo")
+        monkeypatch.setattr(
+            pipeline_worker, "run_pipeline", lambda **kw: {"status": "success", "run_id": "LOCAL"}
+        )
+        assert pipeline_worker.run_pipeline_via_worker(source="demo")["run_id"] == "LOCAL"
+
+        client.drain()
+        thread.join(5)
+        assert not thread.is_alive()
+        with pytest.raises(WorkerUnavailableError):
+            client.submit(source="demo")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_run_via_worker_runs_in_process_without_worker(monkeypatch):
+    monkeypatch.delenv(pipeline_worker.SOCKET_ENV_VAR, raising=False)
+    monkeypatch.setenv(pipeline_worker.URL_ENV_VAR, "http://127.0.0.1:9")
+    calls: List[Dict[str, Any]] = []
+    monkeypatch.setattr(
+        pipeline_worker, "run_pipeline", lambda **kw: calls.append(kw) or {"status": "success"}
+    )
+
+    assert pipeline_worker.run_pipeline_via_worker(source="demo") == {"status": "success"}
+    assert calls == [{"source": "demo"}]
+
+
+class _BusyClient:
+    def __init__(self, busy: int) -> None:
+        self.busy = busy
+        self.submits = 0
+
+    def submit(self, **request: Any) -> str:
+        self.submits += 1
+        if self.submits <= self.busy:
+            raise WorkerBusyError("run queue is full")
+        return "job-1"
+
+    def wait(self, job_id: str) -> Dict[str, Any]:
+        return {"status": "success", "run_id": job_id}
+
+
+def test_run_via_worker_backs_off_while_worker_is_busy(monkeypatch):
+    client = _BusyClient(busy=2)
+    monkeypatch.setattr(pipeline_worker.WorkerClient, "from_env", classmethod(lambda cls: client))
+    monkeypatch.setattr(pipeline_worker, "run_pipeline", lambda **kw: pytest.fail("ran in-process"))
+
+    result = pipeline_worker.run_pipeline_via_worker(source="demo", backoff_base=0.01)
+
+    assert result == {"status": "success", "run_id": "job-1"}
+    assert client.submits == 3
+
+
+def test_run_via_worker_gives_up_when_busy_too_long(monkeypatch):
+    client = _BusyClient(busy=1000)
+    monkeypatch.setattr(pipeline_worker.WorkerClient, "from_env", classmethod(lambda cls: client))
+    monkeypatch.setattr(pipeline_worker, "run_pipeline", lambda **kw: pytest.fail("ran in-process"))
+
+    with pytest.raises(WorkerBusyError, match="still busy"):
+        pipeline_worker.run_pipeline_via_worker(source="demo", busy_timeout=0.05, backoff_base=0.01)
+    assert client.submits > 1
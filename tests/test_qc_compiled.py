@@ -0,0 +1,168 @@
+import random
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.processors.qc import rules
+from src.processors.qc.columnar import ColumnBatch
+
+TRICKY = [
+    None,
+    "",
+    "   ",
+    "abc",
+    "0",
+    "0.01",
+    "0.0099999999999999999999",
+    "1000000",
+    "1000000.0000000000001",
+    "12.50",
+    " 7 ",
+    "1e400",
+    "nan",
+    "-inf",
+    True,
+    5,
+    -1,
+    10 ** 400,
+    12.5,
+    float("nan"),
+    Decimal("3.10"),
+    Decimal("NaN"),
+    ["unhashable"],
+    "usd",
+    " eur ",
+    "GBP",
+]
+
+
+def _record(rng):
+    record = {
+        "source": "unit-test",
+        "country": "AR",
+        "product_url": "http://example.com/p",
+        "name": "Product",
+        "company": "Co",
+        "price": "10.00",
+        "currency": "USD",
+        "reimbursed_price": "4",
+        "retail_price": "8",
+    }
+    for key in list(record):
+        roll = rng.random()
+        if roll < 0.15:
+            record[key] = rng.choice(TRICKY)
+        elif roll < 0.2:
+            del record[key]
+    return record
+
+
+def _expected(records, ruleset):
+    passed, failed, failures = [], [], {}
+    for idx, record in enumerate(records):
+        ok, results = rules.run_qc_for_record(record, ruleset)
+        (passed if ok else failed).append(record)
+        bad = [r for r in results if not r.passed]
+        if bad:
+            failures[idx] = bad
+    return passed, failed, failures
+
+
+def test_compiled_matches_per_record_on_messy_records():
+    rng = random.Random(7)
+    records = [_record(rng) for _ in range(3_000)]
+    ruleset = rules.get_default_ruleset()
+
+    outcome = rules.compile_ruleset(ruleset, chunk_size=256).run(records)
+    passed, failed, failures = _expected(records, ruleset)
+
+    assert outcome.failures == failures
+    mask = outcome.passed_mask()
+    assert [r for r, ok in zip(records, mask) if ok] == passed
+    assert [r for r, ok in zip(records, mask) if not ok] == failed
+    for rule in ruleset:
+        expected = [
+            any(r.rule_id == rule.rule_id for r in failures.get(i, [])) for i in range(len(records))
+        ]
+        assert outcome.failed_mask(rule.rule_id).tolist() == expected
+
+
+def test_only_failing_records_get_results():
+    good = {
+        "source": "s",
+        "country": "AR",
+        "product_url": "u",
+        "name": "n",
+        "company": "c",
+        "price": 10.0,
+        "currency": "ars",
+    }
+    bad = dict(good, price="0.001", reimbursed_price="9", retail_price=5)
+    outcome = rules.compile_ruleset(rules.get_default_ruleset()).run([good, bad, good])
+
+    assert list(outcome.failures) == [1]
+    assert [r.rule_id for r in outcome.failures[1]] == ["price_sanity", "reimbursed_leq_retail"]
+    assert outcome.failures[1][0].message == "price=0.001 is below minimum 0.01"
+    assert outcome.passed_mask().tolist() == [True, False, True]
+    assert outcome.bitmaps[1].dtype == np.uint8 and outcome.bitmaps[1].size == 1
+    assert outcome.failure_counts() == {
+        "required_core_fields": 0,
+        "price_sanity": 1,
+        "currency_allowed": 0,
+        "reimbursed_leq_retail": 1,
+    }
+
+
+def test_rules_without_columnar_check_run_per_record():
+    custom = rules.QCRule(
+        rule_id="name_short",
+        description="name under 5 chars",
+        severity="error",
+        check_fn=lambda rec: (len(rec.get("name") or "") < 5, "name too long"),
+    )
+    boom = rules.QCRule(
+        rule_id="boom",
+        description="always raises",
+        severity="warning",
+        check_fn=lambda rec: 1 / 0,
+    )
+    records = [{"name": "abc"}, {"name": "abcdef"}]
+    outcome = rules.compile_ruleset([custom, boom]).run(records)
+
+    assert outcome.passed_mask().tolist() == [True, False]
+    assert outcome.failures[1][0].message == "name too long"
+    assert outcome.failures[0][0].message.startswith("rule execution error")
+
+
+def test_column_batch_input_matches_records():
+    rng = random.Random(11)
+    records = [_record(rng) for _ in range(500)]
+    fields = sorted({key for record in records for key in record})
+    columns = {name: [record.get(name) for record in records] for name in fields}
+    ruleset = rules.get_default_ruleset()
+
+    from_records = rules.compile_ruleset(ruleset).run(records)
+    from_columns = rules.compile_ruleset(ruleset).run(ColumnBatch.from_columns(columns))
+
+    assert from_columns.passed_mask().tolist() == from_records.passed_mask().tolist()
+    assert from_columns.failures == from_records.failures
+
+
+def test_column_batch_rejects_ragged_columns():
+    with pytest.raises(ValueError):
+        ColumnBatch.from_columns({"a": [1, 2], "b": [1]})
+
+
+def test_run_qc_batch_keeps_contract():
+    rng = random.Random(3)
+    records = [_record(rng) for _ in range(200)]
+    ruleset = rules.get_default_ruleset()
+
+    passed, failed, all_results = rules.run_qc_batch(iter(records), rules=ruleset)
+    exp_passed, exp_failed, _ = _expected(records, ruleset)
+
+    assert passed == exp_passed and failed == exp_failed
+    assert len(all_results) == len(records)
+    assert all_results[5] == rules.run_qc_for_record(records[5], ruleset)[1]
+    assert all_results[-2:] == [rules.run_qc_for_record(r, ruleset)[1] for r in records[-2:]]
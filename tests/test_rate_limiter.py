@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.engines.rate_limiter import SimpleRateLimiter
+from src.resource_manager import rate_limiter as rl
+from src.utils.token_bucket import LeakyBucket, TokenBucket
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    clock = _Clock()
+    bucket = TokenBucket(rate=2.0, burst=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+    assert bucket.waits == 2
+    assert bucket.waited_seconds == pytest.approx(1.5)
+
+
+def test_token_bucket_supports_fractional_rate_and_refill():
+    clock = _Clock()
+    bucket = TokenBucket(rate=0.5, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.try_acquire() is False
+    clock.now += 2.0
+    assert bucket.try_acquire() is True
+
+
+def test_leaky_bucket_does_not_wait_when_idle():
+    clock = _Clock()
+    bucket = LeakyBucket(interval=1.0, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1.0)
+    clock.now += 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_simple_rate_limiter_idle_source_is_not_delayed():
+    limiter = SimpleRateLimiter(min_delay=1.0, max_delay=3.0)
+
+    start = time.monotonic()
+    limiter.wait()
+    assert time.monotonic() - start < 0.1
+    assert 1.0 <= limiter.reserve() <= 3.0
+
+
+def test_waiters_sleep_outside_the_lock():
+    limiter = rl.RateLimiter("unit-threads", max_qps=20, max_concurrent=None, burst=1)
+    finished = []
+
+    def worker():
+        limiter.wait()
+        finished.append(time.monotonic())
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Each waiter reserves its own slot (0, 50, 100, ... ms) and sleeps in parallel
+    assert max(finished) - start < 0.5
+    assert limiter.qps_waited_seconds > 0
+
+
+def test_async_waiters_share_the_bucket():
+    limiter = rl.RateLimiter("unit-async", max_qps=50, max_concurrent=2, burst=2)
+
+    async def _run():
+        await asyncio.gather(*(limiter.async_wait() for _ in range(6)))
+
+    start = time.monotonic()
+    asyncio.run(_run())
+    elapsed = time.monotonic() - start
+
+    assert 0.05 <= elapsed < 0.5
+    assert limiter.waited_seconds > 0
+
+
+def test_get_rate_limiter_shares_instances_and_reports_waits(monkeypatch):
+    monkeypatch.setattr(rl, "_default_limiters", {})
+
+    a = rl.get_rate_limiter("unit-src", settings={"max_qps": 1000, "burst": 1})
+    b = rl.get_rate_limiter("unit-src")
+    a.wait()
+    b.wait()
+
+    assert a is b
+    stats = rl.get_wait_stats()["unit-src"]
+    assert stats["waited_seconds"] == pytest.approx(stats["qps_waited_seconds"])
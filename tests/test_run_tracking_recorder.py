@@ -84,3 +84,114 @@ def test_run_tracking_rolls_back_on_error(temp_db):
         assert conn.execute("SELECT COUNT(*) FROM run_steps").fetchone()[0] == 0
     finally:
         conn.close()
+
+
+def test_steps_are_buffered_and_flushed_in_one_batch(temp_db, monkeypatch):
+    import time
+
+    from src.run_tracking import recorder
+    from src.scheduler import scheduler_db_adapter as db
+
+    buffer = recorder.WriteBehindBuffer(flush_interval=60, batch_size=1_000_000)
+    monkeypatch.setattr(recorder, "_BUFFER", buffer)
+    batches = []
+    real_write = db.write_tracking_batch
+    monkeypatch.setattr(
+        db,
+        "write_tracking_batch",
+        lambda runs, steps: batches.append((len(runs), len(steps))) or real_write(runs, steps),
+    )
+
+    run_id = "write-behind-test"
+    recorder.start_run(run_id, "alfabeta", metadata={"env": "test"})
+    start = time.perf_counter()
+    for idx in range(2_000):
+        recorder.record_step(run_id, name=f"step-{idx}", status="success")
+    per_step = (time.perf_counter() - start) / 2_000
+
+    assert batches == []  # nothing written in the hot path
+    assert per_step < 100e-6
+    assert buffer.pending() == 2_001
+
+    recorder.finish_run(run_id, source="alfabeta", status="success", stats={"records": 1})
+    assert batches == [(2, 2_000)]
+
+    conn = sqlite3.connect(temp_db)
+    try:
+        step_count = conn.execute(
+            "SELECT COUNT(*) FROM run_steps WHERE run_id = ?", (run_id,)
+        ).fetchone()[0]
+        assert step_count == 2_000
+        status, metadata = conn.execute(
+            "SELECT status, metadata FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+    finally:
+        conn.close()
+    # Metadata from start_run is carried forward without re-reading the run
+    assert status == "success" and '"env": "test"' in metadata
+
+
+def test_start_and_finish_in_one_flush_keep_the_start_time(temp_db, monkeypatch):
+    import time
+
+    from src.run_tracking import recorder
+
+    monkeypatch.setattr(recorder, "_BUFFER", recorder.WriteBehindBuffer(flush_interval=60))
+    recorder.start_run("same-flush", "alfabeta", metadata={"env": "test"})
+    time.sleep(0.01)
+    recorder.finish_run("same-flush", source="alfabeta", status="success")
+
+    conn = sqlite3.connect(temp_db)
+    try:
+        started_at, finished_at, duration, metadata = conn.execute(
+            "SELECT started_at, finished_at, duration_seconds, metadata FROM runs WHERE run_id = ?",
+            ("same-flush",),
+        ).fetchone()
+    finally:
+        conn.close()
+    assert started_at < finished_at
+    assert duration == 0
+    assert '"env": "test"' in metadata
+
+
+def test_failed_flush_keeps_events_for_retry(temp_db, monkeypatch):
+    from src.run_tracking import recorder
+    from src.scheduler import scheduler_db_adapter as db
+
+    buffer = recorder.WriteBehindBuffer(flush_interval=60)
+    monkeypatch.setattr(recorder, "_BUFFER", buffer)
+    recorder.start_run("retry-test", "alfabeta")
+    recorder.record_step("retry-test", name="company_index", status="success")
+
+    real_write = db.write_tracking_batch
+
+    def failing_write(runs, steps):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(db, "write_tracking_batch", failing_write)
+    with pytest.raises(RuntimeError):
+        recorder.flush()
+    assert buffer.pending() == 2
+
+    monkeypatch.setattr(db, "write_tracking_batch", real_write)
+    assert recorder.flush() == 2
+    assert db.fetch_run_steps("retry-test")[0].name == "company_index"
+
+
+def test_background_thread_flushes_when_batch_fills(temp_db, monkeypatch):
+    import time
+
+    from src.run_tracking import recorder
+    from src.scheduler import scheduler_db_adapter as db
+
+    buffer = recorder.WriteBehindBuffer(flush_interval=60, batch_size=3)
+    monkeypatch.setattr(recorder, "_BUFFER", buffer)
+    recorder.start_run("bg-test", "alfabeta")
+    recorder.record_step("bg-test", name="a", status="success")
+    recorder.record_step("bg-test", name="b", status="success")
+
+    deadline = time.monotonic() + 5
+    while buffer.pending() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert buffer.pending() == 0
+    assert len(db.fetch_run_steps("bg-test")) == 2
@@ -0,0 +1,85 @@
+import random
+
+from src.core_kernel.models import NormalizedRecord
+from src.observability import metrics
+from src.processors.dedupe import StreamingDeduper, dedupe_records, dedupe_stream, key_hash64
+from src.processors.qc import iter_unique_records
+
+
+def _records(count, distinct, seed=1):
+    rng = random.Random(seed)
+    return [
+        {"product_url": f"u{rng.randrange(distinct)}", "name": "n", "i": i} for i in range(count)
+    ]
+
+
+def _first_occurrences(records):
+    seen = set()
+    out = []
+    for record in records:
+        key = (record["product_url"], record["name"])
+        if key not in seen:
+            seen.add(key)
+            out.append(record)
+    return out
+
+
+def _counter(name, source):
+    return sum(
+        s.value
+        for s in metrics.dump_metrics()["counters"]
+        if s.name == name and s.labels.get("source") == source
+    )
+
+
+def test_key_hash64_is_stable_64_bit():
+    assert key_hash64(("a", 1)) == key_hash64(("a", 1))
+    assert key_hash64(("a", 1)) != key_hash64(("a", "1"))
+    assert 0 <= key_hash64(("a", None)) < 2**64
+
+
+def test_spilling_deduper_matches_in_memory_set(tmp_path):
+    records = _records(20_000, 3_000)
+
+    with StreamingDeduper(memory_budget=4 * 1024, spill_dir=tmp_path, chunk_size=500) as deduper:
+        unique = list(deduper.filter(records))
+        assert deduper.stats.spills > 1
+        assert deduper.memory_bytes <= 4 * 1024
+        assert list(tmp_path.glob("dedupe-*/run-*.u64"))
+
+    assert unique == _first_occurrences(records)
+    assert deduper.stats.records == 20_000
+    assert deduper.stats.unique == len(unique)
+    assert deduper.stats.duplicates == 20_000 - len(unique)
+    assert not list(tmp_path.glob("dedupe-*"))
+
+
+def test_duplicates_are_reported_as_counters():
+    records = _records(1_000, 100, seed=4)
+    with StreamingDeduper(source="dedupe-counter-test", chunk_size=64) as deduper:
+        kept = list(deduper.filter(records))
+
+    assert _counter("dedupe.records", "dedupe-counter-test") == 1_000
+    assert _counter("dedupe.duplicates", "dedupe-counter-test") == 1_000 - len(kept)
+
+
+def test_dedupe_stream_and_records_accept_models():
+    models = [
+        NormalizedRecord(product_url="a", name="x"),
+        NormalizedRecord(product_url="a", name="x"),
+        NormalizedRecord(product_url="b", name="x"),
+    ]
+    assert [m.product_url for m in dedupe_records(models)] == ["a", "b"]
+    assert [m.product_url for m in dedupe_stream(iter(models))] == ["a", "b"]
+
+
+def test_qc_iter_unique_records_normalizes_keys(tmp_path):
+    records = [
+        {"product_url": "A ", "name": "x"},
+        {"product_url": "a", "name": "X"},
+        {"product_url": "b", "name": "x"},
+    ]
+    unique = list(
+        iter_unique_records(records, ["product_url", "name"], memory_budget=8, spill_dir=tmp_path)
+    )
+    assert unique == [records[0], records[2]]
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import threading
+import time
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from src.processors.exporters import gcs_exporter, s3_exporter
+from src.processors.exporters.streaming_upload import iter_csv_parts, object_key, upload_parts
+
+MiB = 1024 * 1024
+
+
+def _records(n: int) -> Iterator[Dict[str, Any]]:
+    for i in range(n):
+        yield {
+            "product_url": f"https://example.test/p/{i}",
+            "name": f"Product {i}, \"{i % 7}\"",
+            "price": i / 4,
+        }
+
+
+def _expected_csv(n: int) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=["product_url", "name", "price"])
+    writer.writeheader()
+    writer.writerows(_records(n))
+    return buffer.getvalue().encode("utf-8")
+
+
+class _Concurrency:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def __enter__(self) -> None:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def __exit__(self, *exc: Any) -> None:
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+
+
+class FakeS3Client:
+    """In-memory stand-in for the boto3 S3 client calls the exporter makes."""
+
+    def __init__(self, fail_part: int = 0) -> None:
+        self.objects: Dict[str, Dict[str, Any]] = {}
+        self.uploads: Dict[str, Dict[str, Any]] = {}
+        self.aborted: List[str] = []
+        self.concurrency = _Concurrency()
+        self.fail_part = fail_part
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes, **extra: Any) -> Dict[str, Any]:
+        self.objects[f"{Bucket}/{Key}"] = {"body": Body, **extra}
+        return {}
+
+    def create_multipart_upload(self, *, Bucket: str, Key: str, **extra: Any) -> Dict[str, Any]:
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {"key": f"{Bucket}/{Key}", "parts": {}, "extra": extra}
+        return {"UploadId": upload_id}
+
+    def upload_part(
+        self, *, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes
+    ) -> Dict[str, Any]:
+        with self.concurrency:
+            if PartNumber == self.fail_part:
+                raise RuntimeError("part upload failed")
+            self.uploads[UploadId]["parts"][PartNumber] = Body
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    def complete_multipart_upload(
+        self, *, Bucket: str, Key: str, UploadId: str, MultipartUpload: Dict[str, Any]
+    ) -> None:
+        upload = self.uploads.pop(UploadId)
+        listed = MultipartUpload["Parts"]
+        assert [p["PartNumber"] for p in listed] == sorted(upload["parts"])
+        assert all(p["ETag"] == f'"etag-{p["PartNumber"]}"' for p in listed)
+        body = b"".join(upload["parts"][p["PartNumber"]] for p in listed)
+        self.objects[upload["key"]] = {"body": body, "parts": len(listed), **upload["extra"]}
+
+    def abort_multipart_upload(self, *, Bucket: str, Key: str, UploadId: str) -> None:
+        self.uploads.pop(UploadId)
+        self.aborted.append(UploadId)
+
+
+class FakeBlob:
+    def __init__(self, store: "FakeGCSClient", name: str) -> None:
+        self.store = store
+        self.name = name
+        self.content_type = None
+        self.content_encoding = None
+
+    def upload_from_string(self, data: bytes, content_type: str = "") -> None:
+        with self.store.concurrency:
+            self.store.blobs[self.name] = {
+                "body": data,
+                "content_type": content_type,
+                "content_encoding": self.content_encoding,
+            }
+
+    def compose(self, sources: List["FakeBlob"]) -> None:
+        assert len(sources) <= gcs_exporter.MAX_COMPOSE_SOURCES
+        body = b"".join(self.store.blobs[s.name]["body"] for s in sources)
+        self.store.blobs[self.name] = {
+            "body": body,
+            "content_type": self.content_type,
+            "content_encoding": self.content_encoding,
+        }
+
+    def delete(self) -> None:
+        del self.store.blobs[self.name]
+
+
+class FakeGCSClient:
+    """In-memory stand-in for ``storage.Client`` (bucket / blob / compose)."""
+
+    def __init__(self) -> None:
+        self.blobs: Dict[str, Dict[str, Any]] = {}
+        self.concurrency = _Concurrency()
+
+    def bucket(self, name: str) -> "FakeGCSClient":
+        return self
+
+    def blob(self, name: str) -> FakeBlob:
+        return FakeBlob(self, name)
+
+
+def test_iter_csv_parts_cuts_exact_parts_of_a_single_stream():
+    parts = list(iter_csv_parts(_records(5000), part_size=4096))
+
+    assert all(len(p) == 4096 for p in parts[:-1])
+    assert 0 < len(parts[-1]) <= 4096
+    assert b"".join(parts) == _expected_csv(5000)
+    assert list(iter_csv_parts([], part_size=4096)) == []
+
+
+def test_gzip_parts_concatenate_to_one_gzip_file():
+    parts = list(iter_csv_parts(_records(20_000), part_size=8192, compression="gzip"))
+
+    assert len(parts) > 1
+    assert gzip.decompress(b"".join(parts)) == _expected_csv(20_000)
+
+
+def test_zstd_parts_concatenate_to_one_zstd_file():
+    zstandard = pytest.importorskip("zstandard")
+    parts = list(iter_csv_parts(_records(20_000), part_size=8192, compression="zstd"))
+
+    data = zstandard.ZstdDecompressor().decompressobj().decompress(b"".join(parts))
+    assert data == _expected_csv(20_000)
+
+
+def test_object_key_appends_compression_suffix():
+    assert object_key(None, "exports") == "exports/export.csv"
+    assert object_key("dir/run.csv", "exports/", "gzip") == "exports/run.csv.gz"
+    assert object_key("run.csv.zst", None, "zstd") == "run.csv.zst"
+
+
+def test_upload_parts_bounds_in_flight_parts_and_keeps_order():
+    concurrency = _Concurrency()
+    produced: List[int] = []
+
+    def parts() -> Iterator[bytes]:
+        for i in range(12):
+            produced.append(i)
+            yield bytes([i])
+
+    def upload(number: int, data: bytes) -> int:
+        with concurrency:
+            # The producer may be at most max_concurrency parts ahead of completed uploads
+            assert len(produced) <= number + 3
+            return data[0]
+
+    assert upload_parts(parts(), upload, max_concurrency=3) == list(range(12))
+    assert 1 < concurrency.peak <= 3
+
+
+def test_s3_multipart_upload_streams_parallel_parts():
+    client = FakeS3Client()
+
+    key = s3_exporter.export_to_s3(
+        _records(150_000),
+        bucket="bucket",
+        prefix="exports",
+        object_name="run.csv",
+        part_size=5 * MiB,
+        client=client,
+    )
+
+    assert key == "exports/run.csv"
+    stored = client.objects["bucket/exports/run.csv"]
+    assert stored["parts"] > 1
+    assert stored["ContentType"] == "text/csv"
+    assert stored["body"] == _expected_csv(150_000)
+    assert client.concurrency.peak > 1
+
+
+def test_s3_small_gzip_export_uses_single_put():
+    client = FakeS3Client()
+
+    key = s3_exporter.export_to_s3(
+        _records(100), bucket="bucket", compression="gzip", client=client
+    )
+
+    assert key == "export.csv.gz"
+    stored = client.objects["bucket/export.csv.gz"]
+    assert stored["ContentEncoding"] == "gzip"
+    assert gzip.decompress(stored["body"]) == _expected_csv(100)
+    assert s3_exporter.export_to_s3([], bucket="bucket", client=client) == ""
+
+
+def test_s3_failed_part_aborts_multipart_upload():
+    client = FakeS3Client(fail_part=2)
+
+    with pytest.raises(RuntimeError):
+        s3_exporter.export_to_s3(
+            _records(150_000), bucket="bucket", part_size=5 * MiB, client=client
+        )
+
+    assert client.aborted == ["upload-0"]
+    assert not client.objects
+
+
+def test_s3_rejects_parts_below_minimum():
+    with pytest.raises(ValueError):
+        s3_exporter.export_to_s3(_records(1), bucket="bucket", part_size=MiB, client=FakeS3Client())
+
+
+def test_gcs_composite_upload_composes_and_cleans_up(monkeypatch):
+    monkeypatch.setattr(gcs_exporter, "MAX_COMPOSE_SOURCES", 4)
+    client = FakeGCSClient()
+
+    key = gcs_exporter.export_to_gcs(
+        _records(20_000),
+        bucket="bucket",
+        prefix="exports",
+        compression="gzip",
+        part_size=16 * 1024,
+        client=client,
+    )
+
+    assert key == "exports/export.csv.gz"
+    assert list(client.blobs) == [key]  # part and intermediate compose objects are deleted
+    stored = client.blobs[key]
+    assert stored["content_type"] == "text/csv"
+    assert stored["content_encoding"] == "gzip"
+    assert gzip.decompress(stored["body"]) == _expected_csv(20_000)
+    assert client.concurrency.peak > 1
+
+
+def test_gcs_single_part_upload():
+    client = FakeGCSClient()
+
+    key = gcs_exporter.export_to_gcs(_records(10), bucket="bucket", client=client)
+
+    assert client.blobs[key]["body"] == _expected_csv(10)
+    assert gcs_exporter.export_to_gcs(iter([]), bucket="bucket", client=client) == ""
@@ -1,14 +1,19 @@
 import json
 import math
+import os
+
+import numpy as np
 
 from src.governance.openfeature import override_flags
 from src.processors import vector_store as vector_store_module
 from src.processors.pcid_matcher import (
     build_pcid_index,
     build_vector_store,
+    load_or_build_pcid_resources,
     load_pcid_master,
     match_pcid,
     match_pcid_with_confidence,
+    match_records_batch,
     persist_pcid_mappings,
 )
 from src.processors.vector_store import PCIDVectorStore
@@ -155,3 +160,164 @@ def test_pcid_master_load_index_and_persist(tmp_path):
     persisted = mappings_path.read_text(encoding="utf-8").strip().splitlines()
     assert len(persisted) == 1
     assert "PCID-XYZ" in persisted[0]
+
+
+def test_vector_store_binary_roundtrip_is_memory_mapped(tmp_path):
+    store = PCIDVectorStore(dims=8)
+    store.populate_from_records(
+        [
+            {
+                "pcid": "PCID-A",
+                "name": "Widget",
+                "company": "ACME",
+                "currency": "USD",
+                "source": "a",
+            },
+            {"pcid": "PCID-B", "name": "Gadget", "company": "Beta Labs", "currency": "USD"},
+        ]
+    )
+    base = tmp_path / "index" / "pcid"
+    store.save(base)
+
+    loaded = PCIDVectorStore.load(base)
+    assert isinstance(loaded.matrix.base, np.memmap) or isinstance(loaded.matrix, np.memmap)
+    assert loaded.pcids == ["PCID-A", "PCID-B"]
+
+    query = store.embed_record({"name": "Widget", "company": "ACME", "currency": "USD"})
+    assert loaded.query(query, top_k=1)[0]["pcid"] == "PCID-A"
+    assert loaded.query(query, top_k=1)[0]["metadata"] == {"source": "a"}
+
+    # Adding to a mapped store copies instead of writing through to disk
+    loaded.add("PCID-C", query)
+    assert len(loaded) == 3
+    assert len(PCIDVectorStore.load(base)) == 2
+
+
+def test_pcid_resources_rebuild_only_when_master_changes(tmp_path, monkeypatch):
+    from src.processors import pcid_matcher
+
+    master_path = tmp_path / "pcid_master.jsonl"
+    records = [
+        {"pcid": "PCID-XYZ", "name": "Widget", "company": "ACME", "currency": "USD"},
+        {"pcid": "PCID-ABC", "name": "Gadget", "company": "Beta Labs", "currency": "USD"},
+    ]
+    master_path.write_text("\n".join(json.dumps(rec) for rec in records), encoding="utf-8")
+    cache_base = tmp_path / "cache" / "pcid_master"
+
+    builds = []
+    real_build = pcid_matcher.build_vector_store
+    monkeypatch.setattr(
+        pcid_matcher,
+        "build_vector_store",
+        lambda recs, dims=48: builds.append(1) or real_build(recs, dims=dims),
+    )
+
+    index, store = load_or_build_pcid_resources(master_path, cache_base, dims=8)
+    assert len(builds) == 1
+    assert index.get(("widget", "acme", "usd")) == "PCID-XYZ"
+
+    # Same content, new mtime: verified by hash, no rebuild
+    stat = master_path.stat()
+    os.utime(master_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    index, store = load_or_build_pcid_resources(master_path, cache_base, dims=8)
+    assert len(builds) == 1
+    assert ("gadget", "beta labs", "usd") in index
+    assert index.get(("missing", "", "")) is None
+    pcid, score = match_pcid_with_confidence(
+        {"name": "Widget", "company": "ACME", "currency": "USD"}, index, vector_store=store
+    )
+    assert (pcid, score) == ("PCID-XYZ", 1.0)
+
+    records.append({"pcid": "PCID-NEW", "name": "Doohickey", "company": "ACME", "currency": "ARS"})
+    master_path.write_text("\n".join(json.dumps(rec) for rec in records), encoding="utf-8")
+    index, store = load_or_build_pcid_resources(master_path, cache_base, dims=8)
+    assert len(builds) == 2
+    assert len(store) == 3
+    assert index[("doohickey", "acme", "ars")] == "PCID-NEW"
+
+
+def test_match_records_batch_joins_exact_and_batches_misses(tmp_path):
+    master = [
+        {"pcid": "PCID-A", "name": "Widget", "company": "ACME", "currency": "USD"},
+        {"pcid": "PCID-B", "name": "Gadget", "company": "Beta Labs", "currency": "USD"},
+    ]
+    store = PCIDVectorStore(dims=8)
+    store.populate_from_records(master)
+
+    calls = []
+
+    class CountingBackend:
+        dims = 8
+
+        def query_many(self, vectors, top_k=3, threshold=0.75):
+            calls.append(len(vectors))
+            return store.query_many(vectors, top_k=top_k, threshold=threshold)
+
+    records = [
+        {"name": " widget ", "company": "acme", "currency": "usd"},
+        {"name": "Gadget Kit", "company": "Beta Labs", "currency": "USD"},
+        {"name": "WIDGET", "company": "ACME", "currency": "USD"},
+        {"name": "gadget kit", "company": "beta labs", "currency": "usd"},
+        {"name": "Unrelated", "company": "Nobody", "currency": None},
+    ]
+    batch = match_records_batch(
+        records, build_pcid_index(master), vector_store=CountingBackend(), min_similarity=0.5
+    )
+
+    assert calls == [2]  # one call, distinct misses only
+    assert batch.pcids == ["PCID-A", "PCID-B", "PCID-A", "PCID-B", None]
+    assert batch.methods == ["exact", "vector", "exact", "vector", "none"]
+    assert batch.matched == 4
+    assert batch.confidence[0] == 1.0 and 0.5 < batch.confidence[1] < 1.0
+
+    # Same decisions from the memory-mapped exact index
+    master_path = tmp_path / "pcid_master.jsonl"
+    master_path.write_text("\n".join(json.dumps(rec) for rec in master), encoding="utf-8")
+    index, _ = load_or_build_pcid_resources(master_path, tmp_path / "cache" / "pcid", dims=8)
+    mapped = match_records_batch(records, index, vector_store=CountingBackend(), min_similarity=0.5)
+    assert mapped.pcids == batch.pcids
+
+    with override_flags({"pcid.vector_store.similarity_fallback": False}):
+        gated = match_records_batch(
+            records, build_pcid_index(master), vector_store=CountingBackend()
+        )
+    assert calls == [2, 2]
+    assert gated.pcids == ["PCID-A", None, "PCID-A", None, None]
+
+
+def test_remote_backend_batches_misses(monkeypatch):
+    posted = []
+
+    class DummyResponse:
+        def __init__(self, payload):
+            self._payload = payload
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return self._payload
+
+    def fake_post(url, json, timeout):
+        posted.append((url, json))
+        return DummyResponse(
+            {
+                "results": [
+                    [{"pcid": f"PCID-{rec['name']}", "score": 0.9}] for rec in json["records"]
+                ]
+            }
+        )
+
+    monkeypatch.setenv("PCID_VECTOR_STORE_URL", "http://pcid-backend")
+    monkeypatch.setattr(vector_store_module.requests, "post", fake_post)
+
+    records = [
+        {"name": "Widget", "company": "ACME"},
+        {"name": "Gadget"},
+        {"name": "widget", "company": "acme"},
+    ]
+    batch = match_records_batch(records, {})
+
+    assert [url for url, _ in posted] == ["http://pcid-backend/query/batch"]
+    assert posted[0][1]["records"] == records[:2]
+    assert batch.pcids == ["PCID-Widget", "PCID-Gadget", "PCID-Widget"]
@@ -0,0 +1,120 @@
+"""Benchmark per-page parse and extraction time for the AlfaBeta extractors.
+
+Times each bundled ``src/scrapers/alfabeta/samples/*.html`` page through the
+previous BeautifulSoup path (parse with ``BeautifulSoup(html, "lxml")``, then
+one CSS ``select`` per selector) and through the shared lxml document layer
+with selectors precompiled to XPath.
+
+The shared-DOM path reuses a parsed tree when the same page source is seen
+again. That reuse is not what is measured here: every timed iteration parses
+a distinct copy of the page.
+
+Example:
+    python -m tools.bench_alfabeta_parse --iterations 500
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+from src.common.logging_utils import get_logger
+from src.scrapers.alfabeta.dom import parse_html, selector_set
+
+log = get_logger("bench-alfabeta-parse")
+
+ALFABETA_DIR = Path(__file__).resolve().parents[1] / "src" / "scrapers" / "alfabeta"
+SAMPLES_DIR = ALFABETA_DIR / "samples"
+
+DETAIL_FIELDS = (
+    "product_name_selector",
+    "lab_name_selector",
+    "presentation_selector",
+    "price_selector",
+)
+LINK_FIELDS = ("company_link_selector", "product_link_selector")
+
+
+def _selectors() -> Dict[str, str]:
+    raw = json.loads((ALFABETA_DIR / "selectors.json").read_text(encoding="utf-8"))
+    return {key: raw[key] for key in DETAIL_FIELDS + LINK_FIELDS if key in raw}
+
+
+def _bs4_extract(html: str, selectors: Dict[str, str]) -> int:
+    soup = BeautifulSoup(html, "lxml")
+    found = 0
+    for key in DETAIL_FIELDS:
+        node = soup.select_one(selectors[key])
+        found += bool(node and node.get_text(strip=True))
+    for key in LINK_FIELDS:
+        found += sum(1 for a in soup.select(selectors[key]) if a.get("href"))
+    return found
+
+
+def _dom_extract(html: str, selectors: Dict[str, str]) -> int:
+    doc = parse_html(html)
+    details = selector_set({key: selectors[key] for key in DETAIL_FIELDS})
+    links = selector_set({key: selectors[key] for key in LINK_FIELDS})
+    found = sum(1 for text in details.first_texts(doc).values() if text)
+    for key in LINK_FIELDS:
+        found += len(links.hrefs(doc, key))
+    return found
+
+
+def _time_pages(
+    extract, pages: List[str], selectors: Dict[str, str], iterations: int, repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        for idx in range(iterations):
+            for page in pages:
+                # A distinct string per iteration defeats the shared-tree cache
+                extract(f"{page}<!-- {idx} -->", selectors)
+        best = min(best, time.perf_counter() - start)
+    return best / (iterations * len(pages))
+
+
+def run_benchmark(
+    iterations: int = 200, repeat: int = 3, samples_dir: Path = SAMPLES_DIR
+) -> Dict[str, float]:
+    selectors = _selectors()
+    pages = [path.read_text(encoding="utf-8") for path in sorted(samples_dir.glob("*.html"))]
+    if not pages:
+        raise FileNotFoundError(f"No sample pages under {samples_dir}")
+
+    # Both paths must find the same fields and links on every page
+    for page in pages:
+        if _bs4_extract(page, selectors) != _dom_extract(page, selectors):
+            raise RuntimeError("BeautifulSoup and shared-DOM extraction disagree on a sample page")
+
+    bs4_s = _time_pages(_bs4_extract, pages, selectors, iterations, repeat)
+    dom_s = _time_pages(_dom_extract, pages, selectors, iterations, repeat)
+    return {
+        "pages": float(len(pages)),
+        "bs4_ms_per_page": bs4_s * 1000,
+        "dom_ms_per_page": dom_s * 1000,
+        "speedup": bs4_s / dom_s if dom_s else float("inf"),
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark AlfaBeta per-page parse time")
+    parser.add_argument(
+        "--iterations", type=int, default=200, help="Passes over the sample pages per run"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per path; the best is kept"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    args = parse_args()
+    result = run_benchmark(args.iterations, args.repeat)
+    for key, value in result.items():
+        log.info("%s: %.4f", key, value)
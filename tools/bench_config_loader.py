@@ -0,0 +1,67 @@
+"""Benchmark cold and warm config access for every ``config/sources/*.yaml``.
+
+Cold: the config cache is cleared before each pass, so every source (and the
+platform settings) is read and parsed again, as before the cache existed.
+Warm: the same loads against a populated cache, which only ``stat`` the files.
+
+Example:
+    python -m tools.bench_config_loader --repeat 20
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.common import config_loader
+from src.common.logging_utils import get_logger
+from src.common.paths import CONFIG_DIR
+
+log = get_logger("bench-config-loader")
+
+
+def _load_all(sources: List[str], config_dir: Path) -> None:
+    config_loader.load_config(config_dir=config_dir)
+    for source in sources:
+        config_loader.load_source_config(source, config_dir=config_dir)
+
+
+def run_benchmark(*, repeat: int = 10, config_dir: Path = CONFIG_DIR) -> Dict[str, float]:
+    cache = config_loader.get_config_cache()
+    sources = config_loader.prewarm(config_dir=config_dir)
+
+    cold_s = warm_s = float("inf")
+    for _ in range(max(1, repeat)):
+        cache.clear()
+        start = time.perf_counter()
+        _load_all(sources, config_dir)
+        cold_s = min(cold_s, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        _load_all(sources, config_dir)
+        warm_s = min(warm_s, time.perf_counter() - start)
+
+    loads = len(sources) + 1
+    return {
+        "sources": float(len(sources)),
+        "yaml_loader_is_libyaml": float(
+            config_loader._YAML_LOADER is not config_loader.yaml.SafeLoader
+        ),
+        "cold_ms_per_load": cold_s * 1000 / loads,
+        "warm_us_per_load": warm_s * 1_000_000 / loads,
+        "speedup": cold_s / warm_s if warm_s else float("inf"),
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="Timed passes; the best is kept")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    args = parse_args()
+    result = run_benchmark(repeat=args.repeat)
+    for key, value in result.items():
+        log.info("%s: %.3f", key, value)
@@ -0,0 +1,119 @@
+"""Benchmark for the matrix-backed PCID similarity index.
+
+Builds a synthetic PCID master and a batch of scraped records, then times
+index construction and batched ``query_many`` scoring, and projects the cost
+of the previous list-of-floats implementation (``_cosine`` against every entry
+plus a full sort per record) from a sample of records.
+
+Example:
+    python -m tools.bench_pcid_index --master 100000 --records 50000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict, List, Optional
+
+from src.common.logging_utils import get_logger
+from src.processors.vector_store import PCIDVectorStore, _cosine
+
+log = get_logger("bench-pcid-index")
+
+_WORDS = [
+    "amoxicilina", "ibuprofeno", "paracetamol", "losartan", "enalapril", "metformina",
+    "omeprazol", "atorvastatina", "clonazepam", "diclofenac", "tabletas", "capsulas",
+    "jarabe", "forte", "plus", "retard", "mg", "ml", "100", "250", "500", "850",
+]
+_COMPANIES = ["bago", "roemmers", "elea", "gador", "casasco", "raffo", "montpellier", "baliarda"]
+_CURRENCIES = ["ARS", "USD", "EUR"]
+
+
+def synthetic_records(count: int, seed: int = 7, with_pcid: bool = True) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    records = []
+    for idx in range(count):
+        record = {
+            "name": " ".join(rng.choices(_WORDS, k=rng.randint(2, 5))),
+            "company": " ".join(rng.choices(_COMPANIES, k=rng.randint(1, 2))) + " labs",
+            "currency": rng.choice(_CURRENCIES),
+        }
+        if with_pcid:
+            record["pcid"] = f"PCID-{idx:07d}"
+        records.append(record)
+    return records
+
+
+def run_benchmark(
+    master_rows: int,
+    scraped_records: int,
+    *,
+    top_k: int = 3,
+    threshold: float = 0.8,
+    loop_sample: int = 20,
+) -> Dict[str, float]:
+    master = synthetic_records(master_rows, seed=1)
+    scraped = synthetic_records(scraped_records, seed=2, with_pcid=False)
+
+    start = time.perf_counter()
+    store = PCIDVectorStore()
+    store.populate_from_records(master)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    queries = store.embed_records(scraped)
+    embed_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = store.query_many(queries, top_k=top_k, threshold=threshold)
+    batch_s = time.perf_counter() - start
+
+    stats: Dict[str, float] = {
+        "master_rows": float(master_rows),
+        "scraped_records": float(scraped_records),
+        "build_seconds": build_s,
+        "embed_seconds": embed_s,
+        "query_many_seconds": batch_s,
+        "records_per_second": scraped_records / batch_s if batch_s else float("inf"),
+        "matched": float(sum(1 for r in results if r)),
+    }
+
+    sample = min(loop_sample, scraped_records)
+    if sample:
+        entries = store.matrix.tolist()
+        start = time.perf_counter()
+        for row in queries[:sample].tolist():
+            scored = [_cosine(row, candidate) for candidate in entries]
+            sorted((s for s in scored if s >= threshold), reverse=True)[:top_k]
+        per_record = (time.perf_counter() - start) / sample
+        stats["legacy_projected_seconds"] = per_record * scraped_records
+        stats["speedup"] = stats["legacy_projected_seconds"] / batch_s if batch_s else float("inf")
+    return stats
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the PCID vector index")
+    parser.add_argument("--master", type=int, default=100_000, help="PCID master rows")
+    parser.add_argument("--records", type=int, default=50_000, help="Scraped records to match")
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument(
+        "--loop-sample",
+        type=int,
+        default=20,
+        help="Records timed through the legacy pure-Python scorer to project its total",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    args = parse_args()
+    result = run_benchmark(
+        args.master,
+        args.records,
+        top_k=args.top_k,
+        threshold=args.threshold,
+        loop_sample=args.loop_sample,
+    )
+    for key, value in result.items():
+        log.info("%s: %.3f", key, value)
@@ -0,0 +1,149 @@
+"""Benchmark the COPY-based Postgres loader against row-at-a-time INSERTs.
+
+Without a DSN only the client side is measured: rows are encoded and streamed
+into a cursor that discards them, which bounds the loader's own overhead.
+With ``--dsn`` (or ``PG_BENCH_DSN``) a scratch table is created, the COPY
+upsert path loads ``--rows`` rows, and the previous ``executemany`` INSERT
+path is projected from ``--insert-sample`` rows.
+
+Example:
+    python -m tools.bench_pg_copy --rows 1000000 --dsn postgresql://localhost/bench
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Any, Dict, Iterator, Optional
+
+from src.common.logging_utils import get_logger
+from src.processors.exporters.pg_copy_loader import PostgresCopyLoader
+
+log = get_logger("bench-pg-copy")
+
+BENCH_TABLE = "bench_pg_copy"
+_COLUMNS = ["product_url", "name", "company", "price", "currency", "raw"]
+
+
+def synthetic_rows(count: int) -> Iterator[Dict[str, Any]]:
+    for idx in range(count):
+        yield {
+            "product_url": f"https://example.test/p/{idx}",
+            "name": f"PRODUCT {idx % 5000}",
+            "company": f"LAB {idx % 300}",
+            "price": round(100 + (idx % 50_000) / 100, 2),
+            "currency": "ARS",
+            "raw": {"idx": idx, "note": "tab\there"},
+        }
+
+
+class _DiscardCursor:
+    def __enter__(self) -> "_DiscardCursor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        return None
+
+    def copy_expert(self, sql: str, stream: Any, size: int = 8192) -> None:
+        while stream.read(size):
+            pass
+
+
+class _DiscardConnection:
+    def cursor(self) -> _DiscardCursor:
+        return _DiscardCursor()
+
+    def commit(self) -> None:
+        return None
+
+    def rollback(self) -> None:
+        return None
+
+
+def _reset_table(conn: Any) -> None:
+    with conn.cursor() as cur:
+        cur.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+        cur.execute(
+            f"CREATE TABLE {BENCH_TABLE} (product_url TEXT PRIMARY KEY, name TEXT, company TEXT, "
+            "price NUMERIC, currency TEXT, raw JSONB)"
+        )
+    conn.commit()
+
+
+def _insert_rows(conn: Any, count: int) -> float:
+    import json
+
+    placeholders = ", ".join(["%s"] * len(_COLUMNS))
+    sql = f"INSERT INTO {BENCH_TABLE} ({', '.join(_COLUMNS)}) VALUES ({placeholders})"
+    start = time.perf_counter()
+    with conn.cursor() as cur:
+        rows = [
+            tuple(json.dumps(r[c]) if c == "raw" else r[c] for c in _COLUMNS)
+            for r in synthetic_rows(count)
+        ]
+        for offset in range(0, len(rows), 1000):
+            cur.executemany(sql, rows[offset : offset + 1000])
+    conn.commit()
+    return time.perf_counter() - start
+
+
+def run_benchmark(
+    rows: int, *, dsn: Optional[str] = None, insert_sample: int = 20_000
+) -> Dict[str, float]:
+    if not dsn:
+        loader = PostgresCopyLoader(
+            BENCH_TABLE,
+            conflict_key=["product_url"],
+            columns=_COLUMNS,
+            connection=_DiscardConnection(),
+        )
+        stats = loader.load(synthetic_rows(rows))
+        return {
+            "rows": float(stats.rows),
+            "copy_seconds": stats.seconds,
+            "copy_rows_per_second": stats.rows_per_second,
+        }
+
+    import psycopg2
+
+    conn = psycopg2.connect(dsn)
+    try:
+        _reset_table(conn)
+        insert_s = _insert_rows(conn, min(rows, insert_sample))
+        _reset_table(conn)
+        loader = PostgresCopyLoader(
+            BENCH_TABLE, conflict_key=["product_url"], columns=_COLUMNS, connection=conn
+        )
+        stats = loader.load(synthetic_rows(rows))
+        with conn.cursor() as cur:
+            cur.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+        conn.commit()
+    finally:
+        conn.close()
+
+    projected_insert_s = insert_s * rows / min(rows, insert_sample)
+    return {
+        "rows": float(stats.rows),
+        "copy_seconds": stats.seconds,
+        "copy_rows_per_second": stats.rows_per_second,
+        "insert_seconds_projected": projected_insert_s,
+        "speedup": projected_insert_s / stats.seconds if stats.seconds else float("inf"),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--dsn", default=os.getenv("PG_BENCH_DSN"))
+    parser.add_argument("--insert-sample", type=int, default=20_000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    args = parse_args()
+    result = run_benchmark(args.rows, dsn=args.dsn, insert_sample=args.insert_sample)
+    for key, value in result.items():
+        log.info("%s: %.3f", key, value)
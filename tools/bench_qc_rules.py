@@ -0,0 +1,133 @@
+"""Benchmark the compiled QC engine against the per-record rule loop.
+
+Builds a synthetic batch shaped like normalized scraper output (a share of
+records carrying a defect for one of the default rules), then times
+``CompiledRuleset.run`` over the record list and over a prepared
+``ColumnBatch``, and projects the per-record ``run_qc_for_record`` loop from a
+sample.
+
+Example:
+    python -m tools.bench_qc_rules --records 1000000 --defect-ratio 0.01
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from src.common.logging_utils import get_logger
+from src.processors.qc.columnar import ColumnBatch
+from src.processors.qc.rules import compile_ruleset, get_default_ruleset, run_qc_for_record
+
+log = get_logger("bench-qc-rules")
+
+_DEFECTS = [
+    ("name", "  "),
+    ("price", "abc"),
+    ("price", "0.001"),
+    ("currency", "GBP"),
+    ("reimbursed_price", "999999"),
+]
+
+
+def synthetic_batch(
+    count: int, *, defect_ratio: float = 0.01, seed: int = 3
+) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    currencies = ["ARS", "USD", "EUR"]
+    records: List[Dict[str, Any]] = []
+    for idx in range(count):
+        record: Dict[str, Any] = {
+            "source": "alfabeta",
+            "country": "AR",
+            "product_url": f"https://example.test/p/{idx}",
+            "name": f"PRODUCT {idx % 5000}",
+            "company": f"LAB {idx % 300}",
+            "price": f"{rng.randint(100, 500_000) / 100:.2f}",
+            "currency": currencies[idx % 3],
+            "reimbursed_price": None if idx % 4 else float(rng.randint(1, 100)),
+            "retail_price": float(rng.randint(100, 1000)),
+        }
+        if rng.random() < defect_ratio:
+            key, value = rng.choice(_DEFECTS)
+            record[key] = value
+        records.append(record)
+    return records
+
+
+def run_benchmark(
+    records: int,
+    *,
+    defect_ratio: float = 0.01,
+    loop_sample: int = 20_000,
+    repeat: int = 3,
+) -> Dict[str, float]:
+    batch = synthetic_batch(records, defect_ratio=defect_ratio)
+    ruleset = get_default_ruleset()
+    compiled = compile_ruleset(ruleset)
+    fields = sorted({key for record in batch[:1000] for key in record})
+    columns = {name: [record.get(name) for record in batch] for name in fields}
+
+    records_s = columns_s = float("inf")
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        outcome = compiled.run(batch)
+        records_s = min(records_s, time.perf_counter() - start)
+
+        column_batch = ColumnBatch.from_columns(columns)
+        start = time.perf_counter()
+        compiled.run(column_batch)
+        columns_s = min(columns_s, time.perf_counter() - start)
+
+    stats: Dict[str, float] = {
+        "records": float(records),
+        "failed_records": float(len(outcome.failures)),
+        "records_seconds": records_s,
+        "records_per_second": records / records_s if records_s else float("inf"),
+        "columns_seconds": columns_s,
+        "columns_records_per_second": records / columns_s if columns_s else float("inf"),
+    }
+
+    sample = min(loop_sample, records)
+    if sample:
+        loop_s = float("inf")
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            for record in batch[:sample]:
+                run_qc_for_record(record, ruleset)
+            loop_s = min(loop_s, time.perf_counter() - start)
+        stats["per_record_projected_seconds"] = loop_s / sample * records
+        projected = stats["per_record_projected_seconds"]
+        stats["speedup"] = projected / records_s if records_s else float("inf")
+    return stats
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the compiled QC rule engine")
+    parser.add_argument("--records", type=int, default=1_000_000, help="Records in the batch")
+    parser.add_argument(
+        "--defect-ratio", type=float, default=0.01, help="Share of records with one rule defect"
+    )
+    parser.add_argument(
+        "--loop-sample",
+        type=int,
+        default=20_000,
+        help="Records timed through run_qc_for_record to project its total",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per path; the best is kept"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    args = parse_args()
+    result = run_benchmark(
+        args.records,
+        defect_ratio=args.defect_ratio,
+        loop_sample=args.loop_sample,
+        repeat=args.repeat,
+    )
+    for key, value in result.items():
+        log.info("%s: %.3f", key, value)
@@ -0,0 +1,112 @@
+"""Measure cold import time of the CLI, worker and DAG entry modules.
+
+Each module is imported in a fresh interpreter under ``python -X importtime``
+and the cumulative time reported for the module itself is kept (the best of
+``--repeat`` runs), so interpreter start-up and ``site`` are excluded. The
+child also reports which heavy optional dependencies ended up in
+``sys.modules``; entry points should only load those on first use.
+
+Example:
+    python -m tools.bench_startup --repeat 5 src.scrapers.alfabeta.pipeline
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from src.common.logging_utils import get_logger
+
+log = get_logger("bench-startup")
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Modules imported by ``run_pipeline_cli``, the AlfaBeta worker and the
+# ``dags/scraper_base`` factory (minus Airflow itself)
+DEFAULT_MODULES = (
+    "src.entrypoints.run_pipeline",
+    "src.scrapers.alfabeta.pipeline",
+    "src.engines.engine_factory",
+    "src.pipeline",
+    "src.integrations.jira_airflow_integration",
+)
+
+HEAVY_MODULES = (
+    "boto3",
+    "google.cloud.storage",
+    "groq",
+    "httpx",
+    "jsonschema",
+    "selenium",
+    "src.agents",
+    "webdriver_manager",
+)
+
+_PROBE = (
+    "import sys\n"
+    # ``__import__`` goes through the C import path that ``-X importtime`` traces
+    "__import__(sys.argv[1])\n"
+    "print(','.join(m for m in sys.argv[2:] if m in sys.modules))\n"
+)
+
+
+def _parse_importtime(stderr: str, module: str) -> float:
+    """Cumulative microseconds for ``module`` from ``-X importtime`` output."""
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return float(parts[1])
+    raise ValueError(f"no importtime entry for {module!r}")
+
+
+def measure_import(module: str) -> Dict[str, object]:
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE, module, *HEAVY_MODULES],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = [name for name in proc.stdout.strip().split(",") if name]
+    return {"ms": _parse_importtime(proc.stderr, module) / 1000, "heavy": loaded}
+
+
+def run_benchmark(
+    modules: Sequence[str] = DEFAULT_MODULES, *, repeat: int = 3
+) -> Dict[str, Dict[str, object]]:
+    results: Dict[str, Dict[str, object]] = {}
+    for module in modules:
+        best: Optional[Dict[str, object]] = None
+        for _ in range(max(1, repeat)):
+            sample = measure_import(module)
+            if best is None or sample["ms"] < best["ms"]:
+                best = sample
+        results[module] = best  # type: ignore[assignment]
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "modules", nargs="*", default=list(DEFAULT_MODULES), help="Modules to import"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Fresh interpreters per module; the best is kept"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    args = parse_args()
+    result = run_benchmark(args.modules, repeat=args.repeat)
+    for name, stats in result.items():
+        log.info("%s: %.3f ms (heavy: %s)", name, stats["ms"], ", ".join(stats["heavy"]) or "none")
@@ -18,7 +18,8 @@ from pathlib import Path
 from typing import Iterable, List, Optional
 
 from src.common.logging_utils import get_logger
-from src.core_kernel import CompiledPipeline, ComponentRegistry, ExecutionEngine, PipelineCompiler
+from src.core_kernel import CompiledPipeline, ExecutionEngine
+from src.core_kernel.pipeline_compiler import compile_pipeline_file
 from src.observability.run_trace_context import get_current_run_id
 from src.scheduler import scheduler_db_adapter
 
@@ -66,9 +67,8 @@ def _load_compiled_pipeline(pipeline_name: str) -> tuple[ExecutionEngine, Compil
     registry_path = REPO_ROOT / "dsl" / "components.yaml"
     pipeline_path = REPO_ROOT / "dsl" / "pipelines" / f"{pipeline_name}.yaml"
 
-    registry = ComponentRegistry.from_yaml(registry_path)
-    compiler = PipelineCompiler(registry)
-    compiled = compiler.compile_from_file(pipeline_path)
+    # Cached by content hash, so repeated load tests in one process compile once
+    registry, compiled = compile_pipeline_file(pipeline_path, registry_path)
     engine = ExecutionEngine(registry)
     return engine, compiled
 